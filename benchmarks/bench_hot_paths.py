@@ -0,0 +1,445 @@
+"""
+Hot-path benchmarks for every tab, on synthetic inventory and audit data.
+
+    python benchmarks/bench_hot_paths.py --items 1000 100000 --audit-rows 1000000 --output results.json
+    python benchmarks/bench_hot_paths.py --items 1000000 --audit-rows 10000000 --cache-dir /tmp/wp-bench --only audit
+    python benchmarks/bench_hot_paths.py --baseline main.json --output branch.json
+
+Each benchmark times one hot path (setup is not timed) through the app's own modules,
+with an in-memory MemorySupabase in place of the database. Results are written as
+JSON; seconds spent inside the stand-in's execute() are reported separately, so
+client-side regressions are not hidden by the fake server. The run exits 1 when a
+benchmark misses its own latency budget or, with --baseline, when any median is more
+than --tolerance slower than the baseline's.
+"""
+import argparse
+import gc
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import MemorySupabase, load_or_make, make_packing_list  # noqa: E402
+
+BENCHMARKS = []
+
+
+def benchmark(name, tab, scale, budget=None):
+    """Register a setup function returning the zero-argument callable to time.
+
+    scale: "items" runs once per --items size, "audit" once per --audit-rows size,
+    "fixed" once per suite.
+    budget: (seconds, rows) - the median must stay under `seconds` at every size up to
+    `rows`; the run exits 1 otherwise.
+    """
+    def register(setup):
+        BENCHMARKS.append({"name": name, "tab": tab, "scale": scale, "budget": budget, "setup": setup})
+        return setup
+    return register
+
+
+def load_app(db, workdir):
+    """Point the app at `db` with throwaway secrets so its modules import outside `streamlit run`."""
+    secrets = os.path.join(workdir, "secrets.toml")
+    with open(secrets, "w") as f:
+        f.write('SUPABASE_URL = "memory://benchmarks"\n')
+        f.write('SUPABASE_KEY = "benchmarks"\n')
+        f.write(f'AUDIT_SPILL_PATH = {json.dumps(os.path.join(workdir, "audit_spill.jsonl"))}\n')
+
+    from streamlit import config, logger
+    config.set_option("secrets.files", [secrets])
+    logger.set_log_level("error")  # bare-mode ScriptRunContext/cache warnings
+
+    # data.client builds the shared client at import time through create_client
+    import supabase as supabase_py
+    supabase_py.create_client = lambda *args, **kwargs: db
+
+    from warehouse_pulse.data.client import supabase
+    return supabase
+
+
+# --- DASHBOARD ---
+@benchmark("normalize_category", "Dashboard", "items")
+def bench_normalize_category(ctx):
+    from warehouse_pulse.catalog import normalize_category
+    raw = ctx.raw_inventory['Category']
+    return lambda: raw.map(normalize_category)
+
+
+@benchmark("dashboard_filter", "Dashboard", "items")
+def bench_dashboard_filter(ctx):
+    from warehouse_pulse.domain.materials import VIEW_ATTRIBUTES, filter_view
+    from warehouse_pulse.domain.pulse_grid import summarize_materials
+    views = [("All Materials", {})] + [(view, {}) for view in VIEW_ATTRIBUTES]
+    views += [("Coils", {"Metal_Type": "Aluminum", "Gauge": ".016"}), ("Elbows", {"Angle": "90°", "Size": "#3"})]
+
+    def run():
+        for view, selections in views:
+            display_df, _ = filter_view(ctx.inventory, view, selections)
+            summarize_materials(display_df)
+    return run
+
+
+@benchmark("pulse_grid", "Dashboard", "items")
+def bench_pulse_grid(ctx):
+    from warehouse_pulse.domain.pulse_grid import pulse_card, summarize_materials
+    summary_df = summarize_materials(ctx.inventory)
+
+    def run():
+        for _, row in summary_df.iterrows():
+            pulse_card(row['Material'], row['Total_Footage'], row['Unit_Count'], row['Type'], {})
+    return run
+
+
+# --- PRODUCTION LOG ---
+def _available(inventory, category):
+    return inventory[(inventory['Category'] == category) & (inventory['Footage'] > 0)]
+
+
+@benchmark("pool_validation", "Production Log", "items")
+def bench_pool_validation(ctx):
+    from warehouse_pulse.domain.production import calculate_pool_capacity, clean_pool, get_pool_details
+    available = _available(ctx.inventory, "Coils")
+    depleted = ctx.inventory.loc[ctx.inventory['Footage'] <= 0, 'Item_ID'].head(1).tolist()
+    # Five coil lines with an eight-coil pool each, one of them holding a depleted coil
+    pools = [available['Item_ID'].sample(min(8, len(available)), random_state=i).tolist() for i in range(5)]
+    pools[0] += depleted
+
+    def run():
+        for pool in pools:
+            cleaned = clean_pool(pool, available)
+            calculate_pool_capacity(cleaned, available)
+            get_pool_details(cleaned, available)
+    return run
+
+
+@benchmark("pool_deduction", "Production Log", "items")
+def bench_pool_deduction(ctx):
+    from warehouse_pulse.domain.production import process_pool_deduction
+    available = _available(ctx.inventory, "Coils")
+    pool = available.nlargest(4, 'Footage')['Item_ID'].tolist()
+
+    def run():
+        ok, _, error = process_pool_deduction(
+            pool, 60.0, 55.0, 5.0, available, ctx.client,
+            "benchmark", "SO-BENCH", "Acme Mechanical", "Coil line", "#3", 4
+        )
+        if not ok:
+            raise RuntimeError(error)
+    return run
+
+
+@benchmark("production_pdf", "Production Log", "fixed")
+def bench_production_pdf(ctx):
+    from warehouse_pulse.reporting.pdf import generate_production_pdf
+    coils = _available(ctx.inventory, "Coils").head(30)
+    rolls = _available(ctx.inventory, "Rolls").head(30)
+    details = []
+    for material_type, items in (("Coil", coils), ("Roll", rolls)):
+        for i, row in enumerate(items.itertuples()):
+            details.append({
+                'source_id': row.Item_ID, 'material': row.Material, 'material_type': material_type,
+                'size': f"#{i % 33 + 1}", 'pieces': 4, 'footage_used': 20.0, 'production_footage': 18.0,
+                'waste': 2.0, 'previous_footage': row.Footage, 'remaining_footage': row.Footage - 20.0,
+                'status': "Active",
+            })
+    box_usage = {"Small Metal Box": 2, "Big Metal Box": 1, "Small Elbow Box": 0, "Medium Elbow Box": 3, "Large Elbow Box": 0}
+    return lambda: generate_production_pdf("SO-BENCH", "Acme Mechanical", "benchmark", details, box_usage)
+
+
+# --- MANAGE ---
+@benchmark("receipt_pdf", "Manage", "fixed")
+def bench_receipt_pdf(ctx):
+    from warehouse_pulse.reporting.pdf import generate_receipt_pdf
+    received = ctx.inventory.head(500)
+    return lambda: generate_receipt_pdf("PO-BENCH", received, "benchmark")
+
+
+@benchmark("packing_list_validate", "Manage", "items", budget=(1.0, 100000))
+def bench_packing_list_validate(ctx):
+    from warehouse_pulse.domain.purchasing import SERIALIZED_CATEGORIES
+    from warehouse_pulse.domain.receiving import validate_packing_list
+    # A 5,000-line supplier list checked against the whole inventory
+    packing_list = make_packing_list(5000, ctx.inventory)
+    categories = sorted(ctx.inventory['Category'].unique())
+    cart_ids = packing_list['Item_ID'].iloc[:100].tolist()
+    return lambda: validate_packing_list(packing_list, ctx.inventory, categories, SERIALIZED_CATEGORIES, cart_ids)
+
+
+# --- ADMIN ACTIONS ---
+@benchmark("search_index_build", "Admin Actions", "items")
+def bench_search_index_build(ctx):
+    from warehouse_pulse.domain.search import build_search_index
+    build = inspect.unwrap(build_search_index)  # time the build, not the cache lookup
+    return lambda: build(ctx.version, ctx.inventory)
+
+
+@benchmark("inventory_search", "Admin Actions", "items")
+def bench_inventory_search(ctx):
+    from warehouse_pulse.domain.search import build_search_index, search_inventory
+    index = inspect.unwrap(build_search_index)(ctx.version, ctx.inventory)
+    queries = ["016 smooth alum", "stainles coil", "elbow #12", "wing seal open 3/4", "COIL-00012", "rack b-4"]
+
+    def run():
+        for query in queries:
+            search_inventory(index, query)
+    return run
+
+
+# --- INSIGHTS ---
+@benchmark("movement_classify", "Insights", "audit")
+def bench_movement_classify(ctx):
+    from warehouse_pulse.data.movements import classify_movements
+    return lambda: classify_movements(ctx.audit, ctx.inventory)
+
+
+# --- AUDIT TRAIL ---
+@benchmark("audit_search_first_page", "Audit Trail", "audit")
+def bench_audit_first_page(ctx):
+    from warehouse_pulse.data.audit_log import search_audit_log
+    return lambda: search_audit_log()
+
+
+@benchmark("audit_search_text", "Audit Trail", "audit")
+def bench_audit_text(ctx):
+    from warehouse_pulse.data.audit_log import search_audit_log
+    return lambda: search_audit_log(query="acme coil")
+
+
+@benchmark("audit_search_filters", "Audit Trail", "audit")
+def bench_audit_filters(ctx):
+    from datetime import date, timedelta
+
+    from warehouse_pulse.data.audit_log import search_audit_log
+    last_day = date.fromisoformat(ctx.audit['Timestamp'].iloc[-1][:10])
+    return lambda: search_audit_log(action="Admin Edit - Footage", user="mchen",
+                                    date_from=last_day - timedelta(days=90), date_to=last_day)
+
+
+@benchmark("audit_search_paging", "Audit Trail", "audit")
+def bench_audit_paging(ctx):
+    from warehouse_pulse.data.audit_log import search_audit_log
+
+    def run():
+        cursor = None
+        for _ in range(5):
+            _, cursor = search_audit_log(cursor=cursor)
+            if cursor is None:
+                break
+    return run
+
+
+# --- REPORTS ---
+def _report(ctx):
+    from warehouse_pulse.reporting.inventory_report import build_inventory_report
+    return inspect.unwrap(build_inventory_report)(ctx.version, ctx.inventory)
+
+
+@benchmark("report_build", "Reports", "items")
+def bench_report_build(ctx):
+    from warehouse_pulse.reporting.inventory_report import build_inventory_report
+    build = inspect.unwrap(build_inventory_report)
+    return lambda: build(ctx.version, ctx.inventory)
+
+
+@benchmark("report_pdf", "Reports", "items")
+def bench_report_pdf(ctx):
+    from warehouse_pulse.reporting.inventory_report import render_inventory_report_pdf
+    report = _report(ctx)
+    return lambda: render_inventory_report_pdf(report, "All Categories", "2026-10-01 08:00")
+
+
+@benchmark("report_excel", "Reports", "items")
+def bench_report_excel(ctx):
+    from warehouse_pulse.reporting.inventory_report import write_report_excel
+    report = _report(ctx)
+    return lambda: write_report_excel(report, ctx.inventory, "All Categories", "2026-10-01 08:00")
+
+
+# --- RUNNER ---
+def measure(fn, repeat, warmup):
+    """Wall seconds and seconds inside Supabase execute() for each timed call."""
+    from warehouse_pulse import metrics
+    for _ in range(warmup):
+        fn()
+    seconds, db_seconds = [], []
+    for _ in range(repeat):
+        gc.collect()
+        metrics.begin_rerun()
+        start = time.perf_counter()
+        fn()
+        seconds.append(time.perf_counter() - start)
+        db_seconds.append(metrics.end_rerun()["supabase_seconds"])
+    return seconds, db_seconds
+
+
+def run_one(spec, ctx, args):
+    fn = spec["setup"](ctx)
+    seconds, db_seconds = measure(fn, args.repeat, args.warmup)
+    median = statistics.median(seconds)
+    db_median = statistics.median(db_seconds)
+    rows = {"items": ctx.items, "audit": ctx.audit_rows, "fixed": None}[spec["scale"]]
+    budget = spec["budget"]
+    budget_seconds = budget[0] if budget and (rows or 0) <= budget[1] else None
+    return {
+        "name": spec["name"],
+        "tab": spec["tab"],
+        "items": ctx.items if spec["scale"] != "audit" else len(ctx.inventory),
+        "audit_rows": ctx.audit_rows if spec["scale"] == "audit" else None,
+        "repeat": args.repeat,
+        "seconds": {
+            "min": round(min(seconds), 6),
+            "median": round(median, 6),
+            "mean": round(statistics.fmean(seconds), 6),
+            "max": round(max(seconds), 6),
+        },
+        "supabase_seconds": round(db_median, 6),
+        "client_seconds": round(max(median - db_median, 0.0), 6),
+        "rows_per_second": round(rows / median, 1) if rows and median > 0 else None,
+        "budget_seconds": budget_seconds,
+        "over_budget": budget_seconds is not None and median > budget_seconds,
+    }
+
+
+def _key(result):
+    return result["name"], result["items"], result["audit_rows"]
+
+
+def compare(results, baseline_path, tolerance):
+    """Results whose median is more than `tolerance` slower than the baseline's."""
+    with open(baseline_path) as f:
+        baseline = {_key(r): r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        before = baseline.get(_key(result))
+        if not before or not before["seconds"]["median"]:
+            continue
+        ratio = result["seconds"]["median"] / before["seconds"]["median"]
+        result["baseline_ratio"] = round(ratio, 3)
+        if ratio > 1 + tolerance:
+            regressions.append(result)
+    return regressions
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Inventory sizes (1k to 1M)")
+    parser.add_argument("--audit-rows", type=int, nargs="+", default=[100000, 1000000],
+                        help="Audit log sizes (up to 10M); audit benchmarks use the largest inventory")
+    parser.add_argument("--only", nargs="+", default=None,
+                        help="Benchmark names, tab names or name prefixes to run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", default=None, help="Keep generated data here as Parquet between runs")
+    parser.add_argument("--output", default=None, help="Write JSON results here instead of stdout")
+    parser.add_argument("--baseline", default=None, help="Earlier JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown over the baseline median (0.2 = 20%%)")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args()
+
+    selected = BENCHMARKS
+    if args.only:
+        wanted = [w.lower() for w in args.only]
+        selected = [b for b in BENCHMARKS
+                    if any(b["name"].startswith(w) or b["tab"].lower() == w for w in wanted)]
+    if args.list:
+        for spec in selected:
+            print(f"{spec['name']:<26} {spec['tab']:<16} {spec['scale']}")
+        return 0
+
+    db = MemorySupabase()
+    workdir = tempfile.mkdtemp(prefix="wp-bench-")
+    client = load_app(db, workdir)
+    from warehouse_pulse.data.inventory import compute_data_version
+
+    def context(items, audit_rows=None):
+        inventory = load_or_make("inventory", items, args.seed, args.cache_dir)
+        db.load("inventory", inventory.copy())
+        ctx = SimpleNamespace(items=items, audit_rows=audit_rows, inventory=inventory, db=db, client=client,
+                              version=compute_data_version(inventory, None), audit=None, raw_inventory=None)
+        if any(b["name"] == "normalize_category" for b in selected):
+            ctx.raw_inventory = load_or_make("inventory", items, args.seed, args.cache_dir, raw_categories=True)
+        if audit_rows:
+            ctx.audit = load_or_make("audit", audit_rows, args.seed, args.cache_dir, inventory=inventory)
+            db.load("audit_log", ctx.audit, sorted_by=["Timestamp", "id"])
+        return ctx
+
+    runs = []
+    for items in sorted(set(args.items)):
+        runs.append((context, (items,), [b for b in selected if b["scale"] == "items"]))
+    if any(b["scale"] == "fixed" for b in selected):
+        runs.append((context, (min(args.items),), [b for b in selected if b["scale"] == "fixed"]))
+    for audit_rows in sorted(set(args.audit_rows)):
+        runs.append((context, (max(args.items), audit_rows), [b for b in selected if b["scale"] == "audit"]))
+
+    results = []
+    for make_context, context_args, specs in runs:
+        if not specs:
+            continue
+        ctx = make_context(*context_args)
+        for spec in specs:
+            result = run_one(spec, ctx, args)
+            results.append(result)
+            size = f"{result['audit_rows']:,} audit rows" if result["audit_rows"] else f"{result['items']:,} items"
+            print(f"{spec['name']:<26} {size:>20}  median {result['seconds']['median'] * 1000:10.1f} ms"
+                  f"  (db {result['supabase_seconds'] * 1000:.1f} ms)", file=sys.stderr)
+        del ctx
+        gc.collect()
+
+    regressions = compare(results, args.baseline, args.tolerance) if args.baseline else []
+    import numpy as np
+    import pandas as pd
+    document = {
+        "suite": "warehouse_pulse hot paths",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "results": results,
+        "regressions": [_key(r) for r in regressions],
+        "over_budget": [_key(r) for r in results if r["over_budget"]],
+    }
+    text = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for result in regressions:
+        print(f"REGRESSION {result['name']} ({result['items']} items, {result['audit_rows']} audit rows): "
+              f"{result['baseline_ratio']:.2f}x baseline", file=sys.stderr)
+    over_budget = [r for r in results if r["over_budget"]]
+    for result in over_budget:
+        print(f"OVER BUDGET {result['name']} ({result['items']} items): median "
+              f"{result['seconds']['median']:.3f}s > {result['budget_seconds']}s", file=sys.stderr)
+    return 1 if regressions or over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Serial vs process-pool rendering of a synthetic inventory report.
+
+    python benchmarks/bench_report_pdf.py --lines 10000 --categories 8
+
+Prints one timing per worker count and the speedup over the serial render.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from warehouse_pulse.reporting import report_pdf
+
+
+def synthetic_report(lines, categories, seed=7):
+    rng = random.Random(seed)
+    per_category = [lines // categories + (1 if i < lines % categories else 0) for i in range(categories)]
+    sections = []
+    total_footage = 0.0
+    for c, count in enumerate(per_category):
+        rows, cat_footage = [], 0.0
+        for m in range(count):
+            footage = rng.uniform(50, 5000)
+            cat_footage += footage
+            rows.append([f"Material {c}-{m} .0{rng.randint(10, 32)} Gauge", str(rng.randint(1, 40)),
+                         f"{footage:,.1f} ft", f"{footage / 4:,.0f} ft", f"R{rng.randint(1, 30)}-S{rng.randint(1, 9)}"])
+        total_footage += cat_footage
+        sections.append({"title": f"Category {c}", "subtitle": f"{count} items | {cat_footage:,.1f} ft total", "rows": rows})
+    header = {
+        "category_label": "All Categories",
+        "report_date": time.strftime("%Y-%m-%d %H:%M"),
+        "summary_row": [f"{total_footage:,.1f} ft", str(lines), str(lines), "270"],
+    }
+    return header, sections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=10000)
+    parser.add_argument("--categories", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="*", default=None,
+                        help="Worker counts to time (default: 1 and report_pdf.MAX_WORKERS)")
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    header, sections = synthetic_report(args.lines, args.categories)
+    footer = "Benchmark report"
+    worker_counts = args.workers or sorted({1, report_pdf.MAX_WORKERS})
+
+    # Start the pool before timing so process spawn is not counted (the app keeps it warm)
+    if max(worker_counts) > 1:
+        list(report_pdf._get_pool().map(abs, range(report_pdf.MAX_WORKERS)))
+
+    print(f"{args.lines} lines in {args.categories} categories, {os.cpu_count()} CPUs")
+    baseline = None
+    for workers in worker_counts:
+        best, size = None, 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            size = len(report_pdf.render_inventory_report(header, sections, footer, workers=workers))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        baseline = baseline or best
+        print(f"workers={workers:<2} {best:7.2f}s  {size / 1024:,.0f} KiB  speedup x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
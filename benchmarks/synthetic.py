@@ -0,0 +1,542 @@
+"""
+Synthetic warehouse data and an in-memory Supabase stand-in for the benchmarks.
+
+make_inventory() and make_audit_log() build frames shaped like the Supabase tables, with
+material names spelled the way the Receive form writes them (coils and rolls from
+COIL_MATERIALS/ROLL_MATERIALS, elbows and straps in every SIZE_DISPLAY size, wing seals,
+banding, insulation, wire). Generation is vectorized, so 1M items or 10M audit rows take
+seconds rather than minutes; load_or_make() keeps them as Parquet between runs.
+
+MemorySupabase answers the query-builder calls the app makes (filters, keyset ordering,
+full-text search on audit_log, RPCs, Storage) against those frames.
+"""
+
+import os
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from warehouse_pulse.catalog import COIL_MATERIALS, ROLL_MATERIALS, SIZE_DISPLAY
+
+INVENTORY_COLUMNS = ['Item_ID', 'Material', 'Footage', 'Location', 'Status', 'Category', 'Purchase_Order_Num']
+AUDIT_COLUMNS = ['id', 'Item_ID', 'Action', 'User', 'Timestamp', 'Details']
+
+# Part of the Parquet cache file name; bump when the generated frames change shape or mix
+DATA_VERSION = 2
+
+# --- CATALOG ---
+def _materials():
+    textures, metals = ["Stucco", "Smooth"], ["Aluminum", "Stainless Steel"]
+    sizes = list(SIZE_DISPLAY)
+    return {
+        "Coils": COIL_MATERIALS + [
+            f"{t} {m} Coil - {g} Gauge" for t in textures for m in metals for g in [".010", ".016", ".020", ".024", ".032"]
+        ],
+        "Rolls": ROLL_MATERIALS + [
+            f"{t} {m} {r}Roll - {g} Gauge" for t in textures for m in metals for r in ["", "RPR-"] for g in [".016", ".020", ".024", ".032"]
+        ],
+        "Elbows": [
+            f"{a} Elbow - Size {s} - {m}" for a in ["90°", "45°"] for s in sizes for m in ["Aluminum", "Stainless Steel", "Galvanized"]
+        ],
+        "Fab Straps": [f"Fab Strap {g} - {s} - {m}" for g in [".015", ".020"] for s in sizes for m in metals],
+        "Mineral Wool": [
+            f"Mineral Wool - Pipe Size: {p} - Thickness: {t}" for p in ["1 in", "2 in", "3 in", "4 in"] for t in ["0.5 in", "1 in", "1.5 in", "2 in"]
+        ],
+        "Fiberglass Insulation": [
+            f"Fiberglass {f} - {t} Thickness" for f in ["Rolls", "Batts", "Pipe Wrap"] for t in ["0.25 in", "0.5 in", "1 in", "1.5 in", "2 in"]
+        ],
+        "Wing Seals": [
+            f"{s} Wing Seal - {z} - {g} Gauge - {gr} - Joint at {j}"
+            for s in ["Open", "Closed"] for z in ["1/2 in", "3/4 in"] for g in [".028", ".032"]
+            for gr in ["With Grooves (Center)", "Without Grooves"] for j in ["Bottom", "Top", "N/A"]
+        ],
+        "Wire": [f"Wire - {g} Gauge" for g in ["14", "16", "18"]],
+        "Banding": [
+            f"{o} Banding - {z} - {g} Gauge - {c}"
+            for o in ["Oscillated", "Non-Oscillated"] for z in ["3/4 in", "1/2 in"] for g in [".015", ".020"] for c in ["Metal Core", "Non-Metal Core"]
+        ],
+        "Other": ["Custom Gaskets", "Pop Rivets - Box of 500", "Sealant Tubes", "Jacketing Screws"],
+    }
+
+MATERIALS = _materials()
+
+# Share of items, quantity range and Item_ID prefix per category
+CATEGORY_MIX = {
+    "Coils": (0.28, (200, 3000), "COIL"),
+    "Rolls": (0.22, (25, 100), "ROLL"),
+    "Elbows": (0.14, (1, 400), "ELBOWS"),
+    "Fab Straps": (0.10, (1, 40), "FAB-STRAPS"),
+    "Wing Seals": (0.07, (100, 5000), "WING-SEALS"),
+    "Mineral Wool": (0.06, (1, 60), "MINERAL-WOOL"),
+    "Fiberglass Insulation": (0.05, (50, 600), "FIBERGLASS-INSULATION"),
+    "Wire": (0.04, (1, 20), "WIRE"),
+    "Banding": (0.03, (50, 100), "BANDING"),
+    "Other": (0.01, (1, 50), "OTHER"),
+}
+COUNTED_CATEGORIES = {"Elbows", "Fab Straps", "Wing Seals", "Mineral Wool", "Wire", "Other"}
+
+# Spellings seen in hand-entered data, for the normalize_category benchmark
+RAW_CATEGORY_SPELLINGS = {
+    "Coils": ["Coils", "Coil", "coils", " Coil "],
+    "Rolls": ["Rolls", "Roll", "rolls"],
+    "Elbows": ["Elbows", "Elbow", "elbows"],
+    "Fab Straps": ["Fab Straps", "Fab Strap", "straps", "FabStraps"],
+    "Wing Seals": ["Wing Seals", "Wing Seal", "wingseals"],
+    "Mineral Wool": ["Mineral Wool", "mineralwool"],
+    "Fiberglass Insulation": ["Fiberglass Insulation", "Fiberglass"],
+    "Wire": ["Wire", "wire"],
+    "Banding": ["Banding", "banding"],
+    "Other": ["Accessories", "Fasteners"],
+}
+
+OPERATORS = ["tmilazi", "jgarcia", "mchen", "dpatel", "sowens", "kbrooks", "lnguyen", "rmartin", "admin", "manager"]
+CLIENTS = [f"{name} {kind}" for name in ["Acme", "Northwind", "Summit", "Harbor", "Pioneer", "Granite", "Cascade", "Ridge"]
+           for kind in ["Mechanical", "Insulation", "Industrial", "Energy", "Contractors"]]
+
+
+def _pick(rng, values, n):
+    values = np.asarray(values, dtype=object)
+    return values[rng.integers(0, len(values), n)]
+
+
+def _concat(*parts):
+    """Row-wise string concatenation of Series and scalars."""
+    out = None
+    for part in parts:
+        part = part if isinstance(part, (str, pd.Series)) else pd.Series(part)
+        out = part if out is None else out + part
+    return out
+
+
+# --- GENERATORS ---
+def make_inventory(n, seed=0, raw_categories=False):
+    """
+    Inventory rows shaped like the inventory table.
+
+    Args:
+        n: Number of items
+        seed: RNG seed; the same (n, seed) always gives the same frame
+        raw_categories: Spell categories the inconsistent ways hand-entered data does
+
+    Returns:
+        pd.DataFrame: INVENTORY_COLUMNS
+    """
+    rng = np.random.default_rng(seed)
+    names = list(CATEGORY_MIX)
+    shares = np.array([CATEGORY_MIX[c][0] for c in names])
+    cat_idx = rng.choice(len(names), size=n, p=shares / shares.sum())
+
+    material = np.empty(n, dtype=object)
+    footage = np.empty(n)
+    for i, cat in enumerate(names):
+        rows = np.flatnonzero(cat_idx == i)
+        _, (lo, hi), _ = CATEGORY_MIX[cat]
+        material[rows] = _pick(rng, MATERIALS[cat], len(rows))
+        qty = rng.uniform(lo, hi, len(rows))
+        footage[rows] = np.floor(qty) if cat in COUNTED_CATEGORIES else np.round(qty, 1)
+
+    depleted = rng.random(n) < 0.03
+    footage[depleted] = 0.0
+
+    prefixes = np.array([CATEGORY_MIX[c][2] for c in names], dtype=object)[cat_idx]
+    if raw_categories:
+        category = np.empty(n, dtype=object)
+        for i, cat in enumerate(names):
+            rows = np.flatnonzero(cat_idx == i)
+            category[rows] = _pick(rng, RAW_CATEGORY_SPELLINGS[cat], len(rows))
+    else:
+        category = np.array(names, dtype=object)[cat_idx]
+
+    frame = pd.DataFrame({
+        'Item_ID': _concat(pd.Series(prefixes), "-", pd.Series(np.arange(1, n + 1)).astype(str).str.zfill(7)),
+        'Material': material,
+        'Footage': footage,
+        'Location': _concat("Rack ", pd.Series(_pick(rng, list("ABCDEFGH"), n)), "-",
+                            pd.Series(rng.integers(1, 25, n)).astype(str)),
+        'Status': np.where(depleted, "Depleted", "Active"),
+        'Category': category,
+        'Purchase_Order_Num': _concat("PO-", pd.Series(rng.integers(10000, 99999, n)).astype(str)),
+    })
+    return frame[INVENTORY_COLUMNS]
+
+
+def make_packing_list(n, inventory, seed=0, clash_rate=0.01):
+    """
+    Supplier packing-list rows (PACKING_LIST_COLUMNS) for materials already in `inventory`.
+
+    Serialized rows get new Item IDs, except `clash_rate` of them that reuse an existing
+    one so the validator has errors to report.
+    """
+    rng = np.random.default_rng(seed)
+    sample = inventory.sample(n, replace=True, random_state=seed).reset_index(drop=True)
+    serialized = sample['Category'].isin(["Coils", "Rolls"]).to_numpy()
+    item_ids = np.where(serialized, [f"PL-{seed}-{i:07d}" for i in range(n)], "").astype(object)
+    clashes = np.flatnonzero(serialized & (rng.random(n) < clash_rate))
+    item_ids[clashes] = inventory['Item_ID'].sample(len(clashes), replace=True, random_state=seed).to_numpy()
+    return pd.DataFrame({
+        'Category': sample['Category'],
+        'Material': sample['Material'],
+        'Quantity': rng.integers(1, 500, n),
+        'Item_ID': item_ids,
+        'Location': sample['Location'],
+    })
+
+
+def make_audit_log(n, inventory, seed=0, days=730, end="2026-10-01"):
+    """
+    audit_log rows for `inventory`, oldest first, with the Action/Details formats the app writes.
+
+    Mix: production draws, stock picks (partial and whole-item), receipts, admin edits and
+    removals. Timestamps are spread over `days` before `end` and ids increase with time,
+    like the real table.
+
+    Returns:
+        pd.DataFrame: AUDIT_COLUMNS
+    """
+    rng = np.random.default_rng(seed + 1)
+    end_ts = np.datetime64(pd.Timestamp(end).tz_localize(None), "s")
+    offsets = np.sort(rng.integers(0, days * 86400, n))
+    stamps = end_ts - np.timedelta64(days * 86400, "s") + offsets.astype("timedelta64[s]")
+    timestamp = pd.Series(np.datetime_as_string(stamps, unit="s")) + "+00:00"
+
+    rows = rng.integers(0, len(inventory), n)
+    item_id = pd.Series(inventory['Item_ID'].to_numpy(dtype=object)[rows])
+    material = pd.Series(inventory['Material'].to_numpy(dtype=object)[rows]).str.slice(0, 40)
+    category = pd.Series(inventory['Category'].to_numpy(dtype=object)[rows])
+    user = pd.Series(_pick(rng, OPERATORS, n))
+    client = pd.Series(_pick(rng, CLIENTS, n))
+    qty_n, waste_n = rng.integers(1, 400, n), rng.integers(0, 20, n)
+    qty, waste, used = (pd.Series(v).astype(str) for v in (qty_n, waste_n, qty_n + waste_n))
+    order = pd.Series(rng.integers(100000, 999999, n)).astype(str)
+    size = pd.Series(_pick(rng, list(SIZE_DISPLAY), n))
+    suffix = pd.Series(rng.integers(0, 16 ** 8, n)).map("{:08x}".format)
+
+    kinds = ["production", "pick", "received", "edit_footage", "edit_location", "removed", "pick_whole"]
+    kind = rng.choice(len(kinds), size=n, p=[0.40, 0.23, 0.15, 0.09, 0.06, 0.03, 0.04])
+    kind[(kind == 6) & ~category.isin(["Coils", "Rolls"]).to_numpy()] = 1  # only coils and rolls go out whole
+
+    action = pd.Series("", index=range(n), dtype=object)
+    details = pd.Series("", index=range(n), dtype=object)
+    audit_item = item_id.copy()
+
+    def fill(k, act, det, audit_id=None):
+        mask = kind == k
+        action[mask] = act[mask] if isinstance(act, pd.Series) else act
+        details[mask] = det[mask]
+        if audit_id is not None:
+            audit_item[mask] = audit_id[mask]
+
+    fill(0, _concat("Production: ", qty, " pcs of ", size),
+         _concat("Source: ", item_id, " | Production: ", qty, " pcs of ", size, " (", qty, ".00 ft production + ", waste,
+                 ".00 ft waste = ", used, ".00 ft used) for ", client, " (Order: ", order, ") | Pool deduction"),
+         audit_id=_concat(item_id, "-", suffix))
+    fill(1, _concat("Stock Pick - ", category),
+         _concat("Picked ", qty, " units from ", category, " for ", client, " (SO: SO-", order, "). Material: ", material))
+    fill(2, "Received (New Item)",
+         _concat("PO: PO-", order, " | ", material, " | ", qty, " units | Location: Rack A-1"))
+    fill(3, "Admin Edit - Footage", _concat("Footage changed to ", qty, " by ", user))
+    fill(4, "Admin Edit - Location", _concat("Moved to Rack ", pd.Series(_pick(rng, list("ABCDEFGH"), n)), "-", waste))
+    fill(5, "Admin - Item Removed", _concat("Removed ", qty, " | ", material))
+    fill(6, _concat("Stock Pick - ", category),
+         _concat("Picked whole ", category.str.slice(0, -1), " (", qty, " ft) for ", client, " (SO: SO-", order,
+                 "). Material: ", material, ". Remaining: 0"))
+
+    frame = pd.DataFrame({
+        'id': np.arange(1, n + 1),
+        'Item_ID': audit_item.astype(str),
+        'Action': action.astype(str),
+        'User': user.astype(str),
+        'Timestamp': timestamp,
+        'Details': details.astype(str),
+    })
+    return frame[AUDIT_COLUMNS]
+
+
+def load_or_make(kind, n, seed, cache_dir=None, **kwargs):
+    """make_inventory/make_audit_log, read from `cache_dir` as Parquet when generated before."""
+    make = {"inventory": make_inventory, "audit": make_audit_log}[kind]
+    tag = "-raw" if kwargs.get("raw_categories") else ""
+    if kwargs.get("inventory") is not None:
+        tag += f"-inv{len(kwargs['inventory'])}"
+    path = os.path.join(cache_dir, f"{kind}{tag}-{n}-{seed}-v{DATA_VERSION}.parquet") if cache_dir else None
+    if path and os.path.exists(path):
+        return pd.read_parquet(path)
+    frame = make(n, seed=seed, **kwargs)
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        frame.to_parquet(path, index=False)
+    return frame
+
+
+# --- IN-MEMORY SUPABASE ---
+class MemoryResponse:
+    def __init__(self, data, count=None):
+        self.data, self.count = data, count
+
+
+def _records(frame):
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+class MemoryQuery:
+    """postgrest query builder over a DataFrame; every filter is a vectorized mask."""
+
+    # audit_log.search_vector is generated from these columns
+    SEARCH_COLUMNS = ["Item_ID", "Action", "User", "Details"]
+
+    def __init__(self, db, table):
+        self.db, self.table = db, table
+        self.operation, self.payload, self.on_conflict = "select", None, None
+        self.columns, self.count_mode = None, None
+        self.masks, self.orders = [], []
+        self.start, self.stop, self.single_row = 0, None, False
+
+    # Operations
+    def select(self, columns="*", count=None, **_):
+        self.columns = None if columns.strip() == "*" else [c.strip() for c in columns.split(",")]
+        self.count_mode = count
+        return self
+
+    def insert(self, rows, **_):
+        self.operation, self.payload = "insert", rows
+        return self
+
+    def upsert(self, rows, on_conflict=None, **_):
+        self.operation, self.payload, self.on_conflict = "upsert", rows, on_conflict
+        return self
+
+    def update(self, values, count=None, **_):
+        self.operation, self.payload, self.count_mode = "update", values, count
+        return self
+
+    def delete(self, count=None, **_):
+        self.operation, self.count_mode = "delete", count
+        return self
+
+    # Filters
+    def _where(self, mask_fn):
+        self.masks.append(mask_fn)
+        return self
+
+    def eq(self, column, value):
+        return self._where(lambda f: f[column] == value)
+
+    def neq(self, column, value):
+        return self._where(lambda f: f[column] != value)
+
+    def gt(self, column, value):
+        return self._where(lambda f: f[column] > value)
+
+    def gte(self, column, value):
+        return self._where(lambda f: f[column] >= value)
+
+    def lt(self, column, value):
+        return self._where(lambda f: f[column] < value)
+
+    def lte(self, column, value):
+        return self._where(lambda f: f[column] <= value)
+
+    def in_(self, column, values):
+        return self._where(lambda f: f[column].isin(list(values)))
+
+    def is_(self, column, value):
+        return self._where(lambda f: f[column].isna() if value in (None, "null") else f[column] == value)
+
+    def ilike(self, column, pattern):
+        needle = re.escape(pattern).replace("%", ".*").replace("_", ".")
+        return self._where(lambda f: f[column].astype(str).str.fullmatch(needle, case=False))
+
+    def filter(self, column, operator, value):
+        if column == "search_vector" and operator.startswith("fts"):
+            tokens = re.findall(r"(\w+):\*", value)
+            def mask(f):
+                keep = pd.Series(True, index=f.index)
+                for token in tokens:
+                    hit = pd.Series(False, index=f.index)
+                    for col in self.SEARCH_COLUMNS:
+                        hit |= f[col].str.contains(r"\b" + re.escape(token), case=False, regex=True)
+                    keep &= hit
+                return keep
+            return self._where(mask)
+        raise NotImplementedError(f"MemorySupabase does not support filter({column!r}, {operator!r})")
+
+    def or_(self, expression):
+        # Only the keyset cursor the Audit Trail sends: a.lt."x",and(a.eq."x",b.lt.n)
+        m = re.fullmatch(r'(\w+)\.lt\."([^"]+)",and\(\1\.eq\."\2",(\w+)\.lt\.(-?\d+)\)', expression)
+        if not m:
+            raise NotImplementedError(f"MemorySupabase does not support or_({expression!r})")
+        col, value, tie, tie_value = m.group(1), m.group(2), m.group(3), int(m.group(4))
+        return self._where(lambda f: (f[col] < value) | ((f[col] == value) & (f[tie] < tie_value)))
+
+    # Shaping
+    def order(self, column, desc=False, **_):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, n):
+        self.stop = self.start + n
+        return self
+
+    def range(self, start, end):
+        self.start, self.stop = start, end + 1
+        return self
+
+    def single(self):
+        self.single_row = True
+        return self
+
+    maybe_single = single
+
+    def execute(self):
+        with self.db.lock:
+            return getattr(self, f"_{self.operation}")()
+
+    def _matching(self, frame):
+        if not self.masks:
+            return frame
+        mask = np.ones(len(frame), dtype=bool)
+        for mask_fn in self.masks:
+            mask &= mask_fn(frame).fillna(False).to_numpy(dtype=bool)
+        return frame[mask]
+
+    def _select(self):
+        frame = self.db.tables.get(self.table, pd.DataFrame())
+        rows = self._matching(frame)
+        total = len(rows)
+        stop = total if self.stop is None else min(self.stop, total)
+        start = min(self.start, stop)
+
+        stored = self.db.sorted_by.get(self.table, [])
+        natural = (bool(self.orders) and [c for c, _ in self.orders] == stored[:len(self.orders)]
+                   and len({desc for _, desc in self.orders}) == 1)
+        if natural:
+            # Table is stored in this order; slice from the right end instead of sorting
+            if self.orders[0][1]:
+                rows = rows.iloc[total - stop:total - start].iloc[::-1]
+            else:
+                rows = rows.iloc[start:stop]
+        else:
+            if self.orders:
+                rows = rows.sort_values([c for c, _ in self.orders], ascending=[not d for _, d in self.orders], kind="stable")
+            rows = rows.iloc[start:stop]
+
+        if self.columns:
+            rows = rows[[c for c in self.columns if c in rows.columns]]
+        data = _records(rows)
+        if self.single_row:
+            data = data[0] if data else None
+        return MemoryResponse(data, total if self.count_mode else None)
+
+    def _new_rows(self):
+        rows = self.payload if isinstance(self.payload, list) else [self.payload]
+        frame = self.db.tables.get(self.table)
+        new = pd.DataFrame(rows)
+        if frame is not None and 'id' in frame.columns and 'id' not in new.columns:
+            first = int(frame['id'].max()) + 1 if len(frame) else 1
+            new.insert(0, 'id', np.arange(first, first + len(new)))
+        return frame, new
+
+    def _insert(self):
+        frame, new = self._new_rows()
+        self.db.tables[self.table] = new if frame is None or frame.empty else pd.concat([frame, new], ignore_index=True)
+        return MemoryResponse(_records(new))
+
+    def _upsert(self):
+        frame, new = self._new_rows()
+        keys = [k.strip() for k in (self.on_conflict or "id").split(",")]
+        if frame is not None and not frame.empty and all(k in frame.columns for k in keys):
+            existing = frame.set_index(keys).index.isin(new.set_index(keys).index)
+            frame = frame[~existing]
+        self.db.tables[self.table] = new if frame is None or frame.empty else pd.concat([frame, new], ignore_index=True)
+        return MemoryResponse(_records(new))
+
+    def _update(self):
+        frame = self.db.tables[self.table]
+        rows = self._matching(frame)
+        for column, value in self.payload.items():
+            frame.loc[rows.index, column] = value
+        return MemoryResponse(_records(frame.loc[rows.index]), len(rows) if self.count_mode else None)
+
+    def _delete(self):
+        frame = self.db.tables[self.table]
+        rows = self._matching(frame)
+        self.db.tables[self.table] = frame.drop(index=rows.index)
+        return MemoryResponse(_records(rows), len(rows) if self.count_mode else None)
+
+
+class _RpcCall:
+    def __init__(self, db, handler, params):
+        self.db, self.handler, self.params = db, handler, params
+
+    def execute(self):
+        with self.db.lock:
+            return MemoryResponse(self.handler(self.db, self.params or {}))
+
+
+class MemoryBucket:
+    def __init__(self, files):
+        self.files = files
+
+    def upload(self, path, data, file_options=None):
+        self.files[path] = bytes(data)
+
+    def download(self, path):
+        return self.files[path]
+
+    def remove(self, paths):
+        for path in paths:
+            self.files.pop(path, None)
+
+    def list(self, path=None, *_args, **_kwargs):
+        prefix = f"{path.rstrip('/')}/" if path else ""
+        return [{"name": p[len(prefix):]} for p in sorted(self.files) if p.startswith(prefix)]
+
+
+class MemoryStorage:
+    def __init__(self):
+        self.buckets = {}
+
+    def from_(self, bucket):
+        return MemoryBucket(self.buckets.setdefault(bucket, {}))
+
+
+def _audit_log_facets(db, params):
+    audit = db.tables.get("audit_log", pd.DataFrame(columns=AUDIT_COLUMNS))
+    return ([{"kind": "action", "value": v} for v in audit['Action'].dropna().unique()]
+            + [{"kind": "user", "value": v} for v in audit['User'].dropna().unique()])
+
+
+class MemorySupabase:
+    """
+    Supabase client over in-memory DataFrames.
+
+    Args:
+        tables: Table name -> DataFrame
+        sorted_by: Table name -> columns the frame is stored sorted by (ascending); ordered
+                   reads on those columns slice instead of sorting, like an index scan
+        rpcs: Extra RPC name -> handler(db, params) returning a list of rows
+    """
+
+    def __init__(self, tables=None, sorted_by=None, rpcs=None):
+        self.tables = dict(tables or {})
+        self.sorted_by = dict(sorted_by or {})
+        self.rpcs = {"audit_log_facets": _audit_log_facets, **(rpcs or {})}
+        self.storage = MemoryStorage()
+        self.lock = threading.RLock()
+
+    def load(self, table, frame, sorted_by=None):
+        with self.lock:
+            self.tables[table] = frame.reset_index(drop=True)
+            self.sorted_by[table] = list(sorted_by or [])
+
+    def table(self, name):
+        return MemoryQuery(self, name)
+
+    from_ = table
+
+    def rpc(self, fn, params=None):
+        if fn not in self.rpcs:
+            raise NotImplementedError(f"MemorySupabase has no RPC {fn!r}")
+        return _RpcCall(self, self.rpcs[fn], params)
@@ -0,0 +1,34 @@
+-- Bulk (non-serialized) stock is one row per (Category, Material).
+-- Receiving increments that row in place instead of SELECT + UPDATE/INSERT per cart line.
+--
+-- Older receipts could create duplicate bulk rows; merge them before applying:
+--   SELECT "Category", "Material", count(*) FROM inventory
+--   WHERE "Category" NOT IN ('Coils', 'Rolls')
+--   GROUP BY 1, 2 HAVING count(*) > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS inventory_bulk_category_material_key
+    ON inventory ("Category", "Material")
+    WHERE "Category" NOT IN ('Coils', 'Rolls');
+
+-- p_items: [{"Item_ID", "Material", "Footage", "Location", "Category", "Purchase_Order_Num"}, ...]
+-- Item_ID is only used when the row is new; existing rows keep theirs.
+CREATE OR REPLACE FUNCTION receive_bulk_items(p_items jsonb)
+RETURNS TABLE ("Item_ID" text, "Material" text, "Category" text, "Footage" double precision, inserted boolean)
+LANGUAGE sql
+AS $$
+    INSERT INTO inventory AS inv ("Item_ID", "Material", "Footage", "Location", "Status", "Category", "Purchase_Order_Num")
+    SELECT
+        x->>'Item_ID',
+        x->>'Material',
+        (x->>'Footage')::double precision,
+        x->>'Location',
+        'Active',
+        x->>'Category',
+        x->>'Purchase_Order_Num'
+    FROM jsonb_array_elements(p_items) AS x
+    ON CONFLICT ("Category", "Material") WHERE "Category" NOT IN ('Coils', 'Rolls')
+    DO UPDATE SET
+        "Footage" = inv."Footage" + EXCLUDED."Footage",
+        "Location" = EXCLUDED."Location"
+    RETURNING inv."Item_ID", inv."Material", inv."Category", inv."Footage"::double precision, (xmax = 0);
+$$;
@@ -0,0 +1,50 @@
+-- Per-prefix counters for sequential Item IDs (e.g. Coil-AL-016-STP-07).
+
+CREATE TABLE IF NOT EXISTS item_id_sequences (
+    prefix     text PRIMARY KEY,
+    last_value integer NOT NULL DEFAULT 0
+);
+
+-- Lets the prefix lookup below use an index instead of scanning inventory
+CREATE INDEX IF NOT EXISTS inventory_item_id_pattern_idx ON inventory ("Item_ID" text_pattern_ops);
+
+-- Reserves p_count numbers for p_prefix and returns the first one.
+-- The counter is raised to the highest numeric suffix in inventory on every call, so IDs added
+-- by other paths (bulk editor, imports, manual edits) never collide with the next reservation.
+CREATE OR REPLACE FUNCTION reserve_item_ids(p_prefix text, p_count integer)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_pattern text;
+    v_existing integer;
+    v_last integer;
+BEGIN
+    IF p_count < 1 THEN
+        RAISE EXCEPTION 'p_count must be positive, got %', p_count;
+    END IF;
+
+    INSERT INTO item_id_sequences (prefix, last_value)
+    VALUES (p_prefix, 0)
+    ON CONFLICT (prefix) DO NOTHING;
+
+    -- Lock the counter first so concurrent receivers on this prefix queue up behind
+    -- the suffix scan instead of racing it
+    PERFORM 1 FROM item_id_sequences WHERE prefix = p_prefix FOR UPDATE;
+
+    -- LIKE wildcards in the prefix are matched literally
+    v_pattern := replace(replace(replace(p_prefix, '\', '\\'), '%', '\%'), '_', '\_') || '-%';
+    SELECT COALESCE(MAX(substring("Item_ID" FROM length(p_prefix) + 2)::integer), 0)
+    INTO v_existing
+    FROM inventory
+    WHERE "Item_ID" LIKE v_pattern
+      AND substring("Item_ID" FROM length(p_prefix) + 2) ~ '^[0-9]+$';
+
+    UPDATE item_id_sequences
+    SET last_value = GREATEST(last_value, v_existing) + p_count
+    WHERE prefix = p_prefix
+    RETURNING last_value INTO v_last;
+
+    RETURN v_last - p_count + 1;
+END;
+$$;
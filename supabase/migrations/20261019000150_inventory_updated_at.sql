@@ -0,0 +1,22 @@
+-- inventory.updated_at lets the app version the loaded table by (row count, max updated_at)
+-- instead of hashing every row on each reload. Inserts take the default; every update,
+-- including upserts that hit ON CONFLICT and RPC writes, is restamped by the trigger.
+
+ALTER TABLE inventory ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+CREATE OR REPLACE FUNCTION touch_inventory_updated_at()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.updated_at := clock_timestamp();
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS inventory_touch_updated_at ON inventory;
+CREATE TRIGGER inventory_touch_updated_at
+    BEFORE UPDATE ON inventory
+    FOR EACH ROW EXECUTE FUNCTION touch_inventory_updated_at();
+
+CREATE INDEX IF NOT EXISTS inventory_updated_at_idx ON inventory (updated_at);
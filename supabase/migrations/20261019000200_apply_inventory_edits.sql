@@ -0,0 +1,49 @@
+-- Applies an Admin grid save (footage/location edits, ID renames, deletions and their audit rows)
+-- in one transaction. Deletes run before renames, and renames go through a temporary ID, so a
+-- rename may target an ID freed in the same batch (deleted or renamed away) and IDs can be swapped.
+
+CREATE OR REPLACE FUNCTION apply_inventory_edits(
+    p_updates jsonb,   -- [{"Item_ID", "Footage", "Location"}, ...] keyed by the current ID
+    p_renames jsonb,   -- [{"old_id", "new_id"}, ...]
+    p_deletes text[],
+    p_audit   jsonb    -- audit_log rows
+)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_changed integer := 0;
+    v_rows    integer;
+BEGIN
+    UPDATE inventory AS inv
+    SET "Footage"  = COALESCE(u."Footage", inv."Footage"),
+        "Location" = COALESCE(u."Location", inv."Location")
+    FROM jsonb_populate_recordset(NULL::inventory, p_updates) AS u
+    WHERE inv."Item_ID" = u."Item_ID";
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    v_changed := v_changed + v_rows;
+
+    DELETE FROM inventory WHERE "Item_ID" = ANY (p_deletes);
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    v_changed := v_changed + v_rows;
+
+    -- Park every renamed row first so no rename collides with an ID that is about to move
+    UPDATE inventory AS inv
+    SET "Item_ID" = '__renaming__:' || inv."Item_ID"
+    FROM jsonb_array_elements(p_renames) AS r
+    WHERE inv."Item_ID" = r->>'old_id';
+
+    UPDATE inventory AS inv
+    SET "Item_ID" = r->>'new_id'
+    FROM jsonb_array_elements(p_renames) AS r
+    WHERE inv."Item_ID" = '__renaming__:' || (r->>'old_id');
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    v_changed := v_changed + v_rows;
+
+    INSERT INTO audit_log ("Item_ID", "Action", "User", "Timestamp", "Details")
+    SELECT "Item_ID", "Action", "User", "Timestamp", "Details"
+    FROM jsonb_populate_recordset(NULL::audit_log, p_audit);
+
+    RETURN v_changed;
+END;
+$$;
@@ -0,0 +1,56 @@
+-- Daily movement rollup fed incrementally from audit_log by the app.
+-- Insights charts read this instead of scanning and parsing the whole audit log.
+
+CREATE TABLE IF NOT EXISTS movement_daily (
+    day         date             NOT NULL,
+    material    text             NOT NULL,
+    category    text             NOT NULL,
+    client      text             NOT NULL DEFAULT '',
+    action_type text             NOT NULL,
+    quantity    double precision NOT NULL DEFAULT 0,
+    events      integer          NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, material, category, client, action_type)
+);
+
+CREATE INDEX IF NOT EXISTS movement_daily_action_day_idx ON movement_daily (action_type, day);
+
+-- Single-row watermark: the highest audit_log id already folded into movement_daily.
+-- Timestamps are stamped by the app when an action is logged, so a row another process
+-- inserts late (spill replay after an outage, a slow batch) can carry a Timestamp older than
+-- rows already folded; ids are assigned at insert.
+CREATE TABLE IF NOT EXISTS movement_rollup_state (
+    id             integer PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    last_id        bigint,
+    last_timestamp timestamptz
+);
+INSERT INTO movement_rollup_state (id, last_id, last_timestamp) VALUES (1, NULL, NULL) ON CONFLICT (id) DO NOTHING;
+
+-- Adds p_rows onto movement_daily and moves the watermark from p_since_id to p_until_id.
+-- last_timestamp keeps the newest Timestamp folded so far.
+-- Returns false without writing if another session already advanced the watermark.
+CREATE OR REPLACE FUNCTION merge_movement_rollup(p_rows jsonb, p_since_id bigint, p_until_id bigint, p_until timestamptz)
+RETURNS boolean
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_current bigint;
+BEGIN
+    SELECT last_id INTO v_current FROM movement_rollup_state WHERE id = 1 FOR UPDATE;
+    IF v_current IS DISTINCT FROM p_since_id THEN
+        RETURN false;
+    END IF;
+
+    INSERT INTO movement_daily AS m (day, material, category, client, action_type, quantity, events)
+    SELECT day, material, category, client, action_type, quantity, events
+    FROM jsonb_populate_recordset(NULL::movement_daily, p_rows)
+    ON CONFLICT (day, material, category, client, action_type)
+    DO UPDATE SET quantity = m.quantity + EXCLUDED.quantity,
+                  events   = m.events + EXCLUDED.events;
+
+    UPDATE movement_rollup_state
+    SET last_id = p_until_id,
+        last_timestamp = GREATEST(last_timestamp, p_until)
+    WHERE id = 1;
+    RETURN true;
+END;
+$$;
@@ -0,0 +1,55 @@
+-- Daily closing stock per material, written by the app whenever it loads new inventory data.
+-- Together with the signed deltas in movement_daily this answers "stock as of day X"
+-- from one snapshot plus a few days of replay instead of the whole audit log.
+
+CREATE TABLE IF NOT EXISTS inventory_snapshots (
+    day        date             NOT NULL,
+    material   text             NOT NULL,
+    category   text             NOT NULL,
+    footage    double precision NOT NULL DEFAULT 0,
+    item_count integer          NOT NULL DEFAULT 0,
+    taken_at   timestamptz      NOT NULL DEFAULT now(),
+    PRIMARY KEY (day, category, material)
+);
+
+-- Trend lookups for one material across days
+CREATE INDEX IF NOT EXISTS inventory_snapshots_material_day_idx ON inventory_snapshots (category, material, day);
+
+-- Stock per material at the close of p_day.
+-- Starts from the nearest snapshot on or before p_day and adds the movements after it;
+-- for days older than the first snapshot, walks back from the earliest one instead.
+-- A material missing from a snapshot had no stock that day.
+CREATE OR REPLACE FUNCTION inventory_as_of(p_day date)
+RETURNS TABLE (material text, category text, footage double precision, snapshot_day date)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_base date;
+    v_sign integer := 1;
+BEGIN
+    SELECT max(s.day) INTO v_base FROM inventory_snapshots s WHERE s.day <= p_day;
+    IF v_base IS NULL THEN
+        SELECT min(s.day) INTO v_base FROM inventory_snapshots s WHERE s.day > p_day;
+        v_sign := -1;
+    END IF;
+    IF v_base IS NULL THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    SELECT t.material, t.category, sum(t.footage)::double precision, v_base
+    FROM (
+        SELECT s.material, s.category, s.footage
+        FROM inventory_snapshots s
+        WHERE s.day = v_base
+        UNION ALL
+        SELECT m.material, m.category,
+               v_sign * CASE WHEN m.action_type = 'Received' THEN m.quantity ELSE -m.quantity END
+        FROM movement_daily m
+        WHERE m.day > least(v_base, p_day)
+          AND m.day <= greatest(v_base, p_day)
+    ) t
+    GROUP BY t.material, t.category;
+END;
+$$;
@@ -0,0 +1,32 @@
+-- Indexed search for the Audit Trail tab.
+-- The app pages through audit_log with keyset pagination on ("Timestamp", id) and
+-- matches free text against a stored tsvector instead of downloading the whole log.
+
+-- Tie-breaker for rows sharing a Timestamp (no-op if the table already has an id)
+ALTER TABLE audit_log ADD COLUMN IF NOT EXISTS id bigserial;
+
+-- 'simple' keeps order numbers, Item IDs and names as typed (no stemming or stop words)
+ALTER TABLE audit_log ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple',
+            coalesce("Item_ID", '') || ' ' ||
+            coalesce("Action", '')  || ' ' ||
+            coalesce("User", '')    || ' ' ||
+            coalesce("Details", ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS audit_log_search_idx ON audit_log USING gin (search_vector);
+CREATE INDEX IF NOT EXISTS audit_log_timestamp_id_idx ON audit_log ("Timestamp" DESC, id DESC);
+CREATE INDEX IF NOT EXISTS audit_log_action_idx ON audit_log ("Action");
+CREATE INDEX IF NOT EXISTS audit_log_user_idx ON audit_log ("User");
+
+-- Distinct actions and users for the filter dropdowns
+CREATE OR REPLACE FUNCTION audit_log_facets()
+RETURNS TABLE (kind text, value text)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT DISTINCT 'action', "Action" FROM audit_log WHERE "Action" IS NOT NULL
+    UNION ALL
+    SELECT DISTINCT 'user', "User" FROM audit_log WHERE "User" IS NOT NULL;
+$$;
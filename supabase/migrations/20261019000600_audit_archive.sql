@@ -0,0 +1,23 @@
+-- Cold storage for old audit_log rows.
+-- The app moves rows older than the hot window into monthly Parquet files in the
+-- audit-archive Storage bucket and records each file here; audit_log keeps recent activity only.
+
+INSERT INTO storage.buckets (id, name, public)
+VALUES ('audit-archive', 'audit-archive', false)
+ON CONFLICT (id) DO NOTHING;
+
+CREATE TABLE IF NOT EXISTS audit_archive_partitions (
+    month         date        PRIMARY KEY,  -- first day of the month
+    path          text        NOT NULL,
+    row_count     integer     NOT NULL DEFAULT 0,
+    min_timestamp timestamptz,
+    max_timestamp timestamptz,
+    archived_at   timestamptz NOT NULL DEFAULT now()
+);
+
+-- Single-row boundary: every audit row older than archived_before lives in a partition
+CREATE TABLE IF NOT EXISTS audit_archive_state (
+    id              integer PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    archived_before timestamptz
+);
+INSERT INTO audit_archive_state (id, archived_before) VALUES (1, NULL) ON CONFLICT (id) DO NOTHING;
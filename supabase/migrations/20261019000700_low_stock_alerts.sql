@@ -0,0 +1,74 @@
+-- State for the low-stock alert engine.
+-- One row per tracked material: whether an alert is outstanding for the current dip
+-- and when the last email went out, so restarts do not re-send and the cool-down holds.
+-- Every app process runs its own alert engine, so the fire decision is made here, under a
+-- row lock, by claim_low_stock_alerts; each dip is claimed by exactly one process.
+
+CREATE TABLE IF NOT EXISTS low_stock_alert_state (
+    material      text             PRIMARY KEY,
+    alerting      boolean          NOT NULL DEFAULT false,
+    last_total    double precision,
+    last_alert_at timestamptz,
+    updated_at    timestamptz      NOT NULL DEFAULT now()
+);
+
+-- Stock per material summed in the database, so a scheduled check reads one row per material
+CREATE OR REPLACE FUNCTION material_stock_totals(p_materials text[])
+RETURNS TABLE (material text, footage double precision)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT i."Material", coalesce(sum(i."Footage"), 0)::double precision
+    FROM inventory i
+    WHERE i."Material" = ANY(p_materials)
+    GROUP BY i."Material";
+$$;
+
+-- Applies the hysteresis and cool-down rules to the current totals and marks the materials
+-- that alert now. The state rows are locked for the whole decision, so concurrent callers see
+-- each other's claims and only one of them gets fired = true for a material.
+-- previous_alert_at lets a caller that could not queue the email hand the claim back.
+CREATE OR REPLACE FUNCTION claim_low_stock_alerts(
+    p_totals    jsonb,              -- [{"material", "total", "threshold"}, ...]
+    p_rearm_pct double precision,
+    p_cooldown  interval
+)
+RETURNS TABLE (material text, alerting boolean, fired boolean, previous_alert_at timestamptz)
+LANGUAGE sql
+AS $$
+    INSERT INTO low_stock_alert_state (material)
+    SELECT t.material FROM jsonb_to_recordset(p_totals) AS t(material text)
+    ON CONFLICT (material) DO NOTHING;
+
+    WITH input AS (
+        SELECT t.material, t.total, t.threshold
+        FROM jsonb_to_recordset(p_totals) AS t(material text, total double precision, threshold double precision)
+    ),
+    locked AS (
+        SELECT s.material, s.alerting, s.last_alert_at
+        FROM low_stock_alert_state s
+        WHERE s.material IN (SELECT i.material FROM input i)
+        ORDER BY s.material
+        FOR UPDATE
+    ),
+    decided AS (
+        SELECT i.material, i.total, l.last_alert_at,
+               i.total < i.threshold AS low,
+               -- Re-armed once stock is comfortably back above the line
+               l.alerting AND i.total < i.threshold * (1 + p_rearm_pct / 100) AS still_alerting
+        FROM input i JOIN locked l ON l.material = i.material
+    ),
+    fire AS (
+        SELECT d.*, d.low AND NOT d.still_alerting
+                    AND (d.last_alert_at IS NULL OR now() - d.last_alert_at >= p_cooldown) AS fired
+        FROM decided d
+    )
+    UPDATE low_stock_alert_state s
+    SET alerting      = f.still_alerting OR f.fired,
+        last_total    = f.total,
+        last_alert_at = CASE WHEN f.fired THEN now() ELSE f.last_alert_at END,
+        updated_at    = now()
+    FROM fire f
+    WHERE s.material = f.material
+    RETURNING s.material, s.alerting, f.fired, f.last_alert_at;
+$$;
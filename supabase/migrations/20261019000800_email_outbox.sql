@@ -0,0 +1,43 @@
+-- Outbound email queue shared by production, receipt and low-stock mail.
+-- The app stores the complete MIME message (attachments included) and a background
+-- worker delivers it, so a failed email can be re-sent without rebuilding its PDF.
+
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id              bigserial   PRIMARY KEY,
+    kind            text        NOT NULL,
+    recipient       text        NOT NULL,
+    subject         text        NOT NULL,
+    message         text        NOT NULL,               -- RFC 5322 message as sent
+    status          text        NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'sending', 'sent', 'failed')),
+    attempts        integer     NOT NULL DEFAULT 0,
+    next_attempt_at timestamptz NOT NULL DEFAULT now(),
+    locked_until    timestamptz,
+    last_error      text,
+    created_at      timestamptz NOT NULL DEFAULT now(),
+    sent_at         timestamptz
+);
+
+CREATE INDEX IF NOT EXISTS email_outbox_due_idx ON email_outbox (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS email_outbox_created_idx ON email_outbox (created_at DESC);
+
+-- Lease up to p_limit due messages to one worker.
+-- SKIP LOCKED keeps concurrent app instances from claiming the same rows; a lease that
+-- runs out (worker died mid-send) makes the row claimable again.
+CREATE OR REPLACE FUNCTION claim_email_outbox(p_limit integer DEFAULT 20, p_lease_seconds integer DEFAULT 300)
+RETURNS SETOF email_outbox
+LANGUAGE sql
+AS $$
+    UPDATE email_outbox o
+    SET status = 'sending',
+        attempts = o.attempts + 1,
+        locked_until = now() + make_interval(secs => p_lease_seconds)
+    WHERE o.id IN (
+        SELECT id FROM email_outbox
+        WHERE (status = 'queued' AND next_attempt_at <= now())
+           OR (status = 'sending' AND locked_until < now())
+        ORDER BY id
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING o.*;
+$$;
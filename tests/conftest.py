@@ -0,0 +1,109 @@
+"""
+Test setup shared by every module.
+
+The app's modules read st.secrets and build the Supabase client at import time, so
+throwaway secrets and an in-memory MemorySupabase (benchmarks/synthetic.py) are put in
+place before anything under warehouse_pulse is imported. Outgoing mail goes to a local
+SMTP sink that keeps every message it receives.
+"""
+import email
+import os
+import socketserver
+import sys
+import tempfile
+import threading
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import MemorySupabase  # noqa: E402
+
+WORKDIR = tempfile.mkdtemp(prefix="wp-tests-")
+DB = MemorySupabase()
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """Minimal SMTP server on localhost that accepts everything (no STARTTLS, no AUTH)."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.messages = []
+        threading.Thread(target=self.serve_forever, name="smtp-sink", daemon=True).start()
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def _reply(self, text):
+        self.wfile.write(text.encode() + b"\r\n")
+
+    def handle(self):
+        self._reply("220 sink ESMTP")
+        data = None
+        for line in self.rfile:
+            if data is not None:
+                if line.rstrip(b"\r\n") == b".":
+                    self.server.messages.append(email.message_from_bytes(b"".join(data)))
+                    data = None
+                    self._reply("250 OK")
+                else:
+                    data.append(line[1:] if line.startswith(b"..") else line)
+                continue
+            verb = line[:4].upper()
+            if verb == b"EHLO":
+                self._reply("250-sink\r\n250 8BITMIME")
+            elif verb == b"DATA":
+                data = []
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+            elif verb == b"QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("250 OK")
+
+
+SMTP = SMTPSink()
+
+
+def _configure_app():
+    secrets = os.path.join(WORKDIR, "secrets.toml")
+    with open(secrets, "w") as f:
+        f.write('SUPABASE_URL = "memory://tests"\n')
+        f.write('SUPABASE_KEY = "tests"\n')
+        f.write(f'AUDIT_SPILL_PATH = {_toml(os.path.join(WORKDIR, "audit_spill.jsonl"))}\n')
+        f.write(f'PROFILE_DIR = {_toml(os.path.join(WORKDIR, "profiles"))}\n')
+        f.write("[email]\n")
+        f.write(f'smtp_server = "127.0.0.1"\nsmtp_port = {SMTP.server_address[1]}\n')
+        f.write('sender_email = "pulse@example.test"\nadmin_email = "admin@example.test"\n')
+
+    from streamlit import config, logger
+    config.set_option("secrets.files", [secrets])
+    logger.set_log_level("error")
+
+    import supabase
+    supabase.create_client = lambda *args, **kwargs: DB
+
+
+def _toml(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+_configure_app()
+
+
+@pytest.fixture
+def db():
+    """The shared in-memory Supabase, emptied before each test."""
+    with DB.lock:
+        DB.tables.clear()
+        DB.sorted_by.clear()
+    return DB
+
+
+@pytest.fixture
+def smtp():
+    """The local SMTP sink, emptied before each test."""
+    SMTP.messages.clear()
+    return SMTP
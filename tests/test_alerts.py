@@ -0,0 +1,111 @@
+import time
+
+import pandas as pd
+import pytest
+
+from warehouse_pulse.alerts import LowStockAlertEngine, check_and_alert_low_stock
+from warehouse_pulse.catalog import LOW_STOCK_THRESHOLDS
+from warehouse_pulse.mail import email_outbox
+
+OUTBOX_COLUMNS = ["id", "kind", "recipient", "subject", "message", "status", "attempts",
+                  "next_attempt_at", "locked_until", "last_error", "created_at", "sent_at"]
+
+
+def _claim_email_outbox(db, params):
+    """claim_email_outbox without leases: every queued row, marked as sending."""
+    # Inserting into an empty MemorySupabase table keeps only the inserted columns
+    outbox = db.tables["email_outbox"] = db.tables["email_outbox"].reindex(columns=OUTBOX_COLUMNS).astype(object)
+    due = outbox.index[outbox["status"].isna() | (outbox["status"] == "queued")][:params["p_limit"]]
+    outbox.loc[due, "status"] = "sending"
+    outbox.loc[due, "attempts"] = outbox.loc[due, "attempts"].fillna(0) + 1
+    return outbox.loc[due].astype(object).where(outbox.loc[due].notna(), None).to_dict("records")
+
+
+def _claim_low_stock_alerts(db, params):
+    """claim_low_stock_alerts: the hysteresis and cool-down rules applied under the db lock."""
+    with db.lock:
+        state = db.tables["low_stock_alert_state"].set_index("material")
+        now = pd.Timestamp.now(tz="UTC")
+        cooldown = pd.Timedelta(params["p_cooldown"])
+        result = []
+        for row in params["p_totals"]:
+            material, total, threshold = row["material"], row["total"], row["threshold"]
+            alerting, last_alert = (state.at[material, "alerting"], state.at[material, "last_alert_at"]) \
+                if material in state.index else (False, None)
+            still_alerting = bool(alerting) and total < threshold * (1 + params["p_rearm_pct"] / 100)
+            fired = total < threshold and not still_alerting and (last_alert is None or now - last_alert >= cooldown)
+            state.loc[material, ["alerting", "last_alert_at"]] = [still_alerting or fired, now if fired else last_alert]
+            result.append({"material": material, "alerting": still_alerting or fired, "fired": fired, "previous_alert_at": last_alert})
+        db.tables["low_stock_alert_state"] = state.reset_index()
+        return result
+
+
+@pytest.fixture
+def alert_db(db):
+    db.load("low_stock_alert_state", pd.DataFrame({"material": pd.Series(dtype=object), "alerting": pd.Series(dtype=object),
+                                                   "last_alert_at": pd.Series(dtype=object)}))
+    db.load("email_outbox", pd.DataFrame({c: pd.Series(dtype="int64" if c == "id" else object) for c in OUTBOX_COLUMNS}))
+    db.rpcs["claim_email_outbox"] = _claim_email_outbox
+    db.rpcs["claim_low_stock_alerts"] = _claim_low_stock_alerts
+    return db
+
+
+def test_low_stock_emails_once_within_cooldown(alert_db, smtp):
+    db = alert_db
+
+    material, threshold = next(iter(LOW_STOCK_THRESHOLDS.items()))
+    inventory = pd.DataFrame({"Item_ID": ["Coil-1"], "Material": [material], "Footage": [threshold / 2]})
+
+    check_and_alert_low_stock(inventory)
+    check_and_alert_low_stock(inventory)
+    email_outbox.deliver_due()
+
+    deadline = time.monotonic() + 10
+    while set(db.tables["email_outbox"]["status"]) != {"sent"} and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert len(db.tables["email_outbox"]) == 1
+    assert len(smtp.messages) == 1
+    message = smtp.messages[0]
+    assert message["To"] == "admin@example.test"
+    assert message["Subject"] == "URGENT: Low Stock Alert - MJP Pulse"
+    assert material in message.get_payload()[0].get_payload()
+
+
+def _engine(db, outbox, material, threshold):
+    engine = LowStockAlertEngine(db, outbox, {material: threshold}, "pulse@example.test", "admin@example.test",
+                                 interval_minutes=60)
+    # The startup check fails (no material_stock_totals here); let it finish before the test's own runs
+    deadline = time.monotonic() + 10
+    while engine.stats["errors"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    return engine
+
+
+def test_engines_in_other_processes_share_the_claim(alert_db):
+    material, threshold = next(iter(LOW_STOCK_THRESHOLDS.items()))
+    inventory = pd.DataFrame({"Item_ID": ["Coil-1"], "Material": [material], "Footage": [threshold / 2]})
+    # One engine per app process, each started before any alert was sent
+    engines = [_engine(alert_db, email_outbox, material, threshold) for _ in range(2)]
+
+    alerted = [bool(engine.run_once(inventory)["Alerted"].any()) for engine in engines]
+
+    assert sorted(alerted) == [False, True]
+    assert len(alert_db.tables["email_outbox"]) == 1
+
+
+def test_failed_enqueue_hands_the_claim_back(alert_db):
+    material, threshold = next(iter(LOW_STOCK_THRESHOLDS.items()))
+    inventory = pd.DataFrame({"Item_ID": ["Coil-1"], "Material": [material], "Footage": [threshold / 2]})
+
+    class BrokenOutbox:
+        def enqueue(self, msg, kind):
+            raise ConnectionError("outbox unavailable")
+
+    broken = _engine(alert_db, BrokenOutbox(), material, threshold)
+    assert not broken.run_once(inventory)["Alerted"].any()
+    assert broken.last_error == "outbox unavailable" and broken.stats["errors"] == 2
+
+    retry = _engine(alert_db, email_outbox, material, threshold)
+    assert retry.run_once(inventory)["Alerted"].all()
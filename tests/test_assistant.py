@@ -0,0 +1,137 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openai
+import pytest
+
+from warehouse_pulse.domain.assistant import _ai_response_cache, stream_ai_answer
+
+
+class FakeChatServer(ThreadingHTTPServer):
+    """Local OpenAI-compatible /chat/completions endpoint replaying scripted replies."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.replies = []
+        self.requests = []
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        status, payload = self.server.replies.pop(0)
+
+        if isinstance(payload, list):
+            # Server-sent events, one content delta per chunk
+            self.send_response(status)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for i, text in enumerate(payload):
+                chunk = {"id": "chatcmpl-1", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+                         "choices": [{"index": 0, "delta": {"role": "assistant", "content": text} if i == 0 else {"content": text},
+                                      "finish_reason": None}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+            return
+
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _completion(content=None, tool_calls=None):
+    message = {"role": "assistant", "content": content}
+    if tool_calls:
+        message["tool_calls"] = [
+            {"id": f"call_{i}", "type": "function", "function": {"name": name, "arguments": json.dumps(args)}}
+            for i, (name, args) in enumerate(tool_calls)
+        ]
+    return {"id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "grok-beta",
+            "choices": [{"index": 0, "message": message, "finish_reason": "tool_calls" if tool_calls else "stop"}]}
+
+
+@pytest.fixture
+def server():
+    srv = FakeChatServer()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    _ai_response_cache().clear()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def client(server):
+    return openai.OpenAI(api_key="xai-test", base_url=server.base_url, max_retries=0)
+
+
+def test_tool_round_trip_streams_answer_and_caches_it(server, client):
+    server.replies = [
+        (200, _completion(tool_calls=[("stock_by_material", {"material": ".016 Stucco", "category": "Coils"})])),
+        (200, ["You have ", "1,200 ft ", "of .016 Stucco."]),
+    ]
+    calls = []
+
+    def run_tool(name, args):
+        calls.append((name, args))
+        return {"rows": [{"Material": ".016 Stucco Aluminum", "Total": 1200.0}], "total_rows": 1}
+
+    chunks = list(stream_ai_answer(client, "How much .016 Stucco?", 1, run_tool))
+
+    assert chunks == ["You have ", "1,200 ft ", "of .016 Stucco."]
+    assert calls == [("stock_by_material", {"material": ".016 Stucco", "category": "Coils"})]
+
+    plan, phrasing = server.requests
+    assert plan["tools"] and "stream" not in plan
+    assert phrasing["stream"] is True
+    assistant, tool = phrasing["messages"][-2:]
+    assert assistant["tool_calls"][0]["function"]["name"] == "stock_by_material"
+    assert tool["tool_call_id"] == "call_0"
+    assert json.loads(tool["content"])["rows"][0]["Total"] == 1200.0
+
+    # Same question, differently spaced, on the same data: served from cache
+    assert list(stream_ai_answer(client, "  how much .016   stucco? ", 1, run_tool)) == ["".join(chunks)]
+    assert len(server.requests) == 2 and len(calls) == 1
+
+    # New data version asks again
+    server.replies = [(200, _completion(content="Now 900 ft."))]
+    assert list(stream_ai_answer(client, "How much .016 Stucco?", 2, run_tool)) == ["Now 900 ft."]
+    assert len(server.requests) == 3
+
+
+def test_tool_failure_is_reported_to_the_model(server, client):
+    server.replies = [
+        (200, _completion(tool_calls=[("po_summary", {"po_number": "4410"})])),
+        (200, ["PO 4410 could not be looked up."]),
+    ]
+
+    def run_tool(name, args):
+        raise KeyError("Purchase_Order_Num")
+
+    assert "".join(stream_ai_answer(client, "What came in on PO 4410?", 1, run_tool)) == "PO 4410 could not be looked up."
+    tool = server.requests[1]["messages"][-1]
+    assert json.loads(tool["content"]) == {"error": "'Purchase_Order_Num'"}
+
+
+def test_endpoint_error_propagates_and_is_not_cached(server, client):
+    server.replies = [(503, {"error": {"message": "overloaded", "type": "server_error"}})]
+
+    with pytest.raises(openai.InternalServerError):
+        list(stream_ai_answer(client, "Which coils are low?", 1, lambda name, args: {}))
+    assert len(_ai_response_cache()) == 0
+
+    server.replies = [(200, _completion(content="None are low."))]
+    assert list(stream_ai_answer(client, "Which coils are low?", 1, lambda name, args: {})) == ["None are low."]
@@ -0,0 +1,62 @@
+import io
+
+import pandas as pd
+
+from warehouse_pulse.data.audit_log import AUDIT_ARCHIVE_BUCKET, archive_audit_log, audit_partition_path, query_audit_log
+
+
+def test_archive_deletes_only_archived_folded_rows(db):
+    db.storage.buckets.clear()
+    db.load("audit_log", pd.DataFrame({
+        "id": [1, 2, 3, 4, 5],
+        "Item_ID": ["Coil-1", "Coil-2", "Coil-3", "Coil-4", "Coil-5"],
+        "Action": ["Stock Pick - Coils"] * 5,
+        "User": ["Dana"] * 5,
+        # id 4 landed late (spill replay) in an old month; id 5 is inside the hot window
+        "Timestamp": ["2025-01-03T08:00:00+00:00", "2025-01-20T09:00:00+00:00", "2025-02-02T10:00:00+00:00",
+                      "2025-01-25T11:00:00+00:00", pd.Timestamp.now(tz="UTC").isoformat()],
+        "Details": ["Picked 10 ft"] * 5,
+    }))
+    db.load("movement_rollup_state", pd.DataFrame({"id": [1], "last_id": [3], "last_timestamp": ["2025-02-02T10:00:00+00:00"]}))
+    db.load("audit_archive_state", pd.DataFrame({"id": [1], "archived_before": [None]}))
+    db.load("audit_archive_partitions", pd.DataFrame(columns=["month", "path", "row_count", "min_timestamp", "max_timestamp", "archived_at"]))
+
+    assert archive_audit_log(hot_days=30, delete_chunk=1) == 3
+    assert sorted(db.tables["audit_log"]["id"]) == [4, 5]
+
+    january = pd.read_parquet(io.BytesIO(db.storage.from_(AUDIT_ARCHIVE_BUCKET).download(
+        audit_partition_path(pd.Timestamp("2025-01-01")))))
+    assert list(january["id"]) == [1, 2]
+
+    # Once the rollup folds the late row, the next run merges it into January
+    db.tables["movement_rollup_state"].loc[0, "last_id"] = 4
+    assert archive_audit_log(hot_days=30) == 1
+    assert list(db.tables["audit_log"]["id"]) == [5]
+    january = pd.read_parquet(io.BytesIO(db.storage.from_(AUDIT_ARCHIVE_BUCKET).download(
+        audit_partition_path(pd.Timestamp("2025-01-01")))))
+    assert list(january["id"]) == [1, 2, 4]
+
+
+def test_rows_left_hot_before_the_boundary_are_still_queried(db):
+    db.storage.buckets.clear()
+    db.load("audit_log", pd.DataFrame({
+        "id": [1, 2, 3],
+        "Item_ID": ["Coil-1", "Coil-2", "Coil-3"],
+        "Action": ["Stock Pick - Coils"] * 3,
+        "User": ["Dana"] * 3,
+        "Timestamp": ["2025-01-03T08:00:00+00:00", "2025-01-20T09:00:00+00:00", "2025-01-25T11:00:00+00:00"],
+        "Details": ["Picked 10 ft"] * 3,
+    }))
+    # The rollup has only folded id 1, so ids 2 and 3 stay hot although they are past the cutoff
+    db.load("movement_rollup_state", pd.DataFrame({"id": [1], "last_id": [1], "last_timestamp": ["2025-01-03T08:00:00+00:00"]}))
+    db.load("audit_archive_state", pd.DataFrame({"id": [1], "archived_before": [None]}))
+    db.load("audit_archive_partitions", pd.DataFrame(columns=["month", "path", "row_count", "min_timestamp", "max_timestamp", "archived_at"]))
+    hot_before = db.tables["audit_log"].copy()
+
+    assert archive_audit_log(hot_days=30) == 1
+
+    january = query_audit_log(pd.Timestamp("2025-01-01").date(), pd.Timestamp("2025-01-31").date())
+    assert list(january["id"]) == [1, 2, 3]
+    # A session still holding the pre-archive hot rows sees each row once
+    stale = query_audit_log(pd.Timestamp("2025-01-01").date(), None, hot_df=hot_before)
+    assert list(stale["id"]) == [1, 2, 3]
@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+import time
+
+from postgrest.exceptions import APIError
+
+from conftest import WORKDIR
+from warehouse_pulse.data.audit_writer import AuditWriter
+
+
+class FlakyClient:
+    """audit_log inserts that raise the scripted errors first (None lets a call through), then succeed."""
+
+    def __init__(self, errors=(), reject=()):
+        self.errors = list(errors)
+        self.reject = set(reject)
+        self.stored = []
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def table(self, name):
+        return self
+
+    def insert(self, rows):
+        self._rows = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def execute(self):
+        with self.lock:
+            self.calls += 1
+            error = self.errors.pop(0) if self.errors else None
+            if error is not None:
+                raise error
+            bad = [r for r in self._rows if r["Item_ID"] in self.reject]
+            if bad:
+                raise APIError({"code": "23502", "message": "null value in column \"User\""})
+            self.stored.extend(self._rows)
+
+
+def _writer(client, name):
+    return AuditWriter(client, os.path.join(WORKDIR, f"{name}.jsonl"), flush_interval=0.05)
+
+
+def test_transient_errors_keep_rows_and_retry():
+    client = FlakyClient(errors=[APIError({"code": 503, "message": "JSON could not be generated"}),
+                                 APIError({"code": "PGRST301", "message": "JWT expired"})])
+    writer = _writer(client, "transient")
+
+    writer.log([{"Item_ID": "Coil-1", "Action": "Stock Pick - Coils"}, {"Item_ID": "Coil-2", "Action": "Stock Pick - Coils"}])
+
+    assert writer.flush(timeout=10)
+    assert [r["Item_ID"] for r in client.stored] == ["Coil-1", "Coil-2"]
+    assert writer.stats["rejected"] == 0 and writer.stats["retries"] == 2
+    assert not os.path.exists(writer.dead_letter_path)
+
+
+def test_data_errors_set_aside_only_the_bad_rows():
+    client = FlakyClient(errors=[APIError({"code": "23502"}), None, None,
+                                 APIError({"code": "429", "message": "Too Many Requests"})],
+                         reject={"Coil-2"})
+    writer = _writer(client, "data")
+
+    writer.log([{"Item_ID": f"Coil-{i}", "Action": "Stock Pick - Coils"} for i in (1, 2, 3)])
+
+    assert writer.flush(timeout=10)
+    # Batch refused, Coil-2 refused on its own, Coil-3 rate-limited once: only Coil-2 is bad data
+    assert sorted(r["Item_ID"] for r in client.stored) == ["Coil-1", "Coil-3"]
+    assert writer.stats["rejected"] == 1
+    with open(writer.dead_letter_path, encoding="utf-8") as dead:
+        assert [json.loads(line)["entry"]["Item_ID"] for line in dead] == ["Coil-2"]
+
+
+def test_spill_files_are_per_process_and_orphans_are_taken_over():
+    from warehouse_pulse.data.audit_writer import _try_lock
+
+    base = os.path.join(WORKDIR, "shared.jsonl")
+    orphan, live = os.path.join(WORKDIR, "shared.999990.jsonl"), os.path.join(WORKDIR, "shared.999991.jsonl")
+    for path, item_id in ((orphan, "Coil-1"), (live, "Coil-2")):
+        with open(path, "w", encoding="utf-8") as spill:
+            spill.write(json.dumps({"seq": 1, "entry": {"Item_ID": item_id, "Action": "Stock Pick - Coils"}}) + "\n")
+    holder = open(live, "r+", encoding="utf-8")
+    assert _try_lock(holder)
+
+    client = FlakyClient()
+    writer = AuditWriter(client, base, flush_interval=0.05)
+    assert writer.flush(timeout=10)
+
+    assert writer.spill_path == os.path.join(WORKDIR, f"shared.{os.getpid()}.jsonl")
+    assert [r["Item_ID"] for r in client.stored] == ["Coil-1"]
+    assert not os.path.exists(orphan)
+    # Another process's file is neither sent nor truncated when this writer drains
+    with open(live, encoding="utf-8") as spill:
+        assert "Coil-2" in spill.read()
+    holder.close()
+
+
+def test_flush_with_timeout_leaves_unsent_entries_readable():
+    client = FlakyClient(errors=[APIError({"code": 503, "message": "JSON could not be generated"})] * 100)
+    writer = _writer(client, "slow")
+    writer.log({"Item_ID": "Coil-1", "Action": "Stock Pick - Coils"})
+
+    started = time.monotonic()
+    assert not writer.flush(timeout=0.2)
+    assert time.monotonic() - started < 1
+    assert [e["Item_ID"] for e in writer.unsent_entries()] == ["Coil-1"]
+    assert writer.unsent_entries()[0]["Timestamp"]
+
+    with client.lock:
+        client.errors.clear()
+    assert writer.flush(timeout=10)
+    assert writer.unsent_entries() == [] and writer.pending == 0
@@ -0,0 +1,55 @@
+import pandas as pd
+
+from warehouse_pulse.domain.bulk_edit import BULK_EDIT_COLUMNS, diff_inventory_edits
+
+INVENTORY = pd.DataFrame({
+    "Item_ID": ["Coil-1", "Coil-2", "Coil-3", "Coil-4"],
+    "Category": ["Coils"] * 4,
+    "Material": [".016 Stucco Aluminum"] * 4,
+    "Footage": [500.0, 400.0, 300.0, 200.0],
+    "Location": ["Rack A-1"] * 4,
+    "Status": ["Active"] * 4,
+})
+
+
+def _grid(inventory):
+    grid = inventory[BULK_EDIT_COLUMNS].set_index("Item_ID", drop=False)
+    grid.index.name = None
+    grid.insert(0, "Delete", False)
+    return grid
+
+
+def _diff(edit):
+    grid = _grid(INVENTORY)
+    edited = grid.copy()
+    edit(edited)
+    return diff_inventory_edits(grid, edited, INVENTORY["Item_ID"])
+
+
+def test_renames_are_checked_against_the_final_ids():
+    def swap_and_reuse(edited):
+        edited.loc["Coil-1", "Item_ID"] = "Coil-2"
+        edited.loc["Coil-2", "Item_ID"] = "Coil-1"
+        edited.loc["Coil-3", "Delete"] = True
+        edited.loc["Coil-4", "Item_ID"] = "Coil-3"
+
+    changes = _diff(swap_and_reuse)
+    assert changes["errors"] == []
+    assert changes["renames"] == [{"old_id": "Coil-1", "new_id": "Coil-2"}, {"old_id": "Coil-2", "new_id": "Coil-1"},
+                                  {"old_id": "Coil-4", "new_id": "Coil-3"}]
+    assert changes["deletes"] == ["Coil-3"]
+
+    def onto_kept_row(edited):
+        edited.loc["Coil-4", "Item_ID"] = "Coil-3"
+
+    assert "Item IDs already exist: ['Coil-3']" in _diff(onto_kept_row)["errors"]
+
+
+def test_duplicate_ids_are_reported_instead_of_diffed():
+    inventory = pd.concat([INVENTORY, INVENTORY.iloc[[1]]], ignore_index=True)
+    grid = _grid(inventory)
+
+    changes = diff_inventory_edits(grid, grid.copy(), inventory["Item_ID"])
+
+    assert changes["updates"] == changes["renames"] == changes["deletes"] == []
+    assert len(changes["errors"]) == 1 and "['Coil-2']" in changes["errors"][0]
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from warehouse_pulse.domain.forecasting import fit_demand_models
+
+DAYS = 730
+
+
+def test_new_steady_material_is_not_intermittent():
+    # Drawn 10/day, but only for the last 160 days of the window
+    matrix = np.zeros((2, DAYS))
+    matrix[0, DAYS - 160:] = 10
+    matrix[1, :] = 10
+
+    fit = fit_demand_models(matrix)
+
+    assert not fit["intermittent"].any()
+    np.testing.assert_allclose(fit["rate"], [10.0, 10.0], rtol=0.01)
+
+
+def test_intermittent_series_measured_from_first_demand():
+    # Every fifth day, from day 0 and from day 400: same pattern, same forecast
+    matrix = np.zeros((2, DAYS))
+    matrix[0, ::5] = 10
+    matrix[1, 400::5] = 10
+
+    fit = fit_demand_models(matrix)
+
+    assert fit["intermittent"].all()
+    # SBA: 0.95 * size / interval = 0.95 * 10 / 5
+    np.testing.assert_allclose(fit["rate"], [1.9, 1.9], rtol=0.02)
+
+
+def test_series_without_demand_forecasts_zero():
+    fit = fit_demand_models(np.zeros((1, DAYS)))
+
+    assert fit["rate"][0] == 0.0
+    assert fit["sigma"][0] == 0.0
+
+
+def test_forecast_reads_the_rollup_and_keys_stock_by_category(db):
+    from warehouse_pulse.data.movements import APP_TIMEZONE
+    from warehouse_pulse.domain.forecasting import forecast_reorder_points
+
+    days = pd.date_range(end=pd.Timestamp.now(tz=APP_TIMEZONE).normalize().tz_localize(None), periods=60).strftime("%Y-%m-%d")
+    db.load("movement_daily", pd.DataFrame({
+        "day": list(days) * 2,
+        "material": ["Wire"] * 120,
+        "category": ["Wire"] * 60 + ["Other"] * 60,
+        "client": [""] * 120,
+        "action_type": ["Pick"] * 120,
+        "quantity": [10.0] * 60 + [2.0] * 60,
+        "events": [1] * 120,
+    }))
+    inventory = pd.DataFrame({
+        "Item_ID": ["W-1", "O-1"], "Material": ["Wire", "Wire"], "Category": ["Wire", "Other"], "Footage": [100.0, 40.0],
+    })
+
+    forecast = forecast_reorder_points("rollup-v1", inventory).set_index("Category")
+
+    assert forecast.loc["Wire", "On_Hand"] == 100.0 and forecast.loc["Other", "On_Hand"] == 40.0
+    np.testing.assert_allclose(forecast["Days_Of_Cover"].loc[["Wire", "Other"]], [10.0, 20.0], rtol=0.01)
@@ -0,0 +1,41 @@
+import pandas as pd
+
+from warehouse_pulse.data.inventory import compute_data_version
+
+
+def _inventory():
+    return pd.DataFrame({
+        "Item_ID": ["CC-0001", "CC-0002"],
+        "Footage": [1200.0, 800.0],
+        "updated_at": ["2026-10-19T14:00:00+00:00", "2026-10-19T15:30:00.25+00:00"],
+    })
+
+
+def _audit():
+    return pd.DataFrame({"id": [7, 9], "Item_ID": ["CC-0001", "CC-0002"], "Action": ["Pick", "Pick"]})
+
+
+def test_version_follows_watermarks():
+    base = compute_data_version(_inventory(), _audit())
+    assert base == compute_data_version(_inventory(), _audit())
+
+    # A write restamps updated_at
+    edited = _inventory()
+    edited.loc[0, ["Footage", "updated_at"]] = [1100.0, "2026-10-19T16:00:00+00:00"]
+    assert compute_data_version(edited, _audit()) != base
+
+    # A delete changes the row count even when the newest row survives
+    assert compute_data_version(_inventory().iloc[1:], _audit()) != base
+
+    # New audit rows move the max id; unsent rows (no id yet) the count
+    assert compute_data_version(_inventory(), pd.concat([_audit(), pd.DataFrame({"id": [10]})])) != base
+    unsent = pd.concat([_audit(), pd.DataFrame({"Item_ID": ["CC-0001"], "Action": ["Pick"]})], ignore_index=True)
+    assert compute_data_version(_inventory(), unsent) != base
+
+
+def test_version_without_updated_at_hashes_content():
+    inv = _inventory().drop(columns="updated_at")
+    edited = inv.copy()
+    edited.loc[0, "Footage"] = 1100.0
+    assert compute_data_version(inv, None) == compute_data_version(inv.copy(), None)
+    assert compute_data_version(edited, None) != compute_data_version(inv, None)
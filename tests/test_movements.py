@@ -0,0 +1,41 @@
+import pandas as pd
+
+from warehouse_pulse.data.movements import classify_movements, sync_movement_rollup
+
+INVENTORY = pd.DataFrame({"Item_ID": ["Coil-1"], "Material": [".016 Stucco Aluminum"], "Category": ["Coils"]})
+
+
+def _picks(n, timestamp="2025-01-03T03:00:00+00:00"):
+    return pd.DataFrame({
+        "id": range(1, n + 1),
+        "Item_ID": ["Coil-1"] * n,
+        "Action": ["Stock Pick - Coils"] * n,
+        "Timestamp": [timestamp] * n,
+        "Details": ["Picked 10 ft for Acme (SO: 1)"] * n,
+    })
+
+
+def _merge_movement_rollup(db, params):
+    state = db.tables["movement_rollup_state"]
+    if state.loc[0, "last_id"] != params["p_since_id"]:
+        return False
+    rows = pd.DataFrame(params["p_rows"])
+    db.tables["movement_daily"] = pd.concat([db.tables.get("movement_daily"), rows], ignore_index=True)
+    state.loc[0, "last_id"] = params["p_until_id"]
+    return True
+
+
+def test_days_are_bucketed_in_app_time():
+    # 03:00 UTC on Jan 3 is 20:00 MST on Jan 2
+    moves = classify_movements(_picks(1), INVENTORY)
+    assert list(moves["day"]) == ["2025-01-02"]
+
+
+def test_sync_folds_a_large_log_in_bounded_batches(db):
+    db.load("audit_log", _picks(25))
+    db.load("movement_rollup_state", pd.DataFrame({"id": [1], "last_id": [None]}, dtype=object))
+    db.rpcs["merge_movement_rollup"] = _merge_movement_rollup
+
+    assert [sync_movement_rollup(INVENTORY, max_rows=10) for _ in range(4)] == [10, 10, 5, 0]
+    assert db.tables["movement_rollup_state"].loc[0, "last_id"] == 25
+    assert db.tables["movement_daily"]["quantity"].sum() == 250.0
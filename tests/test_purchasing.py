@@ -0,0 +1,84 @@
+import pandas as pd
+
+from warehouse_pulse.domain.purchasing import build_purchase_plan, purchase_plan_to_cart
+from warehouse_pulse.domain.receiving import reserve_pending_ids
+
+INVENTORY = pd.DataFrame({
+    "Item_ID": ["Coil-SS-010-01", "Coil-SS-010-02", "ELB-1"],
+    "Material": [".010 Stainless Steel Polythene"] * 2 + ["90° #3 Elbow"],
+    "Footage": [400.0, 600.0, 500.0],
+    "Location": ["Rack A-1", "Rack A-1", "Rack C-2"],
+    "Category": ["Coils", "Coils", "Elbows"],
+})
+
+
+def _forecast(rows):
+    return pd.DataFrame(rows, columns=["Material", "Category", "Daily_Demand", "Reorder_Point", "Lead_Time"])
+
+
+def test_sold_out_materials_are_planned():
+    forecast = _forecast([
+        # No inventory rows left at all, only history
+        [".016 Smooth Aluminum", "Coils", 50.0, 2000.0, 21],
+        ["90° #3 Elbow", "Elbows", 1.0, 10.0, 14],
+    ])
+    thresholds = {".010 Stainless Steel Polythene": 2500.0, ".020 Stucco Aluminum": 6000.0}
+
+    plan = build_purchase_plan(forecast, INVENTORY, thresholds).set_index("Material")
+
+    assert set(plan.index) == {".016 Smooth Aluminum", ".010 Stainless Steel Polythene", ".020 Stucco Aluminum"}
+    sold_out = plan.loc[".016 Smooth Aluminum"]
+    assert sold_out["On_Hand"] == 0
+    assert sold_out["Location"] == "Rack A-1"        # where the category's stock sits
+    assert sold_out["Pack_Size"] == 500.0              # median coil on hand
+    assert plan.loc[".020 Stucco Aluminum", "Category"] == "Coils"
+
+
+def test_draft_po_reserves_ids_only_when_received(db):
+    calls = []
+
+    def reserve(_db, params):
+        calls.append(params)
+        return 7
+
+    db.rpcs["reserve_item_ids"] = reserve
+    plan = build_purchase_plan(_forecast([]), INVENTORY, {".010 Stainless Steel Polythene": 2500.0})
+
+    cart = purchase_plan_to_cart(plan, INVENTORY)
+    assert calls == []
+    assert cart[0]["id_list"] == [] and cart[0]["id_prefix"] == "Coil-SS-010"
+
+    assert reserve_pending_ids(cart) == cart[0]["item_count"]
+    assert calls == [{"p_prefix": "Coil-SS-010", "p_count": cart[0]["item_count"]}]
+    assert cart[0]["id_list"][0] == "Coil-SS-010-07"
+    assert reserve_pending_ids(cart) == 0
+
+
+def test_cart_peeks_each_prefix_once_and_previews_consecutive_ranges(monkeypatch):
+    peeks = []
+
+    def peek(prefix, inventory_df):
+        peeks.append(prefix)
+        return 3
+
+    monkeypatch.setattr("warehouse_pulse.domain.purchasing.peek_next_item_number", peek)
+    inventory = pd.DataFrame({
+        "Item_ID": ["Coil-SS-010-01", "Coil-SS-010-02", "Coil-SS-010X-01", "ELB-1"],
+        "Material": [".010 Stainless Steel Polythene", ".010 Stainless Steel Smooth", ".010 Stainless Steel Smooth", "90° #3 Elbow"],
+    })
+    plan = pd.DataFrame({
+        "Material": [".010 Stainless Steel Polythene", ".010 Stainless Steel Smooth", ".016 Smooth Aluminum", "90° #3 Elbow"],
+        "Category": ["Coils", "Coils", "Coils", "Elbows"],
+        "Location": ["Rack A-1"] * 3 + ["Rack C-2"],
+        "Pack_Size": [500.0, 500.0, 500.0, 25.0],
+        "Packs": [2, 4, 1, 2],
+        "Order_Qty": [1000.0, 2000.0, 500.0, 50.0],
+        "Serialized": [True, True, True, False],
+    })
+
+    cart = purchase_plan_to_cart(plan, inventory)
+
+    # Smooth has one roll under each prefix; the tie goes to the first prefix
+    assert [line.get("id_prefix") for line in cart] == ["Coil-SS-010", "Coil-SS-010", "Coil-016SMOOTHALU", None]
+    assert sorted(peeks) == ["Coil-016SMOOTHALU", "Coil-SS-010"]
+    assert [line["id_preview"] for line in cart] == ["Coil-SS-010-03", "Coil-SS-010-05", "Coil-016SMOOTHALU-03", "ELBOWS-BULK"]
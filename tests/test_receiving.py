@@ -0,0 +1,24 @@
+import pandas as pd
+
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.movements import classify_movements
+from warehouse_pulse.domain.receiving import commit_receiving_cart
+
+
+def test_serialized_receipts_are_counted_as_movements(db):
+    cart = [{
+        "is_serialized": True, "id_list": ["Coil-AL-016-STP-01", "Coil-AL-016-STP-02"], "item_count": 2,
+        "material": ".016 Stucco Aluminum", "category": "Coils", "location": "Rack A-1",
+        "qty_val": 3000.0, "total_added": 6000.0, "unit_label": "Coils",
+    }]
+
+    assert commit_receiving_cart(cart, " PO-4410 ", "Dana") == 2
+    assert audit_writer.flush(timeout=10)
+
+    audit = pd.DataFrame(db.tables["audit_log"])
+    assert sorted(audit["Item_ID"]) == cart[0]["id_list"]
+
+    moves = classify_movements(audit, pd.DataFrame(db.tables["inventory"]))
+    assert set(moves["action_type"]) == {"Received"}
+    assert set(moves["material"]) == {".016 Stucco Aluminum"}
+    assert moves["quantity"].sum() == 6000.0
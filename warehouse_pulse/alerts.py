@@ -0,0 +1,184 @@
+"""Scheduled low-stock alerts."""
+
+import threading
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse import metrics
+from warehouse_pulse.catalog import LOW_STOCK_THRESHOLDS
+from warehouse_pulse.data.client import supabase
+from warehouse_pulse.mail import email_outbox, smtp_settings
+
+# --- LOW STOCK ALERTS ---
+LOW_STOCK_CHECK_MINUTES = float(st.secrets.get("LOW_STOCK_CHECK_MINUTES", 15))
+LOW_STOCK_REARM_PCT = float(st.secrets.get("LOW_STOCK_REARM_PCT", 10))
+LOW_STOCK_COOLDOWN_HOURS = float(st.secrets.get("LOW_STOCK_COOLDOWN_HOURS", 24))
+
+def evaluate_low_stock(totals, thresholds):
+    """
+    Compare stock against every threshold in one pass.
+
+    Args:
+        totals (Series): Footage per material (materials with no stock may be missing)
+        thresholds (dict): Material -> minimum footage
+
+    Returns:
+        DataFrame: Indexed by Material with Threshold, Total and Low
+    """
+    frame = pd.DataFrame({"Threshold": pd.Series(thresholds, dtype=float)})
+    frame.index.name = "Material"
+    frame["Total"] = pd.to_numeric(totals, errors="coerce").reindex(frame.index).fillna(0.0)
+    frame["Low"] = frame["Total"] < frame["Threshold"]
+    return frame
+
+class LowStockAlertEngine:
+    """
+    Scheduled low-stock checks with hysteresis and cool-down.
+
+    A material alerts when its stock falls below its threshold and is not re-armed until
+    it climbs back above threshold * (1 + rearm_pct / 100), so stock hovering around the
+    line sends one email per dip. A re-armed material still waits `cooldown_hours` after
+    its previous alert. State is kept in low_stock_alert_state and the fire decision is
+    made there under a row lock (claim_low_stock_alerts), so restarts, manual checks and
+    the engines of other app processes do not send the same alert again. Emails go
+    through the outbox; errors are counted in stats and the latest kept in last_error.
+    """
+
+    def __init__(self, client, outbox, thresholds, sender, recipient,
+                 interval_minutes=15, rearm_pct=10, cooldown_hours=24):
+        self.client = client
+        self.outbox = outbox
+        self.thresholds = dict(thresholds)
+        self.sender, self.recipient = sender, recipient
+        self.interval = interval_minutes * 60
+        self.rearm_pct = rearm_pct
+        self.cooldown = pd.Timedelta(hours=cooldown_hours)
+        self.stats = {"runs": 0, "alerts": 0, "emails": 0, "errors": 0}
+        self.last_run = None
+        self.last_error = None
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name="low-stock-alerts", daemon=True).start()
+
+    def _stock_totals(self):
+        rows = self.client.rpc("material_stock_totals", {"p_materials": list(self.thresholds)}).execute().data or []
+        return pd.Series({r["material"]: r["footage"] for r in rows}, dtype=float)
+
+    def _send(self, low):
+        msg = MIMEMultipart()
+        msg['From'] = self.sender
+        msg['To'] = self.recipient
+        msg['Subject'] = "URGENT: Low Stock Alert - MJP Pulse"
+        lines = [f"{material}: {row.Total:.1f} ft (below {row.Threshold})" for material, row in low.iterrows()]
+        body = "The following materials are low:\n\n" + "\n".join(lines) + "\n\nCheck dashboard immediately."
+        msg.attach(MIMEText(body, 'plain'))
+        self.outbox.enqueue(msg, "low_stock_alert")
+
+    def run_once(self, inventory_df=None):
+        """
+        Evaluate all thresholds and email materials that newly went low.
+
+        Args:
+            inventory_df (DataFrame): Inventory to check; totals are read from the database when None
+
+        Returns:
+            DataFrame: evaluate_low_stock() result plus Alerting and Alerted (emailed on this run)
+        """
+        with self._lock:
+            self.last_error = None
+            if inventory_df is not None:
+                totals = pd.to_numeric(inventory_df['Footage'], errors='coerce').groupby(inventory_df['Material']).sum()
+            else:
+                totals = self._stock_totals()
+            frame = evaluate_low_stock(totals, self.thresholds)
+
+            now = pd.Timestamp.now(tz="UTC")
+            try:
+                claimed = self._claim(frame)
+            except Exception as e:
+                self.stats["errors"] += 1
+                self.last_error = f"could not check alert state: {e}"
+                return frame.assign(Alerting=False, Alerted=False)
+            alerting = claimed["alerting"].fillna(False).astype(bool)
+            fire = claimed["fired"].fillna(False).astype(bool)
+
+            if fire.any():
+                try:
+                    self._send(frame[fire])
+                    self.stats["emails"] += 1
+                    self.stats["alerts"] += int(fire.sum())
+                except Exception as e:
+                    # Could not queue the email: give the claim back so the next run tries again
+                    self.stats["errors"] += 1
+                    self.last_error = str(e)
+                    self._release(claimed[fire])
+                    alerting &= ~fire
+                    fire[:] = False
+
+            self.stats["runs"] += 1
+            self.last_run = now
+            return frame.assign(Alerting=alerting, Alerted=fire)
+
+    def _claim(self, frame):
+        """claim_low_stock_alerts for every threshold; indexed like frame with alerting, fired and previous_alert_at."""
+        rows = self.client.rpc("claim_low_stock_alerts", {
+            "p_totals": [{"material": material, "total": float(row.Total), "threshold": float(row.Threshold)}
+                         for material, row in frame.iterrows()],
+            "p_rearm_pct": float(self.rearm_pct),
+            "p_cooldown": f"{self.cooldown.total_seconds():.0f} seconds",
+        }).execute().data or []
+        return pd.DataFrame(rows, columns=["material", "alerting", "fired", "previous_alert_at"]).set_index("material").reindex(frame.index)
+
+    def _release(self, claimed):
+        rows = [{"material": material, "alerting": False, "last_alert_at": None if pd.isna(previous) else previous}
+                for material, previous in claimed["previous_alert_at"].items()]
+        try:
+            self.client.table("low_stock_alert_state").upsert(rows, on_conflict="material").execute()
+        except Exception as e:
+            self.last_error = f"{self.last_error}; could not release the alert claim: {e}"
+
+    def _run(self):
+        while True:
+            try:
+                self.run_once()
+            except Exception as e:
+                self.stats["errors"] += 1
+                self.last_error = str(e)
+            time.sleep(self.interval)
+
+@st.cache_resource
+def get_low_stock_alert_engine():
+    if supabase is None:
+        return None
+    settings = smtp_settings()
+    return LowStockAlertEngine(
+        supabase, email_outbox, LOW_STOCK_THRESHOLDS, settings["user"], settings["admin_email"],
+        interval_minutes=LOW_STOCK_CHECK_MINUTES, rearm_pct=LOW_STOCK_REARM_PCT,
+        cooldown_hours=LOW_STOCK_COOLDOWN_HOURS,
+    )
+
+low_stock_alerts = get_low_stock_alert_engine()
+if low_stock_alerts is not None:
+    metrics.register_component("low_stock_alerts", lambda: low_stock_alerts.stats)
+
+# --- LOW STOCK CHECK & EMAIL (manual trigger for the alert engine) ---
+def check_and_alert_low_stock(df):
+    if df is None or df.empty:
+        st.warning("Low stock check skipped: No inventory data loaded.")
+        return
+    if low_stock_alerts is None:
+        st.warning("Low stock check skipped: Database not connected.")
+        return
+
+    result = low_stock_alerts.run_once(df)
+    if low_stock_alerts.last_error:
+        st.error(f"Low stock email failed: {low_stock_alerts.last_error}")
+    elif result['Alerted'].any():
+        st.toast("Low stock alert email queued!", icon="⚠️")
+    elif result['Low'].any():
+        st.info(f"{int(result['Low'].sum())} material(s) below threshold - alert already sent.")
+    else:
+        st.success("All tracked materials are above their thresholds.")
@@ -0,0 +1,143 @@
+"""Materials, sizes, categories and stock thresholds."""
+
+import pandas as pd
+
+# --- CATEGORY NORMALIZATION ---
+def normalize_category(cat):
+    """Normalize category names to handle singular/plural variations"""
+    if pd.isna(cat) or not isinstance(cat, str):
+        return "Other"
+    
+    cat_lower = str(cat).strip().lower()
+    
+    # Map all variations to standard plural form
+    mapping = {
+        'coil': 'Coils',
+        'coils': 'Coils',
+        'roll': 'Rolls',
+        'rolls': 'Rolls',
+        'elbow': 'Elbows',
+        'elbows': 'Elbows',
+        'fab strap': 'Fab Straps',
+        'fab straps': 'Fab Straps',
+        'fabstrap': 'Fab Straps',
+        'fabstraps': 'Fab Straps',
+        'strap': 'Fab Straps',
+        'straps': 'Fab Straps',
+        'mineral wool': 'Mineral Wool',
+        'mineralwool': 'Mineral Wool',
+        'fiberglass insulation': 'Fiberglass Insulation',
+        'fiberglass': 'Fiberglass Insulation',
+        'wing seal': 'Wing Seals',
+        'wing seals': 'Wing Seals',
+        'wingseals': 'Wing Seals',
+        'wire': 'Wire',
+        'banding': 'Banding',
+        'other': 'Other',
+    }
+    
+    # Check for exact match first
+    if cat_lower in mapping:
+        return mapping[cat_lower]
+    
+    # Check for partial match
+    for key, value in mapping.items():
+        if key in cat_lower:
+            return value
+    
+    # Return original with title case if no match
+    return cat.strip().title()
+
+# Then continue with login, sidebar, etc.
+
+# --- LOW STOCK THRESHOLDS ---
+LOW_STOCK_THRESHOLDS = {
+    ".016 Smooth Aluminum": 6000.0,
+    ".020 Stucco Aluminum": 6000.0,
+    ".020 Smooth Aluminum": 3500.0,
+    ".016 Stucco Aluminum": 2500.0,
+    ".010 Stainless Steel Polythene": 2500.0,
+    # Add more as needed (e.g. for rolls, insulation, etc.)
+}
+
+# --- SIZE MAP ---
+SIZE_DISPLAY = {
+    "1#": 12.0,
+    "#2": 13.5,
+    "#3": 14.75,
+    "#4": 16.25,
+    "#5": 18.0,
+    "#6": 20.0,
+    "#7": 23.0,
+    "#8": 26.0,
+    "#9": 29.5,
+    "#10": 32.5,
+    "#11": 36.0,
+    "#12": 39.25,
+    "#13": 42.25,
+    "#14": 46.5,
+    "#15": 49.5,
+    "#16": 52.75,
+    "#17": 57,
+    "#18": 60.25,
+    "#19": 63.25,
+    "#20": 66.5,
+    "#21": 69.75,
+    "#22": 72.75,
+    "#23": 76,
+    "#24": 79.25,
+    "#25": 82.5,
+    "#26": 85.5,
+    "#27": 88.5,
+    "#28": 92,
+    "#29": 95,
+    "#30": 98.25,
+    "#31": 101.5,
+    "#32": 104.5,
+    "#33": 107.75,
+}
+SIZE_MAP = {k.replace("#", "Size "): v for k, v in SIZE_DISPLAY.items()}
+        
+# --- MATERIALS FOR COILS ---
+COIL_MATERIALS = [
+    ".010 Smooth Stainless Steel No Polythene",
+    ".010 Stainless Steel Polythene",
+    ".016 Stainless Steel No Polythene",
+    ".016 Stainless Polythene",
+    ".020 Stainless Steel Polythene",
+    ".010 Stainless Steel RPR",
+    ".016 Smooth Aluminum",
+    ".016 Stucco Aluminum",
+    ".020 Smooth Aluminum",
+    ".020 Stucco Aluminum",
+    ".024 Smooth Aluminum",
+    ".024 Stucco Aluminum",
+    ".032 Smooth Aluminum",
+    ".032 Stucco Aluminum"
+]
+
+# --- MATERIALS FOR ROLLS ---
+ROLL_MATERIALS = [
+    "RPR .016 Smooth Aluminum",
+    "RPR .016 Stucco Aluminum",
+    "RPR .020 Smooth Aluminum",
+    "RPR .020 Stucco Aluminum",
+    "RPR .024 Smooth Aluminum",
+    "RPR .024 Stucco Aluminum",
+    "RPR .032 Smooth Aluminum",
+    "RPR .032 Stucco Aluminum",
+    ".010 Smooth Stainless Steel",
+    ".010 Stucco Stainless Steel",
+    ".016 Smooth Stainless Steel",
+    ".016 Stucco Stainless Steel",
+    ".020 Smooth Stainless Steel",
+    ".020 Stucco Stainless Steel",
+    ".016 Smooth Aluminum",
+    ".016 Stucco Aluminum",
+    ".020 Smooth Aluminum",
+    ".020 Stucco Aluminum",
+    ".024 Smooth Aluminum",
+    ".024 Stucco Aluminum",
+    ".032 Smooth Aluminum",
+    ".032 Stucco Aluminum"
+]
@@ -0,0 +1,244 @@
+"""Audit Trail search and the Parquet archive of old audit rows."""
+
+import io
+import re
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse import metrics
+from warehouse_pulse.data.client import supabase
+
+# --- AUDIT TRAIL ---
+AUDIT_PAGE_SIZE = 100
+AUDIT_COLUMNS = "id, Timestamp, Action, User, Item_ID, Details"
+
+def audit_search_tsquery(text):
+    """Prefix tsquery for free text, e.g. "smith so-12" -> "smith:* & so:* & 12:*"."""
+    return " & ".join(f"{token}:*" for token in re.findall(r"\w+", text.lower()))
+
+@metrics.timed("search_audit_log")
+def search_audit_log(query="", action=None, user=None, date_from=None, date_to=None,
+                     cursor=None, page_size=AUDIT_PAGE_SIZE):
+    """
+    One page of audit_log rows, newest first, filtered on the server.
+
+    Free text goes through the search_vector GIN index; pages are keyset-paginated on
+    (Timestamp, id) so every page costs the same no matter how deep it is.
+
+    Args:
+        query: Free-text search (prefix match on every word)
+        action: Exact Action to keep, or None for all
+        user: Exact User to keep, or None for all
+        date_from: First day to include (date or None)
+        date_to: Last day to include (date or None)
+        cursor: (Timestamp, id) of the last row on the previous page, or None for the first page
+        page_size: Rows per page
+
+    Returns:
+        tuple: (page DataFrame, cursor for the next page or None when this is the last page)
+    """
+    from datetime import timedelta
+
+    request = supabase.table("audit_log").select(AUDIT_COLUMNS)
+    tsquery = audit_search_tsquery(query or "")
+    if tsquery:
+        request = request.filter("search_vector", "fts(simple)", tsquery)
+    if action:
+        request = request.eq("Action", action)
+    if user:
+        request = request.eq("User", user)
+    if date_from:
+        request = request.gte("Timestamp", date_from.strftime("%Y-%m-%d"))
+    if date_to:
+        request = request.lt("Timestamp", (date_to + timedelta(days=1)).strftime("%Y-%m-%d"))
+    if cursor:
+        last_ts, last_id = cursor
+        request = request.or_(f'Timestamp.lt."{last_ts}",and(Timestamp.eq."{last_ts}",id.lt.{last_id})')
+
+    # One extra row tells us whether another page follows
+    rows = (
+        request.order("Timestamp", desc=True).order("id", desc=True)
+        .limit(page_size + 1).execute().data or []
+    )
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = (rows[-1]["Timestamp"], rows[-1]["id"])
+    page = pd.DataFrame(rows, columns=AUDIT_COLUMNS.split(", "))
+    return page, next_cursor
+
+@metrics.cache_data(ttl=600)
+def load_audit_facets():
+    """Distinct Action and User values for the Audit Trail filters."""
+    res = supabase.rpc("audit_log_facets", {}).execute()
+    facets = {"action": [], "user": []}
+    for row in res.data or []:
+        facets.setdefault(row["kind"], []).append(row["value"])
+    return {kind: sorted(values) for kind, values in facets.items()}
+
+# --- AUDIT ARCHIVE ---
+# Rows older than the hot window move to monthly Parquet files in Supabase Storage
+AUDIT_HOT_DAYS = int(st.secrets.get("AUDIT_HOT_DAYS", 180))
+AUDIT_ARCHIVE_BUCKET = "audit-archive"
+AUDIT_ARCHIVE_COLUMNS = ["id", "Item_ID", "Action", "User", "Timestamp", "Details"]
+
+def _as_utc(value):
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+def _month_start(ts):
+    return ts.normalize().replace(day=1)
+
+def audit_partition_path(month):
+    return f"audit_log/year={month.year}/month={month.month:02d}.parquet"
+
+@metrics.timed("_fetch_audit_range")
+def _fetch_audit_range(start, end, columns="*", page_size=1000, max_id=None):
+    """Hot audit rows with start <= Timestamp < end (either bound may be None) and id <= max_id, oldest first."""
+    rows, offset = [], 0
+    while True:
+        query = supabase.table("audit_log").select(columns)
+        if start is not None:
+            query = query.gte("Timestamp", start.isoformat())
+        if end is not None:
+            query = query.lt("Timestamp", end.isoformat())
+        if max_id is not None:
+            query = query.lte("id", max_id)
+        batch = query.order("Timestamp").order("id").range(offset, offset + page_size - 1).execute().data or []
+        rows.extend(batch)
+        if len(batch) < page_size:
+            return rows
+        offset += page_size
+
+def _audit_frame(rows_or_df):
+    """Audit rows with the archive columns and a UTC datetime Timestamp."""
+    frame = pd.DataFrame(rows_or_df).reindex(columns=AUDIT_ARCHIVE_COLUMNS)
+    frame["Timestamp"] = pd.to_datetime(frame["Timestamp"], errors="coerce", utc=True, format="ISO8601")
+    return frame
+
+@metrics.cache_data(ttl=300)
+def load_audit_archive_manifest():
+    """Archived partitions and the hot/cold boundary (None until the first archive run)."""
+    state = supabase.table("audit_archive_state").select("archived_before").eq("id", 1).execute()
+    boundary = state.data[0]["archived_before"] if state.data else None
+    parts = supabase.table("audit_archive_partitions").select("*").order("month").execute()
+    manifest = pd.DataFrame(parts.data or [], columns=["month", "path", "row_count", "min_timestamp", "max_timestamp", "archived_at"])
+    return manifest, (_as_utc(boundary) if boundary else None)
+
+@metrics.cache_data(max_entries=64, show_spinner=False)
+def _load_audit_partition(path, row_count):
+    """One archived month; `row_count` is part of the key so a re-archived month is fetched again."""
+    data = supabase.storage.from_(AUDIT_ARCHIVE_BUCKET).download(path)
+    return pd.read_parquet(io.BytesIO(data))
+
+@metrics.timed("query_audit_log")
+def query_audit_log(date_from=None, date_to=None, hot_df=None):
+    """
+    Audit rows between two days (inclusive) from the hot table and, only when the range
+    reaches past the archive boundary, the matching monthly Parquet partitions.
+
+    The hot table is always read from `date_from`: rows the rollup had not folded yet, or
+    rows logged late, stay hot even when they are older than the boundary. Rows found in
+    both places (a `hot_df` loaded before an archive run) are kept once, by id.
+
+    Args:
+        date_from: First day (date/Timestamp) or None for the beginning
+        date_to: Last day (date/Timestamp) or None for today
+        hot_df: Already-loaded hot rows to use instead of querying audit_log again
+
+    Returns:
+        pd.DataFrame: AUDIT_ARCHIVE_COLUMNS, Timestamp as UTC datetime, oldest first
+    """
+    start = pd.Timestamp(date_from).tz_localize("UTC") if date_from is not None else None
+    end = pd.Timestamp(date_to).tz_localize("UTC") + pd.Timedelta(days=1) if date_to is not None else None
+
+    manifest, boundary = load_audit_archive_manifest()
+    frames = []
+
+    if boundary is not None and (start is None or start < boundary) and not manifest.empty:
+        months = pd.to_datetime(manifest["month"]).dt.tz_localize("UTC")
+        wanted = months < (boundary if end is None else min(end, boundary))
+        if start is not None:
+            wanted &= months >= _month_start(start)
+        for part in manifest[wanted.to_numpy()].itertuples():
+            frames.append(_load_audit_partition(part.path, part.row_count))
+
+    if hot_df is not None:
+        frames.append(_audit_frame(hot_df))
+    else:
+        frames.append(_audit_frame(_fetch_audit_range(start, end, ", ".join(AUDIT_ARCHIVE_COLUMNS))))
+
+    audit = pd.concat(frames, ignore_index=True)
+    # Hot frames come last, so their copy of a row that was also archived is the one kept
+    audit = audit[~(audit["id"].notna() & audit["id"].duplicated(keep="last"))]
+    in_range = pd.Series(True, index=audit.index)
+    if start is not None:
+        in_range &= audit["Timestamp"] >= start
+    if end is not None:
+        in_range &= audit["Timestamp"] < end
+    return audit[in_range].sort_values("Timestamp", kind="stable", ignore_index=True)
+
+def archive_audit_log(hot_days=AUDIT_HOT_DAYS, delete_chunk=500):
+    """
+    Move audit rows older than `hot_days` into monthly Parquet partitions.
+
+    Each month is uploaded and recorded before its rows are deleted, and only the ids
+    that went into the file are deleted, so an interrupted run or a row inserted late
+    into an archived month loses nothing; re-running merges on id. Rows above the
+    movement rollup's id watermark (not folded yet) stay hot.
+
+    Returns:
+        int: Number of rows archived
+    """
+    from datetime import timezone
+
+    cutoff = pd.Timestamp(datetime.now(timezone.utc)).normalize() - pd.Timedelta(days=hot_days)
+    rollup = supabase.table("movement_rollup_state").select("last_id").eq("id", 1).execute()
+    rollup_id = rollup.data[0]["last_id"] if rollup.data else None
+    if rollup_id is None:
+        return 0
+
+    oldest = supabase.table("audit_log").select("Timestamp").order("Timestamp").limit(1).execute()
+    if not oldest.data or _as_utc(oldest.data[0]["Timestamp"]) >= cutoff:
+        return 0
+
+    manifest, _ = load_audit_archive_manifest()
+    existing = set(pd.to_datetime(manifest["month"]).dt.strftime("%Y-%m-%d")) if not manifest.empty else set()
+    bucket = supabase.storage.from_(AUDIT_ARCHIVE_BUCKET)
+
+    archived = 0
+    month = _month_start(_as_utc(oldest.data[0]["Timestamp"]))
+    while month < cutoff:
+        chunk_end = min(month + pd.DateOffset(months=1), cutoff)
+        rows = _fetch_audit_range(month, chunk_end, ", ".join(AUDIT_ARCHIVE_COLUMNS), max_id=rollup_id)
+        if rows:
+            part = _audit_frame(rows)
+            path = audit_partition_path(month)
+            if month.strftime("%Y-%m-%d") in existing:
+                part = pd.concat([pd.read_parquet(io.BytesIO(bucket.download(path))), part], ignore_index=True)
+                part = part.drop_duplicates("id", keep="last").sort_values(["Timestamp", "id"], ignore_index=True)
+
+            buffer = io.BytesIO()
+            part.to_parquet(buffer, index=False, compression="zstd")
+            bucket.upload(path, buffer.getvalue(), {"content-type": "application/vnd.apache.parquet", "upsert": "true"})
+            supabase.table("audit_archive_partitions").upsert({
+                "month": month.strftime("%Y-%m-%d"),
+                "path": path,
+                "row_count": len(part),
+                "min_timestamp": part["Timestamp"].min().isoformat(),
+                "max_timestamp": part["Timestamp"].max().isoformat(),
+                "archived_at": datetime.now(timezone.utc).isoformat(),
+            }).execute()
+
+            # The file is stored and recorded; drop exactly the rows it holds
+            ids = [row["id"] for row in rows]
+            for start in range(0, len(ids), delete_chunk):
+                supabase.table("audit_log").delete().in_("id", ids[start:start + delete_chunk]).execute()
+            archived += len(rows)
+        month = month + pd.DateOffset(months=1)
+
+    supabase.table("audit_archive_state").update({"archived_before": cutoff.isoformat()}).eq("id", 1).execute()
+    load_audit_archive_manifest.clear()
+    return archived
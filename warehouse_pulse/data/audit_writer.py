@@ -0,0 +1,256 @@
+"""Buffered background writer for audit_log."""
+
+import glob
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from warehouse_pulse import metrics
+from warehouse_pulse.data.client import supabase
+
+# --- AUDIT WRITER ---
+def audit_timestamp():
+    """Current time as a UTC ISO-8601 string, the single Timestamp format for audit rows."""
+    from datetime import timezone
+    return datetime.now(timezone.utc).isoformat()
+
+def is_data_error(error):
+    """
+    True when PostgREST refused rows for what they contain, so sending them again can't help.
+
+    That is SQLSTATE class 22 (bad value) or 23 (constraint), a PGRST1xx request error, or
+    an HTTP 4xx other than 401/408/429. Everything else (auth, timeouts, rate limits, 5xx,
+    connection errors) is transient.
+    """
+    code = str(error.code or "")
+    if code.isdigit() and len(code) == 3:
+        return 400 <= int(code) < 500 and int(code) not in (401, 408, 429)
+    return (len(code) == 5 and code[:2] in ("22", "23")) or code.startswith("PGRST1")
+
+def _try_lock(handle):
+    """Non-blocking exclusive flock on an open file: True, False if held elsewhere, None without fcntl."""
+    try:
+        import fcntl
+    except ImportError:
+        return None
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+def _read_unsent(spill):
+    """Entries in an open spill file that were never acked, in logging order."""
+    entries, acked = {}, set()
+    for line in spill:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # torn final line from a crash mid-write
+        if "ack" in record:
+            acked.update(record["ack"])
+        else:
+            entries[record["seq"]] = record["entry"]
+    return [entry for seq, entry in sorted(entries.items()) if seq not in acked]
+
+class AuditWriter:
+    """
+    Background writer for audit_log.
+
+    log() stamps entries with a UTC timestamp, appends them to a local spill file and
+    returns; a daemon thread inserts them in batches once `batch_size` are waiting or
+    `flush_interval` seconds have passed. Entries still in the spill file when the
+    process starts (crash, restart) are sent again, so delivery is at-least-once.
+
+    Each process spills to its own file next to `spill_path` (name.<pid>.jsonl) and
+    holds a lock on it while it runs. At start-up the writer also takes over spill files
+    whose lock is free, i.e. whose process has exited.
+    """
+
+    def __init__(self, client, spill_path, batch_size=50, flush_interval=2.0):
+        self.client = client
+        self.base_spill_path = spill_path
+        self.dead_letter_path = spill_path + ".rejected"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = {"logged": 0, "written": 0, "batches": 0, "retries": 0, "rejected": 0, "recovered": 0}
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._unsent = {}  # seq -> entry, until stored or set aside
+        self._seq = 0
+        self._spill_handle = self._claim_spill()
+        self._recover()
+        threading.Thread(target=self._run, name="audit-writer", daemon=True).start()
+
+    # Spill file: one {"seq", "entry"} line per logged entry, {"ack": [...]} once stored
+    def _append(self, records):
+        with open(self.spill_path, "a", encoding="utf-8") as spill:
+            spill.write("".join(json.dumps(r, default=str) + "\n" for r in records))
+
+    def _claim_spill(self):
+        """Open and lock this process's spill file; the handle stays open to keep the lock."""
+        root, ext = os.path.splitext(self.base_spill_path)
+        attempt = 0
+        while True:
+            suffix = f"{os.getpid()}-{attempt}" if attempt else str(os.getpid())
+            self.spill_path = f"{root}.{suffix}{ext}"
+            handle = open(self.spill_path, "a", encoding="utf-8")
+            locked = _try_lock(handle)
+            try:
+                # A starting writer may have taken the file over and removed it before we locked it
+                current = locked is None or os.stat(self.spill_path).st_ino == os.fstat(handle.fileno()).st_ino
+            except FileNotFoundError:
+                current = False
+            if locked is not False and current:
+                return handle
+            handle.close()
+            if locked is False:
+                attempt += 1  # same pid in another container sharing the directory
+
+    def _recover(self):
+        with open(self.spill_path, encoding="utf-8") as spill:
+            unsent = _read_unsent(spill)
+
+        # Files left by processes that have exited, plus the shared file older versions used
+        root, ext = os.path.splitext(self.base_spill_path)
+        orphans = []
+        for path in sorted(glob.glob(f"{glob.escape(root)}.*{ext}")) + [self.base_spill_path]:
+            if path == self.spill_path:
+                continue
+            try:
+                spill = open(path, "r+", encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            if not _try_lock(spill):
+                spill.close()  # still in use, or no locking on this platform
+                continue
+            unsent += _read_unsent(spill)
+            orphans.append((path, spill))
+
+        records = [{"seq": seq, "entry": entry} for seq, entry in enumerate(unsent, start=1)]
+        with open(self.spill_path, "w", encoding="utf-8"):
+            pass
+        if records:
+            self._append(records)
+            for record in records:
+                self._unsent[record["seq"]] = record["entry"]
+                self._queue.put(record)
+        # Only once the entries are safe in our own file
+        for path, spill in orphans:
+            os.remove(path)
+            spill.close()
+        self._seq = len(records)
+        self.stats["recovered"] = len(records)
+
+    def log(self, entries):
+        """Queue one audit entry (dict) or several (list of dicts)."""
+        if isinstance(entries, dict):
+            entries = [entries]
+        with self._lock:
+            now = audit_timestamp()
+            records = []
+            for entry in entries:
+                self._seq += 1
+                records.append({"seq": self._seq, "entry": {**entry, "Timestamp": now}})
+            self._append(records)
+            self._unsent.update((r["seq"], r["entry"]) for r in records)
+            self.stats["logged"] += len(records)
+        for record in records:
+            self._queue.put(record)
+
+    def flush(self, timeout=10.0):
+        """Send everything queued now and wait until it is stored; False on timeout."""
+        self._queue.put(None)
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._unsent, timeout)
+
+    @property
+    def pending(self):
+        return len(self._unsent)
+
+    def unsent_entries(self):
+        """Entries logged but not stored yet, oldest first (copies, with their Timestamp)."""
+        with self._lock:
+            return [dict(entry) for _, entry in sorted(self._unsent.items())]
+
+    def _ack(self, records, rejected=False):
+        with self._lock:
+            self._append([{"ack": [r["seq"] for r in records]}])
+            for record in records:
+                self._unsent.pop(record["seq"], None)
+            self.stats["rejected" if rejected else "written"] += len(records)
+            if not self._unsent:
+                with open(self.spill_path, "w", encoding="utf-8"):
+                    pass
+            self._idle.notify_all()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            records = [r for r in batch if r is not None]
+            if records:
+                self._write(records)
+            else:
+                with self._idle:
+                    self._idle.notify_all()
+
+    def _write(self, records):
+        from postgrest.exceptions import APIError
+
+        delay = 1.0
+        while records:
+            try:
+                self.client.table("audit_log").insert([r["entry"] for r in records]).execute()
+                self.stats["batches"] += 1
+                self._ack(records)
+                return
+            except APIError as e:
+                if not is_data_error(e):
+                    print(f"Audit writer: insert failed, retrying in {delay:.0f}s: {e}")
+                else:
+                    # The server refused the batch's data: send rows one by one so only bad rows are set aside
+                    retry = []
+                    for record in records:
+                        try:
+                            self.client.table("audit_log").insert(record["entry"]).execute()
+                            self._ack([record])
+                        except APIError as row_error:
+                            if not is_data_error(row_error):
+                                retry.append(record)
+                                continue
+                            with open(self.dead_letter_path, "a", encoding="utf-8") as dead:
+                                dead.write(json.dumps({"entry": record["entry"], "error": str(row_error)}, default=str) + "\n")
+                            self._ack([record], rejected=True)
+                        except Exception:
+                            retry.append(record)
+                    records = retry
+            except Exception as e:
+                print(f"Audit writer: insert failed, retrying in {delay:.0f}s: {e}")
+            if records:
+                self.stats["retries"] += 1
+                time.sleep(delay)
+                delay = min(delay * 2, 60.0)
+
+@st.cache_resource
+def get_audit_writer():
+    spill_path = st.secrets.get("AUDIT_SPILL_PATH", os.path.join(tempfile.gettempdir(), "warehouse_pulse_audit_spill.jsonl"))
+    return AuditWriter(supabase, spill_path)
+
+audit_writer = get_audit_writer()
+metrics.register_component("audit_writer", lambda: {**audit_writer.stats, "pending": audit_writer.pending})
@@ -0,0 +1,95 @@
+"""Back order queries and bulk status changes."""
+
+from datetime import datetime
+
+
+from warehouse_pulse import metrics
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.client import supabase
+
+# --- BACK ORDERS ---
+@metrics.cache_data(ttl=30)
+def load_back_orders():
+    """Fetch all back orders (newest first). Cleared on its own after back-order writes."""
+    if supabase is None:
+        return []
+    response = supabase.table("back_orders").select("*").order("id", desc=True).execute()
+    return response.data if response.data else []
+
+def _affected_rows(response):
+    """Row count of a PostgREST write, preferring the exact count header."""
+    if getattr(response, 'count', None) is not None:
+        return response.count
+    return len(response.data) if response.data else 0
+
+def bulk_set_back_order_status(bo_ids, new_status, user_name):
+    """
+    Move many open back orders to a new status with one UPDATE ... WHERE id IN (...) AND status = 'Open'.
+
+    The status guard keeps two operators working from the cached list from closing the
+    same back order twice; only the rows this call actually changed are counted and logged.
+
+    Args:
+        bo_ids: List of back order ids
+        new_status: "Fulfilled" or "Cancelled"
+        user_name: Operator recorded on the rows and in the audit log
+
+    Returns:
+        int: Number of back orders updated
+    """
+    if not bo_ids:
+        return 0
+
+    now = datetime.now().isoformat()
+    update_data = {"status": new_status}
+    if new_status == "Fulfilled":
+        update_data.update({"fulfilled_date": now, "fulfilled_by": user_name})
+    elif new_status == "Cancelled":
+        update_data.update({"cancelled_date": now, "cancelled_by": user_name})
+
+    response = (
+        supabase.table("back_orders").update(update_data, count="exact")
+        .in_("id", list(bo_ids)).eq("status", "Open").execute()
+    )
+    affected = _affected_rows(response)
+    updated_ids = [row['id'] for row in (response.data or []) if 'id' in row]
+
+    if affected:
+        # One summary entry for the whole batch
+        action = "Bulk Back Order Fulfillment" if new_status == "Fulfilled" else "Bulk Back Order Cancellation"
+        skipped = len(bo_ids) - affected
+        log_entry = {
+            "Item_ID": "BULK",
+            "Action": action,
+            "User": user_name,
+            "Details": f"{new_status} {affected} back orders in bulk (IDs: {', '.join(str(i) for i in updated_ids[:10])}{'...' if len(updated_ids) > 10 else ''})"
+                       + (f"; {skipped} already closed" if skipped > 0 else "")
+        }
+        audit_writer.log(log_entry)
+
+    load_back_orders.clear()
+    return affected
+
+def delete_back_orders_by_status(statuses, user_name):
+    """
+    Delete every back order whose status is in `statuses` with a single DELETE.
+
+    Returns:
+        int: Number of back orders deleted
+    """
+    if not statuses:
+        return 0
+
+    response = supabase.table("back_orders").delete(count="exact").in_("status", list(statuses)).execute()
+    affected = _affected_rows(response)
+
+    log_entry = {
+        "Item_ID": "BULK",
+        "Action": "Back Order Cleanup",
+        "User": user_name,
+        "Details": f"Deleted {affected} back orders with status: {', '.join(statuses)}"
+    }
+    audit_writer.log(log_entry)
+
+    load_back_orders.clear()
+    return affected
@@ -0,0 +1,24 @@
+"""Supabase client shared by every module."""
+
+import streamlit as st
+from supabase import create_client
+
+from warehouse_pulse import metrics
+
+# --- Supabase CONNECTION ---
+@st.cache_resource
+def init_connection():
+    try:
+        if "SUPABASE_URL" not in st.secrets or "SUPABASE_KEY" not in st.secrets:
+            return None
+        url = st.secrets["SUPABASE_URL"]
+        key = st.secrets["SUPABASE_KEY"]
+        return create_client(url, key)
+    except Exception as e:
+        st.error(f"Supabase connection failed: {e}")
+        return None
+
+supabase = init_connection()
+if supabase is not None:
+    # Every table, RPC and Storage request is timed for the performance panel
+    supabase = metrics.InstrumentedClient(supabase)
@@ -0,0 +1,109 @@
+"""Loading the inventory and audit tables, and single-item stock updates."""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse import metrics
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.client import supabase
+
+# --- DATA LOADER (Supabase only) ---
+@metrics.timed("load_all_tables")
+@metrics.cache_data(ttl=5)
+def load_all_tables():
+    if supabase is None:
+        st.error("Supabase not connected")
+        # Return empty DataFrames WITH proper structure
+        empty_inv = pd.DataFrame(columns=['Item_ID', 'Material', 'Footage', 'Location', 'Status', 'Category', 'Purchase_Order_Num'])
+        empty_audit = pd.DataFrame(columns=['Item_ID', 'Action', 'User', 'Timestamp', 'Details'])
+        return empty_inv, empty_audit
+    
+    try:
+        inv_res = supabase.table("inventory").select("*").execute()
+        audit_res = supabase.table("audit_log").select("*").execute()
+        
+        # Create DataFrames with proper structure even if empty
+        if inv_res.data:
+            df_inv = pd.DataFrame(inv_res.data)
+        else:
+            df_inv = pd.DataFrame(columns=['Item_ID', 'Material', 'Footage', 'Location', 'Status', 'Category', 'Purchase_Order_Num'])
+        
+        if audit_res.data:
+            df_audit = pd.DataFrame(audit_res.data)
+        else:
+            df_audit = pd.DataFrame(columns=['Item_ID', 'Action', 'User', 'Timestamp', 'Details'])
+        
+        return df_inv, df_audit
+        
+    except Exception as e:
+        st.error(f"Error loading from Supabase: {e}")
+        # Return properly structured empty DataFrames
+        empty_inv = pd.DataFrame(columns=['Item_ID', 'Material', 'Footage', 'Location', 'Status', 'Category', 'Purchase_Order_Num'])
+        empty_audit = pd.DataFrame(columns=['Item_ID', 'Action', 'User', 'Timestamp', 'Details'])
+        return empty_inv, empty_audit
+        
+def with_unsent_audit_rows(df_audit):
+    """
+    df_audit plus the entries this process's audit writer has not stored yet.
+
+    Returns:
+        tuple: (DataFrame, number of unsent rows added; they have no id yet)
+    """
+    unsent = audit_writer.unsent_entries()
+    if not unsent:
+        return df_audit, 0
+    return pd.concat([df_audit, pd.DataFrame(unsent)], ignore_index=True), len(unsent)
+
+def compute_data_version(df_inv, df_audit):
+    """
+    Cheap version key for the loaded tables; identical data gives the same version across sessions.
+
+    Inventory is versioned by row count and max updated_at (stamped by a trigger on every
+    write), the audit log by row count and max id. Unsent audit rows have no id yet but
+    still change the count. A frame without updated_at falls back to a content hash.
+    """
+    parts = []
+    if df_inv is None or df_inv.empty:
+        parts.append("0")
+    elif 'updated_at' in df_inv.columns:
+        updated = pd.to_datetime(df_inv['updated_at'], utc=True, format='ISO8601', errors='coerce').max()
+        parts.append(f"{len(df_inv)}:{updated.isoformat() if pd.notna(updated) else ''}")
+    else:
+        row_hashes = pd.util.hash_pandas_object(df_inv.astype(str), index=False).to_numpy()
+        parts.append(f"{len(df_inv)}:{int(row_hashes.sum(dtype=np.uint64))}:{int(np.bitwise_xor.reduce(row_hashes))}")
+
+    if df_audit is None or df_audit.empty:
+        parts.append("0")
+    else:
+        max_id = pd.to_numeric(df_audit['id'], errors='coerce').max() if 'id' in df_audit.columns else None
+        parts.append(f"{len(df_audit)}:{int(max_id) if pd.notna(max_id) else ''}")
+    return "-".join(parts)
+    
+def update_stock(item_id, new_footage, user_name, action_type):
+    try:
+        # Update the inventory
+        supabase.table("inventory").update({"Footage": new_footage}).eq("Item_ID", item_id).execute()
+        
+        # Log the action
+        log_entry = {
+            "Item_ID": item_id,
+            "Action": action_type,
+            "User": user_name,
+            "Details": f"Updated Item {item_id} to {new_footage:.2f} ft via {action_type}"
+        }
+        audit_writer.log(log_entry)
+        
+        # Clear ALL caches and session state to force fresh data
+        st.cache_data.clear()
+        
+        # Force refresh session state data
+        if 'df' in st.session_state:
+            del st.session_state['df']
+        if 'df_audit' in st.session_state:
+            del st.session_state['df_audit']
+        
+        return True
+    except Exception as e:
+        st.error(f"Failed to update database: {e}")
+        return False
@@ -0,0 +1,221 @@
+"""Daily movement rollup built from the audit log."""
+
+import time
+from datetime import timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse import metrics
+from warehouse_pulse.catalog import normalize_category
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.client import supabase
+
+# --- MOVEMENT ROLLUP ---
+MOVEMENT_ROLLUP_KEYS = ["day", "material", "category", "client", "action_type"]
+# Movements are bucketed into days in the zone the app reports in (MST, UTC-7 all year)
+APP_TIMEZONE = timezone(timedelta(hours=-7), "MST")
+
+def classify_movements(audit_df, inventory_df):
+    """
+    Turn raw audit rows into movement rows (one per stock movement).
+
+    Picks/sales, production draws, receipts and removals are kept; edits,
+    reversals and back-order bookkeeping are dropped.
+
+    Args:
+        audit_df: audit_log rows (Item_ID, Action, Timestamp, Details)
+        inventory_df: Current inventory, used to resolve Material/Category
+
+    Returns:
+        pd.DataFrame: day, material, category, client, action_type, quantity
+    """
+    if audit_df is None or audit_df.empty:
+        return pd.DataFrame(columns=MOVEMENT_ROLLUP_KEYS + ["quantity"])
+
+    action = audit_df["Action"].fillna("").astype(str)
+
+    action_type = pd.Series(None, index=audit_df.index, dtype=object)
+    action_type[action.str.contains("Removed", regex=False) & ~action.str.startswith("Admin")] = "Removed"
+    action_type[action.str.startswith("Received") | (action == "Stock Added")] = "Received"
+    action_type[action.str.startswith("Production:")] = "Production"
+    action_type[action.str.startswith("Stock Pick") | action.str.contains("Sold", regex=False)] = "Pick"
+
+    # Only movement rows need their Details parsed
+    keep = action_type.notna()
+    audit_df, action, action_type = audit_df[keep], action[keep], action_type[keep]
+    details = audit_df["Details"].fillna("").astype(str)
+
+    # Whole-item picks log the footage in brackets: "Picked whole Coil (1000 ft) for ..."
+    qty_parts = details.str.extract(
+        r"Picked whole [^(]*\(([\d,]*\.?\d+) ft\)|(?:Picked|Removed|Added)\s+([\d,]*\.?\d+)"
+        r"|=\s*([\d.]+)\s*ft used|\|\s*([\d.]+)\s+[A-Za-z]+\s*\|"
+    )
+    quantity = pd.to_numeric(qty_parts.bfill(axis=1)[0].str.replace(",", ""), errors="coerce")
+
+    # Production rows log a synthetic Item_ID; the real item is in "Source: ..."
+    source_id = details.str.extract(r"Source:\s*(\S+)", expand=False).fillna(audit_df["Item_ID"].astype(str))
+
+    material = pd.Series(None, index=audit_df.index, dtype=object)
+    category = pd.Series(None, index=audit_df.index, dtype=object)
+    if inventory_df is not None and not inventory_df.empty:
+        lookup = inventory_df.drop_duplicates("Item_ID").set_index("Item_ID")
+        pos = lookup.index.get_indexer(source_id)
+        found = pos >= 0
+        material[found] = lookup["Material"].to_numpy()[pos[found]]
+        category[found] = lookup["Category"].to_numpy()[pos[found]]
+    if material.isna().any():
+        missing = material.isna()
+        material[missing] = details[missing].str.extract(r"Material:\s*(.+?)\.\s*Remaining", expand=False)
+    if category.isna().any():
+        missing = category.isna()
+        category[missing] = action[missing].str.extract(r"^Stock Pick - (.+)$", expand=False)
+
+    category = category.fillna("Other").astype(str)
+    category_lookup = {c: normalize_category(c) for c in category.unique()}
+
+    # Format each distinct day once instead of every timestamp
+    day_codes, day_values = pd.factorize(
+        pd.to_datetime(audit_df["Timestamp"], errors="coerce", utc=True, format="ISO8601")
+        .dt.tz_convert(APP_TIMEZONE).dt.normalize()
+    )
+    day_labels = np.append(pd.DatetimeIndex(day_values).strftime("%Y-%m-%d").to_numpy(dtype=object), None)
+
+    movements = pd.DataFrame({
+        "day": day_labels[day_codes],
+        "material": material.fillna("Unknown").astype(str).str.strip(),
+        "category": category.map(category_lookup),
+        "client": details.str.extract(r" for (.+?) \((?:SO|Order):", expand=False).fillna("").str.strip(),
+        "action_type": action_type,
+        "quantity": quantity,
+    })
+    return movements.dropna(subset=["day", "action_type", "quantity"])
+
+# A gap in audit ids followed by rows younger than this may be a batch still committing
+ROLLUP_SETTLE_SECONDS = 60
+# Audit rows folded per sync, so building the rollup from a large existing log is spread over reruns
+ROLLUP_SYNC_BATCH = 10000
+
+def _fetch_audit_since(since_id, max_rows=ROLLUP_SYNC_BATCH, page_size=1000):
+    """
+    Up to `max_rows` audit rows with id above `since_id`, in id order.
+
+    Keyset-paged on the unique id, so rows sharing a Timestamp at a page boundary and
+    rows inserted during the sync can't shift a page and be skipped or read twice.
+    """
+    rows, last_id = [], since_id
+    while len(rows) < max_rows:
+        query = supabase.table("audit_log").select("id, Item_ID, Action, Timestamp, Details")
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        limit = min(page_size, max_rows - len(rows))
+        batch = query.order("id").limit(limit).execute().data or []
+        rows.extend(batch)
+        if len(batch) < limit:
+            break
+        last_id = batch[-1]["id"]
+    return rows
+
+def _settled_rows(rows, since_id, settle_seconds=ROLLUP_SETTLE_SECONDS):
+    """
+    Leading rows that can be folded without skipping an uncommitted insert.
+
+    ids are handed out when an INSERT starts, so another process's batch that has not
+    committed yet shows up as a gap below rows that are already visible. A gap whose next
+    row is younger than `settle_seconds` stops the batch there; the next sync picks it up.
+    Older gaps are rolled-back inserts and are stepped over.
+    """
+    from datetime import datetime
+
+    cutoff = pd.Timestamp(datetime.now(timezone.utc)) - pd.Timedelta(seconds=settle_seconds)
+    previous = since_id
+    for i, row in enumerate(rows):
+        if previous is not None and row["id"] != previous + 1:
+            logged = pd.to_datetime(row["Timestamp"], errors="coerce", utc=True, format="ISO8601")
+            if pd.isna(logged) or logged > cutoff:
+                return rows[:i]
+        previous = row["id"]
+    return rows
+
+@metrics.timed("sync_movement_rollup")
+def sync_movement_rollup(inventory_df, max_rows=ROLLUP_SYNC_BATCH):
+    """
+    Fold up to `max_rows` audit rows above the rollup's id watermark into movement_daily.
+
+    Only the new tail of the audit log is read. The watermark is the audit id, not the
+    Timestamp: rows are stamped when an action is logged, so a row another process inserts
+    late (spill replay, a slow batch) can carry a Timestamp the rollup has already passed,
+    but its id is always new. If another session advances the watermark first,
+    merge_movement_rollup refuses the batch so nothing is counted twice.
+
+    Returns:
+        int: Number of audit rows folded in (`max_rows` means more are waiting)
+    """
+    # Give this process's queued rows a moment to land; the next sync picks up any that don't
+    audit_writer.flush(timeout=1.0)
+    state = supabase.table("movement_rollup_state").select("last_id").eq("id", 1).execute()
+    since_id = state.data[0]["last_id"] if state.data else None
+
+    new_rows = _settled_rows(_fetch_audit_since(since_id, max_rows), since_id)
+    if not new_rows:
+        return 0
+
+    audit_df = pd.DataFrame(new_rows)
+    movements = classify_movements(audit_df, inventory_df)
+    daily = movements.groupby(MOVEMENT_ROLLUP_KEYS, as_index=False).agg(
+        quantity=("quantity", "sum"), events=("quantity", "size")
+    )
+
+    logged = pd.to_datetime(audit_df["Timestamp"], errors="coerce", utc=True, format="ISO8601")
+    merged = supabase.rpc("merge_movement_rollup", {
+        "p_rows": daily.to_dict("records"),
+        "p_since_id": since_id,
+        "p_until_id": new_rows[-1]["id"],
+        "p_until": logged.max().isoformat() if logged.notna().any() else None,
+    }).execute()
+    if merged.data:
+        load_movement_rollup.clear()
+        return len(new_rows)
+    return 0
+
+def keep_movement_rollup_current(inventory_df, interval=60):
+    """
+    Sync the rollup at most every `interval` seconds per session, one batch per rerun.
+
+    While a large log is still being folded in, every rerun takes the next batch instead
+    of waiting out the interval.
+
+    Returns:
+        str or None: Notice for the page when movement history is incomplete
+    """
+    now = time.time()
+    behind = st.session_state.get('movement_rollup_behind', False)
+    if not behind and now - st.session_state.get('movement_rollup_synced_at', 0) < interval:
+        return None
+    st.session_state.movement_rollup_synced_at = now
+    try:
+        behind = sync_movement_rollup(inventory_df) >= ROLLUP_SYNC_BATCH
+    except Exception as e:
+        return f"⚠️ Movement history may be out of date: {e}"
+    st.session_state.movement_rollup_behind = behind
+    if behind:
+        return "⏳ Movement history is still being built from the audit log; it fills in over the next few page loads."
+    return None
+
+@metrics.cache_data(ttl=60)
+def load_movement_rollup(action_types, since_day=None):
+    """Pre-aggregated daily movements for the given action types, optionally from `since_day` on."""
+    rows, offset, page_size = [], 0, 1000
+    while True:
+        query = supabase.table("movement_daily").select("*").in_("action_type", list(action_types))
+        if since_day:
+            query = query.gte("day", since_day)
+        batch = query.order("day").range(offset, offset + page_size - 1).execute().data or []
+        rows.extend(batch)
+        if len(batch) < page_size:
+            break
+        offset += page_size
+    if not rows:
+        return pd.DataFrame(columns=MOVEMENT_ROLLUP_KEYS + ["quantity", "events"])
+    return pd.DataFrame(rows)
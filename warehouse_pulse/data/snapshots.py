@@ -0,0 +1,129 @@
+"""Daily inventory snapshots and stock-as-of queries."""
+
+from datetime import datetime
+
+import pandas as pd
+
+from warehouse_pulse import metrics
+from warehouse_pulse.data.client import supabase
+from warehouse_pulse.data.movements import APP_TIMEZONE, load_movement_rollup
+
+# --- INVENTORY SNAPSHOTS ---
+# Direction of each movement_daily action type on stock
+MOVEMENT_SIGN = {"Received": 1, "Pick": -1, "Production": -1, "Removed": -1}
+SNAPSHOT_COLUMNS = ["material", "category", "footage", "item_count"]
+
+def summarize_stock(inventory_df):
+    """Footage and item count per (material, category) for a snapshot."""
+    if inventory_df is None or inventory_df.empty:
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+    stock = inventory_df.assign(Footage=pd.to_numeric(inventory_df['Footage'], errors='coerce').fillna(0))
+    summary = stock.groupby(['Material', 'Category'], as_index=False).agg(
+        footage=('Footage', 'sum'), item_count=('Item_ID', 'count')
+    )
+    summary.columns = SNAPSHOT_COLUMNS
+    return summary
+
+def _upsert_snapshot_rows(rows, ignore_duplicates=False, chunk_size=1000):
+    for start in range(0, len(rows), chunk_size):
+        supabase.table("inventory_snapshots").upsert(
+            rows[start:start + chunk_size],
+            on_conflict="day,category,material",
+            ignore_duplicates=ignore_duplicates,
+        ).execute()
+
+def save_inventory_snapshot(inventory_df):
+    """
+    Write today's closing snapshot from the current inventory.
+
+    Days are MST days, the same buckets movement_daily uses, so replay lines up.
+
+    Rewritten whenever new data is loaded, so the last write of the day is the close.
+    Materials that ran out since the previous write are dropped from today's snapshot.
+
+    Returns:
+        int: Number of material rows written
+    """
+    now = datetime.now(APP_TIMEZONE)
+    day, taken_at = now.strftime("%Y-%m-%d"), now.isoformat()
+
+    summary = summarize_stock(inventory_df)
+    summary = summary[summary['footage'] != 0]
+    rows = summary.assign(day=day, taken_at=taken_at).to_dict("records")
+    if rows:
+        _upsert_snapshot_rows(rows)
+    supabase.table("inventory_snapshots").delete().eq("day", day).lt("taken_at", taken_at).execute()
+    load_stock_as_of.clear()
+    load_snapshot_trend.clear()
+    return len(rows)
+
+def backfill_inventory_snapshots(inventory_df, days=365):
+    """
+    Reconstruct daily snapshots for the last `days` days from current stock and movement_daily.
+
+    Each day's close is today's stock minus the net movements logged after it. Days that
+    already have a real snapshot are left alone.
+
+    Returns:
+        int: Number of snapshot rows written
+    """
+    from datetime import timedelta
+    today = datetime.now(APP_TIMEZONE).date()
+    since = (today - timedelta(days=days)).strftime("%Y-%m-%d")
+
+    current = summarize_stock(inventory_df).set_index(['material', 'category'])['footage']
+    moves = load_movement_rollup(tuple(MOVEMENT_SIGN), since)
+    day_index = pd.date_range(since, today, freq="D").strftime("%Y-%m-%d")
+
+    if moves.empty:
+        deltas = pd.DataFrame(0.0, index=current.index, columns=day_index)
+    else:
+        signed = moves['quantity'].astype(float) * moves['action_type'].map(MOVEMENT_SIGN)
+        deltas = signed.groupby([moves['material'], moves['category'], moves['day']]).sum().unstack(fill_value=0.0)
+        deltas.index.names = ['material', 'category']
+        deltas = deltas.reindex(index=deltas.index.union(current.index), columns=day_index, fill_value=0.0)
+
+    # Close of day D = current stock - movements on days after D
+    after = deltas.iloc[:, ::-1].cumsum(axis=1).iloc[:, ::-1].shift(-1, axis=1, fill_value=0.0)
+    # Movements logged before the first receipt can push the walk-back negative; stock cannot be
+    closes = after.rsub(current.reindex(deltas.index, fill_value=0.0), axis=0).clip(lower=0)
+
+    history = closes.iloc[:, :-1].stack().rename('footage').reset_index()
+    history.columns = ['material', 'category', 'day', 'footage']
+    history = history[history['footage'].round(6) != 0]
+    rows = history.assign(item_count=0).to_dict("records")
+    _upsert_snapshot_rows(rows, ignore_duplicates=True)
+    load_stock_as_of.clear()
+    load_snapshot_trend.clear()
+    return len(rows)
+
+@metrics.cache_data(ttl=300)
+def load_stock_as_of(day):
+    """Stock per material at the close of `day` (YYYY-MM-DD), from the nearest snapshot plus replay."""
+    res = supabase.rpc("inventory_as_of", {"p_day": day}).execute()
+    if not res.data:
+        return pd.DataFrame(columns=["material", "category", "footage", "snapshot_day"])
+    stock = pd.DataFrame(res.data)
+    return stock[stock['footage'].round(6) != 0].sort_values(['category', 'material'], ignore_index=True)
+
+@metrics.cache_data(ttl=300)
+def load_snapshot_trend(materials, since_day):
+    """Daily snapshot footage for the given materials from `since_day` on."""
+    rows, offset, page_size = [], 0, 1000
+    while True:
+        batch = (
+            supabase.table("inventory_snapshots")
+            .select("day, material, category, footage")
+            .in_("material", list(materials))
+            .gte("day", since_day)
+            .order("day")
+            .range(offset, offset + page_size - 1)
+            .execute().data or []
+        )
+        rows.extend(batch)
+        if len(batch) < page_size:
+            break
+        offset += page_size
+    if not rows:
+        return pd.DataFrame(columns=["day", "material", "category", "footage"])
+    return pd.DataFrame(rows)
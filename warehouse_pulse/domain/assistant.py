@@ -0,0 +1,256 @@
+"""Context, tools and streaming for the AI assistant."""
+
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# --- AI ASSISTANT ---
+GROK_MODEL = "grok-beta"
+GROK_SYSTEM_PROMPT = "You are a helpful warehouse management AI assistant. Provide clear, actionable insights based on inventory data."
+AI_CACHE_SIZE = 128
+_ai_cache_lock = threading.Lock()
+
+def build_ai_context(inventory_df, reorder_df=None, thresholds=None, top_n=5):
+    """
+    Compact statistical summary of the inventory for the AI prompt (no raw rows).
+
+    Args:
+        inventory_df: Current inventory
+        reorder_df: Output of forecast_reorder_points, if available
+        thresholds: Static low-stock thresholds by material
+        top_n: Materials listed per category
+
+    Returns:
+        str: Plain-text context block
+    """
+    if inventory_df is None or inventory_df.empty:
+        return "Inventory is empty."
+
+    by_cat = inventory_df.groupby("Category").agg(
+        Items=("Item_ID", "count"), Total=("Footage", "sum"), Materials=("Material", "nunique"), Locations=("Location", "nunique")
+    ).sort_values("Total", ascending=False)
+    lines = [f"Totals: {len(inventory_df)} items, {inventory_df['Material'].nunique()} materials, {inventory_df['Footage'].sum():,.0f} ft/units on hand."]
+    lines.append("Per category (items | total ft/units | materials | locations):")
+    lines += [f"- {r.Index}: {r.Items} | {r.Total:,.0f} | {r.Materials} | {r.Locations}" for r in by_cat.itertuples()]
+
+    by_mat = inventory_df.groupby(["Category", "Material"]).agg(Total=("Footage", "sum"), Items=("Item_ID", "count")).reset_index()
+    top = by_mat.sort_values("Total", ascending=False).groupby("Category").head(top_n)
+    lines.append(f"Largest {top_n} materials per category (total, items):")
+    lines += [f"- [{r.Category}] {r.Material}: {r.Total:,.0f} ({r.Items})" for r in top.itertuples()]
+
+    if reorder_df is not None and not reorder_df.empty:
+        active = reorder_df[reorder_df["Daily_Demand"] > 0].sort_values("Days_Of_Cover").head(15)
+        if not active.empty:
+            lines.append("Forecast (daily demand | reorder point | on hand | days of cover), lowest cover first:")
+            lines += [f"- {r.Material}: {r.Daily_Demand:,.1f} | {r.Reorder_Point:,.0f} | {r.On_Hand:,.0f} | {r.Days_Of_Cover:,.0f}" for r in active.itertuples()]
+
+    if thresholds:
+        totals = inventory_df.groupby("Material")["Footage"].sum()
+        low = [f"- {m}: {totals.get(m, 0):,.0f} (threshold {t:,.0f})" for m, t in thresholds.items() if totals.get(m, 0) < t]
+        if low:
+            lines.append("Below static threshold:")
+            lines += low
+
+    return "\n".join(lines)
+
+@st.cache_resource
+def _ai_response_cache():
+    """Process-wide LRU of finished answers keyed by (question, data version); guard with _ai_cache_lock."""
+    from collections import OrderedDict
+    return OrderedDict()
+
+AI_TOOLS = [
+    {"type": "function", "function": {
+        "name": "inventory_overview",
+        "description": "Totals per category, largest materials, forecast cover and items below threshold.",
+        "parameters": {"type": "object", "properties": {}},
+    }},
+    {"type": "function", "function": {
+        "name": "stock_by_material",
+        "description": "On-hand totals for materials whose name contains the search text.",
+        "parameters": {"type": "object", "properties": {
+            "material": {"type": "string", "description": "Text to match in the material name, e.g. '.016 Stucco'"},
+            "category": {"type": "string", "description": "Optional category, e.g. Coils"},
+        }, "required": ["material"]},
+    }},
+    {"type": "function", "function": {
+        "name": "low_stock_list",
+        "description": "Materials at or below their reorder point, lowest days of cover first.",
+        "parameters": {"type": "object", "properties": {
+            "limit": {"type": "integer", "description": "Maximum rows", "default": 20},
+        }},
+    }},
+    {"type": "function", "function": {
+        "name": "location_contents",
+        "description": "Everything stored at a location (partial match).",
+        "parameters": {"type": "object", "properties": {
+            "location": {"type": "string"},
+        }, "required": ["location"]},
+    }},
+    {"type": "function", "function": {
+        "name": "po_summary",
+        "description": "Items received under a purchase order number (partial match).",
+        "parameters": {"type": "object", "properties": {
+            "po_number": {"type": "string"},
+        }, "required": ["po_number"]},
+    }},
+    {"type": "function", "function": {
+        "name": "movement_summary",
+        "description": "Quantities picked, used in production, received or removed between two dates.",
+        "parameters": {"type": "object", "properties": {
+            "start_date": {"type": "string", "description": "YYYY-MM-DD"},
+            "end_date": {"type": "string", "description": "YYYY-MM-DD"},
+            "action_type": {"type": "string", "enum": ["Pick", "Production", "Received", "Removed"]},
+            "group_by": {"type": "string", "enum": ["material", "category", "client", "day"], "default": "material"},
+        }, "required": ["start_date", "end_date"]},
+    }},
+]
+
+def run_ai_tool(name, args, inventory_df, reorder_df=None, thresholds=None, movements_df=None):
+    """
+    Execute one assistant tool against the in-memory data.
+
+    Returns:
+        dict: JSON-serializable result (capped at 50 rows)
+    """
+    inv = inventory_df if inventory_df is not None else pd.DataFrame(columns=["Item_ID", "Material", "Category", "Footage", "Location", "Purchase_Order_Num"])
+
+    def _records(frame, limit=50):
+        return {"rows": frame.head(limit).round(2).to_dict("records"), "total_rows": len(frame)}
+
+    if name == "inventory_overview":
+        return {"overview": build_ai_context(inv, reorder_df, thresholds)}
+
+    if name == "stock_by_material":
+        hits = inv[inv["Material"].astype(str).str.contains(str(args.get("material", "")), case=False, regex=False)]
+        if args.get("category"):
+            hits = hits[hits["Category"].astype(str).str.lower() == str(args["category"]).lower()]
+        summary = hits.groupby(["Category", "Material"]).agg(
+            Total=("Footage", "sum"), Items=("Item_ID", "count"), Locations=("Location", "nunique")
+        ).reset_index().sort_values("Total", ascending=False)
+        return _records(summary)
+
+    if name == "low_stock_list":
+        limit = int(args.get("limit", 20))
+        rows = []
+        if reorder_df is not None and not reorder_df.empty:
+            due = reorder_df[(reorder_df["Daily_Demand"] > 0) & (reorder_df["On_Hand"] <= reorder_df["Reorder_Point"])]
+            rows.append(due[["Material", "Category", "On_Hand", "Reorder_Point", "Days_Of_Cover"]])
+        if thresholds:
+            totals = inv.groupby("Material")["Footage"].sum()
+            static = pd.DataFrame([
+                {"Material": m, "On_Hand": float(totals.get(m, 0)), "Reorder_Point": t}
+                for m, t in thresholds.items() if totals.get(m, 0) < t
+            ])
+            rows.append(static)
+        combined = pd.concat([r for r in rows if not r.empty]) if any(not r.empty for r in rows) else pd.DataFrame()
+        if combined.empty:
+            return {"rows": [], "total_rows": 0}
+        combined = combined.drop_duplicates("Material")
+        if "Days_Of_Cover" in combined.columns:
+            combined = combined.sort_values("Days_Of_Cover", na_position="last")
+        return _records(combined.replace([np.inf, -np.inf], None), limit)
+
+    if name == "location_contents":
+        hits = inv[inv["Location"].astype(str).str.contains(str(args.get("location", "")), case=False, regex=False)]
+        return _records(hits.groupby(["Location", "Category", "Material"]).agg(
+            Total=("Footage", "sum"), Items=("Item_ID", "count")
+        ).reset_index())
+
+    if name == "po_summary":
+        hits = inv[inv["Purchase_Order_Num"].astype(str).str.contains(str(args.get("po_number", "")), case=False, regex=False)]
+        return _records(hits.groupby(["Purchase_Order_Num", "Category", "Material"]).agg(
+            Total=("Footage", "sum"), Items=("Item_ID", "count")
+        ).reset_index())
+
+    if name == "movement_summary":
+        if movements_df is None or movements_df.empty:
+            return {"rows": [], "total_rows": 0}
+        moves = movements_df[(movements_df["day"] >= str(args["start_date"])) & (movements_df["day"] <= str(args["end_date"]))]
+        if args.get("action_type"):
+            moves = moves[moves["action_type"] == args["action_type"]]
+        group_by = args.get("group_by", "material")
+        grouped = moves.groupby([group_by, "action_type"])["quantity"].sum().reset_index().sort_values("quantity", ascending=False)
+        return _records(grouped)
+
+    return {"error": f"Unknown tool: {name}"}
+
+def stream_ai_answer(client, question, data_version, run_tool, model=GROK_MODEL):
+    """
+    Answer a question by letting the model call local tools, then stream its phrasing.
+
+    The model only sees the question, the tool schemas and the tool results, never
+    raw inventory rows. Repeats of a question on the same data come from cache.
+
+    Args:
+        client: OpenAI-compatible client
+        question: User question
+        data_version: Inventory data version the tools read from
+        run_tool: Callable (name, args) -> dict executing a tool locally
+
+    Yields:
+        str: Answer text chunks
+    """
+    import json
+
+    cache = _ai_response_cache()
+    key = (" ".join(question.lower().split()), data_version)
+    with _ai_cache_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+    if cached is not None:
+        yield cached
+        return
+
+    messages = [
+        {"role": "system", "content": GROK_SYSTEM_PROMPT + " Use the tools to look up exact figures; never guess quantities. "
+                                       f"Today is {datetime.now().strftime('%Y-%m-%d')}."},
+        {"role": "user", "content": question},
+    ]
+
+    # Planning round: the model picks tools, which run locally
+    plan = client.chat.completions.create(
+        model=model, messages=messages, tools=AI_TOOLS, tool_choice="auto", temperature=0.2, max_tokens=400
+    )
+    reply = plan.choices[0].message
+    parts = []
+
+    if reply.tool_calls:
+        messages.append({
+            "role": "assistant",
+            "content": reply.content or "",
+            "tool_calls": [
+                {"id": call.id, "type": "function", "function": {"name": call.function.name, "arguments": call.function.arguments}}
+                for call in reply.tool_calls
+            ],
+        })
+        for call in reply.tool_calls:
+            try:
+                result = run_tool(call.function.name, json.loads(call.function.arguments or "{}"))
+            except Exception as e:
+                result = {"error": str(e)}
+            messages.append({"role": "tool", "tool_call_id": call.id, "content": json.dumps(result, default=str)})
+
+        # Phrasing round, streamed
+        stream = client.chat.completions.create(
+            model=model, messages=messages, temperature=0.7, max_tokens=1500, stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+                yield parts[-1]
+    elif reply.content:
+        parts.append(reply.content)
+        yield reply.content
+
+    answer = "".join(parts)
+    if answer:
+        with _ai_cache_lock:
+            cache[key] = answer
+            cache.move_to_end(key)
+            while len(cache) > AI_CACHE_SIZE:
+                cache.popitem(last=False)
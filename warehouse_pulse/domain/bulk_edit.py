@@ -0,0 +1,115 @@
+"""Admin bulk edit: diffing the edited grid and applying it atomically."""
+
+import numpy as np
+import pandas as pd
+
+from warehouse_pulse.data.audit_writer import audit_timestamp
+from warehouse_pulse.data.client import supabase
+
+# --- ADMIN BULK EDIT ---
+BULK_EDIT_COLUMNS = ['Item_ID', 'Category', 'Material', 'Footage', 'Location', 'Status']
+
+def duplicate_item_ids(item_ids):
+    """Item_IDs that occur more than once (the grid and the diff are keyed by Item_ID)."""
+    ids = pd.Series(item_ids).astype(str)
+    return sorted(set(ids[ids.duplicated()]))
+
+def diff_inventory_edits(original_df, edited_df, all_item_ids):
+    """
+    Row-level diff between the Admin grid before and after editing.
+
+    Both frames are indexed by the original Item_ID, which must be unique; edited_df
+    also carries a boolean "Delete" column. A row marked for deletion ignores its other
+    edits. Rename clashes are checked against the IDs left after the whole batch, so a
+    rename may take an ID deleted or renamed away in the same save, and IDs can be swapped.
+
+    Args:
+        original_df: Grid rows as loaded
+        edited_df: Grid rows as returned by st.data_editor
+        all_item_ids: Every Item_ID currently in inventory (for rename clashes)
+
+    Returns:
+        dict: updates, renames, deletes and a list of validation errors
+    """
+    duplicates = duplicate_item_ids(original_df.index)
+    if duplicates:
+        return {"updates": [], "renames": [], "deletes": [], "original": original_df,
+                "errors": [f"Item IDs appear on more than one inventory row, fix them one at a time first: {duplicates[:5]}"]}
+
+    orig = original_df.loc[edited_df.index]
+    deleted = edited_df['Delete'].fillna(False).astype(bool)
+    kept = edited_df[~deleted]
+    kept_orig = orig[~deleted]
+
+    new_ids = kept['Item_ID'].fillna("").astype(str).str.strip()
+    footage_changed = ~np.isclose(
+        pd.to_numeric(kept['Footage'], errors='coerce').fillna(-1).to_numpy(dtype=float),
+        pd.to_numeric(kept_orig['Footage'], errors='coerce').fillna(-1).to_numpy(dtype=float)
+    )
+    location_changed = (kept['Location'].fillna("").astype(str).str.strip() != kept_orig['Location'].fillna("").astype(str)).to_numpy()
+    renamed = (new_ids != kept.index.astype(str)).to_numpy()
+
+    errors = []
+    if (new_ids == "").any():
+        errors.append("Item ID cannot be empty")
+    if new_ids.duplicated().any():
+        errors.append(f"Duplicate Item IDs in grid: {sorted(set(new_ids[new_ids.duplicated()]))[:5]}")
+    # IDs still held after this save by rows that are neither deleted nor renamed
+    vacated = set(edited_df.index[deleted].astype(str)) | set(kept.index[renamed].astype(str))
+    taken = set(all_item_ids) - vacated
+    clashes = [nid for nid in new_ids[renamed] if nid in taken]
+    if clashes:
+        errors.append(f"Item IDs already exist: {clashes[:5]}")
+    if (pd.to_numeric(kept['Footage'], errors='coerce').fillna(-1) < 0).any():
+        errors.append("Footage must be zero or more")
+
+    changed = kept[footage_changed | location_changed]
+    updates = [{
+        "Item_ID": str(old_id),
+        "Footage": float(row['Footage']),
+        "Location": str(row['Location']).strip(),
+    } for old_id, row in changed.iterrows()]
+
+    return {
+        "updates": updates,
+        "renames": [{"old_id": str(o), "new_id": n} for o, n in zip(kept.index[renamed], new_ids[renamed])],
+        "deletes": [str(i) for i in edited_df.index[deleted]],
+        "original": orig,
+        "errors": errors,
+    }
+
+def apply_inventory_edits(changes, user_name, reason):
+    """
+    Write a bulk-edit diff and its audit trail in one transaction (apply_inventory_edits RPC).
+
+    Returns:
+        int: Number of inventory rows touched
+    """
+    # Written inside the RPC's transaction rather than through audit_writer
+    now = audit_timestamp()
+    orig = changes['original']
+    audit = []
+
+    for upd in changes['updates']:
+        before = orig.loc[upd['Item_ID']]
+        if not np.isclose(float(before['Footage']), upd['Footage']):
+            audit.append({"Item_ID": upd['Item_ID'], "Action": "Admin Edit - Footage", "User": user_name, "Timestamp": now,
+                          "Details": f"Bulk edit: footage {float(before['Footage']):.1f} → {upd['Footage']:.1f}. Reason: {reason}"})
+        if str(before['Location']) != upd['Location']:
+            audit.append({"Item_ID": upd['Item_ID'], "Action": "Admin Edit - Location", "User": user_name, "Timestamp": now,
+                          "Details": f"Bulk edit: moved from {before['Location']} to {upd['Location']}. Reason: {reason}"})
+    for ren in changes['renames']:
+        audit.append({"Item_ID": ren['new_id'], "Action": "Admin Edit - Item ID Changed", "User": user_name, "Timestamp": now,
+                      "Details": f"Item ID changed from '{ren['old_id']}' to '{ren['new_id']}' (bulk edit). Reason: {reason}"})
+    for item_id in changes['deletes']:
+        before = orig.loc[item_id]
+        audit.append({"Item_ID": item_id, "Action": "Admin - Item Removed", "User": user_name, "Timestamp": now,
+                      "Details": f"Bulk edit removed {before['Material']} ({float(before['Footage']):.1f}) from {before['Location']}. Reason: {reason}"})
+
+    response = supabase.rpc("apply_inventory_edits", {
+        "p_updates": changes['updates'],
+        "p_renames": changes['renames'],
+        "p_deletes": changes['deletes'],
+        "p_audit": audit,
+    }).execute()
+    return int(response.data or 0)
@@ -0,0 +1,134 @@
+"""Demand forecasting and reorder points."""
+
+import numpy as np
+import pandas as pd
+
+from warehouse_pulse import metrics
+from warehouse_pulse.data.movements import APP_TIMEZONE, load_movement_rollup
+
+# --- DEMAND FORECASTING ---
+# Supplier lead time in days per category (DEFAULT_LEAD_TIME_DAYS otherwise)
+LEAD_TIME_DAYS = {
+    "Coils": 21,
+    "Rolls": 21,
+}
+DEFAULT_LEAD_TIME_DAYS = 14
+
+def build_consumption_matrix(movements, history_days=730):
+    """
+    Pivot outbound movements into a materials x days matrix of daily consumption.
+
+    Args:
+        movements: movement_daily rows (or classify_movements output), days in MST
+        history_days: Days of history to keep, ending today
+
+    Returns:
+        tuple: (keys DataFrame of Material/Category, 2-D float array)
+    """
+    outbound = movements[movements["action_type"].isin(["Pick", "Production"])]
+    end = pd.Timestamp.now(tz=APP_TIMEZONE).normalize().tz_localize(None)
+    start = end - pd.Timedelta(days=history_days - 1)
+    days = pd.to_datetime(outbound["day"])
+    outbound = outbound[(days >= start) & (days <= end)]
+
+    keys = outbound[["material", "category"]].drop_duplicates().reset_index(drop=True)
+    matrix = np.zeros((len(keys), history_days))
+    if keys.empty:
+        return keys.rename(columns={"material": "Material", "category": "Category"}), matrix
+
+    row_idx = pd.MultiIndex.from_frame(keys).get_indexer(pd.MultiIndex.from_frame(outbound[["material", "category"]]))
+    col_idx = ((pd.to_datetime(outbound["day"]) - start).dt.days).to_numpy()
+    np.add.at(matrix, (row_idx, col_idx), outbound["quantity"].to_numpy(dtype=float))
+    return keys.rename(columns={"material": "Material", "category": "Category"}), matrix
+
+def fit_demand_models(matrix, alpha=0.1):
+    """
+    Fit every series at once: simple exponential smoothing for steady demand,
+    Croston (SBA) for intermittent demand (average gap between demands > 1.32 days).
+
+    Each series starts at its material's first demand. The days before it are not
+    demand-free days, so a new material drawing steadily is not read as intermittent
+    and its Croston interval does not absorb the empty lead-in.
+
+    Args:
+        matrix: materials x days consumption
+        alpha: Smoothing constant shared by both models
+
+    Returns:
+        dict: rate (daily demand), sigma (one-step error std), intermittent flags
+    """
+    n, t = matrix.shape
+    rows = np.arange(n)
+    demand_days = (matrix > 0).sum(axis=1)
+    start = np.argmax(matrix > 0, axis=1)  # 0 for series without demand
+    intermittent = (t - start) / np.maximum(demand_days, 1) > 1.32
+
+    first = matrix[rows, start]
+    level = first.copy()
+    size = np.where(first > 0, first, matrix.sum(axis=1) / np.maximum(demand_days, 1))
+    interval = np.full(n, 1.0)
+    gap = np.ones(n)
+    sq_error = np.zeros(n)
+
+    for day in range(1, t):
+        live = day > start
+        y = matrix[:, day]
+        croston_rate = size / interval
+        rate = np.where(intermittent, croston_rate, level)
+        sq_error = np.where(live, (1 - alpha) * sq_error + alpha * (y - rate) ** 2, sq_error)
+
+        # SES
+        level = np.where(live, level + alpha * (y - level), level)
+
+        # Croston only updates on days with demand
+        hit = live & (y > 0)
+        size = np.where(hit, size + alpha * (y - size), size)
+        interval = np.where(hit, interval + alpha * (gap - interval), interval)
+        gap = np.where(hit, 1.0, np.where(live, gap + 1.0, gap))
+
+    rate = np.where(intermittent, (1 - alpha / 2) * size / interval, level)
+    rate = np.where(demand_days > 0, rate, 0.0)
+    return {"rate": rate, "sigma": np.sqrt(sq_error), "intermittent": intermittent}
+
+@metrics.cache_data(show_spinner=False, max_entries=4)
+def forecast_reorder_points(data_version, _inventory_df, service_level=0.95, history_days=730):
+    """
+    Daily demand, safety stock and reorder point per (material, category), cached per data version.
+
+    Demand history comes from the movement_daily rollup (keep it synced first), which
+    also covers audit rows that have since been archived.
+
+    Safety stock = z(service level) * sigma * sqrt(lead time);
+    reorder point = daily demand * lead time + safety stock.
+
+    Returns:
+        pd.DataFrame: Material, Category, Model, Daily_Demand, Lead_Time, Safety_Stock, Reorder_Point, On_Hand, Days_Of_Cover
+    """
+    from statistics import NormalDist
+
+    since_day = (pd.Timestamp.now(tz=APP_TIMEZONE) - pd.Timedelta(days=history_days - 1)).strftime("%Y-%m-%d")
+    movements = load_movement_rollup(("Pick", "Production"), since_day)
+    keys, matrix = build_consumption_matrix(movements, history_days)
+    if keys.empty:
+        return pd.DataFrame(columns=["Material", "Category", "Model", "Daily_Demand", "Lead_Time",
+                                     "Safety_Stock", "Reorder_Point", "On_Hand", "Days_Of_Cover"])
+
+    fit = fit_demand_models(matrix)
+    lead_time = keys["Category"].map(LEAD_TIME_DAYS).fillna(DEFAULT_LEAD_TIME_DAYS).to_numpy(dtype=float)
+    z = NormalDist().inv_cdf(service_level)
+    safety_stock = z * fit["sigma"] * np.sqrt(lead_time)
+
+    if _inventory_df.empty:
+        on_hand = pd.Series(dtype=float, index=pd.MultiIndex.from_arrays([[], []], names=["Material", "Category"]))
+    else:
+        on_hand = pd.to_numeric(_inventory_df["Footage"], errors="coerce").groupby(
+            [_inventory_df["Material"], _inventory_df["Category"]]).sum()
+    result = keys.copy()
+    result["Model"] = np.where(fit["intermittent"], "Croston", "Exp. Smoothing")
+    result["Daily_Demand"] = fit["rate"]
+    result["Lead_Time"] = lead_time
+    result["Safety_Stock"] = safety_stock
+    result["Reorder_Point"] = fit["rate"] * lead_time + safety_stock
+    result["On_Hand"] = on_hand.reindex(pd.MultiIndex.from_frame(keys)).fillna(0.0).to_numpy()
+    result["Days_Of_Cover"] = np.where(fit["rate"] > 0, result["On_Hand"] / np.maximum(fit["rate"], 1e-9), np.inf)
+    return result
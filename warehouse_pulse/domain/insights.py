@@ -0,0 +1,243 @@
+"""Cached metrics and chart figures for the Insights tab."""
+
+
+from warehouse_pulse import metrics
+
+# --- INSIGHTS CHARTS ---
+# Aggregates and figures are memoized per (data version, chart settings); figures are
+# cached as plain dicts so a rerun or a settings toggle only re-renders.
+WAREHOUSE_TARGET_CAPACITY = 50000.0
+
+INSIGHTS_LOW_STOCK_THRESHOLDS = {
+    'Coils': 5000,
+    'Rolls': 1000,
+    'Elbows': 50,
+    'Fab Straps': 100,
+    'Mineral Wool': 50,
+    'Wing Seals': 500,
+    'Wire': 200,
+    'Banding': 500
+}
+
+@metrics.cache_data(show_spinner=False, max_entries=8)
+def insights_metrics(data_version, _df):
+    """Headline numbers for the Warehouse Overview cards."""
+    return {
+        "total_footage": float(_df['Footage'].sum()),
+        "total_items": len(_df),
+        "total_categories": int(_df['Category'].nunique()),
+        "active_items": int((_df['Status'] == 'Active').sum()),
+    }
+
+@metrics.cache_data(show_spinner=False, max_entries=8)
+def insights_gauge_figure(total_footage, target_capacity=WAREHOUSE_TARGET_CAPACITY):
+    """Capacity gauge figure (as a dict) for a given total footage."""
+    import plotly.graph_objects as go
+
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=total_footage,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Total Warehouse Footage", 'font': {'size': 20, 'color': '#1e293b'}},
+        delta={'reference': target_capacity * 0.8, 'increasing': {'color': "#dc2626"}},
+        gauge={
+            'axis': {'range': [None, target_capacity], 'tickwidth': 1, 'tickcolor': "#64748b"},
+            'bar': {'color': "#7c3aed"},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "#e2e8f0",
+            'steps': [
+                {'range': [0, target_capacity * 0.5], 'color': '#dcfce7'},
+                {'range': [target_capacity * 0.5, target_capacity * 0.8], 'color': '#fef9c3'},
+                {'range': [target_capacity * 0.8, target_capacity], 'color': '#fee2e2'}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': target_capacity * 0.9
+            }
+        }
+    ))
+    fig_gauge.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=60, b=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        font={'color': "#1e293b", 'family': "Arial"}
+    )
+    return fig_gauge.to_dict()
+
+@metrics.cache_data(show_spinner=False, max_entries=16)
+def insights_chart1_data(data_version, _df, metric):
+    """
+    Footage grouped for the left chart.
+
+    Returns:
+        tuple: (aggregated DataFrame, title, names column)
+    """
+    if metric == "Category":
+        return _df.groupby('Category')['Footage'].sum().reset_index(), "Inventory by Category", 'Category'
+    if metric == "Location":
+        return _df.groupby('Location')['Footage'].sum().nlargest(10).reset_index(), "Top 10 Locations by Footage", 'Location'
+    if metric == "Status":
+        return _df.groupby('Status')['Footage'].sum().reset_index(), "Inventory by Status", 'Status'
+
+    # Material type (e.g. "Aluminum" from "Smooth Aluminum Coil")
+    material_type = _df['Material'].str.extract(r'(Aluminum|Stainless Steel|Galvanized|Steel)')[0].fillna('Other')
+    data = _df['Footage'].groupby(material_type.rename('Material_Type')).sum().reset_index()
+    return data, "Inventory by Material Type", 'Material_Type'
+
+@metrics.cache_data(show_spinner=False, max_entries=64)
+def insights_chart1_figure(data_version, _df, metric, chart_type, show_value):
+    """Left chart as (title, figure dict)."""
+    import plotly.express as px
+
+    chart1_data, chart1_title, names_col = insights_chart1_data(data_version, _df, metric)
+    values_col = 'Footage'
+
+    if chart_type == "Pie Chart":
+        fig1 = px.pie(
+            chart1_data,
+            names=names_col,
+            values=values_col,
+            hole=0.5,
+            color_discrete_sequence=px.colors.qualitative.Bold
+        )
+        fig1.update_traces(
+            textposition='inside',
+            textinfo='percent+label' if show_value else 'label',
+            hovertemplate=f'<b>%{{label}}</b><br>Footage: %{{value:,.0f}}<br>Percent: %{{percent}}<extra></extra>'
+        )
+    elif chart_type == "Bar Chart":
+        fig1 = px.bar(
+            chart1_data.sort_values(values_col, ascending=True).tail(10),
+            x=values_col,
+            y=names_col,
+            orientation='h',
+            color=names_col,
+            color_discrete_sequence=px.colors.qualitative.Bold
+        )
+        fig1.update_traces(
+            texttemplate='%{x:,.0f}' if show_value else None,
+            textposition='outside',
+            hovertemplate=f'<b>%{{y}}</b><br>Footage: %{{x:,.0f}}<extra></extra>'
+        )
+    else:  # Treemap
+        fig1 = px.treemap(
+            chart1_data,
+            path=[names_col],
+            values=values_col,
+            color=values_col,
+            color_continuous_scale='Blues'
+        )
+        fig1.update_traces(
+            texttemplate='<b>%{label}</b><br>%{value:,.0f} ft' if show_value else '<b>%{label}</b>',
+            hovertemplate='<b>%{label}</b><br>Footage: %{value:,.0f}<extra></extra>'
+        )
+
+    fig1.update_layout(
+        margin=dict(l=20, r=20, t=20, b=20),
+        height=400,
+        showlegend=chart_type != "Treemap"
+    )
+    return chart1_title, fig1.to_dict()
+
+@metrics.cache_data(show_spinner=False, max_entries=64)
+def insights_chart2_figure(data_version, _df, metric, show_value):
+    """
+    Right chart for the inventory-based views (Top 10 Materials, Items by Location,
+    Low Stock Alert, PO Summary).
+
+    Returns:
+        dict: fig (figure dict or None when there is nothing to plot) and count (rows behind the chart)
+    """
+    import plotly.express as px
+
+    if metric == "Top 10 Materials":
+        mat_sum = _df.groupby(['Material', 'Category'])['Footage'].sum().nlargest(10).reset_index()
+        fig2 = px.bar(
+            mat_sum.sort_values('Footage'),
+            x='Footage',
+            y='Material',
+            orientation='h',
+            color='Category',
+            color_discrete_sequence=px.colors.qualitative.Bold
+        )
+        fig2.update_traces(
+            texttemplate='%{x:,.0f}' if show_value else None,
+            textposition='outside',
+            hovertemplate='<b>%{y}</b><br>Footage: %{x:,.0f}<br>Category: %{fullData.name}<extra></extra>'
+        )
+        fig2.update_layout(margin=dict(l=20, r=20, t=20, b=20), height=400)
+        return {"fig": fig2.to_dict(), "count": len(mat_sum)}
+
+    if metric == "Items by Location":
+        loc_sum = _df.groupby('Location').agg({'Item_ID': 'count', 'Footage': 'sum'}).reset_index()
+        loc_sum.columns = ['Location', 'Item_Count', 'Total_Footage']
+        loc_sum = loc_sum.nlargest(10, 'Total_Footage')
+        fig2 = px.scatter(
+            loc_sum,
+            x='Item_Count',
+            y='Total_Footage',
+            size='Total_Footage',
+            color='Location',
+            hover_data=['Location'],
+            color_discrete_sequence=px.colors.qualitative.Bold
+        )
+        fig2.update_traces(
+            hovertemplate='<b>%{customdata[0]}</b><br>Items: %{x}<br>Footage: %{y:,.0f}<extra></extra>'
+        )
+        fig2.update_layout(
+            margin=dict(l=20, r=20, t=20, b=20),
+            height=400,
+            xaxis_title="Number of Items",
+            yaxis_title="Total Footage"
+        )
+        return {"fig": fig2.to_dict(), "count": len(loc_sum)}
+
+    if metric == "Low Stock Alert":
+        totals = _df.groupby(['Category', 'Material'])['Footage'].sum().reset_index(name='Current_Stock')
+        totals['Threshold'] = totals['Category'].map(INSIGHTS_LOW_STOCK_THRESHOLDS)
+        low = totals[totals['Current_Stock'] < totals['Threshold']].copy()
+        if low.empty:
+            return {"fig": None, "count": 0}
+        low['Shortage'] = low['Threshold'] - low['Current_Stock']
+        low_df = low.nlargest(10, 'Shortage')
+        fig2 = px.bar(
+            low_df,
+            x='Shortage',
+            y='Material',
+            orientation='h',
+            color='Category',
+            color_discrete_sequence=px.colors.qualitative.Set1,
+            hover_data=['Current_Stock', 'Threshold']
+        )
+        fig2.update_traces(
+            hovertemplate='<b>%{y}</b><br>Shortage: %{x:,.0f}<br>Current: %{customdata[0]:,.0f}<br>Target: %{customdata[1]:,.0f}<extra></extra>'
+        )
+        fig2.update_layout(margin=dict(l=20, r=20, t=20, b=20), height=400)
+        return {"fig": fig2.to_dict(), "count": len(low)}
+
+    # PO Summary
+    po_data = _df[_df['Purchase_Order_Num'].notna()].groupby('Purchase_Order_Num').agg({
+        'Item_ID': 'count',
+        'Footage': 'sum',
+        'Category': lambda x: ', '.join(x.unique()[:3])
+    }).reset_index()
+    po_data.columns = ['PO_Number', 'Items', 'Total_Footage', 'Categories']
+    po_data = po_data.nlargest(10, 'Total_Footage')
+    if po_data.empty:
+        return {"fig": None, "count": 0}
+    fig2 = px.bar(
+        po_data.sort_values('Total_Footage'),
+        x='Total_Footage',
+        y='PO_Number',
+        orientation='h',
+        color='Items',
+        color_continuous_scale='Viridis',
+        hover_data=['Categories']
+    )
+    fig2.update_traces(
+        hovertemplate='<b>%{y}</b><br>Footage: %{x:,.0f}<br>Items: %{marker.color}<br>Categories: %{customdata[0]}<extra></extra>'
+    )
+    fig2.update_layout(margin=dict(l=20, r=20, t=20, b=20), height=400)
+    return {"fig": fig2.to_dict(), "count": len(po_data)}
@@ -0,0 +1,152 @@
+"""Attribute extraction from material names and the dashboard category filters."""
+
+import re
+
+# --- MATERIAL ATTRIBUTES ---
+def extract_metal(material):
+    material_lower = str(material).lower()
+    if 'stainless' in material_lower:
+        return 'Stainless Steel'
+    elif 'aluminum' in material_lower:
+        return 'Aluminum'
+    elif 'galvanized' in material_lower:
+        return 'Galvanized'
+    else:
+        return 'Other'
+
+def extract_gauge(material):
+    match = re.search(r'\.(\d{2,3})', str(material))
+    if match:
+        return f".{match.group(1)}"
+    return 'Unknown'
+
+def extract_texture(material):
+    material_lower = str(material).lower()
+    if 'smooth' in material_lower:
+        return 'Smooth'
+    elif 'stucco' in material_lower:
+        return 'Stucco'
+    else:
+        return 'Other'
+
+def extract_angle(material):
+    material_str = str(material)
+    if '90°' in material_str or '90 ' in material_str or '90deg' in material_str.lower():
+        return '90°'
+    elif '45°' in material_str or '45 ' in material_str or '45deg' in material_str.lower():
+        return '45°'
+    else:
+        return 'Other'
+
+def extract_size_number(material):
+    match = re.search(r'#(\d+)', str(material))
+    if match:
+        return f"#{match.group(1)}"
+    # Also try "Size X" pattern
+    match2 = re.search(r'Size\s*(\d+)', str(material), re.IGNORECASE)
+    if match2:
+        return f"#{match2.group(1)}"
+    return 'Unknown'
+
+def extract_pipe_size(material):
+    match = re.search(r'(\d+(?:\.\d+)?)\s*(?:in|inch|")', str(material), re.IGNORECASE)
+    if match:
+        return f"{match.group(1)} in"
+    # Try "Pipe Size: X" pattern
+    match2 = re.search(r'Pipe Size:\s*(\d+(?:\.\d+)?)', str(material), re.IGNORECASE)
+    if match2:
+        return f"{match2.group(1)} in"
+    return 'Unknown'
+
+def extract_thickness(material):
+    match = re.search(r'Thickness:\s*(\d+(?:\.\d+)?\s*in)', str(material), re.IGNORECASE)
+    if match:
+        return match.group(1)
+    # Alternative pattern
+    match2 = re.search(r'(\d+(?:\.\d+)?)\s*in\s*Thickness', str(material), re.IGNORECASE)
+    if match2:
+        return f"{match2.group(1)} in"
+    return 'Unknown'
+
+def extract_wing_seal_type(material):
+    material_lower = str(material).lower()
+    if 'open' in material_lower:
+        return 'Open'
+    elif 'closed' in material_lower:
+        return 'Closed'
+    return 'Other'
+
+def extract_wing_seal_size(material):
+    if '3/4' in str(material):
+        return '3/4 in'
+    elif '1/2' in str(material):
+        return '1/2 in'
+    return 'Other'
+
+def extract_banding_type(material):
+    material_lower = str(material).lower()
+    if 'oscillated' in material_lower and 'non' not in material_lower:
+        return 'Oscillated'
+    elif 'non-oscillated' in material_lower or 'non oscillated' in material_lower:
+        return 'Non-Oscillated'
+    return 'Other'
+
+def extract_wire_gauge(material):
+    match = re.search(r'(\d{2})\s*Gauge', str(material), re.IGNORECASE)
+    if match:
+        return f"{match.group(1)} Gauge"
+    return 'Unknown'
+
+def extract_insulation_form(material):
+    material_lower = str(material).lower()
+    if 'roll' in material_lower:
+        return 'Rolls'
+    elif 'batt' in material_lower:
+        return 'Batts'
+    elif 'pipe wrap' in material_lower:
+        return 'Pipe Wrap'
+    return 'Other'
+
+# --- DASHBOARD FILTERS ---
+# Attribute columns shown per dashboard category, in filter order
+VIEW_ATTRIBUTES = {
+    "Coils": [("Metal_Type", extract_metal), ("Gauge", extract_gauge), ("Texture", extract_texture)],
+    "Rolls": [("Metal_Type", extract_metal), ("Gauge", extract_gauge), ("Texture", extract_texture)],
+    "Elbows": [("Angle", extract_angle), ("Size", extract_size_number), ("Metal_Type", extract_metal)],
+    "Fab Straps": [("Gauge", extract_gauge), ("Size", extract_size_number), ("Metal_Type", extract_metal)],
+    "Mineral Wool": [("Pipe_Size", extract_pipe_size), ("Thickness", extract_thickness)],
+    "Wing Seals": [("Seal_Type", extract_wing_seal_type), ("Seal_Size", extract_wing_seal_size), ("Gauge", extract_gauge)],
+    "Wire": [("Wire_Gauge", extract_wire_gauge)],
+    "Banding": [("Banding_Type", extract_banding_type), ("Gauge", extract_gauge), ("Size", extract_wing_seal_size)],  # Same pattern for 3/4, 1/2
+    "Fiberglass Insulation": [("Form", extract_insulation_form), ("Thickness", extract_thickness)],
+}
+
+# Dropdown entries that mean "no filter"
+ALL_OPTIONS = {"All", "All Angles", "All Sizes"}
+
+def filter_view(df, view, selections):
+    """
+    Items for one dashboard view with its attribute columns and filters applied.
+
+    Args:
+        df: Inventory DataFrame
+        view: "All Materials" or a category name
+        selections: Attribute column -> selected dropdown value (None or an "All" entry to skip)
+
+    Returns:
+        tuple: (filtered DataFrame, list of applied filter values for the subtitle)
+    """
+    if view == "All Materials":
+        return df.copy(), []
+
+    display_df = df[df['Category'] == view].copy()
+    filter_parts = []
+    attributes = VIEW_ATTRIBUTES.get(view, [])
+    for column, extract in attributes:
+        display_df[column] = display_df['Material'].apply(extract)
+    for column, _ in attributes:
+        selected = selections.get(column)
+        if selected and selected not in ALL_OPTIONS:
+            display_df = display_df[display_df[column] == selected]
+            filter_parts.append(selected)
+    return display_df, filter_parts
@@ -0,0 +1,283 @@
+"""Production deductions from coil and roll pools."""
+
+from warehouse_pulse import metrics
+from warehouse_pulse.catalog import SIZE_DISPLAY
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.client import supabase
+from warehouse_pulse.data.inventory import update_stock
+
+@metrics.timed("process_production_line")
+def process_production_line(line, extra_allowance, material_type, order_number, client_name, operator_name, feedback, deduction_details):
+    """
+    Process a single production line (coil or roll).
+    
+    Args:
+        line: Dictionary with production line details
+        extra_allowance: Extra inches per piece
+        material_type: "Coil" or "Roll"
+        order_number: Internal order number
+        client_name: Client name
+        operator_name: Operator name
+        feedback: List to append feedback messages
+        deduction_details: List to append deduction records
+    
+    Returns:
+        tuple: (success: bool, total_footage: float)
+    """
+    if line["pieces"] <= 0:
+        return True, 0.0  # Skip empty lines
+    
+    if not line["items"]:
+        feedback.append(f"✗ {material_type} line for {line['display_size']} has no source selected")
+        return False, 0.0
+    
+    # Calculate required footage
+    if line["use_custom"]:
+        # Custom inches mode
+        inches_per_piece = line["custom_inches"]
+        size_label = f"Custom {inches_per_piece}in"
+    else:
+        # Standard size mode
+        inches_per_piece = SIZE_DISPLAY.get(line["display_size"], 12.0)
+        size_label = line["display_size"]
+    
+    # Calculate production footage (pieces × inches per piece + extra allowance per piece)
+    total_inches = (inches_per_piece + extra_allowance) * line["pieces"]
+    production_footage = total_inches / 12.0  # This is JUST production, no waste
+    
+    # Waste is separate
+    waste_footage = line["waste"]
+    
+    # Total needed for deduction = production + waste
+    total_footage_needed = production_footage + waste_footage
+    
+    # Get source items - refresh from database to get current values
+    source_items = []
+    for item_str in line["items"]:
+        item_id = item_str.split(" - ")[0]
+        
+        # Fetch current footage from database
+        try:
+            response = supabase.table("inventory").select("*").eq("Item_ID", item_id).execute()
+            if response.data:
+                item_data = response.data[0]
+                source_items.append({
+                    'id': item_id,
+                    'footage': float(item_data['Footage']),
+                    'material': item_data['Material']
+                })
+        except Exception as e:
+            feedback.append(f"✗ Error fetching {item_id}: {e}")
+            return False, 0.0
+    
+    if not source_items:
+        feedback.append(f"✗ No valid sources found for {material_type} {size_label}")
+        return False, 0.0
+    
+    # Calculate available footage
+    available_footage = sum(item['footage'] for item in source_items)
+    
+    if available_footage < total_footage_needed:
+        feedback.append(f"✗ Insufficient stock for {material_type} {size_label}: need {total_footage_needed:.2f} ft, have {available_footage:.2f} ft")
+        return False, 0.0
+    
+    # Deduct from sources
+    remaining_needed = total_footage_needed
+    
+    for item in source_items:
+        if remaining_needed <= 0:
+            break
+        
+        deduct_amount = min(item['footage'], remaining_needed)
+        new_footage = item['footage'] - deduct_amount
+        
+        # Calculate how much of this deduction is production vs waste
+        # (proportionally allocate if using multiple sources)
+        if total_footage_needed > 0:
+            proportion = deduct_amount / total_footage_needed
+            item_production = production_footage * proportion
+            item_waste = waste_footage * proportion
+        else:
+            item_production = 0
+            item_waste = 0
+        
+        # Update database
+        try:
+            action_details = f"Production: {line['pieces']} pcs of {size_label} ({item_production:.2f} ft production + {item_waste:.2f} ft waste = {deduct_amount:.2f} ft total) for {client_name} (Order: {order_number})"
+            
+            success_update = update_stock(
+                item_id=item['id'],
+                new_footage=new_footage,
+                user_name=operator_name,
+                action_type=action_details
+            )
+            
+            if not success_update:
+                feedback.append(f"✗ Failed to update {item['id']}")
+                return False, 0.0
+            
+            # Record for PDF - SEPARATE production and waste
+            deduction_details.append({
+                'source_id': item['id'],
+                'material': item['material'],
+                'size': size_label,
+                'pieces': line['pieces'],
+                'inches_per_piece': inches_per_piece,
+                'production_footage': item_production,  # Production ONLY (no waste)
+                'waste': item_waste,                    # Waste ONLY
+                'total_deducted': deduct_amount,        # Total deducted from this source
+                'material_type': material_type,
+                # Keep footage_used for backward compatibility
+                'footage_used': deduct_amount
+            })
+            
+            remaining_needed -= deduct_amount
+            
+        except Exception as e:
+            feedback.append(f"✗ Error updating {item['id']}: {e}")
+            return False, 0.0
+    
+    feedback.append(f"✓ {material_type} {size_label}: {line['pieces']} pieces produced ({production_footage:.2f} ft production + {waste_footage:.2f} ft waste = {total_footage_needed:.2f} ft total)")
+    return True, total_footage_needed
+
+# --- COIL / ROLL POOLS ---
+def calculate_pool_capacity(pool_ids, available_df):
+    """Calculate total available footage in a pool"""
+    if available_df.empty:
+        return 0
+    total = 0
+    for item_id in pool_ids:
+        match = available_df[available_df['Item_ID'] == item_id]
+        if not match.empty:
+            footage = float(match.iloc[0]['Footage'])
+            if footage > 0:  # Only count items with footage
+                total += footage
+    return total
+
+def get_pool_details(pool_ids, available_df):
+    """Get detailed info for each item in pool - EXCLUDES DEPLETED ITEMS"""
+    if available_df.empty:
+        return []
+    details = []
+    for item_id in pool_ids:
+        match = available_df[available_df['Item_ID'] == item_id]
+        if not match.empty:
+            footage = float(match.iloc[0]['Footage'])
+            if footage > 0:  # Only include items with footage > 0
+                details.append({
+                    'id': item_id,
+                    'material': match.iloc[0]['Material'],
+                    'footage': footage,
+                    'location': match.iloc[0].get('Location', 'N/A')
+                })
+    return details
+
+def clean_pool(pool_ids, available_df):
+    """Remove depleted items from pool"""
+    if available_df.empty:
+        return []
+    valid_ids = []
+    for item_id in pool_ids:
+        match = available_df[available_df['Item_ID'] == item_id]
+        if not match.empty and float(match.iloc[0]['Footage']) > 0:
+            valid_ids.append(item_id)
+    return valid_ids
+
+@metrics.timed("process_pool_deduction")
+def process_pool_deduction(pool_ids, total_needed, production_footage, waste_footage, available_df, 
+                            supabase_client, operator, order_number, client_name, line_description, size_label, pieces):
+    """
+    Process sequential deduction from a pool of coils/rolls.
+    Returns: (success: bool, deduction_log: list, error_message: str)
+    """
+    import uuid
+
+    if not pool_ids:
+        return False, [], "No items in pool"
+
+    # Get current footage for each item in pool (fresh from DB)
+    pool_items = []
+    for item_id in pool_ids:
+        try:
+            response = supabase_client.table("inventory").select("*").eq("Item_ID", item_id).execute()
+            if response.data:
+                item_data = response.data[0]
+                footage = float(item_data['Footage'])
+                # Skip items with 0 footage (auto-remove depleted from pool)
+                if footage > 0:
+                    pool_items.append({
+                        'id': item_id,
+                        'footage': footage,
+                        'material': item_data['Material']
+                    })
+        except Exception as e:
+            return False, [], f"Error fetching {item_id}: {e}"
+
+    if not pool_items:
+        return False, [], "No valid items with footage > 0 in pool. All items may be depleted."
+
+    # Calculate total available
+    total_available = sum(item['footage'] for item in pool_items)
+
+    if total_available < total_needed:
+        return False, [], f"Insufficient pool capacity: need {total_needed:.2f} ft, pool has {total_available:.2f} ft"
+
+    # Sequential deduction
+    remaining_needed = total_needed
+    deduction_log = []
+
+    for item in pool_items:
+        if remaining_needed <= 0:
+            break
+
+        available = item['footage']
+        deduct_amount = min(available, remaining_needed)
+        new_footage = available - deduct_amount
+
+        # Calculate proportion for this deduction
+        proportion = deduct_amount / total_needed if total_needed > 0 else 0
+        item_production = production_footage * proportion
+        item_waste = waste_footage * proportion
+
+        # Determine new status
+        new_status = "Depleted" if new_footage <= 0 else "Active"
+
+        # Update database
+        try:
+            update_data = {"Footage": new_footage}
+            if new_footage <= 0:
+                update_data["Status"] = "Depleted"
+
+            supabase_client.table("inventory").update(update_data).eq("Item_ID", item['id']).execute()
+
+            # Log this deduction
+            deduction_log.append({
+                'source_id': item['id'],
+                'material': item['material'],
+                'size': size_label,
+                'pieces': pieces,
+                'footage_used': deduct_amount,
+                'production_footage': item_production,
+                'waste': item_waste,
+                'previous_footage': available,
+                'remaining_footage': new_footage,
+                'status': new_status
+            })
+
+            # Audit log entry with UNIQUE ID to prevent duplicate key error
+            unique_log_id = f"{item['id']}-{uuid.uuid4().hex[:8]}"
+
+            log_entry = {
+                "Item_ID": unique_log_id,
+                "Action": f"Production: {pieces} pcs of {size_label}",
+                "User": operator,
+                "Details": f"Source: {item['id']} | Production: {pieces} pcs of {size_label} ({item_production:.2f} ft production + {item_waste:.2f} ft waste = {deduct_amount:.2f} ft used) for {client_name} (Order: {order_number}) | Pool deduction | Previous: {available:.2f} ft → Remaining: {new_footage:.2f} ft | Status: {new_status}"
+            }
+            audit_writer.log(log_entry)
+
+            remaining_needed -= deduct_amount
+
+        except Exception as e:
+            return False, deduction_log, f"Error updating {item['id']}: {e}"
+
+    return True, deduction_log, ""
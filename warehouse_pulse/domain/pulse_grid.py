@@ -0,0 +1,148 @@
+"""Card model for the dashboard's Pulse Grid."""
+
+import re
+
+from warehouse_pulse.catalog import LOW_STOCK_THRESHOLDS
+
+# --- PULSE GRID ---
+def summarize_materials(display_df):
+    """One row per material in view: Material, Type, Total_Footage, Unit_Count, largest stock first."""
+    summary_df = display_df.groupby(['Material', 'Category']).agg({
+        'Footage': 'sum',
+        'Item_ID': 'count'
+    }).reset_index()
+    summary_df.columns = ['Material', 'Type', 'Total_Footage', 'Unit_Count']
+    return summary_df.sort_values('Total_Footage', ascending=False)
+
+def pulse_card(mat, ft, units, cat_type, reorder_points):
+    """
+    Text and health status for one Pulse Grid card.
+
+    Args:
+        mat: Full material name
+        ft: Total footage (or pieces/bundles, depending on the category)
+        units: Number of inventory items
+        cat_type: Category of the material
+        reorder_points: Material -> forecast reorder point (static thresholds are the fallback)
+
+    Returns:
+        tuple: (short_name, display_value, unit_text, sub_label_text, status_color, status_text)
+    """
+    # --- CREATE SHORT NAME FOR DISPLAY ---
+    gauge_match = re.search(r'\.(\d{2,3})', mat)
+    gauge_str = f".{gauge_match.group(1)}" if gauge_match else ""
+
+    mat_lower = mat.lower()
+    texture_str = "Smooth" if "smooth" in mat_lower else ("Stucco" if "stucco" in mat_lower else "")
+    metal_str = "Aluminum" if "aluminum" in mat_lower else ("Stainless Steel" if "stainless" in mat_lower else "")
+
+    # Build short name based on category
+    if gauge_str and texture_str and metal_str:
+        short_name = f"{gauge_str} {texture_str} {metal_str}"
+    elif cat_type == "Elbows":
+        angle_match = re.search(r'(45°|90°|\d+°)', mat)
+        size_match = re.search(r'#(\d+)', mat)
+        angle_str = angle_match.group(1) if angle_match else ""
+        size_str = f"#{size_match.group(1)}" if size_match else ""
+        metal_short = "AL" if "aluminum" in mat_lower else ("SST" if "stainless" in mat_lower else ("GAL" if "galvanized" in mat_lower else ""))
+        short_name = f"{angle_str} {size_str} {metal_short}".strip()
+        if not short_name or short_name == "":
+            short_name = mat[:40] + ("..." if len(mat) > 40 else "")
+    elif cat_type == "Fab Straps":
+        size_match = re.search(r'#(\d+)', mat)
+        size_str = f"#{size_match.group(1)}" if size_match else ""
+        metal_short = "AL" if "aluminum" in mat_lower else ("SST" if "stainless" in mat_lower else "")
+        short_name = f"{gauge_str} {size_str} {metal_short}".strip()
+        if not short_name:
+            short_name = mat[:40] + ("..." if len(mat) > 40 else "")
+    elif cat_type == "Wing Seals":
+        seal_type = "Open" if "open" in mat_lower else ("Closed" if "closed" in mat_lower else "")
+        size_str = "3/4in" if "3/4" in mat else ("1/2in" if "1/2" in mat else "")
+        short_name = f"{seal_type} {size_str} {gauge_str}".strip()
+        if not short_name:
+            short_name = mat[:40] + ("..." if len(mat) > 40 else "")
+    elif cat_type == "Wire":
+        wire_gauge = re.search(r'(\d{2})\s*Gauge', mat, re.IGNORECASE)
+        short_name = f"{wire_gauge.group(1)} Gauge Wire" if wire_gauge else mat[:40]
+    elif cat_type == "Banding":
+        band_type = "Oscillated" if "oscillated" in mat_lower and "non" not in mat_lower else ("Non-Osc" if "non" in mat_lower else "")
+        size_str = "3/4in" if "3/4" in mat else ("1/2in" if "1/2" in mat else "")
+        short_name = f"{band_type} {size_str} {gauge_str}".strip()
+        if not short_name:
+            short_name = mat[:40] + ("..." if len(mat) > 40 else "")
+    else:
+        short_name = mat[:40] + ("..." if len(mat) > 40 else "")
+
+    # --- SET DEFAULTS ---
+    display_value = f"{ft:,.1f}"
+    unit_text = "Units"
+    sub_label_text = "In Stock"
+
+    # --- LOGIC BRANCHES ---
+    if cat_type == "Rolls":
+        if units > 0:
+            avg_per_roll = ft / units
+            display_value = f"{int(units)}"
+            unit_text = "Rolls"
+            sub_label_text = f"Total: {ft:,.1f} FT (~{avg_per_roll:.0f} ft/roll)"
+        else:
+            display_value = "0"
+            unit_text = "Rolls"
+            sub_label_text = "No stock"
+
+    elif cat_type == "Coils":
+        display_value = f"{ft:,.1f}"
+        unit_text = "FT"
+        sub_label_text = f"{int(units)} Coil{'s' if units != 1 else ''} in stock"
+
+    elif cat_type == "Fab Straps":
+        display_value = f"{int(ft)}"
+        unit_text = "Bundles"
+        sub_label_text = f"{int(units)} item{'s' if units != 1 else ''}"
+
+    elif cat_type == "Elbows":
+        display_value = f"{int(ft)}"
+        unit_text = "Pcs"
+        sub_label_text = f"{int(units)} item{'s' if units != 1 else ''}"
+
+    elif cat_type == "Wire":
+        display_value = f"{int(units)}"
+        unit_text = "Rolls"
+        sub_label_text = f"Total: {ft:,.1f} FT"
+
+    elif cat_type == "Banding":
+        display_value = f"{int(units)}"
+        unit_text = "Rolls"
+        sub_label_text = f"Total: {ft:,.1f} FT"
+
+    elif cat_type == "Wing Seals":
+        display_value = f"{int(ft)}"
+        unit_text = "Pcs"
+        sub_label_text = f"{int(units)} box{'es' if units != 1 else ''}"
+
+    elif cat_type == "Mineral Wool":
+        display_value = f"{int(ft)}"
+        unit_text = "Sections"
+        sub_label_text = f"{int(units)} item{'s' if units != 1 else ''}"
+
+    elif cat_type == "Fiberglass Insulation":
+        display_value = f"{int(units)}"
+        unit_text = "Rolls/Batts"
+        sub_label_text = f"Total: {ft:,.1f} sq ft"
+
+    else:
+        display_value = f"{ft:,.1f}"
+        unit_text = "Units"
+        sub_label_text = f"{int(units)} item{'s' if units != 1 else ''}"
+
+    # --- THRESHOLD / HEALTH LOGIC ---
+    limit = reorder_points.get(mat) or LOW_STOCK_THRESHOLDS.get(mat, 10.0 if cat_type in ["Fab Straps", "Elbows"] else 1000.0)
+
+    if ft < limit:
+        status_color, status_text = "#FF4B4B", "🚨 REORDER"
+    elif ft < (limit * 1.5):
+        status_color, status_text = "#FFA500", "⚠️ LOW"
+    else:
+        status_color, status_text = "#00C853", "✅ OK"
+
+    return short_name, display_value, unit_text, sub_label_text, status_color, status_text
@@ -0,0 +1,194 @@
+"""Purchase planning (EOQ, pack sizes) and turning a plan into a receiving cart."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from warehouse_pulse.catalog import COIL_MATERIALS, ROLL_MATERIALS
+from warehouse_pulse.domain.receiving import format_item_ids, peek_next_item_number
+
+# --- PURCHASE PLANNING ---
+ORDER_COST = 75.0  # $ per PO line
+# $ per unit (ft / pc / roll) per year
+HOLDING_COST_PER_UNIT_YEAR = {
+    "Coils": 0.04,
+    "Rolls": 0.04,
+}
+DEFAULT_HOLDING_COST = 0.5
+# Units per pack for bulk items; serialized items use the median footage per coil/roll on hand
+PACK_SIZES = {
+    "Elbows": 25,
+    "Wing Seals": 100,
+}
+MIN_ORDER_QTY = {
+    "Elbows": 50,
+    "Wing Seals": 200,
+}
+# Categories that require unique serial IDs (tracked individually)
+SERIALIZED_CATEGORIES = ["Coils", "Rolls"]
+
+def build_purchase_plan(forecast_df, inventory_df, thresholds, order_cost=ORDER_COST):
+    """
+    EOQ purchase plan for every material at or below its reorder point, in one vectorized pass.
+
+    Candidates are every material in inventory, in the forecast or with a static threshold,
+    so a material sold out to the last row is still planned (with nothing on hand).
+    The reorder trigger is the forecast reorder point when the material has usage,
+    otherwise its static threshold. Quantities are EOQ (at least enough to get back
+    above the trigger), raised to the minimum order and rounded up to whole packs.
+    Lines are grouped into one draft PO per category.
+
+    Args:
+        forecast_df: Output of forecast_reorder_points
+        inventory_df: Current inventory
+        thresholds: Static low-stock thresholds by material
+
+    Returns:
+        pd.DataFrame: One row per line to order, with its Draft_PO
+    """
+    keys = ["Material", "Category"]
+    if inventory_df is None:
+        inventory_df = pd.DataFrame(columns=keys + ["Footage", "Location"])
+    has_forecast = forecast_df is not None and not forecast_df.empty
+
+    stock = inventory_df.groupby(keys, as_index=False).agg(
+        On_Hand=("Footage", "sum"),
+        Item_Footage=("Footage", "median"),
+    )
+    candidates = [stock[keys]]
+    if has_forecast:
+        candidates.append(forecast_df[keys])
+    known = set(stock["Material"]) | (set(forecast_df["Material"]) if has_forecast else set())
+    threshold_only = [m for m in thresholds if m not in known]
+    candidates.append(pd.DataFrame({"Material": threshold_only, "Category": [_threshold_category(m) for m in threshold_only]}))
+    catalog = pd.concat(candidates, ignore_index=True).drop_duplicates(keys).merge(stock, on=keys, how="left")
+    if catalog.empty:
+        return pd.DataFrame()
+    catalog["On_Hand"] = catalog["On_Hand"].fillna(0.0)
+    # Materials with no rows left size their packs like the rest of their category
+    catalog["Item_Footage"] = catalog["Item_Footage"].fillna(
+        catalog["Category"].map(inventory_df.groupby("Category")["Footage"].median())
+    )
+
+    # Deliver to wherever most of the material already sits, else where its category does
+    usual_location = (
+        inventory_df.groupby(["Material", "Category", "Location"]).size().reset_index(name="n")
+        .sort_values("n", ascending=False).drop_duplicates(keys)
+    )
+    category_location = usual_location.sort_values("n", ascending=False).drop_duplicates("Category").set_index("Category")["Location"]
+    catalog = catalog.merge(usual_location[keys + ["Location"]], on=keys, how="left")
+    catalog["Location"] = catalog["Location"].fillna(catalog["Category"].map(category_location)).fillna("Receiving")
+    if has_forecast:
+        catalog = catalog.merge(
+            forecast_df[["Material", "Category", "Daily_Demand", "Reorder_Point", "Lead_Time"]],
+            on=["Material", "Category"], how="left"
+        )
+    else:
+        catalog[["Daily_Demand", "Reorder_Point", "Lead_Time"]] = np.nan
+
+    demand = catalog["Daily_Demand"].fillna(0.0).to_numpy()
+    static = catalog["Material"].map(thresholds).to_numpy(dtype=float)
+    trigger = np.where(demand > 0, catalog["Reorder_Point"].fillna(0.0).to_numpy(), static)
+
+    is_serialized = catalog["Category"].isin(SERIALIZED_CATEGORIES).to_numpy()
+    pack = np.where(
+        is_serialized,
+        np.maximum(catalog["Item_Footage"].fillna(1.0).to_numpy(), 1.0),
+        catalog["Category"].map(PACK_SIZES).fillna(1).to_numpy(dtype=float)
+    )
+    min_qty = catalog["Category"].map(MIN_ORDER_QTY).fillna(0).to_numpy(dtype=float)
+    holding = catalog["Category"].map(HOLDING_COST_PER_UNIT_YEAR).fillna(DEFAULT_HOLDING_COST).to_numpy(dtype=float)
+    on_hand = catalog["On_Hand"].to_numpy(dtype=float)
+
+    eoq = np.sqrt(2 * demand * 365 * order_cost / holding)
+    qty = np.fmax.reduce([eoq, trigger - on_hand, min_qty, pack])  # materials without a trigger are dropped below
+    packs = np.ceil(qty / pack)
+
+    catalog["Trigger"] = trigger
+    catalog["EOQ"] = eoq
+    catalog["Pack_Size"] = pack
+    catalog["Packs"] = packs.astype(int)
+    catalog["Order_Qty"] = packs * pack
+    catalog["Days_Of_Cover_After"] = np.where(demand > 0, (on_hand + packs * pack) / np.maximum(demand, 1e-9), np.inf)
+    catalog["Serialized"] = is_serialized
+
+    plan = catalog[~np.isnan(trigger) & (on_hand <= trigger)].copy()
+    stamp = datetime.now().strftime("%Y%m%d")
+    plan["Draft_PO"] = "DRAFT-" + stamp + "-" + plan["Category"].str.upper().str.replace(" ", "-")
+    return plan.sort_values(["Draft_PO", "Material"]).reset_index(drop=True)
+
+def _threshold_category(material):
+    """Category for a material known only from LOW_STOCK_THRESHOLDS (no stock or history)."""
+    if material in COIL_MATERIALS:
+        return "Coils"
+    if material in ROLL_MATERIALS:
+        return "Rolls"
+    return "Other"
+
+def _material_id_prefixes(plan_rows, inventory_df):
+    """
+    Item ID prefix per serialized plan row: the one most used by that material's stock
+    (Coil-AL-016-STP-07 -> Coil-AL-016-STP), else one derived from category and material.
+    """
+    materials = plan_rows["Material"]
+    stock = inventory_df.loc[inventory_df["Material"].isin(materials), ["Material", "Item_ID"]]
+    used = (stock.assign(Prefix=stock["Item_ID"].astype(str).str.replace(r"-\d+$", "", regex=True))
+                 .groupby(["Material", "Prefix"]).size().rename("Count").reset_index()
+                 .sort_values(["Material", "Count", "Prefix"], ascending=[True, False, True])
+                 .drop_duplicates("Material")
+                 .set_index("Material")["Prefix"])
+    derived = (plan_rows["Category"].str.rstrip("s") + "-"
+               + materials.str.replace(r"[^A-Za-z0-9]+", "", regex=True).str.slice(0, 12).str.upper())
+    return materials.map(used).fillna(derived)
+
+def purchase_plan_to_cart(plan_rows, inventory_df):
+    """
+    Receiving cart lines for one draft PO.
+
+    Serialized lines carry the Item ID prefix already used for that material
+    (Coil-AL-016-STP-07 -> Coil-AL-016-STP) and a preview of the next numbers; the IDs
+    themselves are reserved only when the cart is received (reserve_pending_ids), so
+    opening and discarding drafts doesn't use up the sequence. The sequence is peeked once
+    per prefix and lines sharing a prefix preview consecutive ranges.
+    """
+    serialized = plan_rows[plan_rows["Serialized"].astype(bool)]
+    prefixes = _material_id_prefixes(serialized, inventory_df)
+    packs = serialized["Packs"].astype(int)
+    next_number = {prefix: peek_next_item_number(prefix, inventory_df) for prefix in prefixes.unique()}
+    # Numbers taken by earlier lines with the same prefix
+    offsets = packs.groupby(prefixes).cumsum() - packs
+    starts = prefixes.map(next_number) + offsets
+    previews = {idx: format_item_ids(prefix, int(first), 1)[0]
+                for idx, prefix, first in zip(serialized.index, prefixes, starts)}
+
+    lines = []
+    for idx, row in zip(plan_rows.index, plan_rows.to_dict("records")):
+        if row["Serialized"]:
+            lines.append({
+                'category': row["Category"],
+                'material': row["Material"],
+                'qty_val': float(row["Pack_Size"]),
+                'item_count': int(row["Packs"]),
+                'total_added': float(row["Order_Qty"]),
+                'unit_label': row["Category"],
+                'location': row["Location"],
+                'is_serialized': True,
+                'id_list': [],
+                'id_prefix': prefixes[idx],
+                'id_preview': previews[idx],
+            })
+        else:
+            lines.append({
+                'category': row["Category"],
+                'material': row["Material"],
+                'qty_val': float(row["Order_Qty"]),
+                'item_count': 1,
+                'total_added': float(row["Order_Qty"]),
+                'unit_label': "Items",
+                'location': row["Location"],
+                'is_serialized': False,
+                'id_list': [],
+                'id_preview': f"{row['Category'].upper()}-BULK",
+            })
+    return lines
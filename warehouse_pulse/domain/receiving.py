@@ -0,0 +1,286 @@
+"""Receiving cart, packing-list import and Item ID reservation."""
+
+import pandas as pd
+
+from warehouse_pulse.catalog import normalize_category
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.client import supabase
+
+# --- RECEIVING ---
+def commit_receiving_cart(cart, po_num, operator):
+    """
+    Write a whole receiving cart in three round trips.
+
+    Draft-PO lines still waiting for Item IDs get them reserved first. Serialized
+    lines (Coils/Rolls) go in as one multi-row insert. Bulk lines go
+    through the receive_bulk_items RPC, which upserts on (Category, Material)
+    and increments Footage. Every received item gets an audit entry (the movement
+    rollup and snapshot replay count receipts from them); all are inserted as one batch.
+
+    Args:
+        cart: List of receiving cart line dicts
+        po_num: Purchase order number
+        operator: Receiving operator name
+
+    Returns:
+        int: Number of inventory records created or topped up
+    """
+    import uuid
+
+    po_num = po_num.strip()
+    reserve_pending_ids(cart)
+    serialized_rows = []
+    bulk_lines = {}
+
+    for item in cart:
+        if item['is_serialized']:
+            for unique_id in item['id_list']:
+                serialized_rows.append({
+                    "Item_ID": unique_id,
+                    "Material": item['material'],
+                    "Footage": item['qty_val'],
+                    "Location": item['location'],
+                    "Status": "Active",
+                    "Category": item['category'],
+                    "Purchase_Order_Num": po_num
+                })
+        else:
+            # Same material twice in one cart must be a single upsert row
+            key = (item['category'], item['material'])
+            if key in bulk_lines:
+                bulk_lines[key]['total_added'] += item['total_added']
+                bulk_lines[key]['location'] = item['location']
+            else:
+                bulk_lines[key] = dict(item)
+
+    items_added = 0
+    log_entries = []
+
+    if serialized_rows:
+        supabase.table("inventory").insert(serialized_rows).execute()
+        items_added += len(serialized_rows)
+        log_entries.extend({
+            "Item_ID": row['Item_ID'],
+            "Action": "Received (New Item)",
+            "User": operator,
+            "Details": f"PO: {po_num} | {row['Material']} | {row['Footage']:.0f} ft | Location: {row['Location']}"
+        } for row in serialized_rows)
+
+    if bulk_lines:
+        payload = [{
+            "Item_ID": f"{line['category'].upper().replace(' ', '-')}-{uuid.uuid4().hex[:8].upper()}",
+            "Material": line['material'],
+            "Footage": line['total_added'],
+            "Location": line['location'],
+            "Category": line['category'],
+            "Purchase_Order_Num": po_num
+        } for line in bulk_lines.values()]
+
+        response = supabase.rpc("receive_bulk_items", {"p_items": payload}).execute()
+
+        for row in response.data or []:
+            line = bulk_lines[(row['Category'], row['Material'])]
+            unit = line['unit_label'].lower()
+            if row['inserted']:
+                action = "Received (New Item)"
+                details = f"PO: {po_num} | {line['material']} | {line['total_added']:.0f} {unit} | Location: {line['location']}"
+            else:
+                new_qty = float(row['Footage'])
+                action = "Stock Added"
+                details = f"PO: {po_num} | Added {line['total_added']:.0f} {unit} to existing stock. Previous: {new_qty - line['total_added']:.0f}, New: {new_qty:.0f}"
+            log_entries.append({
+                "Item_ID": row['Item_ID'],
+                "Action": action,
+                "User": operator,
+                "Details": details
+            })
+        items_added += len(response.data or [])
+
+    if log_entries:
+        audit_writer.log(log_entries)
+
+    return items_added
+
+def reserve_pending_ids(cart):
+    """
+    Reserve Item IDs for serialized cart lines that only carry an `id_prefix` (draft POs).
+
+    Lines are filled in place, so a receipt that fails after this point keeps its numbers
+    when it is retried.
+
+    Returns:
+        int: Number of IDs reserved
+    """
+    reserved = 0
+    for line in cart:
+        if line['is_serialized'] and not line['id_list'] and line.get('id_prefix'):
+            line['id_list'] = reserve_item_ids(line['id_prefix'], line['item_count'])
+            line['id_preview'] = line['id_list'][0]
+            reserved += len(line['id_list'])
+    return reserved
+
+def format_item_ids(prefix, start_num, count):
+    """Build `count` sequential IDs like Coil-AL-016-STP-07 starting at `start_num`."""
+    return [f"{prefix}-{str(start_num + i).zfill(2)}" for i in range(count)]
+
+def peek_next_item_number(prefix, inventory_df):
+    """
+    Next free sequence number for a prefix, for previews only (nothing is reserved).
+
+    Uses the server-side sequence when it exists, otherwise the highest numeric
+    suffix already in inventory for that prefix.
+    """
+    if not prefix:
+        return 1
+    try:
+        response = supabase.table("item_id_sequences").select("last_value").eq("prefix", prefix).execute()
+        if response.data:
+            return int(response.data[0]['last_value']) + 1
+    except Exception:
+        pass
+
+    if inventory_df is None or inventory_df.empty:
+        return 1
+    ids = inventory_df['Item_ID'].astype(str)
+    suffixes = ids[ids.str.startswith(f"{prefix}-")].str.slice(len(prefix) + 1)
+    numbers = pd.to_numeric(suffixes[suffixes.str.fullmatch(r"\d+")], errors="coerce")
+    return int(numbers.max()) + 1 if not numbers.empty else 1
+
+def reserve_item_ids(prefix, count):
+    """
+    Atomically reserve the next `count` sequence numbers for a prefix.
+
+    The reserve_item_ids RPC row-locks the prefix's counter, so concurrent
+    receivers always get disjoint ranges. Numbers from removed cart lines are
+    not reused.
+
+    Returns:
+        list: Reserved Item IDs
+    """
+    response = supabase.rpc("reserve_item_ids", {"p_prefix": prefix, "p_count": int(count)}).execute()
+    return format_item_ids(prefix, int(response.data), count)
+
+PACKING_LIST_COLUMNS = ["Category", "Material", "Quantity", "Item_ID", "Location"]
+
+def _member_of(series, values):
+    """
+    Boolean mask of `series` values found in `values`.
+
+    Series.isin on Arrow-backed strings turns `values` back into Python objects on
+    every call; a hash lookup against one unique Index stays flat as inventory grows.
+    """
+    index = pd.Index(values, dtype=object).unique()
+    return pd.Series(index.get_indexer(series.astype(object)) >= 0, index=series.index)
+
+def validate_packing_list(raw_df, inventory_df, known_categories, serialized_categories, reserved_ids=()):
+    """
+    Validate a supplier packing list in one vectorized pass.
+
+    Expected columns: Category, Material, Quantity, Item_ID (Coils/Rolls only), Location.
+    Quantity is footage per item for serialized rows and the total received for bulk rows.
+
+    Args:
+        raw_df: DataFrame read from the uploaded CSV/XLSX
+        inventory_df: Current inventory DataFrame
+        known_categories: Categories accepted by the receiver
+        serialized_categories: Categories that need one unique Item_ID per row
+        reserved_ids: IDs already sitting in the receiving cart
+
+    Returns:
+        tuple: (checked_df, errors_df) - every row with its Change/Error columns, and only the failing rows
+    """
+    df = raw_df.copy()
+    df.columns = [str(c).strip() for c in df.columns]
+    missing = [c for c in PACKING_LIST_COLUMNS if c not in df.columns and c != "Item_ID"]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    if "Item_ID" not in df.columns:
+        df["Item_ID"] = ""
+
+    # Normalize each distinct category once, then map the whole column
+    raw_cats = df["Category"].astype(str).str.strip()
+    cat_lookup = {c: normalize_category(c) for c in raw_cats.unique()}
+    df["Category"] = raw_cats.map(cat_lookup)
+    df["Material"] = df["Material"].fillna("").astype(str).str.strip()
+    df["Location"] = df["Location"].fillna("").astype(str).str.strip()
+    df["Item_ID"] = df["Item_ID"].fillna("").astype(str).str.strip()
+    df["Quantity"] = pd.to_numeric(df["Quantity"], errors="coerce")
+    df["Row"] = df.index + 2  # header is line 1 in the supplier's file
+
+    is_serialized = _member_of(df["Category"], list(serialized_categories))
+    has_id = df["Item_ID"] != ""
+    existing_ids = inventory_df["Item_ID"].astype(str) if inventory_df is not None and not inventory_df.empty else []
+
+    checks = [
+        (~_member_of(df["Category"], list(known_categories)), "Unknown category"),
+        (df["Material"] == "", "Missing material"),
+        (df["Quantity"].isna() | (df["Quantity"] <= 0), "Invalid quantity"),
+        (df["Location"] == "", "Missing location"),
+        (is_serialized & ~has_id, "Missing Item ID"),
+        (has_id & df["Item_ID"].duplicated(keep=False), "Duplicate ID in file"),
+        (has_id & _member_of(df["Item_ID"], existing_ids), "ID already in inventory"),
+        (has_id & _member_of(df["Item_ID"], list(reserved_ids)), "ID already in cart"),
+    ]
+    df["Error"] = ""
+    for mask, msg in checks:
+        df.loc[mask, "Error"] += msg + "; "
+    df["Error"] = df["Error"].str.rstrip("; ")
+
+    # Diff preview: bulk rows top up an existing (Category, Material) row or create one
+    df["Current"] = 0.0
+    if inventory_df is not None and not inventory_df.empty:
+        bulk_stock = (
+            inventory_df[~_member_of(inventory_df["Category"], list(serialized_categories))]
+            .groupby(["Category", "Material"])["Footage"].sum()
+        )
+        keys = pd.MultiIndex.from_arrays([df["Category"], df["Material"]])
+        df["Current"] = bulk_stock.reindex(keys).fillna(0).to_numpy()
+    df["Change"] = "New item"
+    df.loc[~is_serialized & (df["Current"] > 0), "Change"] = "Add to existing"
+    df.loc[df["Error"] != "", "Change"] = "Rejected"
+
+    return df, df[df["Error"] != ""]
+
+def packing_list_to_cart(checked_df, serialized_categories):
+    """
+    Turn the valid rows of a checked packing list into receiving cart lines.
+
+    Serialized rows sharing Category/Material/Quantity/Location become one line with an ID list.
+    """
+    valid = checked_df[checked_df["Error"] == ""]
+    is_serialized = valid["Category"].isin(set(serialized_categories))
+    lines = []
+
+    for (cat, material, qty, loc), group in valid[is_serialized].groupby(["Category", "Material", "Quantity", "Location"], sort=False):
+        ids = group["Item_ID"].tolist()
+        lines.append({
+            'category': cat,
+            'material': material,
+            'qty_val': float(qty),
+            'item_count': len(ids),
+            'total_added': float(qty) * len(ids),
+            'unit_label': cat,
+            'location': loc,
+            'is_serialized': True,
+            'id_list': ids,
+            'id_preview': ids[0],
+        })
+
+    bulk = valid[~is_serialized].groupby(["Category", "Material"], sort=False).agg(
+        Quantity=("Quantity", "sum"), Location=("Location", "last")
+    )
+    for (cat, material), row in bulk.iterrows():
+        lines.append({
+            'category': cat,
+            'material': material,
+            'qty_val': float(row["Quantity"]),
+            'item_count': 1,
+            'total_added': float(row["Quantity"]),
+            'unit_label': "Items",
+            'location': row["Location"],
+            'is_serialized': False,
+            'id_list': [],
+            'id_preview': f"{cat.upper()}-BULK",
+        })
+
+    return lines
@@ -0,0 +1,101 @@
+"""Trigram search over the loaded inventory."""
+
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from warehouse_pulse import metrics
+
+# --- INVENTORY SEARCH ---
+SEARCH_FIELDS = {"Item_ID": 1.0, "Material": 0.8, "Purchase_Order_Num": 0.6, "Location": 0.5}
+
+def _trigrams(text):
+    """Padded character trigrams of each alphanumeric token, e.g. 'coil' -> '  c', ' co', 'coi', 'oil', 'il '."""
+    grams = set()
+    for token in re.findall(r"[a-z0-9]+", str(text).lower()):
+        padded = f"  {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+@metrics.cache_resource(max_entries=4)
+def build_search_index(data_version, _inventory_df):
+    """
+    Trigram index over Item_ID, Material, PO and Location, built once per data version.
+
+    Each field is factorized first, so trigrams are only extracted for distinct
+    values and mapped back to rows with the integer codes.
+
+    Args:
+        data_version: Cache key from compute_data_version
+        _inventory_df: Inventory DataFrame (not hashed by Streamlit)
+
+    Returns:
+        dict: Row count, Item IDs and per-field postings
+    """
+    fields = []
+    for col, weight in SEARCH_FIELDS.items():
+        if col not in _inventory_df.columns:
+            continue
+        codes, uniques = pd.factorize(_inventory_df[col].fillna("").astype(str))
+        postings = defaultdict(list)
+        for code, value in enumerate(uniques):
+            for gram in _trigrams(value):
+                postings[gram].append(code)
+        fields.append({
+            "weight": weight,
+            "codes": codes,
+            "n_uniques": len(uniques),
+            "postings": {g: np.asarray(c, dtype=np.int32) for g, c in postings.items()},
+        })
+
+    item_ids = _inventory_df["Item_ID"].astype(str).to_numpy()
+    return {
+        "n_rows": len(_inventory_df),
+        "fields": fields,
+        "id_lookup": {item_id.lower(): pos for pos, item_id in enumerate(item_ids)},
+    }
+
+def search_inventory(index, query, min_score=0.4):
+    """
+    Rank inventory rows against a query. Typos still match on shared trigrams.
+
+    Trigrams are weighted by how rare they are within each field, so shared
+    boilerplate like "coil" or "stp" barely moves the score and is skipped
+    outright when it appears in most values.
+
+    Returns:
+        tuple: (row positions best-first, their scores)
+    """
+    q_grams = _trigrams(query)
+    if not q_grams or index["n_rows"] == 0:
+        return np.array([], dtype=np.int64), np.array([])
+
+    scores = np.zeros(index["n_rows"])
+    for field in index["fields"]:
+        n_values = field["n_uniques"]
+        value_hits = np.zeros(n_values)
+        seen_weights = []
+        for gram in q_grams:
+            hits = field["postings"].get(gram)
+            if hits is None:
+                continue
+            idf = np.log((n_values + 1) / (len(hits) + 0.5))
+            seen_weights.append(idf)
+            # Fields with one or two distinct values have nothing to prune against
+            if n_values <= 2 or len(hits) <= n_values // 2:
+                value_hits[hits] += idf
+        if value_hits.any():
+            # Grams absent from the field (typos) count as an average gram
+            unseen = len(q_grams) - len(seen_weights)
+            total_weight = sum(seen_weights) * (1 + unseen / len(seen_weights))
+            scores += field["weight"] * (value_hits / total_weight)[field["codes"]]
+
+    exact = index["id_lookup"].get(query.strip().lower())
+    if exact is not None:
+        scores[exact] += 10
+
+    matches = np.flatnonzero(scores >= min_score)
+    order = matches[np.argsort(-scores[matches], kind="stable")]
+    return order, scores[order]
@@ -0,0 +1,390 @@
+"""Outgoing email: pooled SMTP sessions, the persistent outbox and the report emails."""
+
+import queue
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from email import encoders
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse import metrics
+from warehouse_pulse.data.audit_writer import audit_timestamp
+from warehouse_pulse.data.client import supabase
+
+# --- SMTP ---
+def smtp_settings():
+    """SMTP server and accounts from the [email] secrets, falling back to the flat SMTP_* keys."""
+    email_cfg = st.secrets.get("email", {})
+    return {
+        "host": email_cfg.get("smtp_server", "smtp.gmail.com"),
+        "port": int(email_cfg.get("smtp_port", 587)),
+        "user": email_cfg.get("sender_email") or st.secrets.get("SMTP_EMAIL", ""),
+        "password": email_cfg.get("sender_password") or st.secrets.get("SMTP_PASSWORD", ""),
+        "admin_email": email_cfg.get("admin_email") or st.secrets.get("ADMIN_EMAIL", ""),
+    }
+
+class SMTPPool:
+    """
+    Reusable authenticated SMTP sessions.
+
+    connection() hands out an idle session or opens a new one (STARTTLS and login only
+    when the server offers them, so a local sink works too). Sessions idle longer than
+    `max_idle` seconds are closed rather than reused, since servers drop them, and a
+    session that raises is discarded instead of going back to the pool.
+    """
+
+    def __init__(self, host, port, user="", password="", size=2, timeout=30, max_idle=60):
+        self.host, self.port = host, port
+        self.user, self.password = user, password
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.stats = {"opened": 0, "reused": 0, "sent": 0, "errors": 0}
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _open(self):
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        server.ehlo()
+        if server.has_extn("starttls"):
+            server.starttls()
+            server.ehlo()
+        if self.password:
+            server.login(self.user, self.password)
+        self.stats["opened"] += 1
+        return server
+
+    @staticmethod
+    def _close(server):
+        try:
+            server.close()
+        except Exception:
+            pass
+
+    def _checkout(self):
+        while True:
+            try:
+                server, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._open()
+            if time.monotonic() - last_used < self.max_idle:
+                self.stats["reused"] += 1
+                return server
+            self._close(server)
+
+    @contextmanager
+    def connection(self):
+        with self._slots:
+            server = self._checkout()
+            try:
+                yield server
+            except BaseException:
+                self.stats["errors"] += 1
+                self._close(server)
+                raise
+            self._idle.put((server, time.monotonic()))
+
+    def send(self, msg):
+        """Send one email.message.Message, retrying once on a fresh session if a pooled one was dropped."""
+        for attempt in range(2):
+            try:
+                with self.connection() as server:
+                    server.send_message(msg)
+                self.stats["sent"] += 1
+                return
+            except smtplib.SMTPServerDisconnected:
+                if attempt:
+                    raise
+
+    def close(self):
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(server)
+
+@st.cache_resource
+def get_smtp_pool():
+    settings = smtp_settings()
+    return SMTPPool(settings["host"], settings["port"], settings["user"], settings["password"],
+                    size=int(st.secrets.get("SMTP_POOL_SIZE", 2)))
+
+# --- EMAIL OUTBOX ---
+class EmailOutbox:
+    """
+    Outbound email queue backed by the email_outbox table.
+
+    enqueue() stores the finished MIME message and returns; a daemon thread leases due
+    rows (claim_email_outbox), delivers each batch over one pooled SMTP session and
+    records the outcome. Connection problems are retried with exponential backoff up to
+    `max_attempts`; messages the server rejects outright are marked failed at once.
+    Failed rows keep their message and can be queued again with resend().
+    """
+
+    def __init__(self, client, smtp_pool, batch_size=20, poll_interval=30.0, max_attempts=8):
+        self.client = client
+        self.smtp_pool = smtp_pool
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.stats = {"queued": 0, "sent": 0, "retried": 0, "failed": 0, "batches": 0}
+        self._wake = threading.Event()
+        threading.Thread(target=self._run, name="email-outbox", daemon=True).start()
+
+    def enqueue(self, msg, kind):
+        """
+        Queue an email.message.Message for delivery.
+
+        Returns:
+            int: Outbox row id
+        """
+        row = self.client.table("email_outbox").insert({
+            "kind": kind,
+            "recipient": msg['To'],
+            "subject": msg['Subject'],
+            "message": msg.as_string(),
+        }).execute().data[0]
+        self.stats["queued"] += 1
+        self._wake.set()
+        return row["id"]
+
+    def resend(self, ids):
+        """Queue failed (or already sent) messages again as they were stored."""
+        self.client.table("email_outbox").update({
+            "status": "queued", "attempts": 0, "next_attempt_at": audit_timestamp(),
+            "locked_until": None, "last_error": None,
+        }).in_("id", list(ids)).execute()
+        self._wake.set()
+
+    def _update(self, ids, values):
+        self.client.table("email_outbox").update(values).in_("id", ids).execute()
+
+    def _deliver(self, rows):
+        import email
+
+        sent, failed, retry = [], {}, {}
+        try:
+            with self.smtp_pool.connection() as server:
+                for row in rows:
+                    try:
+                        server.send_message(email.message_from_string(row["message"]))
+                        sent.append(row["id"])
+                    except smtplib.SMTPRecipientsRefused as e:
+                        failed[row["id"]] = str(e)
+                    except (smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                        # 5xx is permanent, 4xx is worth another try
+                        (failed if e.smtp_code >= 500 else retry)[row["id"]] = str(e)
+        except Exception as e:
+            # Session broke: whatever was not delivered goes back for another attempt
+            done = set(sent) | set(failed) | set(retry)
+            retry.update({row["id"]: str(e) for row in rows if row["id"] not in done})
+
+        now = pd.Timestamp.now(tz="UTC")
+        if sent:
+            self._update(sent, {"status": "sent", "sent_at": now.isoformat(), "locked_until": None, "last_error": None})
+        attempts = {row["id"]: row["attempts"] for row in rows}
+        for row_id, error in retry.items():
+            if attempts[row_id] >= self.max_attempts:
+                failed[row_id] = error
+                continue
+            delay = min(60 * 2 ** (attempts[row_id] - 1), 3600)
+            self._update([row_id], {"status": "queued", "locked_until": None, "last_error": error,
+                                    "next_attempt_at": (now + pd.Timedelta(seconds=delay)).isoformat()})
+            self.stats["retried"] += 1
+        for row_id, error in failed.items():
+            self._update([row_id], {"status": "failed", "locked_until": None, "last_error": error})
+        self.stats["sent"] += len(sent)
+        self.stats["failed"] += len(failed)
+        self.stats["batches"] += 1
+        return len(sent)
+
+    def deliver_due(self):
+        """Claim and deliver due messages until none are left; returns how many were sent."""
+        delivered = 0
+        while True:
+            rows = self.client.rpc("claim_email_outbox", {"p_limit": self.batch_size}).execute().data or []
+            if not rows:
+                return delivered
+            delivered += self._deliver(rows)
+
+    def _run(self):
+        while True:
+            try:
+                self.deliver_due()
+            except Exception as e:
+                print(f"Email outbox: delivery pass failed: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+@st.cache_resource
+def get_email_outbox():
+    if supabase is None:
+        return None
+    return EmailOutbox(supabase, get_smtp_pool(), poll_interval=float(st.secrets.get("EMAIL_OUTBOX_POLL_SECONDS", 30)))
+
+email_outbox = get_email_outbox()
+metrics.register_component("smtp_pool", lambda: get_smtp_pool().stats)
+if email_outbox is not None:
+    metrics.register_component("email_outbox", lambda: email_outbox.stats)
+
+def load_email_outbox(limit=50):
+    """Most recent outbox rows (without the stored message) for the Admin panel."""
+    rows = supabase.table("email_outbox") \
+        .select("id, kind, recipient, subject, status, attempts, last_error, created_at, sent_at, next_attempt_at") \
+        .order("id", desc=True).limit(limit).execute().data or []
+    return pd.DataFrame(rows)
+def send_production_pdf(pdf_buffer, order_number, client_name):
+    """
+    Queue production PDF email to admin in the outbox.
+    
+    Args:
+        pdf_buffer (BytesIO): PDF file buffer
+        order_number: Order number
+        client_name: Client name
+    
+    Returns:
+        bool: True if email was queued
+    """
+    try:
+        # Get email config from secrets
+        settings = smtp_settings()
+        sender_email = settings["user"]
+        admin_email = settings["admin_email"]
+        
+        # Create message
+        msg = MIMEMultipart()
+        msg['From'] = sender_email
+        msg['To'] = admin_email
+        msg['Subject'] = f"📋 Production Order Complete - {order_number}"
+        
+        # Email body
+        body = f"""
+        <html>
+        <body style="font-family: Arial, sans-serif;">
+            <h2 style="color: #1e3a8a;">Production Order Completed</h2>
+            <p>A new production order has been completed and is ready for review.</p>
+            
+            <table style="border-collapse: collapse; margin: 20px 0;">
+                <tr>
+                    <td style="padding: 8px; background: #dbeafe; font-weight: bold;">Order Number:</td>
+                    <td style="padding: 8px;">{order_number}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px; background: #dbeafe; font-weight: bold;">Client:</td>
+                    <td style="padding: 8px;">{client_name}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px; background: #dbeafe; font-weight: bold;">Completed:</td>
+                    <td style="padding: 8px;">{datetime.now().strftime('%B %d, %Y at %I:%M %p')}</td>
+                </tr>
+            </table>
+            
+            <p>Please find the detailed production report attached as a PDF.</p>
+            
+            <hr style="border: 1px solid #e5e7eb; margin: 20px 0;">
+            <p style="color: #64748b; font-size: 12px;">
+                This is an automated email from the MJP Pulse Warehouse Management System.
+            </p>
+        </body>
+        </html>
+        """
+        
+        msg.attach(MIMEText(body, 'html'))
+        
+        # Attach PDF
+        pdf_buffer.seek(0)
+        attachment = MIMEBase('application', 'pdf')
+        attachment.set_payload(pdf_buffer.read())
+        encoders.encode_base64(attachment)
+        attachment.add_header('Content-Disposition', f'attachment; filename=Production_Order_{order_number}.pdf')
+        msg.attach(attachment)
+        
+        # Delivered by the outbox worker
+        email_outbox.enqueue(msg, "production_pdf")
+        
+        return True
+    
+    except Exception as e:
+        print(f"Email error: {e}")
+        return False
+
+def send_receipt_email(admin_email, po_num, pdf_buffer, operator):
+    """
+    Queue receipt PDF email to admin in the outbox.
+    
+    Args:
+        admin_email (str): Admin email address
+        po_num (str): Purchase Order Number
+        pdf_buffer (BytesIO): PDF file buffer
+        operator (str): Name of receiving operator
+    
+    Returns:
+        bool: True if email was queued, False otherwise
+    """
+    try:
+        # Get email config from Streamlit secrets
+        sender_email = smtp_settings()["user"]
+        
+        # Create message
+        msg = MIMEMultipart()
+        msg['From'] = sender_email
+        msg['To'] = admin_email
+        msg['Subject'] = f"📦 Receipt Report - PO: {po_num}"
+        
+        # Email body
+        body = f"""
+        <html>
+        <body style="font-family: Arial, sans-serif;">
+            <h2 style="color: #16a34a;">Receiving Report</h2>
+            <p>A new receipt report has been generated for your review.</p>
+            
+            <table style="border-collapse: collapse; margin: 20px 0;">
+                <tr>
+                    <td style="padding: 8px; background: #f0fdf4; font-weight: bold;">Purchase Order:</td>
+                    <td style="padding: 8px;">{po_num}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px; background: #f0fdf4; font-weight: bold;">Received By:</td>
+                    <td style="padding: 8px;">{operator}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px; background: #f0fdf4; font-weight: bold;">Generated:</td>
+                    <td style="padding: 8px;">{datetime.now().strftime('%B %d, %Y at %I:%M %p')}</td>
+                </tr>
+            </table>
+            
+            <p>Please find the detailed receipt report attached as a PDF.</p>
+            
+            <hr style="border: 1px solid #e5e7eb; margin: 20px 0;">
+            <p style="color: #64748b; font-size: 12px;">
+                This is an automated email from the Warehouse Management System.
+            </p>
+        </body>
+        </html>
+        """
+        
+        msg.attach(MIMEText(body, 'html'))
+        
+        # Attach PDF
+        pdf_buffer.seek(0)
+        attachment = MIMEBase('application', 'pdf')
+        attachment.set_payload(pdf_buffer.read())
+        encoders.encode_base64(attachment)
+        attachment.add_header('Content-Disposition', f'attachment; filename=Receipt_{po_num}.pdf')
+        msg.attach(attachment)
+        
+        # Delivered by the outbox worker
+        email_outbox.enqueue(msg, "receipt_pdf")
+        
+        return True
+    
+    except Exception as e:
+        print(f"Email error: {e}")
+        return False
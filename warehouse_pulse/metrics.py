@@ -0,0 +1,387 @@
+"""
+In-process performance metrics: section timings, Supabase call latency and cache hit rates.
+
+Everything is kept in one process-wide registry (shared by all sessions) plus a
+per-rerun accumulator on the script thread, so the sidebar panel can show both the
+last rerun and the totals since start. export_json() and export_prometheus() render
+the registry for monitoring.
+"""
+
+import functools
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import streamlit as st
+
+# Histogram bucket upper bounds in seconds (Prometheus style; +Inf is implicit)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_QUERY_OPERATIONS = {"select", "insert", "update", "upsert", "delete"}
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                break
+        else:
+            i = len(BUCKETS)
+        self.counts[i] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th observation (None if empty)."""
+        if not self.count:
+            return None
+        rank, running = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            running += n
+            if running >= rank:
+                return BUCKETS[i] if i < len(BUCKETS) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+            "buckets": {str(b): c for b, c in zip(BUCKETS + ("+Inf",), self.counts)},
+        }
+
+
+_lock = threading.Lock()
+_sections = defaultdict(Histogram)            # section name -> Histogram
+_supabase = defaultdict(Histogram)            # (table, operation) -> Histogram
+_supabase_errors = Counter()                  # (table, operation) -> failed calls
+_cache = defaultdict(lambda: {"calls": 0, "misses": 0})
+_components = {}                              # name -> callable returning a stats dict
+_started_at = datetime.now(timezone.utc)
+_rerun = threading.local()
+
+
+# --- Per-rerun accumulator ---
+def begin_rerun():
+    """Start collecting for the script run on this thread."""
+    _rerun.data = {"started": time.perf_counter(), "sections": {}, "supabase": Counter(),
+                   "supabase_seconds": 0.0, "cache_calls": 0, "cache_misses": 0}
+
+
+def end_rerun():
+    """
+    Finish the current script run.
+
+    Returns:
+        dict: Total seconds, per-section seconds and Supabase/cache counts for this rerun
+    """
+    data = getattr(_rerun, "data", None)
+    if data is None:
+        return None
+    _rerun.data = None
+    elapsed = time.perf_counter() - data["started"]
+    with _lock:
+        _sections["rerun"].observe(elapsed)
+    return {
+        "seconds": round(elapsed, 4),
+        "sections": {name: round(s, 4) for name, s in data["sections"].items()},
+        "supabase_calls": sum(data["supabase"].values()),
+        "supabase_seconds": round(data["supabase_seconds"], 4),
+        "supabase_by_call": {f"{table} {op}": n for (table, op), n in data["supabase"].most_common()},
+        "cache_hits": data["cache_calls"] - data["cache_misses"],
+        "cache_misses": data["cache_misses"],
+    }
+
+
+def current_rerun():
+    """Live accumulator for the script run on this thread (None outside a run)."""
+    return getattr(_rerun, "data", None)
+
+
+
+# --- Timers ---
+@contextmanager
+def timed(name):
+    """Time a block, or a function when used as a decorator, under `name`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            _sections[name].observe(elapsed)
+        data = current_rerun()
+        if data is not None:
+            data["sections"][name] = data["sections"].get(name, 0.0) + elapsed
+
+
+# --- Caches ---
+def _tracked(decorator, func, kwargs):
+    def wrap(func):
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def miss(*args, **kw):
+            # Only runs when Streamlit has no cached value
+            with _lock:
+                _cache[name]["misses"] += 1
+            data = current_rerun()
+            if data is not None:
+                data["cache_misses"] += 1
+            return func(*args, **kw)
+
+        cached = decorator(**kwargs)(miss)
+
+        @functools.wraps(func)
+        def call(*args, **kw):
+            with _lock:
+                _cache[name]["calls"] += 1
+            data = current_rerun()
+            if data is not None:
+                data["cache_calls"] += 1
+            return cached(*args, **kw)
+
+        call.clear = cached.clear
+        return call
+
+    return wrap(func) if func is not None else wrap
+
+
+def cache_data(func=None, **kwargs):
+    """st.cache_data that also counts calls and misses for the performance panel."""
+    return _tracked(st.cache_data, func, kwargs)
+
+
+def cache_resource(func=None, **kwargs):
+    """st.cache_resource that also counts calls and misses for the performance panel."""
+    return _tracked(st.cache_resource, func, kwargs)
+
+
+def cache_stats():
+    """Hits, misses and hit rate per cached function."""
+    with _lock:
+        counts = {name: dict(c) for name, c in _cache.items()}
+    rows = {}
+    for name, c in counts.items():
+        hits = max(c["calls"] - c["misses"], 0)
+        rows[name] = {"hits": hits, "misses": c["misses"],
+                      "hit_rate": round(hits / c["calls"], 4) if c["calls"] else None}
+    return rows
+
+
+def register_component(name, stats):
+    """Expose a component's own stats dict (e.g. AuditWriter.stats) through the panel and exports."""
+    _components[name] = stats
+
+
+def component_stats():
+    out = {}
+    for name, stats in _components.items():
+        try:
+            out[name] = dict(stats() if callable(stats) else stats)
+        except Exception as e:
+            out[name] = {"error": str(e)}
+    return out
+
+
+# --- Supabase ---
+@contextmanager
+def _supabase_call(table, operation):
+    start = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        key = (table, operation)
+        with _lock:
+            _supabase[key].observe(elapsed)
+            if failed:
+                _supabase_errors[key] += 1
+        data = current_rerun()
+        if data is not None:
+            data["supabase"][key] += 1
+            data["supabase_seconds"] += elapsed
+
+
+class _InstrumentedQuery:
+    """Wraps a postgrest builder chain so execute() is timed per table and operation."""
+
+    __slots__ = ("_target", "_table", "_operation")
+
+    def __init__(self, target, table, operation):
+        self._target, self._table, self._operation = target, table, operation
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name == "execute":
+            def execute(*args, **kwargs):
+                with _supabase_call(self._table, self._operation):
+                    return attr(*args, **kwargs)
+            return execute
+        operation = name if name in _QUERY_OPERATIONS else self._operation
+        if not callable(attr):
+            return _InstrumentedQuery(attr, self._table, operation) if hasattr(attr, "execute") else attr
+
+        def method(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return _InstrumentedQuery(result, self._table, operation) if hasattr(result, "execute") else result
+        return method
+
+
+class _InstrumentedBucket:
+    __slots__ = ("_bucket", "_name")
+
+    def __init__(self, bucket, name):
+        self._bucket, self._name = bucket, name
+
+    def __getattr__(self, name):
+        attr = getattr(self._bucket, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with _supabase_call(f"storage:{self._name}", name):
+                return attr(*args, **kwargs)
+        return call
+
+
+class _InstrumentedStorage:
+    __slots__ = ("_storage",)
+
+    def __init__(self, storage):
+        self._storage = storage
+
+    def from_(self, bucket):
+        return _InstrumentedBucket(self._storage.from_(bucket), bucket)
+
+    def __getattr__(self, name):
+        return getattr(self._storage, name)
+
+
+class InstrumentedClient:
+    """Supabase client proxy recording every table, RPC and Storage request."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def table(self, name):
+        return _InstrumentedQuery(self._client.table(name), name, "select")
+
+    from_ = table
+
+    def rpc(self, fn, *args, **kwargs):
+        return _InstrumentedQuery(self._client.rpc(fn, *args, **kwargs), fn, "rpc")
+
+    @property
+    def storage(self):
+        return _InstrumentedStorage(self._client.storage)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def supabase_stats():
+    with _lock:
+        return [
+            {"table": table, "operation": op, "errors": _supabase_errors[(table, op)], **h.to_dict(),
+             "p50": h.quantile(0.5), "p95": h.quantile(0.95)}
+            for (table, op), h in sorted(_supabase.items())
+        ]
+
+
+def section_stats():
+    with _lock:
+        return {name: {**h.to_dict(), "p50": h.quantile(0.5), "p95": h.quantile(0.95)}
+                for name, h in sorted(_sections.items())}
+
+
+# --- Export ---
+def snapshot():
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "started_at": _started_at.isoformat(),
+        "sections": section_stats(),
+        "supabase": supabase_stats(),
+        "caches": cache_stats(),
+        "components": component_stats(),
+    }
+
+
+def export_json(last_rerun=None):
+    data = snapshot()
+    data["last_rerun"] = last_rerun
+    return json.dumps(data, indent=2, default=str)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(metric, labels, hist):
+    lines, running = [], 0
+    for bound, count in zip(BUCKETS + ("+Inf",), hist["counts"]):
+        running += count
+        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {running}')
+    lines.append(f"{metric}_sum{{{labels}}} {hist['total']:.6f}")
+    lines.append(f"{metric}_count{{{labels}}} {hist['count']}")
+    return lines
+
+
+def export_prometheus():
+    """Registry in Prometheus text exposition format."""
+    with _lock:
+        sections = {k: {"counts": list(h.counts), "total": h.total, "count": h.count} for k, h in _sections.items()}
+        calls = {k: {"counts": list(h.counts), "total": h.total, "count": h.count} for k, h in _supabase.items()}
+        errors = dict(_supabase_errors)
+    lines = [
+        "# HELP warehouse_pulse_section_seconds Time spent in instrumented sections (tabs, helpers, whole reruns).",
+        "# TYPE warehouse_pulse_section_seconds histogram",
+    ]
+    for name, hist in sorted(sections.items()):
+        lines += _histogram_lines("warehouse_pulse_section_seconds", f'section="{_label(name)}"', hist)
+    lines += [
+        "# HELP warehouse_pulse_supabase_request_seconds Supabase request latency by table and operation.",
+        "# TYPE warehouse_pulse_supabase_request_seconds histogram",
+    ]
+    for (table, op), hist in sorted(calls.items()):
+        lines += _histogram_lines("warehouse_pulse_supabase_request_seconds", f'table="{_label(table)}",operation="{op}"', hist)
+    lines += [
+        "# HELP warehouse_pulse_supabase_errors_total Supabase requests that raised.",
+        "# TYPE warehouse_pulse_supabase_errors_total counter",
+    ]
+    for (table, op), n in sorted(errors.items()):
+        lines.append(f'warehouse_pulse_supabase_errors_total{{table="{_label(table)}",operation="{op}"}} {n}')
+    lines += [
+        "# HELP warehouse_pulse_cache_requests_total Cached function calls by result.",
+        "# TYPE warehouse_pulse_cache_requests_total counter",
+    ]
+    for name, c in sorted(cache_stats().items()):
+        for key, result in (("hits", "hit"), ("misses", "miss")):
+            lines.append(f'warehouse_pulse_cache_requests_total{{cache="{_label(name)}",result="{result}"}} {c[key]}')
+    lines += [
+        "# HELP warehouse_pulse_component_stat Counters reported by background components.",
+        "# TYPE warehouse_pulse_component_stat gauge",
+    ]
+    for name, stats in sorted(component_stats().items()):
+        for key, value in sorted(stats.items()):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                lines.append(f'warehouse_pulse_component_stat{{component="{_label(name)}",stat="{_label(key)}"}} {value}')
+    return "\n".join(lines) + "\n"
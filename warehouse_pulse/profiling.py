@@ -0,0 +1,212 @@
+"""On-demand profiler capture for slow reruns."""
+
+import cProfile
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import streamlit as st
+
+from warehouse_pulse import metrics
+
+PROFILE_DIR = st.secrets.get("PROFILE_DIR", os.path.join(tempfile.gettempdir(), "warehouse_pulse_profiles"))
+PROFILE_KEEP = int(st.secrets.get("PROFILE_KEEP", 20))
+
+
+# --- STACK SAMPLER ---
+class StackSampler:
+    """
+    Samples one thread's Python stack on a timer and counts collapsed stacks.
+
+    Output is the "folded" format flamegraph.pl, speedscope and inferno read: one line per
+    distinct stack, frames root-first separated by ';', then the sample count. Frames above
+    the Streamlit script (the runner's own machinery) are dropped.
+    """
+
+    def __init__(self, thread_id, interval=0.005, max_seconds=300):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    @staticmethod
+    def _stack(frame):
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            if frame.f_globals.get("__name__") == "__main__":
+                break
+            frame = frame.f_back
+        return ";".join(reversed(frames))
+
+    def _run(self):
+        deadline = time.monotonic() + self.max_seconds
+        while not self._stop.wait(self.interval) and time.monotonic() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self._stack(frame)] += 1
+
+    def folded(self):
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+
+# --- RERUN PROFILER ---
+class Capture:
+    """cProfile plus a stack sampler running on the current script thread."""
+
+    def __init__(self, user, tags, max_seconds=300):
+        self.user = user
+        self.tags = dict(tags)
+        self.started_at = datetime.now(timezone.utc)
+        self.rerun = metrics.current_rerun()
+        self._start = time.perf_counter()
+        self.sampler = StackSampler(threading.get_ident(), max_seconds=max_seconds)
+        self.profile = cProfile.Profile()
+        self.sampler.start()
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+        self.sampler.stop()
+        return time.perf_counter() - self._start
+
+
+class RerunProfiler:
+    """
+    Wraps the next N reruns (of any session, or of one user) in cProfile and a stack sampler.
+
+    Each capture is saved to `directory` as a .prof file (pstats / snakeviz), a .folded
+    collapsed-stack file for flame graphs, and a .json sidecar tagged with the user, the
+    tab that took longest, per-tab seconds and data sizes. Only one capture runs at a
+    time; reruns arriving while one is active are not counted. A capture whose session
+    never finishes it (e.g. the browser closed after st.stop) frees the slot after
+    `max_seconds`. The newest `keep` captures are kept.
+    """
+
+    def __init__(self, directory, keep=20, max_seconds=300):
+        self.directory = directory
+        self.keep = keep
+        self.max_seconds = max_seconds
+        self.remaining = 0
+        self.user = None
+        self.armed_by = None
+        self._lock = threading.Lock()
+        self._active_since = None
+        os.makedirs(directory, exist_ok=True)
+
+    def arm(self, reruns, user=None, armed_by=None):
+        with self._lock:
+            self.remaining = int(reruns)
+            self.user = (user or "").strip().lower() or None
+            self.armed_by = armed_by
+
+    def disarm(self):
+        self.arm(0)
+
+    def start(self, user, **tags):
+        """Begin a capture for this rerun if armed for `user`; returns the Capture or None."""
+        with self._lock:
+            if self.remaining <= 0:
+                return None
+            if self._active_since is not None and time.monotonic() - self._active_since < self.max_seconds:
+                return None
+            if self.user is not None and (user or "").lower() != self.user:
+                return None
+            self.remaining -= 1
+            self._active_since = time.monotonic()
+        try:
+            return Capture(user, tags, self.max_seconds)
+        except Exception as e:
+            # cProfile refuses to start if another profiler is active on this interpreter
+            print(f"Profiler capture skipped: {e}")
+            with self._lock:
+                self._active_since = None
+            return None
+
+    def finish(self, capture, interrupted=False):
+        """Stop `capture` and write its files; returns the metadata dict."""
+        try:
+            seconds = capture.stop()
+            sections = dict(capture.rerun["sections"]) if capture.rerun else {}
+            tabs = {name[4:]: round(s, 4) for name, s in sections.items() if name.startswith("tab.")}
+            stamp = capture.started_at.strftime("%Y%m%dT%H%M%S%f")
+            name = f"{stamp}_{re.sub(r'[^A-Za-z0-9_-]', '_', capture.user or 'anonymous')}"
+            meta = {
+                "name": name,
+                "user": capture.user,
+                "started_at": capture.started_at.isoformat(),
+                "seconds": round(seconds, 4),
+                # Every tab body runs on each rerun, so the active tab is read as the slowest one
+                "tab": max(tabs, key=tabs.get) if tabs else None,
+                "tab_seconds": tabs,
+                "sections": {k: round(v, 4) for k, v in sections.items() if not k.startswith("tab.")},
+                "supabase_calls": sum(capture.rerun["supabase"].values()) if capture.rerun else None,
+                "samples": sum(capture.sampler.stacks.values()),
+                "interrupted": interrupted,
+                **capture.tags,
+            }
+            base = os.path.join(self.directory, name)
+            capture.profile.dump_stats(base + ".prof")
+            with open(base + ".folded", "w") as f:
+                f.write(capture.sampler.folded())
+            with open(base + ".json", "w") as f:
+                json.dump(meta, f, indent=2, default=str)
+            self._prune()
+            return meta
+        finally:
+            with self._lock:
+                self._active_since = None
+
+    def _remove(self, name):
+        for ext in (".prof", ".folded", ".json"):
+            try:
+                os.remove(os.path.join(self.directory, name + ext))
+            except FileNotFoundError:
+                pass
+
+    def _prune(self):
+        for meta in self.captures()[self.keep:]:
+            self._remove(meta["name"])
+
+    def captures(self):
+        """Saved capture metadata, newest first."""
+        out = []
+        for fname in os.listdir(self.directory):
+            if fname.endswith(".json"):
+                try:
+                    with open(os.path.join(self.directory, fname)) as f:
+                        out.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        return sorted(out, key=lambda m: m["started_at"], reverse=True)
+
+    def read(self, name, ext):
+        with open(os.path.join(self.directory, os.path.basename(name) + ext), "rb") as f:
+            return f.read()
+
+    def clear(self):
+        for meta in self.captures():
+            self._remove(meta["name"])
+
+
+@st.cache_resource
+def get_rerun_profiler():
+    return RerunProfiler(PROFILE_DIR, keep=PROFILE_KEEP)
+
+rerun_profiler = get_rerun_profiler()
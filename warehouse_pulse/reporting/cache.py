@@ -0,0 +1,69 @@
+"""Size-bounded cache for generated report files."""
+
+import io
+import json
+import threading
+
+import streamlit as st
+
+from warehouse_pulse import metrics
+
+# --- REPORT CACHE ---
+class ArtifactCache:
+    """
+    Size-capped LRU of generated files (PDF/XLSX bytes) shared by all sessions.
+
+    Keys are a SHA-256 of (report type, parameters, data version), so an unchanged report
+    is served from memory and any data change simply misses and ages out.
+    """
+
+    def __init__(self, max_bytes):
+        from collections import OrderedDict
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def key(kind, params, data_version=""):
+        import hashlib
+        payload = json.dumps([kind, params, data_version], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_or_build(self, kind, params, build, data_version=""):
+        """Cached bytes for this report, calling build() (bytes or BytesIO) on a miss."""
+        key = self.key(kind, params, data_version)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        data = build()
+        if isinstance(data, io.BytesIO):
+            data = data.getvalue()
+        if len(data) > self.max_bytes:
+            return data
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = data
+                self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+        return data
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._size, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+@st.cache_resource
+def get_artifact_cache():
+    return ArtifactCache(int(st.secrets.get("ARTIFACT_CACHE_MB", 64)) * 1024 * 1024)
+
+metrics.register_component("artifact_cache", lambda: get_artifact_cache().stats())
@@ -0,0 +1,237 @@
+"""Inventory report: aggregation, PDF and streaming Excel export."""
+
+import io
+import re
+
+import numpy as np
+import pandas as pd
+
+from warehouse_pulse import metrics
+from warehouse_pulse.reporting import report_pdf
+
+# --- REPORTS ---
+REPORT_MATERIAL_COLUMNS = ['Category', 'Material', 'Total_Footage', 'Item_Count', 'Avg_Footage', 'Min_Footage', 'Max_Footage', 'Locations']
+
+@metrics.timed("build_inventory_report")
+@metrics.cache_data(show_spinner=False, max_entries=8)
+def build_inventory_report(data_version, _inventory_df, category=None):
+    """
+    Every statistic the Reports tab shows, from one (Category, Material) groupby.
+
+    Args:
+        data_version: Cache key from compute_data_version
+        _inventory_df: Inventory rows
+        category: Limit to one category, or None for all
+
+    Returns:
+        dict: materials (REPORT_MATERIAL_COLUMNS), categories (Category, Items, Footage)
+              and totals (footage, items, material_types, locations); categories keep
+              the order they first appear in
+    """
+    items = _inventory_df if category is None else _inventory_df[_inventory_df['Category'] == category]
+    items = items.assign(Footage=pd.to_numeric(items['Footage'], errors='coerce'))
+    keys = ['Category', 'Material']
+
+    materials = items.groupby(keys, sort=False).agg(
+        Total_Footage=('Footage', 'sum'),
+        Item_Count=('Footage', 'size'),
+        Avg_Footage=('Footage', 'mean'),
+        Min_Footage=('Footage', 'min'),
+        Max_Footage=('Footage', 'max'),
+    )
+
+    # First three locations (sorted) per material, "..." when there are more
+    locs = items[keys + ['Location']].dropna().drop_duplicates().sort_values(keys + ['Location'])
+    locs['Location'] = locs['Location'].astype(str)
+    grouped_locs = locs.groupby(keys, sort=False)
+    loc_text = grouped_locs.head(3).groupby(keys, sort=False)['Location'].agg(', '.join)
+    more = grouped_locs.size() > 3
+    loc_text = loc_text.where(~more.reindex(loc_text.index, fill_value=False), loc_text + '...')
+    materials['Locations'] = loc_text.reindex(materials.index).fillna('')
+    materials = materials.reset_index()[REPORT_MATERIAL_COLUMNS]
+
+    categories = materials.groupby('Category', sort=False).agg(
+        Items=('Item_Count', 'sum'), Footage=('Total_Footage', 'sum')
+    ).reset_index()
+
+    totals = {
+        "footage": float(categories['Footage'].sum()),
+        "items": len(items),
+        "material_types": len(materials),
+        "locations": int(items['Location'].nunique()),
+    }
+    return {"materials": materials, "categories": categories, "totals": totals}
+
+@metrics.timed("render_inventory_report_pdf")
+def render_inventory_report_pdf(report, category_label, report_date):
+    """
+    Category inventory report (summary table plus one material table per category) as PDF bytes.
+    Rows are formatted here; report_pdf renders groups of categories in worker processes and merges them.
+    """
+    report_totals = report['totals']
+    header = {
+        "category_label": category_label,
+        "report_date": report_date,
+        "summary_row": [f"{report_totals['footage']:,.1f} ft", str(report_totals['items']),
+                        str(report_totals['material_types']), str(report_totals['locations'])],
+    }
+
+    materials = report['materials']
+    material_names = materials['Material'].astype(str)
+    locations = materials['Locations'].astype(str)
+    rows = pd.DataFrame({
+        "Category": materials['Category'],
+        "Material": material_names.str[:40] + np.where(material_names.str.len() > 40, '...', ''),
+        "Items": materials['Item_Count'].astype(int).astype(str),
+        "Total": materials['Total_Footage'].map('{:,.1f} ft'.format),
+        "Avg": materials['Avg_Footage'].map('{:,.0f} ft'.format),
+        "Locations": locations.str[:20] + np.where(locations.str.len() > 20, '...', ''),
+    })
+    rows_by_category = {
+        category: group.drop(columns='Category').values.tolist()
+        for category, group in rows.groupby('Category', sort=False)
+    }
+
+    sections = [
+        {
+            "title": f"{cat.Category}",
+            "subtitle": f"{cat.Items} items | {cat.Footage:,.1f} ft total",
+            "rows": rows_by_category.get(cat.Category, []),
+        }
+        for cat in report['categories'].itertuples(index=False)
+    ]
+
+    return report_pdf.render_inventory_report(
+        header, sections, "This report was automatically generated by MJP Pulse Inventory System."
+    )
+
+XLSX_CHUNK_ROWS = 20000
+_XLSX_NS = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+_XLSX_STYLES = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><styleSheet {_XLSX_NS}>'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/></font></fonts>'
+    '<fills count="3"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FF0EA5E9"/><bgColor indexed="64"/></patternFill></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles></styleSheet>'
+)
+
+def _xlsx_column_letter(index):
+    name, index = "", index + 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        name = chr(65 + rem) + name
+    return name
+
+def _xml_text(values):
+    """Escape a string Series for XML text, dropping characters XML cannot carry."""
+    return (values.str.replace(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", regex=True)
+            .str.replace("&", "&amp;", regex=False)
+            .str.replace("<", "&lt;", regex=False)
+            .str.replace(">", "&gt;", regex=False))
+
+def _xlsx_sheet_rows(frame, first_row):
+    """SpreadsheetML <row> elements for a chunk of `frame`, built column-wise with string ops."""
+    row_numbers = pd.Series(np.arange(first_row, first_row + len(frame)).astype(str), index=frame.index)
+    row_xml = pd.Series("", index=frame.index)
+    for c, col in enumerate(frame.columns):
+        values = frame[col]
+        ref = '<c r="' + _xlsx_column_letter(c) + row_numbers
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            numbers = values.astype(float)
+            present = np.isfinite(numbers.to_numpy())
+            cells = ref + '"><v>' + numbers.astype(str) + '</v></c>'
+        else:
+            present = values.notna().to_numpy()
+            cells = ref + '" t="inlineStr"><is><t xml:space="preserve">' + _xml_text(values.astype(str)) + '</t></is></c>'
+        row_xml = row_xml + cells.where(present, "")
+    return "".join(('<row r="' + row_numbers + '">' + row_xml + '</row>').tolist())
+
+def write_xlsx_stream(output, sheets, chunk_rows=XLSX_CHUNK_ROWS):
+    """
+    Write DataFrames to an .xlsx file as a stream: each sheet goes into the zip in chunks
+    of `chunk_rows` rows, so memory is bounded by one chunk plus the compressed output.
+
+    Args:
+        output: Path or binary file object
+        sheets: list of (sheet name, DataFrame); columns become a bold header row
+        chunk_rows: Rows rendered per chunk
+    """
+    import zipfile
+
+    names = []
+    for name, _ in sheets:
+        name = re.sub(r"[\[\]:*?/\\]", "", str(name))[:31] or "Sheet"
+        names.append(name.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;"))
+
+    xml_head = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    rels_ns = 'xmlns="http://schemas.openxmlformats.org/package/2006/relationships"'
+    doc_rel = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    sheet_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr("[Content_Types].xml", xml_head +
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            + "".join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="{sheet_type}"/>' for i in range(1, len(sheets) + 1))
+            + '</Types>')
+        zf.writestr("_rels/.rels", xml_head + f'<Relationships {rels_ns}>'
+            f'<Relationship Id="rId1" Type="{doc_rel}/officeDocument" Target="xl/workbook.xml"/></Relationships>')
+        zf.writestr("xl/workbook.xml", xml_head + f'<workbook {_XLSX_NS} xmlns:r="{doc_rel}"><sheets>'
+            + "".join(f'<sheet name="{name}" sheetId="{i}" r:id="rId{i}"/>' for i, name in enumerate(names, start=1))
+            + '</sheets></workbook>')
+        zf.writestr("xl/_rels/workbook.xml.rels", xml_head + f'<Relationships {rels_ns}>'
+            + "".join(f'<Relationship Id="rId{i}" Type="{doc_rel}/worksheet" Target="worksheets/sheet{i}.xml"/>' for i in range(1, len(sheets) + 1))
+            + f'<Relationship Id="rId{len(sheets) + 1}" Type="{doc_rel}/styles" Target="styles.xml"/></Relationships>')
+        zf.writestr("xl/styles.xml", _XLSX_STYLES)
+
+        for i, (_, frame) in enumerate(sheets, start=1):
+            with zf.open(f"xl/worksheets/sheet{i}.xml", "w", force_zip64=True) as sheet:
+                header = "".join(
+                    f'<c r="{_xlsx_column_letter(c)}1" s="1" t="inlineStr"><is><t>{_xml_text(pd.Series([str(col)]))[0]}</t></is></c>'
+                    for c, col in enumerate(frame.columns)
+                )
+                sheet.write((xml_head + f'<worksheet {_XLSX_NS}><sheetData><row r="1">{header}</row>').encode("utf-8"))
+                for start in range(0, len(frame), chunk_rows):
+                    sheet.write(_xlsx_sheet_rows(frame.iloc[start:start + chunk_rows], start + 2).encode("utf-8"))
+                sheet.write(b"</sheetData></worksheet>")
+
+@metrics.timed("write_report_excel")
+def write_report_excel(report, items_df, category_label, report_date):
+    """
+    Report workbook (Summary, Material Summary, All Items, one sheet per category) as bytes.
+
+    Streamed through write_xlsx_stream; items are sorted by category once and every
+    category sheet is a contiguous slice of that order.
+    """
+    totals = report['totals']
+    summary = pd.DataFrame({
+        'Metric': ['Report Date', 'Category', 'Total Footage', 'Total Items', 'Material Types', 'Locations'],
+        'Value': [report_date, category_label, f"{totals['footage']:,.1f} ft",
+                  str(totals['items']), str(totals['material_types']), str(totals['locations'])],
+    })
+
+    category_order = {cat: i for i, cat in enumerate(report['categories']['Category'])}
+    ordered = items_df.assign(_order=items_df['Category'].map(category_order)).sort_values('_order', kind='stable')
+    bounds = ordered['_order'].searchsorted(np.arange(len(category_order) + 1))
+    item_columns = ['Item_ID', 'Category', 'Material', 'Footage', 'Location', 'Status']
+    sheet_columns = ['Item_ID', 'Material', 'Footage', 'Location']
+
+    sheets = [
+        ('Summary', summary),
+        ('Material Summary', report['materials']),
+        ('All Items', ordered.reindex(columns=item_columns)),
+    ]
+    # Excel sheet names max 31 chars
+    sheets += [(str(cat)[:30], ordered.iloc[bounds[i]:bounds[i + 1]][sheet_columns]) for cat, i in category_order.items()]
+
+    buffer = io.BytesIO()
+    write_xlsx_stream(buffer, sheets)
+    return buffer.getvalue()
@@ -0,0 +1,396 @@
+"""Production and PO receipt PDFs."""
+
+from datetime import datetime
+from io import BytesIO
+
+from warehouse_pulse import metrics
+from warehouse_pulse.reporting import report_pdf
+
+
+@metrics.timed("generate_production_pdf")
+def generate_production_pdf(order_number, client_name, operator_name, deduction_details, box_usage, coil_extra=0.5, roll_extra=0.5):
+    """
+    Generate a professional production order PDF with navy blue theme.
+    
+    Args:
+        order_number: Internal order number
+        client_name: Client name
+        operator_name: Operator name
+        deduction_details: List of deduction records
+        box_usage: Dictionary of box types and quantities
+        coil_extra: Extra inch allowance for coils
+        roll_extra: Extra inch allowance for rolls
+    
+    Returns:
+        BytesIO: PDF file buffer
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib.enums import TA_CENTER
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, 
+                           rightMargin=0.5*inch, leftMargin=0.5*inch,
+                           topMargin=0.75*inch, bottomMargin=0.5*inch)
+    
+    elements = []
+    styles = getSampleStyleSheet()
+    
+    # Navy blue theme colors
+    navy_blue = colors.HexColor('#1e3a8a')
+    light_navy = colors.HexColor('#dbeafe')
+    
+    # Title style
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=22,
+        textColor=navy_blue,
+        spaceAfter=8,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'CustomSubtitle',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=colors.HexColor('#64748b'),
+        spaceAfter=20,
+        alignment=TA_CENTER
+    )
+    
+    # Title
+    elements.append(Paragraph("MJP PRODUCTION ORDER LOG", title_style))
+    elements.append(Paragraph("Manufacturing & Stock Deduction Documentation", subtitle_style))
+    
+    # Order metadata with fillable production order number
+    current_time = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+    
+    metadata = [
+        ['Internal Order #:', order_number],
+        ['Production Order #:', '____________________________'],  # Fillable space
+        ['Client:', client_name],
+        ['Operator:', operator_name],
+        ['Completed:', current_time]
+    ]
+    
+    meta_table = Table(metadata, colWidths=[1.8*inch, 4.7*inch])
+    meta_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), light_navy),
+        ('TEXTCOLOR', (0, 0), (0, -1), navy_blue),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ]))
+    
+    elements.append(meta_table)
+    elements.append(Spacer(1, 0.2*inch))
+    
+    # Production details table (compact for up to 10+ sizes)
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=11,
+        textColor=colors.HexColor('#1e293b'),
+        spaceAfter=8,
+        spaceBefore=8
+    )
+    
+    elements.append(Paragraph("Production Details", heading_style))
+    
+    # Table data - UPDATED COLUMNS: Production and Waste separate
+    table_data = [['Type', 'Source ID', 'Size', 'Pcs', 'Production', 'Waste', 'Extra"']]
+    
+    for detail in deduction_details:
+        extra_allowance = coil_extra if detail['material_type'] == 'Coil' else roll_extra
+        
+        # Use new field names, with fallback for backward compatibility
+        production_ft = detail.get('production_footage', detail.get('footage_used', 0) - detail.get('waste', 0))
+        waste_ft = detail.get('waste', 0)
+        
+        table_data.append([
+            detail['material_type'][:4],  # Coil/Roll
+            str(detail['source_id'])[:15],  # Truncate if needed
+            detail['size'],
+            str(detail['pieces']),
+            f"{production_ft:.1f}",   # Production footage ONLY
+            f"{waste_ft:.1f}",        # Waste ONLY
+            f"{extra_allowance}"
+        ])
+    
+    col_widths = [0.5*inch, 1.3*inch, 0.6*inch, 0.5*inch, 0.8*inch, 0.6*inch, 0.6*inch]
+    prod_table = Table(table_data, colWidths=col_widths, repeatRows=1)
+    
+    prod_table.setStyle(TableStyle([
+        # Header
+        ('BACKGROUND', (0, 0), (-1, 0), navy_blue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+        ('TOPPADDING', (0, 0), (-1, 0), 6),
+        
+        # Data rows
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')]),
+        ('LEFTPADDING', (0, 0), (-1, -1), 5),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+        ('TOPPADDING', (0, 1), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
+    ]))
+    
+    elements.append(prod_table)
+    elements.append(Spacer(1, 0.15*inch))
+    
+    # TOTALS SECTION - Group by material with CLEAR separation
+    elements.append(Paragraph("TOTALS BY MATERIAL", heading_style))
+    
+    # Calculate totals by material - SEPARATE production and waste
+    material_totals = {}
+    for detail in deduction_details:
+        material_key = detail['material']
+        if material_key not in material_totals:
+            material_totals[material_key] = {
+                'production': 0,
+                'waste': 0,
+                'pieces': 0,
+                'type': detail['material_type']
+            }
+        
+        # Use new field names with fallback
+        production_ft = detail.get('production_footage', detail.get('footage_used', 0) - detail.get('waste', 0))
+        waste_ft = detail.get('waste', 0)
+        
+        material_totals[material_key]['production'] += production_ft
+        material_totals[material_key]['waste'] += waste_ft
+        material_totals[material_key]['pieces'] += detail['pieces']
+    
+    # Create totals table - UPDATED COLUMNS
+    totals_data = [['Material', 'Type', 'Pieces', 'Production (ft)', 'Waste (ft)', 'Total (ft)']]
+    
+    grand_production = 0
+    grand_waste = 0
+    grand_pieces = 0
+    
+    for material, totals in material_totals.items():
+        material_total = totals['production'] + totals['waste']
+        totals_data.append([
+            material[:30],  # Truncate long names
+            totals['type'],
+            str(totals['pieces']),
+            f"{totals['production']:.2f}",
+            f"{totals['waste']:.2f}",
+            f"{material_total:.2f}"
+        ])
+        grand_production += totals['production']
+        grand_waste += totals['waste']
+        grand_pieces += totals['pieces']
+    
+    grand_total = grand_production + grand_waste
+    
+    # Grand total row
+    totals_data.append([
+        'GRAND TOTAL',
+        '',
+        str(grand_pieces),
+        f"{grand_production:.2f}",
+        f"{grand_waste:.2f}",
+        f"{grand_total:.2f}"
+    ])
+    
+    totals_table = Table(totals_data, colWidths=[1.8*inch, 0.6*inch, 0.7*inch, 1.1*inch, 0.9*inch, 0.9*inch])
+    totals_table.setStyle(TableStyle([
+        # Header
+        ('BACKGROUND', (0, 0), (-1, 0), navy_blue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        
+        # Data rows
+        ('FONTNAME', (0, 1), (-1, -2), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -2), 9),
+        ('ALIGN', (0, 1), (0, -2), 'LEFT'),
+        ('ALIGN', (1, 1), (-1, -2), 'CENTER'),
+        
+        # Grand total row (last row)
+        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#fef3c7')),
+        ('TEXTCOLOR', (0, -1), (-1, -1), colors.HexColor('#92400e')),
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, -1), (-1, -1), 10),
+        ('ALIGN', (0, -1), (-1, -1), 'CENTER'),
+        
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, light_navy]),
+        ('PADDING', (0, 0), (-1, -1), 6),
+    ]))
+    
+    elements.append(totals_table)
+    elements.append(Spacer(1, 0.15*inch))
+    
+    # Summary box - CLEAR breakdown
+    summary_style = ParagraphStyle(
+        'SummaryStyle',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=navy_blue,
+        alignment=TA_CENTER,
+        spaceAfter=10,
+        fontName='Helvetica-Bold'
+    )
+    
+    elements.append(Paragraph(
+        f"SUMMARY: {grand_production:.2f} ft Production + {grand_waste:.2f} ft Waste = {grand_total:.2f} ft Total Deducted",
+        summary_style
+    ))
+    
+    # Extra allowance note
+    allowance_note = ParagraphStyle(
+        'AllowanceNote',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.HexColor('#64748b'),
+        alignment=TA_CENTER,
+        spaceAfter=10
+    )
+    
+    elements.append(Paragraph(
+        f"<b>Note:</b> Extra allowance included in production - Coils: {coil_extra}\" per piece | Rolls: {roll_extra}\" per piece",
+        allowance_note
+    ))
+    
+    # Box usage section (if any)
+    if any(box_usage.values()):
+        elements.append(Spacer(1, 0.1*inch))
+        elements.append(Paragraph("Box Usage", heading_style))
+        
+        box_data = [['Box Type', 'Quantity Used']]
+        for box_type, qty in box_usage.items():
+            if qty > 0:
+                box_data.append([box_type, str(qty)])
+        
+        box_table = Table(box_data, colWidths=[3.5*inch, 1.5*inch])
+        box_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), navy_blue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, light_navy]),
+            ('PADDING', (0, 0), (-1, -1), 6),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ]))
+        
+        elements.append(box_table)
+    
+    elements.append(Spacer(1, 0.2*inch))
+    
+    # Footer
+    footer_style = ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontSize=7,
+        textColor=colors.HexColor('#94a3b8'),
+        alignment=TA_CENTER
+    )
+    
+    elements.append(Paragraph(
+        "This production log was automatically generated by the MJP Pulse Warehouse Management System.<br/>"
+        "For questions or updates, please contact the production manager.",
+        footer_style
+    ))
+    
+    doc.build(elements)
+    buffer.seek(0)
+    
+    return buffer
+
+@metrics.timed("generate_receipt_pdf")
+def generate_receipt_pdf(po_num, df, operator):
+    """
+    Generate a professional PDF receipt report for received inventory items.
+    
+    Args:
+        po_num (str): Purchase Order Number
+        df (DataFrame): DataFrame containing inventory items
+        operator (str): Name of receiving operator
+    
+    Returns:
+        BytesIO: PDF file buffer
+    """
+    # Metadata section
+    current_time = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+    
+    metadata = [
+        ['Purchase Order:', po_num],
+        ['Generated:', current_time],
+        ['Operator:', operator],
+        ['Total Items:', str(len(df))]
+    ]
+    
+    # Group items by Material and Location to consolidate rows
+    grouped_data = df.groupby(['Category', 'Material', 'Location']).agg({
+        'Footage': 'sum',  # Sum quantities
+        'Item_ID': 'count'  # Count how many items
+    }).reset_index()
+    
+    grouped_data.columns = ['Category', 'Material', 'Location', 'Total_Qty', 'Item_Count']
+    
+    # Prepare table rows with simplified columns
+    table_rows = []
+    
+    for row in grouped_data.itertuples(index=False):
+        category = str(row.Category)
+        material = str(row.Material)
+        
+        # Extract key specs from material description
+        # e.g., "Smooth Aluminum Coil - .016 Gauge" -> ".016 Aluminum Smooth"
+        specs = material
+        if category in ['Coils', 'Rolls']:
+            # Try to extract gauge and key descriptors
+            parts = material.split(' - ')
+            if len(parts) > 1:
+                gauge_part = parts[-1].replace(' Gauge', '')  # ".016"
+                desc_parts = parts[0].split()  # ["Smooth", "Aluminum", "Coil"]
+                if len(desc_parts) >= 2:
+                    specs = f"{gauge_part} {desc_parts[1]} {desc_parts[0]}"  # ".016 Aluminum Smooth"
+        
+        # Format quantity with item count
+        qty_display = f"{int(row.Item_Count)} items ({row.Total_Qty} total)"
+        if category in ['Coils', 'Rolls']:
+            qty_display = f"{int(row.Item_Count)} {category}"
+        
+        table_rows.append([
+            category,
+            specs,
+            qty_display,
+            str(row.Location)
+        ])
+    
+    # Large receipts are split across the report_pdf worker pool
+    pdf_bytes = report_pdf.render_receipt(
+        metadata,
+        table_rows,
+        "This report was automatically generated by the Warehouse Management System.<br/>"
+        "For questions or updates, please contact the warehouse administrator."
+    )
+    
+    return BytesIO(pdf_bytes)
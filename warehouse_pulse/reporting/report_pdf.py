@@ -0,0 +1,340 @@
+"""
+PDF rendering for the inventory report and PO receipts.
+
+Has no Streamlit imports so ProcessPoolExecutor workers can import it: a large report is
+split into parts (groups of categories, or runs of receipt rows), each part is rendered
+to its own PDF in a worker process and the parts are merged in order. Paragraph and
+table styles are built once per process and reused by every render.
+"""
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# Below this many table rows a report renders in one document on the calling thread
+PARALLEL_MIN_ROWS = 2000
+MAX_WORKERS = min(os.cpu_count() or 1, 4)
+
+_pool = None
+
+
+def _get_pool():
+    """Shared worker pool, started on first use ('spawn' so no Streamlit threads are forked)."""
+    global _pool
+    if _pool is None:
+        import multiprocessing
+        _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+@lru_cache(maxsize=None)
+def report_styles():
+    """Paragraph and table styles for the inventory report, built once per process."""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#0ea5e9'),
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        "subtitle": ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#64748b'),
+            spaceAfter=20,
+            alignment=TA_CENTER
+        ),
+        "heading": ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor('#0ea5e9'),
+            spaceAfter=10,
+            spaceBefore=15
+        ),
+        "normal": styles['Normal'],
+        "footer": ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor('#94a3b8'),
+            alignment=TA_CENTER
+        ),
+        "summary_table": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0ea5e9')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#f0f9ff')),
+            ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+            ('PADDING', (0, 0), (-1, -1), 8),
+        ]),
+        "material_table": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0ea5e9')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
+            ('PADDING', (0, 0), (-1, -1), 6),
+        ]),
+    }
+
+
+@lru_cache(maxsize=None)
+def receipt_styles():
+    """Paragraph and table styles for PO receipts, built once per process."""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#15803d'),
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        "subtitle": ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#64748b'),
+            spaceAfter=30,
+            alignment=TA_CENTER
+        ),
+        "heading": ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=12,
+            textColor=colors.HexColor('#1e293b'),
+            spaceAfter=12,
+            spaceBefore=12
+        ),
+        "footer": ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor('#94a3b8'),
+            alignment=TA_CENTER
+        ),
+        "meta_table": TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0fdf4')),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#15803d')),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+            ('LEFTPADDING', (0, 0), (-1, -1), 12),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ]),
+        "items_table": TableStyle([
+            # Header row
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#16a34a')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+            ('TOPPADDING', (0, 0), (-1, 0), 10),
+
+            # Data rows
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')]),
+            ('LEFTPADDING', (0, 0), (-1, -1), 8),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 1), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+        ]),
+    }
+
+
+def _split_parts(sizes, parts):
+    """Cut a sequence of item sizes into at most `parts` contiguous runs of similar total size."""
+    total = sum(sizes)
+    bounds, running, target = [0], 0, total / max(parts, 1)
+    for i, size in enumerate(sizes):
+        running += size
+        if running >= target * len(bounds) and len(bounds) < parts and i + 1 < len(sizes):
+            bounds.append(i + 1)
+    bounds.append(len(sizes))
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+
+def merge_pdfs(parts):
+    """Concatenate PDF documents (bytes) in order."""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(io.BytesIO(part))
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _render_parts(render, payloads, workers):
+    if workers > 1 and len(payloads) > 1:
+        parts = list(_get_pool().map(render, payloads))
+    else:
+        parts = [render(payload) for payload in payloads]
+    return parts[0] if len(parts) == 1 else merge_pdfs(parts)
+
+
+# ── Inventory report ──────────────────────────────────────────────────────────
+
+def _render_inventory_part(payload):
+    """One run of categories (plus the title block on the first part, footer on the last) -> PDF bytes."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+
+    styles = report_styles()
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                            rightMargin=0.5*inch, leftMargin=0.5*inch,
+                            topMargin=0.75*inch, bottomMargin=0.5*inch)
+    elements = []
+
+    header = payload.get("header")
+    if header:
+        elements.append(Paragraph("INVENTORY REPORT", styles["title"]))
+        elements.append(Paragraph(f"Category: {header['category_label']} | Generated: {header['report_date']}", styles["subtitle"]))
+        summary_table = Table([['Total Footage', 'Total Items', 'Material Types', 'Locations'], header['summary_row']],
+                              colWidths=[1.8*inch]*4)
+        summary_table.setStyle(styles["summary_table"])
+        elements.append(summary_table)
+        elements.append(Spacer(1, 0.3*inch))
+
+    for section in payload["sections"]:
+        elements.append(Paragraph(section["title"], styles["heading"]))
+        elements.append(Paragraph(section["subtitle"], styles["normal"]))
+        elements.append(Spacer(1, 0.1*inch))
+        mat_table = Table([['Material', 'Items', 'Total Footage', 'Avg/Item', 'Locations']] + section["rows"],
+                          colWidths=[2.2*inch, 0.7*inch, 1.2*inch, 0.9*inch, 1.5*inch], repeatRows=1)
+        mat_table.setStyle(styles["material_table"])
+        elements.append(mat_table)
+        elements.append(Spacer(1, 0.2*inch))
+
+    if payload.get("footer"):
+        elements.append(Spacer(1, 0.3*inch))
+        elements.append(Paragraph(payload["footer"], styles["footer"]))
+
+    doc.build(elements)
+    return buffer.getvalue()
+
+
+def render_inventory_report(header, sections, footer, workers=None):
+    """
+    Inventory report PDF.
+
+    Args:
+        header: dict with category_label, report_date and summary_row (4 strings)
+        sections: list of dicts, one per category: title, subtitle, rows (lists of 5 strings)
+        footer: Footer line
+        workers: Worker processes to use (default MAX_WORKERS); small reports always render inline
+
+    Returns:
+        bytes: PDF document; large reports start a new page at each part boundary
+    """
+    workers = MAX_WORKERS if workers is None else workers
+    sizes = [len(section["rows"]) + 4 for section in sections] or [0]
+    if sum(sizes) < PARALLEL_MIN_ROWS:
+        workers = 1
+
+    runs = _split_parts(sizes, workers) if sections else [(0, 0)]
+    payloads = [{"sections": sections[start:end]} for start, end in runs]
+    payloads[0]["header"] = header
+    payloads[-1]["footer"] = footer
+    return _render_parts(_render_inventory_part, payloads, workers)
+
+
+# ── PO receipt ────────────────────────────────────────────────────────────────
+
+def _render_receipt_part(payload):
+    """One run of receipt rows (title/metadata on the first part, footer on the last) -> PDF bytes."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+
+    styles = receipt_styles()
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                            rightMargin=0.75*inch, leftMargin=0.75*inch,
+                            topMargin=1*inch, bottomMargin=0.75*inch)
+    elements = []
+
+    if payload.get("metadata"):
+        elements.append(Paragraph("📦 RECEIVING REPORT", styles["title"]))
+        elements.append(Paragraph("Purchase Order Receipt Documentation", styles["subtitle"]))
+        meta_table = Table(payload["metadata"], colWidths=[2*inch, 4*inch])
+        meta_table.setStyle(styles["meta_table"])
+        elements.append(meta_table)
+        elements.append(Spacer(1, 0.3*inch))
+        elements.append(Paragraph("Received Items", styles["heading"]))
+
+    items_table = Table([['Category', 'Specifications', 'Quantity', 'Location']] + payload["rows"],
+                        colWidths=[1.2*inch, 3*inch, 1.5*inch, 1*inch], repeatRows=1)
+    items_table.setStyle(styles["items_table"])
+    elements.append(items_table)
+
+    if payload.get("footer"):
+        elements.append(Spacer(1, 0.5*inch))
+        elements.append(Paragraph(payload["footer"], styles["footer"]))
+
+    doc.build(elements)
+    return buffer.getvalue()
+
+
+def render_receipt(metadata, rows, footer, workers=None):
+    """
+    PO receipt PDF.
+
+    Args:
+        metadata: [label, value] pairs for the header table
+        rows: Item rows (Category, Specifications, Quantity, Location)
+        footer: Footer text (may contain <br/>)
+        workers: Worker processes to use (default MAX_WORKERS); small receipts always render inline
+
+    Returns:
+        bytes: PDF document
+    """
+    workers = MAX_WORKERS if workers is None else workers
+    if len(rows) < PARALLEL_MIN_ROWS:
+        workers = 1
+
+    runs = _split_parts([1] * len(rows), workers) if rows else [(0, 0)]
+    payloads = [{"rows": rows[start:end]} for start, end in runs]
+    payloads[0]["metadata"] = metadata
+    payloads[-1]["footer"] = footer
+    return _render_parts(_render_receipt_part, payloads, workers)
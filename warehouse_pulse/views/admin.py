@@ -0,0 +1,924 @@
+"""Admin Actions tab."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse.data.audit_log import AUDIT_HOT_DAYS, archive_audit_log, load_audit_archive_manifest
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.client import supabase
+from warehouse_pulse.data.movements import sync_movement_rollup
+from warehouse_pulse.domain.bulk_edit import BULK_EDIT_COLUMNS, apply_inventory_edits, diff_inventory_edits, duplicate_item_ids
+from warehouse_pulse.domain.search import build_search_index, search_inventory
+from warehouse_pulse.mail import email_outbox, load_email_outbox
+from warehouse_pulse.profiling import rerun_profiler
+
+
+def render(df, df_audit):
+    st.markdown("""
+        <div style="text-align: center; padding: 20px 0;">
+            <h1 style="color: #dc2626; margin: 0;">⚙️ Admin Actions</h1>
+            <p style="color: #64748b; margin-top: 8px;">Edit footage, locations, Item IDs, or remove items from inventory</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if user is admin (optional - add your admin usernames here)
+    admin_users = ["admin", "manager", "tmilazi"]  # Add your admin usernames
+    current_user = st.session_state.get('username', '')
+    
+    # For now, allow all logged-in users (remove this if you want admin-only)
+    is_admin = True  # Change to: current_user.lower() in [u.lower() for u in admin_users]
+    
+    if not is_admin:
+        st.error("🔒 Access Denied. Admin privileges required.")
+    else:
+        # Safe DataFrame check
+        if df is not None and not df.empty:
+            
+            # Search/Filter Section
+            st.markdown("### 🔍 Find Item to Edit")
+            
+            col_search, col_cat_filter = st.columns([2, 1])
+            
+            with col_search:
+                search_term = st.text_input(
+                    "Search by Item ID, Material, Location or PO",
+                    placeholder="e.g. Coil-AL-016 or Stucco Aluminum",
+                    key="admin_search"
+                )
+            
+            with col_cat_filter:
+                admin_categories = ["All"] + sorted(df['Category'].unique().tolist())
+                selected_cat = st.selectbox("Filter by Category", admin_categories, key="admin_cat_filter")
+            
+            # Rank matches with the prebuilt index; no search means inventory order
+            if search_term.strip():
+                search_index = build_search_index(st.session_state.get('data_version', ''), df)
+                positions, _ = search_inventory(search_index, search_term)
+            else:
+                positions = np.arange(len(df))
+            
+            if selected_cat != "All":
+                positions = positions[df['Category'].to_numpy()[positions] == selected_cat]
+            
+            # Paginate so only one page of rows is rendered
+            ADMIN_PAGE_SIZE = 50
+            total_matches = len(positions)
+            page_count = max(1, -(-total_matches // ADMIN_PAGE_SIZE))
+            
+            if total_matches > ADMIN_PAGE_SIZE:
+                admin_page = st.number_input(
+                    f"Page (of {page_count})", min_value=1, max_value=page_count, value=1, step=1, key=f"admin_page_{search_term}_{selected_cat}"
+                )
+            else:
+                admin_page = 1
+            
+            page_positions = positions[(admin_page - 1) * ADMIN_PAGE_SIZE: admin_page * ADMIN_PAGE_SIZE]
+            admin_df = df.iloc[page_positions]
+            
+            # Display filtered inventory
+            if not admin_df.empty:
+                st.markdown(f"### 📋 Inventory Items ({total_matches} found, showing {len(admin_df)})")
+                
+                bulk_mode = st.toggle("✏️ Bulk edit mode (edit footage, location and IDs in the grid)", key="admin_bulk_mode")
+                
+                if bulk_mode:
+                    # The grid covers every match, not just the current page
+                    BULK_EDIT_MAX_ROWS = 2000
+                    if total_matches > BULK_EDIT_MAX_ROWS:
+                        st.warning(f"⚠️ Showing the first {BULK_EDIT_MAX_ROWS} of {total_matches} matches. Narrow the search to edit the rest.")
+                    
+                    duplicate_ids = duplicate_item_ids(df["Item_ID"].iloc[positions[:BULK_EDIT_MAX_ROWS]])
+                    if duplicate_ids:
+                        st.error(f"❌ These Item IDs are on more than one row: {', '.join(duplicate_ids[:10])}. "
+                                 "Give each row its own ID with the single-item editor below, then bulk edit again.")
+                    else:
+                        grid_df = df.iloc[positions[:BULK_EDIT_MAX_ROWS]][BULK_EDIT_COLUMNS].set_index('Item_ID', drop=False)
+                        grid_df.index.name = None
+                        grid_df.insert(0, 'Delete', False)
+                    
+                        with st.form("bulk_edit_form"):
+                            edited_grid = st.data_editor(
+                                grid_df,
+                                use_container_width=True,
+                                hide_index=True,
+                                num_rows="fixed",
+                                disabled=['Category', 'Material', 'Status'],
+                                column_config={
+                                    "Delete": st.column_config.CheckboxColumn("🗑️", help="Remove this item on save"),
+                                    "Footage": st.column_config.NumberColumn("Footage", min_value=0.0),
+                                },
+                                key="admin_bulk_grid"
+                            )
+                        
+                            col_move, col_reason = st.columns(2)
+                            with col_move:
+                                move_all_to = st.text_input("📍 Move every row in the grid to (optional)", placeholder="e.g. Rack B-4")
+                            with col_reason:
+                                bulk_reason = st.text_input("Reason for Changes *", placeholder="e.g. Warehouse reshuffle")
+                        
+                            submit_bulk = st.form_submit_button("💾 Save All Changes", type="primary", use_container_width=True)
+                    
+                        if submit_bulk:
+                            if move_all_to.strip():
+                                edited_grid['Location'] = move_all_to.strip()
+                        
+                            changes = diff_inventory_edits(grid_df, edited_grid, df['Item_ID'].astype(str))
+                            change_count = len(changes['updates']) + len(changes['renames']) + len(changes['deletes'])
+                        
+                            if changes['errors']:
+                                for err in changes['errors']:
+                                    st.error(f"❌ {err}")
+                            elif change_count == 0:
+                                st.info("No changes made.")
+                            elif not bulk_reason.strip():
+                                st.error("⚠️ Please provide a reason for the changes.")
+                            else:
+                                try:
+                                    touched = apply_inventory_edits(changes, st.session_state.get('username', 'Admin'), bulk_reason.strip())
+                                    st.success(
+                                        f"✅ Saved {touched} change(s): {len(changes['updates'])} edited, "
+                                        f"{len(changes['renames'])} renamed, {len(changes['deletes'])} removed"
+                                    )
+                                    st.cache_data.clear()
+                                    st.session_state.force_refresh = True
+                                    st.rerun()
+                                except Exception as e:
+                                    st.error(f"❌ Failed to save changes: {e}")
+                else:
+                    # Show the data
+                    st.dataframe(
+                        admin_df[['Item_ID', 'Category', 'Material', 'Footage', 'Location', 'Status']],
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                
+                st.markdown("---")
+                
+                # Select item to edit
+                st.markdown("### ✏️ Edit Item")
+                
+                item_options = admin_df['Item_ID'].tolist()
+                selected_item = st.selectbox(
+                    "Select Item to Edit",
+                    item_options,
+                    key="admin_select_item"
+                )
+                
+                if selected_item:
+                    # Get current item data
+                    item_data = admin_df[admin_df['Item_ID'] == selected_item].iloc[0]
+                    
+                    st.markdown(f"""
+                        <div style="background: #f0f9ff; padding: 15px; border-radius: 8px; margin: 10px 0; border-left: 4px solid #3b82f6;">
+                            <strong>📦 Current Item Details:</strong><br><br>
+                            <strong>Item ID:</strong> {selected_item}<br>
+                            <strong>Material:</strong> {item_data['Material']}<br>
+                            <strong>Category:</strong> {item_data['Category']}<br>
+                            <strong>Current Footage:</strong> {item_data['Footage']}<br>
+                            <strong>Current Location:</strong> {item_data['Location']}<br>
+                            <strong>Status:</strong> {item_data.get('Status', 'N/A')}
+                        </div>
+                    """, unsafe_allow_html=True)
+                    
+                    # Edit options in tabs
+                    edit_tab1, edit_tab2, edit_tab3, edit_tab4 = st.tabs(["🏷️ Edit Item ID", "📏 Edit Footage", "📍 Edit Location", "🗑️ Remove Item"])
+                    
+                    # ── Edit Item ID Tab ────────────────────────────────────────────
+                    with edit_tab1:
+                        st.markdown("#### 🏷️ Change Item ID")
+                        
+                        st.warning("⚠️ Changing Item IDs affects tracking and audit history. Use with caution!")
+                        
+                        with st.form("edit_item_id_form", clear_on_submit=True):
+                            
+                            # Show current ID format info
+                            if item_data['Category'] == 'Coils':
+                                st.info("💡 **Coil ID Format:** `Coil-[Metal]-[Gauge]-[Texture]-[Footage]-[Number]`\n\nExample: `Coil-AL-016-STP-3000-01`")
+                            elif item_data['Category'] == 'Rolls':
+                                st.info("💡 **Roll ID Format:** `Roll-[Metal]-[Gauge]-[Texture]-[Footage]-[Number]`\n\nExample: `Roll-AL-020-SMP-100-01`")
+                            
+                            new_item_id = st.text_input(
+                                "New Item ID",
+                                value=selected_item,
+                                placeholder="Enter new Item ID",
+                                key="new_item_id_input"
+                            )
+                            
+                            # Check if new ID already exists
+                            if new_item_id != selected_item:
+                                existing_ids = df['Item_ID'].tolist()
+                                if new_item_id in existing_ids:
+                                    st.error(f"❌ Item ID '{new_item_id}' already exists! Choose a different ID.")
+                                    id_is_valid = False
+                                else:
+                                    st.success(f"✅ Item ID '{new_item_id}' is available.")
+                                    id_is_valid = True
+                            else:
+                                st.info("No change to Item ID")
+                                id_is_valid = True
+                            
+                            id_change_reason = st.text_input(
+                                "Reason for ID Change *",
+                                placeholder="e.g. Correcting typo, updating format, label reprint",
+                                key="id_change_reason"
+                            )
+                            
+                            submit_item_id = st.form_submit_button("🏷️ Update Item ID", type="primary", use_container_width=True)
+                        
+                        if submit_item_id:
+                            if new_item_id == selected_item:
+                                st.info("No changes made - Item ID is the same.")
+                            elif not id_change_reason.strip():
+                                st.error("⚠️ Please provide a reason for the ID change.")
+                            elif not id_is_valid:
+                                st.error("⚠️ Cannot use an Item ID that already exists.")
+                            elif not new_item_id.strip():
+                                st.error("⚠️ Item ID cannot be empty.")
+                            else:
+                                try:
+                                    # Update Item ID in inventory table
+                                    supabase.table("inventory").update({
+                                        "Item_ID": new_item_id.strip()
+                                    }).eq("Item_ID", selected_item).execute()
+                                    
+                                    # Log the change
+                                    log_entry = {
+                                        "Item_ID": new_item_id.strip(),
+                                        "Action": "Admin Edit - Item ID Changed",
+                                        "User": st.session_state.get('username', 'Admin'),
+                                        "Details": f"Item ID changed from '{selected_item}' to '{new_item_id.strip()}'. Reason: {id_change_reason}"
+                                    }
+                                    audit_writer.log(log_entry)
+                                    
+                                    st.success(f"✅ Item ID updated: {selected_item} → {new_item_id.strip()}")
+                                    st.cache_data.clear()
+                                    time.sleep(1)
+                                    st.rerun()
+                                    
+                                except Exception as e:
+                                    st.error(f"❌ Failed to update Item ID: {e}")
+                    
+                    # ── Edit Footage/Quantity Tab ────────────────────────────────────────────
+                    with edit_tab2:
+                        st.markdown("#### 📏 Adjust Stock Quantity")
+                        
+                        # Determine what type of item this is
+                        item_category = item_data.get('Category', 'Other')
+                        current_footage = float(item_data['Footage'])
+                        
+                        # Different UI based on category
+                        if item_category == "Rolls":
+                            st.info("🗞️ **Roll Inventory** - Edit footage per roll and/or manage roll count")
+                            
+                            # Get all rolls of same material
+                            same_material_rolls = df[(df['Material'] == item_data['Material']) & (df['Category'] == 'Rolls')]
+                            current_roll_count = len(same_material_rolls)
+                            
+                            st.markdown(f"**Current Inventory:** {current_roll_count} roll(s) of this material")
+                            
+                            # Show all rolls of this material
+                            with st.expander(f"📋 View all {current_roll_count} roll(s) of {item_data['Material'][:40]}..."):
+                                st.dataframe(
+                                    same_material_rolls[['Item_ID', 'Footage', 'Location']].sort_values('Item_ID'),
+                                    use_container_width=True,
+                                    hide_index=True
+                                )
+                            
+                            st.markdown("---")
+                            
+                            # Tab for different roll operations
+                            roll_op1, roll_op2, roll_op3 = st.tabs(["✏️ Edit This Roll", "➕ Add Rolls", "➖ Remove Rolls"])
+                            
+                            # ── Edit single roll footage ──
+                            with roll_op1:
+                                with st.form("edit_single_roll_form", clear_on_submit=True):
+                                    st.markdown(f"**Editing:** {selected_item}")
+                                    
+                                    new_footage = st.number_input(
+                                        "Footage for this roll",
+                                        min_value=0.0,
+                                        value=current_footage,
+                                        step=10.0,
+                                        key="edit_roll_footage",
+                                        help="The length of this roll in feet"
+                                    )
+                                    
+                                    footage_diff = new_footage - current_footage
+                                    if footage_diff > 0:
+                                        st.success(f"📈 Adding {footage_diff:.1f} ft to this roll")
+                                    elif footage_diff < 0:
+                                        st.warning(f"📉 Removing {abs(footage_diff):.1f} ft from this roll")
+                                    
+                                    edit_roll_reason = st.text_input(
+                                        "Reason for change *",
+                                        placeholder="e.g. Physical measurement, partial use",
+                                        key="edit_roll_reason"
+                                    )
+                                    
+                                    submit_edit_roll = st.form_submit_button("💾 Update This Roll", type="primary", use_container_width=True)
+                                
+                                if submit_edit_roll:
+                                    if not edit_roll_reason.strip():
+                                        st.error("⚠️ Please provide a reason")
+                                    elif new_footage == current_footage:
+                                        st.info("No changes made")
+                                    else:
+                                        try:
+                                            supabase.table("inventory").update({
+                                                "Footage": new_footage
+                                            }).eq("Item_ID", selected_item).execute()
+                                            
+                                            log_entry = {
+                                                "Item_ID": selected_item,
+                                                "Action": "Admin Edit - Roll Footage",
+                                                "User": st.session_state.get('username', 'Admin'),
+                                                "Details": f"Changed footage from {current_footage:.1f} to {new_footage:.1f} ft. Reason: {edit_roll_reason}"
+                                            }
+                                            audit_writer.log(log_entry)
+                                            
+                                            st.success(f"✅ Updated {selected_item}: {current_footage:.1f} → {new_footage:.1f} ft")
+                                            st.cache_data.clear()
+                                            st.session_state.force_refresh = True
+                                            time.sleep(1)
+                                            st.rerun()
+                                        except Exception as e:
+                                            st.error(f"❌ Failed: {e}")
+                            
+                            # ── Add more rolls ──
+                            with roll_op2:
+                                with st.form("add_rolls_form", clear_on_submit=True):
+                                    st.markdown("**Add more rolls of the same material**")
+                                    
+                                    add_roll_count = st.number_input(
+                                        "Number of rolls to add",
+                                        min_value=1,
+                                        value=1,
+                                        step=1,
+                                        key="add_roll_count"
+                                    )
+                                    
+                                    add_roll_footage = st.number_input(
+                                        "Footage per roll",
+                                        min_value=0.1,
+                                        value=current_footage,
+                                        step=10.0,
+                                        key="add_roll_footage"
+                                    )
+                                    
+                                    add_roll_location = st.text_input(
+                                        "Location",
+                                        value=item_data.get('Location', ''),
+                                        key="add_roll_location"
+                                    )
+                                    
+                                    st.info(f"📦 Will add {add_roll_count} roll(s) × {add_roll_footage} ft = {add_roll_count * add_roll_footage:,.1f} ft total")
+                                    
+                                    add_roll_reason = st.text_input(
+                                        "Reason *",
+                                        placeholder="e.g. New shipment received, inventory correction",
+                                        key="add_roll_reason"
+                                    )
+                                    
+                                    submit_add_rolls = st.form_submit_button("➕ Add Rolls", type="primary", use_container_width=True)
+                                
+                                if submit_add_rolls:
+                                    if not add_roll_reason.strip():
+                                        st.error("⚠️ Please provide a reason")
+                                    else:
+                                        try:
+                                            # Generate new IDs
+                                            base_id = selected_item.rsplit('-', 1)[0] if '-' in selected_item else selected_item
+                                            
+                                            # Find highest existing number
+                                            existing_ids = df[df['Item_ID'].str.startswith(base_id)]['Item_ID'].tolist()
+                                            max_num = 0
+                                            for eid in existing_ids:
+                                                try:
+                                                    num = int(eid.split('-')[-1])
+                                                    max_num = max(max_num, num)
+                                                except:
+                                                    pass
+                                            
+                                            new_rolls_data = []
+                                            new_ids = []
+                                            for i in range(add_roll_count):
+                                                new_id = f"{base_id}-{str(max_num + i + 1).zfill(2)}"
+                                                new_ids.append(new_id)
+                                                new_rolls_data.append({
+                                                    "Item_ID": new_id,
+                                                    "Material": item_data['Material'],
+                                                    "Footage": add_roll_footage,
+                                                    "Location": add_roll_location,
+                                                    "Status": "Active",
+                                                    "Category": "Rolls",
+                                                    "Purchase_Order_Num": item_data.get('Purchase_Order_Num', '')
+                                                })
+                                            
+                                            supabase.table("inventory").insert(new_rolls_data).execute()
+                                            
+                                            log_entry = {
+                                                "Item_ID": base_id,
+                                                "Action": "Admin - Added Rolls",
+                                                "User": st.session_state.get('username', 'Admin'),
+                                                "Details": f"Added {add_roll_count} roll(s) of {item_data['Material'][:30]}... at {add_roll_footage} ft each. IDs: {', '.join(new_ids[:3])}{'...' if len(new_ids) > 3 else ''}. Reason: {add_roll_reason}"
+                                            }
+                                            audit_writer.log(log_entry)
+                                            
+                                            st.success(f"✅ Added {add_roll_count} roll(s)")
+                                            st.cache_data.clear()
+                                            st.session_state.force_refresh = True
+                                            time.sleep(1)
+                                            st.rerun()
+                                        except Exception as e:
+                                            st.error(f"❌ Failed: {e}")
+                            
+                            # ── Remove rolls ──
+                            with roll_op3:
+                                st.markdown("**Remove rolls of this material**")
+                                st.warning("⚠️ This will permanently delete selected rolls from inventory")
+                                
+                                # Let user select which rolls to remove
+                                roll_options = same_material_rolls['Item_ID'].tolist()
+                                
+                                rolls_to_remove = st.multiselect(
+                                    "Select roll(s) to remove",
+                                    options=roll_options,
+                                    key="rolls_to_remove",
+                                    help="Select one or more rolls to delete"
+                                )
+                                
+                                if rolls_to_remove:
+                                    # Show what will be removed
+                                    remove_df = same_material_rolls[same_material_rolls['Item_ID'].isin(rolls_to_remove)]
+                                    total_footage_removing = remove_df['Footage'].sum()
+                                    
+                                    st.markdown(f"**Removing {len(rolls_to_remove)} roll(s):**")
+                                    st.dataframe(
+                                        remove_df[['Item_ID', 'Footage', 'Location']],
+                                        use_container_width=True,
+                                        hide_index=True
+                                    )
+                                    st.error(f"🗑️ Total footage to remove: {total_footage_removing:,.1f} ft")
+                                    
+                                    with st.form("remove_rolls_form"):
+                                        remove_reason = st.text_input(
+                                            "Reason for removal *",
+                                            placeholder="e.g. Damaged, sold externally, inventory correction",
+                                            key="remove_rolls_reason"
+                                        )
+                                        
+                                        confirm_remove = st.checkbox(
+                                            f"I confirm I want to permanently delete {len(rolls_to_remove)} roll(s)",
+                                            key="confirm_remove_rolls"
+                                        )
+                                        
+                                        submit_remove_rolls = st.form_submit_button("🗑️ Remove Selected Rolls", type="primary", use_container_width=True)
+                                    
+                                    if submit_remove_rolls:
+                                        if not remove_reason.strip():
+                                            st.error("⚠️ Please provide a reason")
+                                        elif not confirm_remove:
+                                            st.error("⚠️ Please confirm the removal")
+                                        else:
+                                            try:
+                                                # Log before deleting
+                                                log_entry = {
+                                                    "Item_ID": item_data['Material'][:30],
+                                                    "Action": "Admin - Removed Rolls",
+                                                    "User": st.session_state.get('username', 'Admin'),
+                                                    "Details": f"Removed {len(rolls_to_remove)} roll(s): {', '.join(rolls_to_remove[:5])}{'...' if len(rolls_to_remove) > 5 else ''} ({total_footage_removing:,.1f} ft total). Reason: {remove_reason}"
+                                                }
+                                                audit_writer.log(log_entry)
+                                                
+                                                # Delete the rolls
+                                                supabase.table("inventory").delete().in_("Item_ID", list(rolls_to_remove)).execute()
+                                                
+                                                st.success(f"✅ Removed {len(rolls_to_remove)} roll(s)")
+                                                st.cache_data.clear()
+                                                st.session_state.force_refresh = True
+                                                time.sleep(1)
+                                                st.rerun()
+                                            except Exception as e:
+                                                st.error(f"❌ Failed: {e}")
+                                else:
+                                    st.info("👆 Select rolls above to remove them")
+                        
+                        elif item_category == "Coils":
+                            st.info("🔄 **Coil Inventory** - Edit footage for this coil")
+                            
+                            with st.form("edit_coil_form", clear_on_submit=True):
+                                col1, col2 = st.columns(2)
+                                
+                                with col1:
+                                    new_footage = st.number_input(
+                                        "New Footage Value",
+                                        min_value=0.0,
+                                        value=current_footage,
+                                        step=50.0,
+                                        key="new_footage_input",
+                                        help="Total footage remaining on this coil"
+                                    )
+                                
+                                with col2:
+                                    footage_diff = new_footage - current_footage
+                                    if footage_diff > 0:
+                                        st.success(f"📈 Adding {footage_diff:.1f} ft")
+                                    elif footage_diff < 0:
+                                        st.warning(f"📉 Removing {abs(footage_diff):.1f} ft")
+                                    else:
+                                        st.info("No change")
+                                
+                                footage_reason = st.text_input(
+                                    "Reason for Change *",
+                                    placeholder="e.g. Physical count adjustment, damaged material",
+                                    key="footage_reason"
+                                )
+                                
+                                submit_footage = st.form_submit_button("💾 Update Footage", type="primary", use_container_width=True)
+                            
+                            if submit_footage:
+                                if not footage_reason.strip():
+                                    st.error("⚠️ Please provide a reason for the change.")
+                                else:
+                                    try:
+                                        supabase.table("inventory").update({
+                                            "Footage": new_footage
+                                        }).eq("Item_ID", selected_item).execute()
+                                        
+                                        log_entry = {
+                                            "Item_ID": selected_item,
+                                            "Action": "Admin Edit - Footage",
+                                            "User": st.session_state.get('username', 'Admin'),
+                                            "Details": f"Changed footage from {current_footage:.1f} to {new_footage:.1f} ft. Reason: {footage_reason}"
+                                        }
+                                        audit_writer.log(log_entry)
+                                        
+                                        st.success(f"✅ Footage updated: {current_footage:.1f} → {new_footage:.1f} ft")
+                                        st.cache_data.clear()
+                                        st.session_state.force_refresh = True
+                                        time.sleep(1)
+                                        st.rerun()
+                                        
+                                    except Exception as e:
+                                        st.error(f"❌ Failed to update: {e}")
+                        
+                        elif item_category in ["Elbows", "Fab Straps", "Wing Seals"]:
+                            st.info(f"📦 **{item_category}** - Edit piece count")
+                            
+                            with st.form("edit_pieces_form", clear_on_submit=True):
+                                col1, col2 = st.columns(2)
+                                
+                                with col1:
+                                    new_qty = st.number_input(
+                                        "Quantity (pieces)",
+                                        min_value=0,
+                                        value=int(current_footage),
+                                        step=1,
+                                        key="new_qty_input",
+                                        help=f"Number of {item_category.lower()} in stock"
+                                    )
+                                
+                                with col2:
+                                    qty_diff = new_qty - int(current_footage)
+                                    if qty_diff > 0:
+                                        st.success(f"📈 Adding {qty_diff} pcs")
+                                    elif qty_diff < 0:
+                                        st.warning(f"📉 Removing {abs(qty_diff)} pcs")
+                                    else:
+                                        st.info("No change")
+                                
+                                qty_reason = st.text_input(
+                                    "Reason for Change *",
+                                    placeholder="e.g. Physical count, used in production",
+                                    key="qty_reason"
+                                )
+                                
+                                submit_qty = st.form_submit_button("💾 Update Quantity", type="primary", use_container_width=True)
+                            
+                            if submit_qty:
+                                if not qty_reason.strip():
+                                    st.error("⚠️ Please provide a reason for the change.")
+                                else:
+                                    try:
+                                        supabase.table("inventory").update({
+                                            "Footage": float(new_qty)
+                                        }).eq("Item_ID", selected_item).execute()
+                                        
+                                        log_entry = {
+                                            "Item_ID": selected_item,
+                                            "Action": "Admin Edit - Quantity",
+                                            "User": st.session_state.get('username', 'Admin'),
+                                            "Details": f"Changed quantity from {int(current_footage)} to {new_qty} pcs. Reason: {qty_reason}"
+                                        }
+                                        audit_writer.log(log_entry)
+                                        
+                                        st.success(f"✅ Quantity updated: {int(current_footage)} → {new_qty} pcs")
+                                        st.cache_data.clear()
+                                        st.session_state.force_refresh = True
+                                        time.sleep(1)
+                                        st.rerun()
+                                        
+                                    except Exception as e:
+                                        st.error(f"❌ Failed to update: {e}")
+                        
+                        else:
+                            # Generic fallback for other categories
+                            st.info(f"📦 **{item_category}** - Edit quantity/footage")
+                            
+                            with st.form("edit_generic_form", clear_on_submit=True):
+                                col1, col2 = st.columns(2)
+                                
+                                with col1:
+                                    new_value = st.number_input(
+                                        "Quantity/Footage",
+                                        min_value=0.0,
+                                        value=current_footage,
+                                        step=1.0,
+                                        key="new_value_input"
+                                    )
+                                
+                                with col2:
+                                    diff = new_value - current_footage
+                                    if diff > 0:
+                                        st.success(f"📈 Adding {diff:.1f}")
+                                    elif diff < 0:
+                                        st.warning(f"📉 Removing {abs(diff):.1f}")
+                                    else:
+                                        st.info("No change")
+                                
+                                generic_reason = st.text_input(
+                                    "Reason for Change *",
+                                    placeholder="e.g. Inventory adjustment",
+                                    key="generic_reason"
+                                )
+                                
+                                submit_generic = st.form_submit_button("💾 Update", type="primary", use_container_width=True)
+                            
+                            if submit_generic:
+                                if not generic_reason.strip():
+                                    st.error("⚠️ Please provide a reason for the change.")
+                                else:
+                                    try:
+                                        supabase.table("inventory").update({
+                                            "Footage": new_value
+                                        }).eq("Item_ID", selected_item).execute()
+                                        
+                                        log_entry = {
+                                            "Item_ID": selected_item,
+                                            "Action": "Admin Edit - Quantity",
+                                            "User": st.session_state.get('username', 'Admin'),
+                                            "Details": f"Changed from {current_footage:.1f} to {new_value:.1f}. Reason: {generic_reason}"
+                                        }
+                                        audit_writer.log(log_entry)
+                                        
+                                        st.success(f"✅ Updated: {current_footage:.1f} → {new_value:.1f}")
+                                        st.cache_data.clear()
+                                        st.session_state.force_refresh = True
+                                        time.sleep(1)
+                                        st.rerun()
+                                        
+                                    except Exception as e:
+                                        st.error(f"❌ Failed to update: {e}")
+                                        
+                    # ── Edit Location Tab ───────────────────────────────────────────
+                    with edit_tab3:
+                        st.markdown("#### 📍 Move Item to New Location")
+                        
+                        with st.form("edit_location_form", clear_on_submit=True):
+                            
+                            loc_type = st.radio(
+                                "🏢 Storage Type",
+                                ["Rack System", "Floor / Open Space"],
+                                horizontal=True,
+                                key="edit_loc_type"
+                            )
+                            
+                            if loc_type == "Rack System":
+                                col1, col2, col3 = st.columns(3)
+                                bay = col1.number_input("🅱️ Bay", min_value=1, value=1, key="edit_rack_bay")
+                                sec = col2.selectbox("🔤 Section", list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), key="edit_rack_sec")
+                                lvl = col3.number_input("⬆️ Level", min_value=1, value=1, key="edit_rack_lvl")
+                                new_location = f"{bay}{sec}{lvl}"
+                            else:
+                                col1, col2, col3 = st.columns(3)
+                                bay = col1.number_input("🅱️ Bay", min_value=1, value=1, key="edit_floor_bay")
+                                floor_options = [f"Floor {letter}" for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
+                                floor_selection = col2.selectbox("🔤 Floor Section", floor_options, key="edit_floor_sec")
+                                lvl = col3.number_input("⬆️ Level", min_value=1, value=1, key="edit_floor_lvl")
+                                new_location = f"{bay}-{floor_selection}-{lvl}"
+                            
+                            st.info(f"📍 **New Location:** {new_location} (Currently: {item_data['Location']})")
+                            
+                            location_reason = st.text_input(
+                                "Reason for Move *",
+                                placeholder="e.g. Reorganizing warehouse, better accessibility, consolidation",
+                                key="location_reason"
+                            )
+                            
+                            submit_location = st.form_submit_button("📍 Update Location", type="primary", use_container_width=True)
+                        
+                        if submit_location:
+                            if not location_reason.strip():
+                                st.error("⚠️ Please provide a reason for the move.")
+                            else:
+                                try:
+                                    # Update location in database
+                                    supabase.table("inventory").update({
+                                        "Location": new_location
+                                    }).eq("Item_ID", selected_item).execute()
+                                    
+                                    # Log the change
+                                    log_entry = {
+                                        "Item_ID": selected_item,
+                                        "Action": "Admin Edit - Location",
+                                        "User": st.session_state.get('username', 'Admin'),
+                                        "Details": f"Moved from {item_data['Location']} to {new_location}. Reason: {location_reason}"
+                                    }
+                                    audit_writer.log(log_entry)
+                                    
+                                    st.success(f"✅ Location updated: {item_data['Location']} → {new_location}")
+                                    st.cache_data.clear()
+                                    time.sleep(1)
+                                    st.rerun()
+                                    
+                                except Exception as e:
+                                    st.error(f"❌ Failed to update: {e}")
+                    
+                    # ── Remove Item Tab ─────────────────────────────────────────────
+                    with edit_tab4:
+                        st.markdown("#### 🗑️ Permanently Remove Item")
+                        
+                        st.error("⚠️ **Warning:** This action cannot be undone!")
+                        
+                        with st.form("remove_item_form"):
+                            st.markdown(f"""
+                                <div style="background: #fef2f2; padding: 15px; border-radius: 8px; border-left: 4px solid #dc2626;">
+                                    <strong>🚨 You are about to permanently delete:</strong><br><br>
+                                    <table style="width: 100%;">
+                                        <tr><td><strong>Item ID:</strong></td><td>{selected_item}</td></tr>
+                                        <tr><td><strong>Material:</strong></td><td>{item_data['Material']}</td></tr>
+                                        <tr><td><strong>Footage:</strong></td><td>{item_data['Footage']}</td></tr>
+                                        <tr><td><strong>Location:</strong></td><td>{item_data['Location']}</td></tr>
+                                    </table>
+                                </div>
+                            """, unsafe_allow_html=True)
+                            
+                            removal_reason = st.text_input(
+                                "Reason for Removal *",
+                                placeholder="e.g. Damaged beyond use, incorrect entry, sold externally",
+                                key="removal_reason"
+                            )
+                            
+                            confirm_text = st.text_input(
+                                f"Type '{selected_item}' to confirm deletion",
+                                placeholder="Type the Item ID exactly to confirm",
+                                key="confirm_delete_text"
+                            )
+                            
+                            submit_remove = st.form_submit_button("🗑️ Permanently Remove Item", type="primary", use_container_width=True)
+                        
+                        if submit_remove:
+                            if not removal_reason.strip():
+                                st.error("⚠️ Please provide a reason for removal.")
+                            elif confirm_text != selected_item:
+                                st.error(f"⚠️ Please type '{selected_item}' exactly to confirm deletion.")
+                            else:
+                                try:
+                                    # Log BEFORE deleting
+                                    log_entry = {
+                                        "Item_ID": selected_item,
+                                        "Action": "Admin - Item Removed",
+                                        "User": st.session_state.get('username', 'Admin'),
+                                        "Details": f"Permanently removed {selected_item} ({item_data['Material']}, {item_data['Footage']} ft at {item_data['Location']}). Reason: {removal_reason}"
+                                    }
+                                    audit_writer.log(log_entry)
+                                    
+                                    # Delete from database
+                                    supabase.table("inventory").delete().eq("Item_ID", selected_item).execute()
+                                    
+                                    st.success(f"✅ Item {selected_item} has been permanently removed.")
+                                    st.cache_data.clear()
+                                    time.sleep(1)
+                                    st.rerun()
+                                    
+                                except Exception as e:
+                                    st.error(f"❌ Failed to remove: {e}")
+            
+            else:
+                st.info("🔍 No items match your search criteria.")
+        
+        else:
+            st.info("📦 No inventory to manage yet. Add items in the Receive tab first.")
+        
+        # ── Audit Log Archive ───────────────────────────────────────────────────
+        st.markdown("---")
+        with st.expander("🗄️ Audit Log Archive", expanded=False):
+            st.caption(f"Audit entries older than {AUDIT_HOT_DAYS} days move to monthly Parquet files; the Audit Trail and forecasts still read them when needed.")
+            try:
+                archive_manifest, archive_boundary = load_audit_archive_manifest()
+                if archive_boundary is None:
+                    st.info("Nothing archived yet.")
+                else:
+                    st.write(f"Archived through **{archive_boundary:%Y-%m-%d}** · {int(archive_manifest['row_count'].sum()):,} entries in {len(archive_manifest)} partitions")
+                    st.dataframe(
+                        archive_manifest[['month', 'row_count', 'min_timestamp', 'max_timestamp', 'archived_at']],
+                        use_container_width=True, hide_index=True
+                    )
+                if st.button("Archive Old Entries", key="archive_audit_btn"):
+                    with st.spinner("Archiving audit log..."):
+                        sync_movement_rollup(df)
+                        moved = archive_audit_log()
+                    st.success(f"✅ Archived {moved:,} entries")
+                    st.session_state.force_refresh = True
+                    st.rerun()
+            except Exception as e:
+                st.error(f"❌ Archive unavailable: {e}")
+        
+        # ── Email Outbox ────────────────────────────────────────────────────────
+        with st.expander("📬 Email Outbox", expanded=False):
+            st.caption("Production, receipt and low-stock emails are queued here and delivered in the background; failed ones can be re-sent as stored.")
+            try:
+                outbox_df = load_email_outbox()
+                if outbox_df.empty:
+                    st.info("No emails queued yet.")
+                else:
+                    status_counts = outbox_df['status'].value_counts()
+                    oc1, oc2, oc3 = st.columns(3)
+                    oc1.metric("Sent", int(status_counts.get('sent', 0)))
+                    oc2.metric("Pending", int(status_counts.get('queued', 0) + status_counts.get('sending', 0)))
+                    oc3.metric("Failed", int(status_counts.get('failed', 0)))
+                    st.dataframe(
+                        outbox_df[['id', 'kind', 'subject', 'recipient', 'status', 'attempts', 'created_at', 'sent_at', 'last_error']],
+                        use_container_width=True, hide_index=True
+                    )
+                    failed_ids = outbox_df.loc[outbox_df['status'] == 'failed', 'id'].tolist()
+                    resend_ids = st.multiselect("Re-send failed emails", failed_ids, default=failed_ids, key="outbox_resend_ids")
+                    if st.button("📤 Re-send Selected", key="outbox_resend_btn", disabled=not resend_ids):
+                        email_outbox.resend(resend_ids)
+                        st.success(f"✅ Queued {len(resend_ids)} email(s) again")
+                        st.rerun()
+            except Exception as e:
+                st.error(f"❌ Outbox unavailable: {e}")
+        
+        # ── Profiler Capture ────────────────────────────────────────────────────
+        with st.expander("🔬 Profiler Capture", expanded=False):
+            st.caption("Profiles the next reruns of the app (anyone's, or one operator's) with cProfile and a stack sampler. Download the .prof for snakeviz/pstats or the .folded file for a flame graph.")
+            if rerun_profiler.remaining > 0:
+                target = rerun_profiler.user or "any user"
+                st.info(f"Armed: next {rerun_profiler.remaining} rerun(s) for {target} (armed by {rerun_profiler.armed_by})")
+            pc1, pc2 = st.columns(2)
+            with pc1:
+                profile_reruns = st.number_input("Reruns to capture", min_value=1, max_value=20, value=3, key="profile_reruns")
+            with pc2:
+                profile_user = st.text_input("Only for user (blank = anyone)", key="profile_user")
+            pb1, pb2 = st.columns(2)
+            with pb1:
+                if st.button("⏺️ Arm Profiler", key="profile_arm_btn", use_container_width=True):
+                    rerun_profiler.arm(profile_reruns, user=profile_user, armed_by=st.session_state.get('username'))
+                    st.success(f"✅ Profiling the next {profile_reruns} rerun(s)")
+            with pb2:
+                if st.button("⏹️ Disarm", key="profile_disarm_btn", use_container_width=True, disabled=rerun_profiler.remaining <= 0):
+                    rerun_profiler.disarm()
+                    st.rerun()
+            
+            try:
+                captures = rerun_profiler.captures()
+                if not captures:
+                    st.info("No captures yet.")
+                else:
+                    st.dataframe(
+                        pd.DataFrame([
+                            {"Captured": m['started_at'][:19].replace("T", " "), "User": m['user'], "Tab": m['tab'],
+                             "Seconds": m['seconds'], "Inventory rows": m.get('inventory_rows'),
+                             "Audit rows": m.get('audit_rows'), "Samples": m['samples'],
+                             "Interrupted": m['interrupted']}
+                            for m in captures
+                        ]),
+                        use_container_width=True, hide_index=True
+                    )
+                    names = [m['name'] for m in captures]
+                    chosen = st.selectbox("Capture", names, key="profile_capture_pick")
+                    dc1, dc2, dc3 = st.columns(3)
+                    with dc1:
+                        st.download_button(
+                            "📥 .prof", rerun_profiler.read(chosen, ".prof"), file_name=f"{chosen}.prof",
+                            mime="application/octet-stream", use_container_width=True, key="profile_dl_prof"
+                        )
+                    with dc2:
+                        st.download_button(
+                            "📥 .folded", rerun_profiler.read(chosen, ".folded"), file_name=f"{chosen}.folded",
+                            mime="text/plain", use_container_width=True, key="profile_dl_folded"
+                        )
+                    with dc3:
+                        st.download_button(
+                            "📥 tags .json", rerun_profiler.read(chosen, ".json"), file_name=f"{chosen}.json",
+                            mime="application/json", use_container_width=True, key="profile_dl_json"
+                        )
+                    if st.button("🗑️ Delete All Captures", key="profile_clear_btn"):
+                        rerun_profiler.clear()
+                        st.rerun()
+            except Exception as e:
+                st.error(f"❌ Profiler unavailable: {e}")
@@ -0,0 +1,106 @@
+"""Audit Trail tab."""
+
+import re
+
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse.data.audit_log import AUDIT_PAGE_SIZE, load_audit_archive_manifest, load_audit_facets, query_audit_log, search_audit_log
+
+
+def render(df, df_audit):
+    st.subheader("📜 System Audit Log")
+    st.caption("Complete history of material movements, production runs, and admin submissions.")
+    
+    try:
+        facets = load_audit_facets()
+        
+        # FILTER & SEARCH BAR
+        search_col, filter_col, user_col, date_col = st.columns([2, 1, 1, 1])
+        with search_col:
+            query = st.text_input("🔍 Search Logs", placeholder="Search Order #, Operator, or Action...", key="audit_search")
+        with filter_col:
+            # Allows you to quickly see only Production submissions
+            selected_action = st.selectbox("Filter by Action", ["All"] + facets.get("action", []), key="audit_filter")
+        with user_col:
+            selected_user = st.selectbox("Filter by User", ["All"] + facets.get("user", []), key="audit_user_filter")
+        with date_col:
+            date_range = st.date_input("Date range", value=(), key="audit_date_range")
+        
+        date_from = date_range[0] if len(date_range) > 0 else None
+        date_to = date_range[1] if len(date_range) > 1 else date_from
+        
+        # Keyset pagination: keep the cursor of every page visited; new filters start over
+        filter_key = (query.strip(), selected_action, selected_user, date_from, date_to)
+        if st.session_state.get('audit_filter_key') != filter_key:
+            st.session_state.audit_filter_key = filter_key
+            st.session_state.audit_cursors = [None]
+        cursors = st.session_state.audit_cursors
+        
+        audit_df, next_cursor = search_audit_log(
+            query=query.strip(),
+            action=None if selected_action == "All" else selected_action,
+            user=None if selected_user == "All" else selected_user,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursors[-1],
+        )
+        
+        if audit_df.empty and len(cursors) == 1:
+            if any([query.strip(), selected_action != "All", selected_user != "All", date_from]):
+                st.info("No audit entries match these filters.")
+            else:
+                st.info("No audit logs recorded yet. Logs will appear here as materials are picked or produced.")
+        else:
+            audit_df['Timestamp'] = pd.to_datetime(audit_df['Timestamp'], errors='coerce', utc=True, format="ISO8601")
+            
+            # Display the log
+            st.dataframe(
+                audit_df[['Timestamp', 'Action', 'User', 'Details']], 
+                use_container_width=True, 
+                hide_index=True
+            )
+            
+            nav_prev, nav_info, nav_next = st.columns([1, 2, 1])
+            with nav_prev:
+                if st.button("← Newer", disabled=len(cursors) == 1, key="audit_prev_page"):
+                    cursors.pop()
+                    st.rerun()
+            with nav_info:
+                first_row = (len(cursors) - 1) * AUDIT_PAGE_SIZE + 1
+                st.caption(f"Showing entries {first_row:,}–{first_row + len(audit_df) - 1:,}")
+            with nav_next:
+                if st.button("Older →", disabled=next_cursor is None, key="audit_next_page"):
+                    cursors.append(next_cursor)
+                    st.rerun()
+
+        # Older entries live in the cold archive; search them on request
+        _, archive_boundary = load_audit_archive_manifest()
+        if archive_boundary is not None and (date_from is None or pd.Timestamp(date_from).tz_localize("UTC") < archive_boundary):
+            with st.expander(f"📦 Archived entries (before {archive_boundary:%Y-%m-%d})", expanded=False):
+                if st.button("Search Archive", key="audit_archive_search"):
+                    archive_to = (archive_boundary - pd.Timedelta(days=1)).date()
+                    if date_to is not None and date_to < archive_to:
+                        archive_to = date_to
+                    with st.spinner("Reading archived months..."):
+                        cold_df = query_audit_log(date_from, archive_to)
+                    if selected_action != "All":
+                        cold_df = cold_df[cold_df['Action'] == selected_action]
+                    if selected_user != "All":
+                        cold_df = cold_df[cold_df['User'] == selected_user]
+                    if query.strip():
+                        haystack = cold_df[['Item_ID', 'Action', 'User', 'Details']].fillna('').astype(str).agg(' '.join, axis=1).str.lower()
+                        keep = pd.Series(True, index=cold_df.index)
+                        for token in re.findall(r"\w+", query.lower()):
+                            keep &= haystack.str.contains(token, regex=False)
+                        cold_df = cold_df[keep]
+                    
+                    if cold_df.empty:
+                        st.info("No archived entries match these filters.")
+                    else:
+                        cold_df = cold_df.iloc[::-1]
+                        st.caption(f"{len(cold_df):,} archived entries" + (" (newest 1,000 shown)" if len(cold_df) > 1000 else ""))
+                        st.dataframe(cold_df[['Timestamp', 'Action', 'User', 'Details']].head(1000), use_container_width=True, hide_index=True)
+
+    except Exception as e:
+        st.error(f"Audit Log Display Error: {e}")
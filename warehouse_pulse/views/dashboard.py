@@ -0,0 +1,467 @@
+"""Dashboard tab."""
+
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse.data.movements import keep_movement_rollup_current
+from warehouse_pulse.domain.forecasting import forecast_reorder_points
+from warehouse_pulse.domain.materials import (
+    extract_angle, extract_banding_type, extract_gauge, extract_insulation_form, extract_metal, extract_pipe_size,
+    extract_size_number, extract_texture, extract_thickness, extract_wing_seal_size, extract_wing_seal_type,
+    extract_wire_gauge, filter_view,
+)
+from warehouse_pulse.domain.pulse_grid import pulse_card, summarize_materials
+
+def render(df, df_audit):
+    # Refresh controls
+    col_refresh, col_auto = st.columns([1, 2])
+    with col_refresh:
+        if st.button("🔄 Refresh Dashboard", use_container_width=False):
+            st.cache_data.clear()
+            st.session_state.force_refresh = True
+            st.toast("Dashboard refreshed from cloud!", icon="🛰️")
+            st.rerun()
+    
+    with col_auto:
+        auto_refresh = st.checkbox("Auto-refresh every 30 seconds", value=False, key="auto_refresh_dash")
+        if auto_refresh:
+            time.sleep(30)
+            st.rerun()
+
+    st.caption(f"Data last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    if not df.empty:
+        # Available categories (sorted)
+        available_categories = sorted(df['Category'].unique().tolist())
+        view_options = ["All Materials"] + available_categories
+
+        # Sidebar filter
+        with st.sidebar:
+            st.subheader("Dashboard Filters")
+            
+            # Category filter
+            selected_view = st.selectbox(
+                "Category",
+                view_options,
+                index=0,
+                placeholder="Select category...",
+                help="Choose what to show on the dashboard",
+                key="dashboard_category_filter"
+            )
+            
+            # Initialize filter variables
+            selected_metal = None
+            selected_gauge = None
+            selected_texture = None
+            selected_angle = None
+            selected_size = None
+            selected_pipe_size = None
+            selected_thickness = None
+            selected_seal_type = None
+            selected_seal_size = None
+            selected_banding_type = None
+            selected_wire_gauge = None
+            selected_insulation_form = None
+            
+            # ══════════════════════════════════════════════════════════════════════
+            # COILS & ROLLS FILTERS
+            # ══════════════════════════════════════════════════════════════════════
+            if selected_view in ["Coils", "Rolls"]:
+                st.markdown("---")
+                st.markdown(f"**🔍 {selected_view} Filters**")
+                
+                category_df = df[df['Category'] == selected_view].copy()
+                
+                category_df['Metal_Type'] = category_df['Material'].apply(extract_metal)
+                category_df['Gauge'] = category_df['Material'].apply(extract_gauge)
+                category_df['Texture'] = category_df['Material'].apply(extract_texture)
+                
+                # Metal filter
+                metal_options = ["All"] + sorted([x for x in category_df['Metal_Type'].unique().tolist() if x != 'Other']) + (['Other'] if 'Other' in category_df['Metal_Type'].values else [])
+                selected_metal = st.selectbox("🔩 Metal Type", metal_options, key="dashboard_metal_filter")
+                
+                # Gauge filter
+                gauge_options = ["All"] + sorted([x for x in category_df['Gauge'].unique().tolist() if x != 'Unknown']) + (['Unknown'] if 'Unknown' in category_df['Gauge'].values else [])
+                selected_gauge = st.selectbox("📏 Gauge", gauge_options, key="dashboard_gauge_filter")
+                
+                # Texture filter
+                texture_options = ["All"] + sorted([x for x in category_df['Texture'].unique().tolist() if x != 'Other']) + (['Other'] if 'Other' in category_df['Texture'].values else [])
+                selected_texture = st.selectbox("🎨 Texture", texture_options, key="dashboard_texture_filter")
+            
+            # ══════════════════════════════════════════════════════════════════════
+            # ELBOWS FILTERS
+            # ══════════════════════════════════════════════════════════════════════
+            elif selected_view == "Elbows":
+                st.markdown("---")
+                st.markdown("**🔍 Elbows Filters**")
+                
+                elbows_df = df[df['Category'] == 'Elbows'].copy()
+                elbows_df['Angle'] = elbows_df['Material'].apply(extract_angle)
+                elbows_df['Size'] = elbows_df['Material'].apply(extract_size_number)
+                elbows_df['Metal_Type'] = elbows_df['Material'].apply(extract_metal)
+                
+                # Angle filter
+                selected_angle = st.selectbox(
+                    "📐 Angle",
+                    ["All Angles", "90°", "45°", "Other"],
+                    key="dashboard_elbow_angle_filter"
+                )
+                
+                # Size filter
+                size_options = ["All Sizes"] + sorted([x for x in elbows_df['Size'].unique().tolist() if x != 'Unknown'], key=lambda x: int(x.replace('#', '')) if x.replace('#', '').isdigit() else 999)
+                if 'Unknown' in elbows_df['Size'].values:
+                    size_options.append('Unknown')
+                selected_size = st.selectbox("📏 Size", size_options, key="dashboard_elbow_size_filter")
+                
+                # Metal filter
+                metal_options = ["All"] + sorted([x for x in elbows_df['Metal_Type'].unique().tolist() if x != 'Other']) + (['Other'] if 'Other' in elbows_df['Metal_Type'].values else [])
+                selected_metal = st.selectbox("🔩 Metal Type", metal_options, key="dashboard_elbow_metal_filter")
+                
+                # Show counts
+                count_90 = len(elbows_df[elbows_df['Angle'] == '90°'])
+                count_45 = len(elbows_df[elbows_df['Angle'] == '45°'])
+                st.caption(f"📊 90°: {count_90} | 45°: {count_45}")
+            
+            # ══════════════════════════════════════════════════════════════════════
+            # FAB STRAPS FILTERS
+            # ══════════════════════════════════════════════════════════════════════
+            elif selected_view == "Fab Straps":
+                st.markdown("---")
+                st.markdown("**🔍 Fab Straps Filters**")
+                
+                straps_df = df[df['Category'] == 'Fab Straps'].copy()
+                straps_df['Gauge'] = straps_df['Material'].apply(extract_gauge)
+                straps_df['Size'] = straps_df['Material'].apply(extract_size_number)
+                straps_df['Metal_Type'] = straps_df['Material'].apply(extract_metal)
+                
+                # Gauge filter
+                gauge_options = ["All"] + sorted([x for x in straps_df['Gauge'].unique().tolist() if x != 'Unknown'])
+                if 'Unknown' in straps_df['Gauge'].values:
+                    gauge_options.append('Unknown')
+                selected_gauge = st.selectbox("📏 Gauge", gauge_options, key="dashboard_strap_gauge_filter")
+                
+                # Size filter
+                size_options = ["All Sizes"] + sorted([x for x in straps_df['Size'].unique().tolist() if x != 'Unknown'], key=lambda x: int(x.replace('#', '')) if x.replace('#', '').isdigit() else 999)
+                if 'Unknown' in straps_df['Size'].values:
+                    size_options.append('Unknown')
+                selected_size = st.selectbox("🔢 Size", size_options, key="dashboard_strap_size_filter")
+                
+                # Metal filter
+                metal_options = ["All"] + sorted([x for x in straps_df['Metal_Type'].unique().tolist() if x != 'Other']) + (['Other'] if 'Other' in straps_df['Metal_Type'].values else [])
+                selected_metal = st.selectbox("🔩 Metal Type", metal_options, key="dashboard_strap_metal_filter")
+                
+                # Show counts
+                count_015 = len(straps_df[straps_df['Gauge'] == '.015'])
+                count_020 = len(straps_df[straps_df['Gauge'] == '.020'])
+                st.caption(f"📊 .015: {count_015} | .020: {count_020}")
+            
+            # ══════════════════════════════════════════════════════════════════════
+            # MINERAL WOOL FILTERS
+            # ══════════════════════════════════════════════════════════════════════
+            elif selected_view == "Mineral Wool":
+                st.markdown("---")
+                st.markdown("**🔍 Mineral Wool Filters**")
+                
+                mw_df = df[df['Category'] == 'Mineral Wool'].copy()
+                mw_df['Pipe_Size'] = mw_df['Material'].apply(extract_pipe_size)
+                mw_df['Thickness'] = mw_df['Material'].apply(extract_thickness)
+                
+                # Pipe size filter
+                pipe_options = ["All"] + sorted([x for x in mw_df['Pipe_Size'].unique().tolist() if x != 'Unknown'])
+                if 'Unknown' in mw_df['Pipe_Size'].values:
+                    pipe_options.append('Unknown')
+                selected_pipe_size = st.selectbox("🔧 Pipe Size", pipe_options, key="dashboard_mw_pipe_filter")
+                
+                # Thickness filter
+                thick_options = ["All"] + sorted([x for x in mw_df['Thickness'].unique().tolist() if x != 'Unknown'])
+                if 'Unknown' in mw_df['Thickness'].values:
+                    thick_options.append('Unknown')
+                selected_thickness = st.selectbox("📏 Thickness", thick_options, key="dashboard_mw_thick_filter")
+            
+            # ══════════════════════════════════════════════════════════════════════
+            # WING SEALS FILTERS
+            # ══════════════════════════════════════════════════════════════════════
+            elif selected_view == "Wing Seals":
+                st.markdown("---")
+                st.markdown("**🔍 Wing Seals Filters**")
+                
+                ws_df = df[df['Category'] == 'Wing Seals'].copy()
+                ws_df['Seal_Type'] = ws_df['Material'].apply(extract_wing_seal_type)
+                ws_df['Seal_Size'] = ws_df['Material'].apply(extract_wing_seal_size)
+                ws_df['Gauge'] = ws_df['Material'].apply(extract_gauge)
+                
+                # Type filter
+                type_options = ["All"] + sorted([x for x in ws_df['Seal_Type'].unique().tolist() if x != 'Other']) + (['Other'] if 'Other' in ws_df['Seal_Type'].values else [])
+                selected_seal_type = st.selectbox("🔐 Type", type_options, key="dashboard_ws_type_filter")
+                
+                # Size filter
+                size_options = ["All"] + sorted([x for x in ws_df['Seal_Size'].unique().tolist() if x != 'Other']) + (['Other'] if 'Other' in ws_df['Seal_Size'].values else [])
+                selected_seal_size = st.selectbox("📏 Size", size_options, key="dashboard_ws_size_filter")
+                
+                # Gauge filter
+                gauge_options = ["All"] + sorted([x for x in ws_df['Gauge'].unique().tolist() if x != 'Unknown'])
+                if 'Unknown' in ws_df['Gauge'].values:
+                    gauge_options.append('Unknown')
+                selected_gauge = st.selectbox("📐 Gauge", gauge_options, key="dashboard_ws_gauge_filter")
+            
+            # ══════════════════════════════════════════════════════════════════════
+            # WIRE FILTERS
+            # ══════════════════════════════════════════════════════════════════════
+            elif selected_view == "Wire":
+                st.markdown("---")
+                st.markdown("**🔍 Wire Filters**")
+                
+                wire_df = df[df['Category'] == 'Wire'].copy()
+                wire_df['Wire_Gauge'] = wire_df['Material'].apply(extract_wire_gauge)
+                
+                # Gauge filter
+                gauge_options = ["All"] + sorted([x for x in wire_df['Wire_Gauge'].unique().tolist() if x != 'Unknown'])
+                if 'Unknown' in wire_df['Wire_Gauge'].values:
+                    gauge_options.append('Unknown')
+                selected_wire_gauge = st.selectbox("📏 Gauge", gauge_options, key="dashboard_wire_gauge_filter")
+            
+            # ══════════════════════════════════════════════════════════════════════
+            # BANDING FILTERS
+            # ══════════════════════════════════════════════════════════════════════
+            elif selected_view == "Banding":
+                st.markdown("---")
+                st.markdown("**🔍 Banding Filters**")
+                
+                band_df = df[df['Category'] == 'Banding'].copy()
+                band_df['Banding_Type'] = band_df['Material'].apply(extract_banding_type)
+                band_df['Gauge'] = band_df['Material'].apply(extract_gauge)
+                band_df['Size'] = band_df['Material'].apply(extract_wing_seal_size)  # Same pattern for 3/4, 1/2
+                
+                # Type filter
+                type_options = ["All"] + sorted([x for x in band_df['Banding_Type'].unique().tolist() if x != 'Other']) + (['Other'] if 'Other' in band_df['Banding_Type'].values else [])
+                selected_banding_type = st.selectbox("🌀 Type", type_options, key="dashboard_band_type_filter")
+                
+                # Gauge filter
+                gauge_options = ["All"] + sorted([x for x in band_df['Gauge'].unique().tolist() if x != 'Unknown'])
+                if 'Unknown' in band_df['Gauge'].values:
+                    gauge_options.append('Unknown')
+                selected_gauge = st.selectbox("📏 Gauge", gauge_options, key="dashboard_band_gauge_filter")
+                
+                # Size filter
+                size_options = ["All"] + sorted([x for x in band_df['Size'].unique().tolist() if x != 'Other']) + (['Other'] if 'Other' in band_df['Size'].values else [])
+                selected_size = st.selectbox("📐 Size", size_options, key="dashboard_band_size_filter")
+            
+            # ══════════════════════════════════════════════════════════════════════
+            # FIBERGLASS INSULATION FILTERS
+            # ══════════════════════════════════════════════════════════════════════
+            elif selected_view == "Fiberglass Insulation":
+                st.markdown("---")
+                st.markdown("**🔍 Fiberglass Filters**")
+                
+                fg_df = df[df['Category'] == 'Fiberglass Insulation'].copy()
+                fg_df['Form'] = fg_df['Material'].apply(extract_insulation_form)
+                fg_df['Thickness'] = fg_df['Material'].apply(extract_thickness)
+                
+                # Form filter
+                form_options = ["All"] + sorted([x for x in fg_df['Form'].unique().tolist() if x != 'Other']) + (['Other'] if 'Other' in fg_df['Form'].values else [])
+                selected_insulation_form = st.selectbox("📦 Form", form_options, key="dashboard_fg_form_filter")
+                
+                # Thickness filter
+                thick_options = ["All"] + sorted([x for x in fg_df['Thickness'].unique().tolist() if x != 'Unknown'])
+                if 'Unknown' in fg_df['Thickness'].values:
+                    thick_options.append('Unknown')
+                selected_thickness = st.selectbox("📏 Thickness", thick_options, key="dashboard_fg_thick_filter")
+
+        # ══════════════════════════════════════════════════════════════════════════════
+        # APPLY FILTERS TO DATA
+        # ══════════════════════════════════════════════════════════════════════════════
+        
+        display_df, filter_parts = filter_view(df, selected_view, {
+            "Metal_Type": selected_metal, "Gauge": selected_gauge, "Texture": selected_texture,
+            "Angle": selected_angle, "Size": selected_size, "Pipe_Size": selected_pipe_size,
+            "Thickness": selected_thickness, "Seal_Type": selected_seal_type, "Seal_Size": selected_seal_size,
+            "Banding_Type": selected_banding_type, "Wire_Gauge": selected_wire_gauge, "Form": selected_insulation_form,
+        })
+        if selected_view == "All Materials":
+            st.subheader("📊 Global Material Pulse")
+        else:
+            # Build subtitle
+            if filter_parts:
+                st.subheader(f"📊 {selected_view} - {' | '.join(filter_parts)}")
+            else:
+                st.subheader(f"📊 {selected_view} Inventory Pulse")
+
+        # ══════════════════════════════════════════════════════════════════════════════
+        # DISPLAY DATA
+        # ══════════════════════════════════════════════════════════════════════════════
+        
+        if display_df.empty:
+            st.warning("No items match the selected filters.")
+        else:
+            # DATA AGGREGATION
+            summary_df = summarize_materials(display_df)
+
+            # TOP-LEVEL METRICS
+            m1, m2, m3 = st.columns(3)
+            current_total_ft = display_df['Footage'].sum()
+            current_unit_count = len(display_df)
+            unique_mats = len(summary_df)
+            
+            m1.metric("Total Footage", f"{current_total_ft:,.1f} ft")
+            m2.metric("Items in View", current_unit_count)
+            m3.metric("Material Types", unique_mats)
+
+            st.divider()
+
+            # ══════════════════════════════════════════════════════════════════════
+            # CATEGORY-SPECIFIC QUICK STATS
+            # ══════════════════════════════════════════════════════════════════════
+            
+            if selected_view in ["Coils", "Rolls"] and not display_df.empty:
+                st.markdown("### 📈 Quick Stats")
+                qs1, qs2, qs3, qs4 = st.columns(4)
+                with qs1:
+                    st.metric("Avg Footage/Item", f"{display_df['Footage'].mean():,.1f} ft")
+                with qs2:
+                    st.metric("Lowest Stock", f"{display_df['Footage'].min():,.1f} ft")
+                with qs3:
+                    st.metric("Highest Stock", f"{display_df['Footage'].max():,.1f} ft")
+                with qs4:
+                    st.metric("Locations", display_df['Location'].nunique())
+                st.divider()
+            
+            elif selected_view == "Elbows" and not display_df.empty:
+                st.markdown("### 📈 Elbows Quick Stats")
+                eq1, eq2, eq3, eq4 = st.columns(4)
+                with eq1:
+                    st.metric("Total Pieces", f"{int(display_df['Footage'].sum()):,}")
+                with eq2:
+                    if 'Angle' in display_df.columns:
+                        st.metric("90° Items", len(display_df[display_df['Angle'] == '90°']))
+                    else:
+                        st.metric("90° Items", len(display_df[display_df['Material'].str.contains('90', na=False)]))
+                with eq3:
+                    if 'Angle' in display_df.columns:
+                        st.metric("45° Items", len(display_df[display_df['Angle'] == '45°']))
+                    else:
+                        st.metric("45° Items", len(display_df[display_df['Material'].str.contains('45', na=False)]))
+                with eq4:
+                    st.metric("Unique Sizes", display_df['Material'].nunique())
+                st.divider()
+            
+            elif selected_view == "Fab Straps" and not display_df.empty:
+                st.markdown("### 📈 Fab Straps Quick Stats")
+                fs1, fs2, fs3, fs4 = st.columns(4)
+                with fs1:
+                    st.metric("Total Bundles", f"{int(display_df['Footage'].sum()):,}")
+                with fs2:
+                    if 'Gauge' in display_df.columns:
+                        st.metric(".015 Gauge", len(display_df[display_df['Gauge'] == '.015']))
+                with fs3:
+                    if 'Gauge' in display_df.columns:
+                        st.metric(".020 Gauge", len(display_df[display_df['Gauge'] == '.020']))
+                with fs4:
+                    st.metric("Unique Sizes", display_df['Material'].nunique())
+                st.divider()
+            
+            elif selected_view == "Wing Seals" and not display_df.empty:
+                st.markdown("### 📈 Wing Seals Quick Stats")
+                ws1, ws2, ws3, ws4 = st.columns(4)
+                with ws1:
+                    st.metric("Total Pieces", f"{int(display_df['Footage'].sum()):,}")
+                with ws2:
+                    if 'Seal_Type' in display_df.columns:
+                        st.metric("Open Type", len(display_df[display_df['Seal_Type'] == 'Open']))
+                with ws3:
+                    if 'Seal_Type' in display_df.columns:
+                        st.metric("Closed Type", len(display_df[display_df['Seal_Type'] == 'Closed']))
+                with ws4:
+                    st.metric("Unique Types", display_df['Material'].nunique())
+                st.divider()
+
+            # Forecast-driven reorder points; static thresholds remain the fallback
+            rollup_notice = keep_movement_rollup_current(df)
+            if rollup_notice:
+                st.caption(rollup_notice)
+            try:
+                reorder_df = forecast_reorder_points(st.session_state.get('data_version', ''), df)
+                active_reorder = reorder_df[reorder_df['Daily_Demand'] > 0]
+                reorder_points = active_reorder.groupby('Material')['Reorder_Point'].max().to_dict()
+            except Exception as e:
+                print(f"Forecast failed: {e}")
+                st.warning(f"⚠️ Demand forecast unavailable, using static thresholds: {e}")
+                reorder_df = pd.DataFrame()
+                reorder_points = {}
+
+            # THE PULSE GRID
+            cols = st.columns(2)
+            for idx, row in summary_df.iterrows():
+                with cols[idx % 2]:
+                    mat = row['Material']
+                    ft = row['Total_Footage']
+                    units = row['Unit_Count']
+                    cat_type = row['Type']
+                    
+                    short_name, display_value, unit_text, sub_label_text, status_color, status_text = pulse_card(
+                        mat, ft, units, cat_type, reorder_points
+                    )
+
+                    # --- RENDER THE CARD ---
+                    st.markdown(f"""
+                    <div style="background-color: #f9f9f9; padding: 20px; border-radius: 12px; 
+                                border-left: 12px solid {status_color}; margin-bottom: 15px; min-height: 220px;">
+                        <p style="color: #666; font-size: 11px; margin: 0; font-weight: bold;">{cat_type.upper()}</p>
+                        <h3 style="margin: 5px 0 0 0; font-size: 18px; color: #1e293b;">{short_name}</h3>
+                        <p style="color: #94a3b8; font-size: 10px; margin: 2px 0 10px 0; word-wrap: break-word;">{mat}</p>
+                        <h1 style="margin: 10px 0; color: {status_color};">{display_value} <span style="font-size: 16px;">{unit_text}</span></h1>
+                        <p style="color: #666; font-size: 13px; margin: 5px 0;">{sub_label_text}</p>
+                        <div style="display: flex; justify-content: space-between; align-items: center; border-top: 1px solid #eee; padding-top: 10px; margin-top: 10px;">
+                            <span style="font-weight: bold; color: {status_color}; font-size: 12px;">{status_text}</span>
+                            <span style="color: #888; font-size: 11px;">{units} ID{'s' if units != 1 else ''}</span>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
+            # FORECAST TABLE
+            view_reorder = reorder_df[reorder_df['Material'].isin(summary_df['Material'])] if not reorder_df.empty else reorder_df
+            if not view_reorder.empty:
+                with st.expander(f"📈 Demand Forecast & Reorder Points ({len(view_reorder)} materials with usage)"):
+                    st.caption("Daily demand from production and pick history (exponential smoothing, or Croston for intermittent items). Reorder point = demand over lead time + 95% safety stock.")
+                    st.dataframe(
+                        view_reorder.sort_values('Days_Of_Cover').round(1),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+
+            # INDIVIDUAL ITEM TABLE
+            with st.expander(f"🔍 View Individual Items ({len(display_df)} items)"):
+                # Determine which columns to show based on category
+                base_cols = ['Item_ID', 'Material', 'Footage', 'Location']
+                
+                if selected_view in ["Coils", "Rolls"] and 'Metal_Type' in display_df.columns:
+                    show_cols = ['Item_ID', 'Material', 'Metal_Type', 'Gauge', 'Texture', 'Footage', 'Location']
+                elif selected_view == "Elbows" and 'Angle' in display_df.columns:
+                    show_cols = ['Item_ID', 'Material', 'Angle', 'Size', 'Metal_Type', 'Footage', 'Location']
+                elif selected_view == "Fab Straps" and 'Gauge' in display_df.columns:
+                    show_cols = ['Item_ID', 'Material', 'Gauge', 'Size', 'Metal_Type', 'Footage', 'Location']
+                elif selected_view == "Mineral Wool" and 'Pipe_Size' in display_df.columns:
+                    show_cols = ['Item_ID', 'Material', 'Pipe_Size', 'Thickness', 'Footage', 'Location']
+                elif selected_view == "Wing Seals" and 'Seal_Type' in display_df.columns:
+                    show_cols = ['Item_ID', 'Material', 'Seal_Type', 'Seal_Size', 'Gauge', 'Footage', 'Location']
+                elif selected_view == "Wire" and 'Wire_Gauge' in display_df.columns:
+                    show_cols = ['Item_ID', 'Material', 'Wire_Gauge', 'Footage', 'Location']
+                elif selected_view == "Banding" and 'Banding_Type' in display_df.columns:
+                    show_cols = ['Item_ID', 'Material', 'Banding_Type', 'Gauge', 'Size', 'Footage', 'Location']
+                elif selected_view == "Fiberglass Insulation" and 'Form' in display_df.columns:
+                    show_cols = ['Item_ID', 'Material', 'Form', 'Thickness', 'Footage', 'Location']
+                else:
+                    show_cols = ['Item_ID', 'Category', 'Material', 'Footage', 'Location']
+                
+                # Filter to only existing columns
+                show_cols = [c for c in show_cols if c in display_df.columns]
+                
+                st.dataframe(
+                    display_df[show_cols].sort_values('Material'), 
+                    use_container_width=True, 
+                    hide_index=True
+                )
+    else:
+        st.info("No data available. Add inventory in the Receive tab.")
@@ -0,0 +1,540 @@
+"""Insights tab: analytics, stock history and the AI assistant."""
+
+from datetime import datetime
+
+import streamlit as st
+
+from warehouse_pulse.catalog import LOW_STOCK_THRESHOLDS
+from warehouse_pulse.data.client import supabase
+from warehouse_pulse.data.movements import ROLLUP_SYNC_BATCH, classify_movements, keep_movement_rollup_current, load_movement_rollup, sync_movement_rollup
+from warehouse_pulse.data.snapshots import backfill_inventory_snapshots, load_snapshot_trend, load_stock_as_of
+from warehouse_pulse.domain.assistant import run_ai_tool, stream_ai_answer
+from warehouse_pulse.domain.forecasting import forecast_reorder_points
+from warehouse_pulse.domain.insights import WAREHOUSE_TARGET_CAPACITY, insights_chart1_figure, insights_chart2_figure, insights_gauge_figure, insights_metrics
+
+def render(df, df_audit):
+    st.markdown("""
+        <div style="text-align: center; padding: 20px 0;">
+            <h1 style="color: #7c3aed; margin: 0;">📈 Inventory Analytics & AI Insights</h1>
+            <p style="color: #64748b; margin-top: 8px;">Real-time analytics and intelligent recommendations powered by AI</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Configure Grok AI (xAI) with better error handling
+    GROK_API_KEY = st.secrets.get("GROK_API_KEY", "")
+    # Optional override for another OpenAI-compatible endpoint (proxy, gateway)
+    GROK_BASE_URL = st.secrets.get("GROK_BASE_URL", "https://api.x.ai/v1")
+    ai_configured = False
+    
+    # Debug info (remove after testing)
+    with st.expander("🔧 API Configuration Debug", expanded=False):
+        if GROK_API_KEY:
+            st.write(f"✅ Key found: `{GROK_API_KEY[:10]}...`")
+            st.write(f"Key starts with 'xai-': {GROK_API_KEY.startswith('xai-')}")
+        else:
+            st.error("❌ No GROK_API_KEY found in secrets")
+            st.code("""
+# Add to .streamlit/secrets.toml:
+GROK_API_KEY = "xai-your-key-here"
+            """)
+    
+    if GROK_API_KEY and GROK_API_KEY.startswith("xai-"):
+        try:
+            import openai
+            
+            # Configure for Grok API
+            grok_client = openai.OpenAI(
+                api_key=GROK_API_KEY,
+                base_url=GROK_BASE_URL
+            )
+            ai_configured = True
+        except ImportError:
+            st.error("❌ OpenAI library not installed. Add 'openai' to requirements.txt")
+            ai_configured = False
+        except Exception as e:
+            st.warning(f"⚠️ AI Configuration Issue: {e}")
+            ai_configured = False
+    else:
+        if GROK_API_KEY:
+            st.warning("⚠️ API Key format looks incorrect. Grok keys should start with 'xai-'")
+        else:
+            st.info("💡 Add GROK_API_KEY to your secrets to enable AI features")
+    
+    if not df.empty:
+        # ── Analytics Dashboard ─────────────────────────────────────────────────
+        st.markdown("### 📊 Warehouse Overview")
+        
+        # Key Metrics Cards
+        col1, col2, col3, col4 = st.columns(4)
+        
+        data_version = st.session_state.get('data_version', '')
+        overview = insights_metrics(data_version, df)
+        total_footage = overview['total_footage']
+        total_items = overview['total_items']
+        total_categories = overview['total_categories']
+        active_items = overview['active_items']
+        
+        with col1:
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                            padding: 20px; border-radius: 12px; text-align: center; color: white;">
+                    <h3 style="margin: 0; font-size: 32px; font-weight: bold;">{:,.0f}</h3>
+                    <p style="margin: 8px 0 0 0; font-size: 14px; opacity: 0.9;">Total Footage</p>
+                </div>
+            """.format(total_footage), unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); 
+                            padding: 20px; border-radius: 12px; text-align: center; color: white;">
+                    <h3 style="margin: 0; font-size: 32px; font-weight: bold;">{}</h3>
+                    <p style="margin: 8px 0 0 0; font-size: 14px; opacity: 0.9;">Total Items</p>
+                </div>
+            """.format(total_items), unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); 
+                            padding: 20px; border-radius: 12px; text-align: center; color: white;">
+                    <h3 style="margin: 0; font-size: 32px; font-weight: bold;">{}</h3>
+                    <p style="margin: 8px 0 0 0; font-size: 14px; opacity: 0.9;">Categories</p>
+                </div>
+            """.format(total_categories), unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); 
+                            padding: 20px; border-radius: 12px; text-align: center; color: white;">
+                    <h3 style="margin: 0; font-size: 32px; font-weight: bold;">{}</h3>
+                    <p style="margin: 8px 0 0 0; font-size: 14px; opacity: 0.9;">Active Items</p>
+                </div>
+            """.format(active_items), unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # ── Capacity Gauge ──────────────────────────────────────────────────────
+        st.markdown("### 📏 Warehouse Capacity")
+        
+        with st.container():
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%); 
+                            padding: 24px; border-radius: 12px; border-left: 4px solid #f97316;">
+            """, unsafe_allow_html=True)
+            
+            target_capacity = WAREHOUSE_TARGET_CAPACITY
+            utilization_pct = (total_footage / target_capacity) * 100
+            
+            fig_gauge = insights_gauge_figure(total_footage, target_capacity)
+            
+            st.plotly_chart(fig_gauge, use_container_width=True)
+            
+            # Capacity warning
+            if utilization_pct > 90:
+                st.error(f"⚠️ **Critical:** Warehouse at {utilization_pct:.1f}% capacity!")
+            elif utilization_pct > 80:
+                st.warning(f"⚠️ **Warning:** Warehouse at {utilization_pct:.1f}% capacity")
+            else:
+                st.success(f"✅ **Healthy:** Warehouse at {utilization_pct:.1f}% capacity")
+            
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # ── Visual Analytics (Flexible & User-Controlled) ──────────────────────
+        st.markdown("### 📊 Custom Analytics Dashboard")
+        st.caption("Customize your view to focus on what matters most")
+        
+        # Analytics Control Panel
+        with st.expander("⚙️ Customize Analytics View", expanded=False):
+            col_ctrl1, col_ctrl2 = st.columns(2)
+            
+            with col_ctrl1:
+                chart1_metric = st.selectbox(
+                    "📈 Left Chart - Group By:",
+                    ["Category", "Location", "Status", "Material Type"],
+                    key="chart1_metric"
+                )
+                chart1_type = st.radio(
+                    "Chart Type:",
+                    ["Pie Chart", "Bar Chart", "Treemap"],
+                    horizontal=True,
+                    key="chart1_type"
+                )
+            
+            with col_ctrl2:
+                chart2_metric = st.selectbox(
+                    "📊 Right Chart - Show:",
+                    ["Top 10 Materials", "Items by Location", "Low Stock Alert", 
+                     "Recent Activity", "PO Summary", "Top 10 Clients", "Material Velocity"],
+                    key="chart2_metric"
+                )
+                show_value = st.checkbox("Show exact values on charts", value=True)
+        
+        col1, col2 = st.columns(2)
+        
+        # ── LEFT CHART (Dynamic) ────────────────────────────────────────────────
+        with col1:
+            st.markdown("""
+                <div style="background: white; padding: 20px; border-radius: 12px; 
+                            box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            """, unsafe_allow_html=True)
+            
+            # Aggregate and figure are cached per (data version, chart settings)
+            chart1_title, fig1 = insights_chart1_figure(data_version, df, chart1_metric, chart1_type, show_value)
+            
+            st.markdown(f"<h4 style='color: #1e293b; margin-top: 0;'>{chart1_title}</h4>", unsafe_allow_html=True)
+            
+            st.plotly_chart(fig1, use_container_width=True)
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        # ── RIGHT CHART (Dynamic) ───────────────────────────────────────────────
+        with col2:
+            st.markdown("""
+                <div style="background: white; padding: 20px; border-radius: 12px; 
+                            box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            """, unsafe_allow_html=True)
+            
+            if chart2_metric == "Top 10 Materials":
+                st.markdown("<h4 style='color: #1e293b; margin-top: 0;'>Top 10 Materials by Stock</h4>", unsafe_allow_html=True)
+                chart2 = insights_chart2_figure(data_version, df, chart2_metric, show_value)
+                st.plotly_chart(chart2['fig'], use_container_width=True)
+            
+            elif chart2_metric == "Items by Location":
+                st.markdown("<h4 style='color: #1e293b; margin-top: 0;'>Busiest Storage Locations</h4>", unsafe_allow_html=True)
+                chart2 = insights_chart2_figure(data_version, df, chart2_metric, show_value)
+                st.plotly_chart(chart2['fig'], use_container_width=True)
+            
+            elif chart2_metric == "Low Stock Alert":
+                st.markdown("<h4 style='color: #1e293b; margin-top: 0;'>⚠️ Low Stock Items</h4>", unsafe_allow_html=True)
+                chart2 = insights_chart2_figure(data_version, df, chart2_metric, show_value)
+                
+                if chart2['fig'] is not None:
+                    st.plotly_chart(chart2['fig'], use_container_width=True)
+                    st.warning(f"⚠️ {chart2['count']} items below threshold!")
+                else:
+                    st.success("✅ All items above minimum stock levels!")
+                    st.markdown("<div style='height: 300px; display: flex; align-items: center; justify-content: center;'><h3 style='color: #64748b;'>No low stock alerts</h3></div>", unsafe_allow_html=True)
+            
+            elif chart2_metric == "Recent Activity":
+                st.markdown("<h4 style='color: #1e293b; margin-top: 0;'>📅 Recent Inventory Changes</h4>", unsafe_allow_html=True)
+                
+                try:
+                    # Fetch recent audit logs
+                    recent_logs = supabase.table("audit_log").select("*").order("Timestamp", desc=True).limit(10).execute()
+                    
+                    if recent_logs.data:
+                        for log in recent_logs.data:
+                            action_color = "#16a34a" if log['Action'] == "Received" else "#dc2626"
+                            st.markdown(f"""
+                                <div style="padding: 12px; margin: 8px 0; background: #f9fafb; border-radius: 8px; border-left: 4px solid {action_color};">
+                                    <div style="display: flex; justify-content: space-between;">
+                                        <strong style="color: {action_color};">{log['Action']}</strong>
+                                        <span style="color: #64748b; font-size: 12px;">{log.get('Timestamp', 'N/A')[:16]}</span>
+                                    </div>
+                                    <div style="color: #1e293b; margin-top: 4px;">{log.get('Details', 'No details')}</div>
+                                    <div style="color: #64748b; font-size: 12px; margin-top: 4px;">By: {log.get('User', 'Unknown')}</div>
+                                </div>
+                            """, unsafe_allow_html=True)
+                    else:
+                        st.info("No recent activity recorded")
+                except Exception as e:
+                    st.error(f"Could not load activity: {e}")
+            
+            elif chart2_metric == "PO Summary":
+                st.markdown("<h4 style='color: #1e293b; margin-top: 0;'>📦 Purchase Order Summary</h4>", unsafe_allow_html=True)
+                chart2 = insights_chart2_figure(data_version, df, chart2_metric, show_value)
+                
+                if chart2['fig'] is not None:
+                    st.plotly_chart(chart2['fig'], use_container_width=True)
+                else:
+                    st.info("No PO data available")
+            
+            # Fold new audit rows into the movement rollup (at most once a minute per session)
+            if chart2_metric in ("Top 10 Clients", "Material Velocity"):
+                rollup_notice = keep_movement_rollup_current(df)
+                if rollup_notice:
+                    st.warning(rollup_notice)
+            
+            # ── NEW: Top 10 Clients ────────────────────────────────────────────
+            if chart2_metric == "Top 10 Clients":
+                st.markdown("<h4 style='color: #1e293b; margin-top: 0;'>👥 Top 10 Clients by Sales</h4>", unsafe_allow_html=True)
+                
+                try:
+                    # Pre-aggregated daily pick totals per client
+                    clients_df = load_movement_rollup(("Pick",))
+                    clients_df = clients_df[clients_df['client'] != ""]
+                    
+                    if not clients_df.empty:
+                        top_clients = clients_df.groupby('client')['quantity'].sum().nlargest(10).reset_index()
+                        top_clients.columns = ['Client', 'Total_Sold']
+                        
+                        import plotly.express as px
+                        fig2 = px.bar(
+                            top_clients.sort_values('Total_Sold'),
+                            x='Total_Sold',
+                            y='Client',
+                            orientation='h',
+                            color='Total_Sold',
+                            color_continuous_scale='Sunset',
+                            text='Total_Sold' if show_value else None
+                        )
+                        fig2.update_traces(
+                            texttemplate='%{text:,.0f}' if show_value else None,
+                            textposition='outside',
+                            hovertemplate='<b>%{y}</b><br>Total Sold: %{x:,.0f} units<extra></extra>'
+                        )
+                        fig2.update_layout(
+                            margin=dict(l=20, r=20, t=20, b=20),
+                            height=400,
+                            showlegend=False
+                        )
+                        st.plotly_chart(fig2, use_container_width=True)
+                        
+                        # Show stats
+                        total_sales = top_clients['Total_Sold'].sum()
+                        st.metric("Total Sales (Top 10)", f"{total_sales:,.0f} units")
+                    else:
+                        st.info("No client sales data found")
+                except Exception as e:
+                    st.error(f"Could not load client data: {e}")
+            
+            # ── NEW: Material Velocity (How fast items move) ───────────────────
+            elif chart2_metric == "Material Velocity":
+                st.markdown("<h4 style='color: #1e293b; margin-top: 0;'>⚡ Material Turnover Rate</h4>", unsafe_allow_html=True)
+                
+                try:
+                    # Outbound movements from the daily rollup, last 30 days
+                    from datetime import timedelta
+                    thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+                    
+                    moves_df = load_movement_rollup(("Pick", "Production", "Removed"), thirty_days_ago)
+                    
+                    if not moves_df.empty:
+                        velocity_df = moves_df.groupby('category', as_index=False)['quantity'].sum()
+                        velocity_df.columns = ['Material', 'Units_Moved']
+                        velocity_df = velocity_df.sort_values('Units_Moved', ascending=True)
+                        
+                        import plotly.express as px
+                        fig2 = px.bar(
+                            velocity_df,
+                            x='Units_Moved',
+                            y='Material',
+                            orientation='h',
+                            color='Units_Moved',
+                            color_continuous_scale='Turbo',
+                            text='Units_Moved' if show_value else None
+                        )
+                        fig2.update_traces(
+                            texttemplate='%{text:,.0f}' if show_value else None,
+                            textposition='outside',
+                            hovertemplate='<b>%{y}</b><br>Moved in 30 days: %{x:,.0f} units<extra></extra>'
+                        )
+                        fig2.update_layout(
+                            margin=dict(l=20, r=20, t=20, b=20),
+                            height=400,
+                            showlegend=False
+                        )
+                        st.plotly_chart(fig2, use_container_width=True)
+                        
+                        st.caption("📊 Units picked, used in production or removed in the last 30 days")
+                    else:
+                        st.info("No movement data in last 30 days")
+                except Exception as e:
+                    st.error(f"Could not calculate velocity: {e}")
+            
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # ── Stock History (snapshots + replay) ──────────────────────────────────
+        st.markdown("### 🕰️ Stock History")
+        st.caption("Daily snapshots of stock per material; past dates are answered from the nearest snapshot plus logged movements")
+        
+        with st.expander("🧱 Rebuild snapshot history", expanded=False):
+            st.caption("Reconstructs missing daily snapshots by walking today's stock back through the movement rollup. Existing snapshots are kept.")
+            backfill_days = st.number_input("Days to rebuild", min_value=7, max_value=1095, value=365, step=7, key="snapshot_backfill_days")
+            if st.button("Rebuild History", key="snapshot_backfill_btn"):
+                try:
+                    with st.spinner("Rebuilding snapshots..."):
+                        # Walking back through a half-built rollup would store wrong closes for good
+                        rollup_complete = sync_movement_rollup(df) < ROLLUP_SYNC_BATCH
+                        written = backfill_inventory_snapshots(df, int(backfill_days)) if rollup_complete else None
+                    if written is None:
+                        st.warning("⏳ Movement history is still being built from the audit log; try again in a few page loads.")
+                    else:
+                        st.success(f"✅ Wrote {written:,} snapshot rows")
+                except Exception as e:
+                    st.error(f"❌ Rebuild failed: {e}")
+        
+        hist_col1, hist_col2 = st.columns(2)
+        
+        with hist_col1:
+            as_of_day = st.date_input("Stock as of", value=datetime.now().date(), max_value=datetime.now().date(), key="stock_as_of_day")
+            try:
+                as_of_df = load_stock_as_of(as_of_day.strftime("%Y-%m-%d"))
+                if as_of_df.empty:
+                    st.info("No snapshots recorded yet")
+                else:
+                    st.caption(f"Based on the {as_of_df['snapshot_day'].iloc[0]} snapshot · {as_of_df['footage'].sum():,.0f} total")
+                    st.dataframe(
+                        as_of_df[['category', 'material', 'footage']].rename(columns=str.title),
+                        use_container_width=True, hide_index=True, height=360
+                    )
+            except Exception as e:
+                st.error(f"Could not load stock history: {e}")
+        
+        with hist_col2:
+            trend_materials = st.multiselect(
+                "Trend for materials",
+                sorted(df['Material'].dropna().unique().tolist()),
+                max_selections=8,
+                key="trend_materials"
+            )
+            trend_days = st.select_slider("Period (days)", options=[30, 90, 180, 365, 730], value=90, key="trend_days")
+            if trend_materials:
+                try:
+                    from datetime import timedelta
+                    trend_since = (datetime.now() - timedelta(days=trend_days)).strftime("%Y-%m-%d")
+                    trend_df = load_snapshot_trend(tuple(trend_materials), trend_since)
+                    if trend_df.empty:
+                        st.info("No snapshots for these materials in this period")
+                    else:
+                        trend_df = trend_df.groupby(['day', 'material'], as_index=False)['footage'].sum()
+                        import plotly.express as px
+                        fig_trend = px.line(trend_df, x='day', y='footage', color='material', markers=len(trend_df) < 60)
+                        fig_trend.update_layout(margin=dict(l=20, r=20, t=20, b=20), height=360,
+                                                xaxis_title=None, yaxis_title="Footage", legend_title=None)
+                        st.plotly_chart(fig_trend, use_container_width=True)
+                except Exception as e:
+                    st.error(f"Could not load trend: {e}")
+            else:
+                st.info("Pick materials to chart their stock over time")
+        
+        st.markdown("---")
+        
+        # ── AI Assistant Section ────────────────────────────────────────────────
+        st.markdown("""
+            <div style="text-align: center; padding: 20px 0;">
+                <h2 style="color: #7c3aed; margin: 0;">🤖 MJP Pulse AI Assistant</h2>
+                <p style="color: #64748b; margin-top: 8px;">Ask intelligent questions about your inventory</p>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        # Show AI status
+        if ai_configured:
+            st.success("✅ AI Assistant is ready!", icon="🤖")
+        else:
+            st.warning("⚠️ AI Assistant not configured - see instructions below", icon="⚙️")
+        
+        with st.container():
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #e0e7ff 0%, #f3e8ff 100%); 
+                            padding: 30px; border-radius: 12px; border-left: 4px solid #7c3aed;">
+            """, unsafe_allow_html=True)
+            
+            # Example questions
+            st.markdown("**💡 Example Questions:**")
+            examples = [
+                "What items are running low and need reordering?",
+                "Show me a summary of all Coils in stock",
+                "Which category has the most inventory?",
+                "What's the total value of Aluminum items?",
+                "Recommend optimal reorder quantities"
+            ]
+            
+            cols = st.columns(3)
+            for idx, example in enumerate(examples):
+                with cols[idx % 3]:
+                    if st.button(f"💬 {example}", key=f"example_{idx}", use_container_width=True):
+                        st.session_state.ai_question = example
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # User input
+            user_q = st.text_area(
+                "✍️ Your Question:",
+                value=st.session_state.get('ai_question', ''),
+                placeholder="e.g., What materials need reordering based on current stock levels?",
+                height=100,
+                key="ai_input_final"
+            )
+            
+            if st.button("🚀 Ask AI Assistant", type="primary", use_container_width=True):
+                if not user_q:
+                    st.warning("⚠️ Please enter a question!")
+                elif not ai_configured:
+                    st.error("⚠️ AI Assistant is not configured. Please check your API key.")
+                    st.markdown("""
+                    **🔧 Setup Instructions for Grok:**
+                    1. Go to [xAI Console](https://console.x.ai/)
+                    2. Sign in and navigate to API Keys
+                    3. Click "Create API Key"
+                    4. Copy the key (starts with `xai-...`)
+                    5. Add to Streamlit secrets as `GROK_API_KEY`
+                    
+                    **In `.streamlit/secrets.toml`:**
+                    ```toml
+                    GROK_API_KEY = "xai-..."
+                    ```
+                    
+                    **Or in Streamlit Cloud:**
+                    - Go to App Settings → Secrets
+                    - Add: `GROK_API_KEY = "xai-..."`
+                    """)
+                else:
+                    try:
+                        data_version = st.session_state.get('data_version', '')
+                        try:
+                            ai_reorder_df = forecast_reorder_points(data_version, df)
+                        except Exception as e:
+                            print(f"Forecast failed: {e}")
+                            st.warning(f"⚠️ Demand forecast unavailable, so the assistant has no reorder points: {e}")
+                            ai_reorder_df = None
+                        def ai_tool_runner(name, args):
+                            # Audit history is only parsed when the model asks for movements
+                            movements = classify_movements(df_audit, df) if name == "movement_summary" else None
+                            return run_ai_tool(name, args, df, ai_reorder_df, LOW_STOCK_THRESHOLDS, movements)
+                        
+                        st.markdown("### 🎯 Grok AI Response")
+                        st.markdown("""
+                            <div style="background: white; padding: 20px; border-radius: 8px; 
+                                        border-left: 4px solid #7c3aed; margin: 20px 0;">
+                        """, unsafe_allow_html=True)
+                        
+                        # The model calls local tools, then its answer streams in; repeats on the same data come from cache
+                        ai_response = st.write_stream(stream_ai_answer(grok_client, user_q, data_version, ai_tool_runner))
+                        
+                        st.markdown("</div>", unsafe_allow_html=True)
+                        
+                        if ai_response:
+                            # Download button
+                            st.download_button(
+                                "📥 Download AI Report",
+                                ai_response,
+                                file_name=f"MJP_Grok_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                                mime="text/plain",
+                                key="download_ai_report"
+                            )
+                            
+                            st.success("✅ Analysis complete!")
+                        
+                    except Exception as e:
+                        st.error(f"❌ Grok AI Error: {e}")
+                        st.markdown("""
+                        **🔧 Troubleshooting:**
+                        1. Verify your API key at [xAI Console](https://console.x.ai/)
+                        2. Ensure you have API credits/billing enabled
+                        3. Check if the key has proper permissions
+                        4. Try regenerating the API key
+                        """)
+            
+            st.markdown("</div>", unsafe_allow_html=True)
+    
+    else:
+        st.info("📊 No inventory data available. Add items to view analytics.")
+        st.markdown("""
+            <div style="text-align: center; padding: 40px;">
+                <h3 style="color: #64748b;">Get Started</h3>
+                <p>Navigate to the <strong>Smart Inventory Receiver</strong> tab to add your first items!</p>
+            </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,925 @@
+"""Manage tab: receiving, purchase planning and PO receipts."""
+
+import time
+from datetime import datetime
+from io import BytesIO
+
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse.catalog import LOW_STOCK_THRESHOLDS
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.client import supabase
+from warehouse_pulse.data.inventory import compute_data_version
+from warehouse_pulse.data.movements import keep_movement_rollup_current
+from warehouse_pulse.domain.forecasting import forecast_reorder_points
+from warehouse_pulse.domain.purchasing import ORDER_COST, SERIALIZED_CATEGORIES, build_purchase_plan, purchase_plan_to_cart
+from warehouse_pulse.domain.receiving import PACKING_LIST_COLUMNS, commit_receiving_cart, format_item_ids, packing_list_to_cart, peek_next_item_number, reserve_item_ids, reserve_pending_ids, validate_packing_list
+from warehouse_pulse.mail import send_receipt_email
+from warehouse_pulse.reporting.cache import get_artifact_cache
+from warehouse_pulse.reporting.pdf import generate_receipt_pdf
+
+
+def render(df, df_audit):
+    st.markdown("""
+        <div style="text-align: center; padding: 20px 0;">
+            <h1 style="color: #1e40af; margin: 0;">📦 Smart Inventory Receiver</h1>
+            <p style="color: #64748b; margin-top: 8px;">Multi-line receiving with intelligent tracking and automatic PO management</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # ── Safe DataFrame Check ────────────────────────────────────────────────────
+    if df is not None and not df.empty:
+        safe_df = df.copy()
+    else:
+        safe_df = pd.DataFrame(columns=['Item_ID', 'Material', 'Footage', 'Location', 'Status', 'Category', 'Purchase_Order_Num'])
+        st.info("📦 No inventory data found. This is your first time receiving items - let's get started!")
+    
+    # Category mapping (plural consistent)
+    cat_mapping = {
+        "Coils": "Coils", 
+        "Rolls": "Rolls", 
+        "Elbows": "Elbows", 
+        "Fab Straps": "Fab Straps", 
+        "Mineral Wool": "Mineral Wool",
+        "Fiberglass Insulation": "Fiberglass Insulation",
+        "Wing Seals": "Wing Seals",
+        "Wire": "Wire",
+        "Banding": "Banding",
+        "Other": "Other"
+    }
+    
+    category_icons = {
+        "Coils": "🔄", "Rolls": "📜", "Elbows": "↩️", 
+        "Fab Straps": "🔗", "Mineral Wool": "🧶",
+        "Fiberglass Insulation": "🏠", "Wing Seals": "🔒", 
+        "Wire": "➰", "Banding": "📏", "Other": "📦"
+    }
+    
+    # ── Initialize Session State for Receiving Cart ────────────────────────────
+    if 'receiving_cart' not in st.session_state:
+        st.session_state.receiving_cart = []
+    if 'current_po' not in st.session_state:
+        st.session_state.current_po = ""
+    if 'receiving_operator' not in st.session_state:
+        st.session_state.receiving_operator = st.session_state.get("username", "")
+    
+    # ── Purchase Plan (suggested reorders) ──────────────────────────────────────
+    with st.expander("🧮 Purchase Plan - Suggested Reorders", expanded=False):
+        rollup_notice = keep_movement_rollup_current(safe_df)
+        if rollup_notice:
+            st.caption(rollup_notice)
+        try:
+            plan_forecast = forecast_reorder_points(st.session_state.get('data_version', ''), safe_df)
+            purchase_plan = build_purchase_plan(plan_forecast, safe_df, LOW_STOCK_THRESHOLDS)
+        except Exception as e:
+            purchase_plan = pd.DataFrame()
+            st.error(f"❌ Could not build purchase plan: {e}")
+
+        if purchase_plan.empty:
+            st.success("✅ Nothing is at or below its reorder point.")
+        else:
+            st.caption(f"EOQ quantities at ${ORDER_COST:.0f}/order, rounded to whole packs and minimum order sizes. One draft PO per category.")
+            st.dataframe(
+                purchase_plan[["Draft_PO", "Category", "Material", "On_Hand", "Trigger", "Daily_Demand", "EOQ", "Packs", "Pack_Size", "Order_Qty", "Days_Of_Cover_After"]].round(1),
+                use_container_width=True,
+                hide_index=True
+            )
+
+            col_plan_po, col_plan_dl = st.columns(2)
+            with col_plan_po:
+                draft_po = st.selectbox("Draft PO", purchase_plan["Draft_PO"].unique().tolist(), key="plan_draft_po")
+                if st.button("🛒 Load Draft PO into Receiving Cart", use_container_width=True):
+                    try:
+                        st.session_state.receiving_cart.extend(
+                            purchase_plan_to_cart(purchase_plan[purchase_plan["Draft_PO"] == draft_po], safe_df)
+                        )
+                        st.session_state.current_po = draft_po
+                        st.session_state.po_header = draft_po
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Could not load draft PO: {e}")
+            with col_plan_dl:
+                st.download_button(
+                    "📥 Download Plan (CSV)",
+                    purchase_plan.to_csv(index=False),
+                    file_name=f"purchase_plan_{datetime.now().strftime('%Y%m%d')}.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
+
+    # ── Purchase Order Header (Outside form for persistence) ───────────────────
+    st.markdown("### 📋 Purchase Order Information")
+    
+    col_po, col_op = st.columns([2, 1])
+    
+    with col_po:
+        st.markdown("""
+            <div style="background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%); 
+                        padding: 20px; border-radius: 12px; border-left: 4px solid #f59e0b;">
+        """, unsafe_allow_html=True)
+        
+        current_po = st.text_input(
+            "📄 Purchase Order Number",
+            value=st.session_state.current_po,
+            placeholder="e.g. PO-2026-001",
+            help="All items added will be tagged with this PO",
+            key="po_header"
+        )
+        st.session_state.current_po = current_po
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    with col_op:
+        st.markdown("""
+            <div style="background: linear-gradient(135deg, #e0e7ff 0%, #c7d2fe 100%); 
+                        padding: 20px; border-radius: 12px; border-left: 4px solid #6366f1;">
+        """, unsafe_allow_html=True)
+        
+        operator = st.text_input(
+            "👤 Receiving Operator",
+            value=st.session_state.receiving_operator,
+            key="op_header"
+        )
+        st.session_state.receiving_operator = operator
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # ── STEP 1: Category Selection (Outside form for reactivity) ───────────────
+    st.markdown("### Step 1️⃣: Select Category")
+    
+    raw_cat = st.selectbox(
+        "What are you receiving?", 
+        list(cat_mapping.keys()),
+        key="cat_select"
+    )
+    cat_choice = cat_mapping[raw_cat]
+    
+    # Determine if this category needs serial IDs
+    is_serialized = cat_choice in SERIALIZED_CATEGORIES
+    
+    if is_serialized:
+        st.info(f"🏷️ **{cat_choice}** require unique Item IDs for tracking")
+    else:
+        st.success(f"📦 **{cat_choice}** - Bulk item (quantities will be added together automatically)")
+    
+    st.markdown("---")
+    
+    # ── STEP 2: Add Item Form ──────────────────────────────────────────────────
+    with st.form("add_receiving_item_form", clear_on_submit=True):
+        
+        # Dynamic Material Builder
+        material = ""
+        qty_val = 1.0
+        unit_label = "Items"
+        id_prefix = ""
+        
+        # Material Specifications Card
+        st.markdown(f"### Step 2️⃣: {category_icons.get(cat_choice, '📦')} {cat_choice} Specifications")
+        
+        with st.container():
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%); 
+                            padding: 24px; border-radius: 12px; border-left: 4px solid #0284c7;">
+            """, unsafe_allow_html=True)
+            
+            if cat_choice == "Coils":
+                col1, col2 = st.columns(2)
+                with col1:
+                    texture = st.radio("🎨 Texture", ["Stucco", "Smooth"], horizontal=True, key="coil_texture")
+                    metal = st.radio("🔩 Metal Type", ["Aluminum", "Stainless Steel"], horizontal=True, key="coil_metal")
+                with col2:
+                    gauge = st.selectbox("📏 Gauge", [".010", ".016", ".020", ".024", ".032", "Other"], key="coil_gauge")
+                    if gauge == "Other":
+                        gauge = st.text_input("Custom Gauge", placeholder="e.g. .040", key="coil_custom_gauge")
+                
+                clean_gauge = gauge.replace('.', '')
+                texture_code = "SMP" if texture == "Smooth" else "STP"
+                metal_code = "AL" if metal == "Aluminum" else "SST"
+                
+                material = f"{texture} {metal} Coil - {gauge} Gauge"
+                qty_val = st.number_input("📐 Footage per Coil", min_value=0.1, value=3000.0, key="coil_footage")
+                unit_label = "Coils"
+                
+                id_prefix = f"Coil-{metal_code}-{clean_gauge}-{texture_code}"
+            
+            elif cat_choice == "Rolls":
+                col1, col2 = st.columns(2)
+                with col1:
+                    roll_type = st.radio("🗞️ Roll Type", ["Regular", "RPR (Reinforced)"], horizontal=True, key="roll_type")
+                    texture = st.radio("🎨 Texture", ["Stucco", "Smooth"], horizontal=True, key="roll_texture")
+                    metal = st.radio("🔩 Metal Type", ["Aluminum", "Stainless Steel"], horizontal=True, key="roll_metal")
+                with col2:
+                    gauge = st.selectbox("📏 Gauge", [".016", ".020", ".024", ".032", "Other"], key="roll_gauge")
+                    if gauge == "Other":
+                        gauge = st.text_input("Custom Gauge", placeholder="e.g. .040", key="roll_custom_gauge")
+                
+                clean_gauge = gauge.replace('.', '')
+                texture_code = "SMP" if texture == "Smooth" else "STP"
+                metal_code = "AL" if metal == "Aluminum" else "SST"
+                roll_type_code = "RPR-" if roll_type == "RPR (Reinforced)" else ""
+                
+                material = f"{texture} {metal} {roll_type_code}Roll - {gauge} Gauge"
+                qty_val = st.number_input("📐 Footage per Roll", min_value=0.1, value=100.0, key="roll_footage")
+                unit_label = "Rolls"
+                
+                id_prefix = f"Roll-{roll_type_code}{metal_code}-{clean_gauge}-{texture_code}"
+            
+            elif cat_choice == "Elbows":
+                col1, col2 = st.columns(2)
+                with col1:
+                    angle = st.radio("📐 Angle", ["90°", "45°", "Other"], horizontal=True, key="elbow_angle")
+                    if angle == "Other":
+                        angle = st.text_input("Custom Angle", placeholder="e.g. 22.5°", key="elbow_custom_angle")
+                    size_num = st.number_input("🔢 Size Number", min_value=1, max_value=60, value=1, key="elbow_size")
+                with col2:
+                    metal = st.radio("🔩 Metal Type", ["Aluminum", "Stainless Steel", "Galvanized", "Other"], key="elbow_metal")
+                
+                material = f"{angle} Elbow - Size #{size_num} - {metal}"
+                qty_val = st.number_input("🔢 Quantity (pieces)", min_value=1, value=1, step=1, key="elbow_qty")
+                unit_label = "Pieces"
+            
+            elif cat_choice == "Fab Straps":
+                col1, col2 = st.columns(2)
+                with col1:
+                    gauge = st.selectbox("📏 Gauge", [".015", ".020"], key="strap_gauge")
+                    size_num = st.number_input("🔢 Size Number", min_value=1, max_value=50, value=1, key="strap_size")
+                with col2:
+                    metal = st.radio("🔩 Metal Type", ["Aluminum", "Stainless Steel", "Other"], key="strap_metal")
+                
+                material = f"Fab Strap {gauge} - #{size_num} - {metal}"
+                qty_val = st.number_input("🔢 Quantity (bundles)", min_value=1, value=1, step=1, key="strap_qty")
+                unit_label = "Bundles"
+            
+            elif cat_choice == "Mineral Wool":
+                col1, col2 = st.columns(2)
+                with col1:
+                    pipe_size = st.selectbox("🔧 Pipe Size", ["1 in", "2 in", "3 in", "4 in", "Other"], key="mw_pipe")
+                    if pipe_size == "Other":
+                        pipe_size = st.text_input("Custom Pipe Size", key="mw_custom_pipe")
+                with col2:
+                    thickness = st.selectbox("📏 Thickness", ["0.5 in", "1 in", "1.5 in", "2 in", "Other"], key="mw_thick")
+                    if thickness == "Other":
+                        thickness = st.text_input("Custom Thickness", key="mw_custom_thick")
+                
+                material = f"Mineral Wool - Pipe Size: {pipe_size} - Thickness: {thickness}"
+                qty_val = st.number_input("🔢 Quantity (sections)", min_value=1, value=1, step=1, key="mw_qty")
+                unit_label = "Sections"
+            
+            elif cat_choice == "Fiberglass Insulation":
+                col1, col2 = st.columns(2)
+                with col1:
+                    form_type = st.radio("📦 Form", ["Rolls", "Batts", "Pipe Wrap", "Other"], key="fg_form")
+                    thickness = st.selectbox("📏 Thickness", ["0.25 in", "0.5 in", "1 in", "1.5 in", "2 in", "Other"], key="fg_thick")
+                    if thickness == "Other":
+                        thickness = st.text_input("Custom Thickness", placeholder="e.g. 3 in", key="fg_custom_thick")
+                with col2:
+                    sq_ft_per = st.number_input("📐 Sq Ft per item", min_value=1.0, value=150.0, key="fg_sqft")
+                
+                material = f"Fiberglass {form_type} - {thickness} Thickness"
+                qty_val = st.number_input("🔢 Quantity", min_value=1, value=1, step=1, key="fg_qty")
+                unit_label = form_type
+            
+            elif cat_choice == "Wing Seals":
+                col1, col2 = st.columns(2)
+                with col1:
+                    seal_type = st.radio("🔐 Type", ["Open", "Closed"], horizontal=True, key="ws_type")
+                    size = st.radio("📏 Size", ["1/2 in", "3/4 in"], horizontal=True, key="ws_size")
+                    gauge = st.selectbox("📐 Gauge", [".028", ".032", "Other"], key="ws_gauge")
+                    if gauge == "Other":
+                        gauge = st.text_input("Custom Gauge", key="ws_custom_gauge")
+                with col2:
+                    grooves = st.radio("〰️ Grooves", ["With Grooves (Center)", "Without Grooves"], key="ws_grooves")
+                    joint_pos = st.radio("📍 Joint Position", ["Bottom", "Top", "N/A"], key="ws_joint")
+                
+                material = f"{seal_type} Wing Seal - {size} - {gauge} Gauge - {grooves} - Joint at {joint_pos}"
+                qty_val = st.number_input("🔢 Quantity (pieces)", min_value=1, value=1000, step=100, key="ws_qty")
+                unit_label = "Pieces"
+            
+            elif cat_choice == "Wire":
+                col1, col2 = st.columns(2)
+                with col1:
+                    gauge = st.selectbox("📏 Gauge", ["14", "16", "18", "Other"], key="wire_gauge")
+                    if gauge == "Other":
+                        gauge = st.text_input("Custom Gauge", key="wire_custom_gauge")
+                with col2:
+                    footage_per_roll = st.number_input("📐 Footage per Roll (optional)", min_value=0.0, value=0.0, key="wire_footage")
+                
+                material = f"Wire - {gauge} Gauge"
+                qty_val = st.number_input("🔢 Number of Rolls", min_value=1, value=1, step=1, key="wire_rolls")
+                unit_label = "Rolls"
+            
+            elif cat_choice == "Banding":
+                col1, col2 = st.columns(2)
+                with col1:
+                    osc_type = st.radio("🌀 Type", ["Oscillated", "Non-Oscillated"], key="band_osc")
+                    size = st.radio("📏 Size", ["3/4 in", "1/2 in"], key="band_size")
+                with col2:
+                    gauge = st.selectbox("📐 Gauge", [".015", ".020"], key="band_gauge")
+                    core = st.radio("⚙️ Core", ["Metal Core", "Non-Metal Core"], key="band_core")
+                
+                material = f"{osc_type} Banding - {size} - {gauge} Gauge - {core}"
+                qty_val = st.number_input("📐 Footage per Roll", min_value=0.1, value=100.0, key="band_footage")
+                unit_label = "Rolls"
+            
+            elif cat_choice == "Other":
+                cat_choice = st.text_input("📝 New Category Name", placeholder="e.g. Accessories", key="other_cat")
+                material = st.text_input("📦 Material Description", placeholder="e.g. Custom Gaskets", key="other_mat")
+                qty_val = st.number_input("🔢 Qty/Footage per item", min_value=0.1, value=1.0, key="other_qty")
+                unit_label = st.text_input("🏷️ Unit Label", value="Units", key="other_unit")
+            
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Quantity & Storage
+        st.markdown("### Step 3️⃣: 📦 Quantity & Storage")
+        
+        with st.container():
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%); 
+                            padding: 24px; border-radius: 12px; border-left: 4px solid #16a34a;">
+            """, unsafe_allow_html=True)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if is_serialized:
+                    item_count = st.number_input(
+                        f"📦 How many {unit_label}?", 
+                        min_value=1, value=1, step=1,
+                        key="item_count_serialized"
+                    )
+                    total_added = item_count * qty_val
+                    st.success(f"**📊 Total:** {item_count} {unit_label.lower()} ({total_added:.1f} ft)")
+                else:
+                    # For non-serialized, qty_val IS the quantity
+                    item_count = 1  # Always 1 "batch"
+                    total_added = qty_val
+                    st.success(f"**📊 Total:** {total_added:.0f} {unit_label.lower()}")
+            
+            with col2:
+                loc_type = st.radio("🏢 Storage Type", ["Rack System", "Floor / Open Space"], horizontal=True, key="storage_type_radio")
+            
+            # Storage location input
+            if loc_type == "Rack System":
+                subcol1, subcol2, subcol3 = st.columns(3)
+                bay = subcol1.number_input("🅱️ Bay", min_value=1, value=1, key="rack_bay")
+                sec = subcol2.selectbox("🔤 Section", list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), key="rack_sec")
+                lvl = subcol3.number_input("⬆️ Level", min_value=1, value=1, key="rack_lvl")
+                gen_loc = f"{bay}{sec}{lvl}"
+            else:
+                subcol1, subcol2, subcol3 = st.columns(3)
+                bay = subcol1.number_input("🅱️ Bay", min_value=1, value=1, key="floor_bay")
+                floor_options = [f"Floor {letter}" for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
+                floor_selection = subcol2.selectbox("🔤 Floor Section", floor_options, key="floor_sec")
+                lvl = subcol3.number_input("⬆️ Level", min_value=1, value=1, key="floor_lvl")
+                gen_loc = f"{bay}-{floor_selection}-{lvl}"
+            
+            st.info(f"📍 **Location:** {gen_loc}")
+            
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # ── STEP 4: ID Generation (Only for Serialized Items) ──────────────────
+        id_list = []
+        sequence_prefix = None
+        
+        if is_serialized:
+            st.markdown("### Step 4️⃣: 🏷️ Item Identification")
+            
+            with st.container():
+                st.markdown("""
+                    <div style="background: linear-gradient(135deg, #fdf4ff 0%, #fae8ff 100%); 
+                                padding: 24px; border-radius: 12px; border-left: 4px solid #9333ea;">
+                """, unsafe_allow_html=True)
+                
+                st.info(f"💡 **Suggested format:** `{id_prefix}-[NUMBER]` (e.g., {id_prefix}-01)")
+                
+                if item_count == 1:
+                    custom_id = st.text_input(
+                        "🏷️ Item ID",
+                        value="",
+                        placeholder=f"e.g., {id_prefix}-01",
+                        key="custom_single_id",
+                        help="Enter any ID you want. Must be unique."
+                    )
+                    id_list = [custom_id.strip()] if custom_id.strip() else []
+                else:
+                    id_method = st.radio(
+                        "How do you want to assign IDs?",
+                        ["Sequential (auto-increment)", "Manual (enter each)"],
+                        horizontal=True,
+                        key="id_method"
+                    )
+                    
+                    if id_method == "Sequential (auto-increment)":
+                        base_id = st.text_input(
+                            "🏷️ Base ID",
+                            value=id_prefix,
+                            placeholder="e.g., Coil-AL-016-STP",
+                            key="base_id_input"
+                        ).strip()
+                        
+                        # Numbers are reserved atomically when the line is added to the cart
+                        sequence_prefix = base_id
+                        next_num = peek_next_item_number(base_id, safe_df)
+                        id_list = format_item_ids(base_id, next_num, item_count)
+                        
+                        st.markdown("**Preview IDs:**")
+                        preview_text = ", ".join(id_list[:5])
+                        if len(id_list) > 5:
+                            preview_text += f", ... ({len(id_list)} total)"
+                        st.code(preview_text)
+                        st.caption("🔒 Next free numbers for this Base ID are reserved when you add to cart, so two receivers can't collide.")
+                    
+                    else:
+                        st.markdown(f"Enter {item_count} IDs (one per line):")
+                        manual_ids = st.text_area(
+                            "🏷️ Item IDs (one per line)",
+                            value="",
+                            height=150,
+                            placeholder=f"Example:\n{id_prefix}-01\n{id_prefix}-02\n{id_prefix}-03",
+                            key="manual_ids_input"
+                        )
+                        id_list = [line.strip() for line in manual_ids.strip().split('\n') if line.strip()]
+                        
+                        if id_list and len(id_list) != item_count:
+                            st.warning(f"⚠️ You entered {len(id_list)} IDs but specified {item_count} items.")
+                
+                # Validation for manually entered IDs (reserved ranges are checked when added to cart)
+                if id_list and not sequence_prefix:
+                    # Check duplicates within list
+                    seen_ids = set()
+                    duplicates_in_list = {id for id in id_list if id in seen_ids or seen_ids.add(id)}
+                    if duplicates_in_list:
+                        st.error(f"❌ Duplicate IDs in your list: {duplicates_in_list}")
+                    
+                    # Check against existing inventory
+                    if safe_df is not None and not safe_df.empty:
+                        existing_ids = set(safe_df['Item_ID'])
+                        clashing_ids = [id for id in id_list if id in existing_ids]
+                        
+                        if clashing_ids:
+                            st.error(f"❌ **These IDs already exist:**")
+                            for clash_id in clashing_ids[:5]:
+                                existing_item = safe_df[safe_df['Item_ID'] == clash_id].iloc[0]
+                                st.markdown(f"- `{clash_id}` → {existing_item['Material']} at {existing_item['Location']}")
+                            if len(clashing_ids) > 5:
+                                st.markdown(f"- ... and {len(clashing_ids) - 5} more")
+                
+                st.markdown("</div>", unsafe_allow_html=True)
+        else:
+            st.markdown("### Step 4️⃣: ✅ Ready to Add")
+            st.success("📦 **Bulk item** - Will be added to existing stock or create new entry automatically. No ID conflicts possible!")
+        
+        # Add to Cart Button
+        add_item = st.form_submit_button(
+            "🛒 Add to Receiving Cart", 
+            use_container_width=True, 
+            type="primary"
+        )
+
+    # ── Process Add to Cart ─────────────────────────────────────────────────────
+    if add_item:
+        if not current_po.strip():
+            st.error("⚠️ Please enter a Purchase Order Number first!")
+        elif not operator.strip():
+            st.error("⚠️ Please enter the Receiving Operator name!")
+        elif not material:
+            st.error("⚠️ Material details are required!")
+        elif is_serialized and not id_list:
+            st.error("⚠️ Please enter Item ID(s) for Coils/Rolls!")
+        elif is_serialized and len(id_list) != item_count:
+            st.error(f"⚠️ ID count mismatch: You entered {len(id_list)} IDs but specified {item_count} items.")
+        else:
+            # Validation for serialized items only
+            has_errors = False
+            
+            if is_serialized and sequence_prefix:
+                try:
+                    id_list = reserve_item_ids(sequence_prefix, item_count)
+                except Exception as e:
+                    st.error(f"❌ Could not reserve IDs for {sequence_prefix}: {e}")
+                    has_errors = True
+                else:
+                    # Backstop for IDs that reached inventory without going through the counter
+                    if safe_df is not None and not safe_df.empty:
+                        existing_ids = set(safe_df['Item_ID'])
+                        clashing_ids = [id for id in id_list if id in existing_ids]
+                        if clashing_ids:
+                            st.error(f"❌ Reserved IDs already exist: {clashing_ids[:5]}{'...' if len(clashing_ids) > 5 else ''}")
+                            has_errors = True
+            elif is_serialized:
+                # Check duplicates within list
+                seen_ids = set()
+                duplicates_in_list = {id for id in id_list if id in seen_ids or seen_ids.add(id)}
+                if duplicates_in_list:
+                    st.error(f"❌ Duplicate IDs: {duplicates_in_list}")
+                    has_errors = True
+                
+                # Check against existing inventory
+                if safe_df is not None and not safe_df.empty:
+                    existing_ids = set(safe_df['Item_ID'])
+                    clashing_ids = [id for id in id_list if id in existing_ids]
+                    if clashing_ids:
+                        st.error(f"❌ IDs already exist: {clashing_ids[:5]}{'...' if len(clashing_ids) > 5 else ''}")
+                        has_errors = True
+            
+            if not has_errors:
+                st.session_state.receiving_cart.append({
+                    'category': cat_choice,
+                    'material': material,
+                    'qty_val': qty_val,
+                    'item_count': item_count,
+                    'total_added': total_added,
+                    'unit_label': unit_label,
+                    'location': gen_loc,
+                    'is_serialized': is_serialized,
+                    'id_list': id_list if is_serialized else [],
+                    'id_preview': id_list[0] if id_list else f"{cat_choice.upper()}-BULK",
+                })
+                
+                if is_serialized:
+                    st.success(f"✅ Added: {item_count} × {material}")
+                    st.info(f"🏷️ IDs: {', '.join(id_list[:3])}{'...' if len(id_list) > 3 else ''}")
+                else:
+                    st.success(f"✅ Added: {total_added:.0f} {unit_label.lower()} of {material}")
+                st.rerun()
+    
+    # ── Packing List Import ─────────────────────────────────────────────────────
+    with st.expander("📄 Import Supplier Packing List (CSV / Excel)", expanded=False):
+        st.caption(f"Columns: {', '.join(PACKING_LIST_COLUMNS)}. Item_ID is required for Coils/Rolls (one row per item); Quantity is footage per item for Coils/Rolls and total received for bulk items.")
+        packing_file = st.file_uploader("Packing list", type=["csv", "xlsx"], key="packing_list_upload")
+
+        if packing_file is not None:
+            try:
+                if packing_file.name.lower().endswith(".xlsx"):
+                    raw_packing_df = pd.read_excel(packing_file, dtype={"Item_ID": str})
+                else:
+                    raw_packing_df = pd.read_csv(packing_file, dtype={"Item_ID": str})
+
+                cart_ids = [i for line in st.session_state.receiving_cart for i in line['id_list']]
+                checked_df, errors_df = validate_packing_list(
+                    raw_packing_df, safe_df, list(cat_mapping.values()), SERIALIZED_CATEGORIES, cart_ids
+                )
+
+                col_rows, col_new, col_top, col_bad = st.columns(4)
+                col_rows.metric("Rows", len(checked_df))
+                col_new.metric("New Items", int((checked_df["Change"] == "New item").sum()))
+                col_top.metric("Top-ups", int((checked_df["Change"] == "Add to existing").sum()))
+                col_bad.metric("Rejected", len(errors_df))
+
+                if not errors_df.empty:
+                    st.error(f"❌ {len(errors_df)} row(s) failed validation and will be skipped")
+                    st.dataframe(errors_df[["Row", "Category", "Material", "Item_ID", "Quantity", "Error"]], use_container_width=True, hide_index=True)
+
+                st.markdown("**Preview**")
+                st.dataframe(
+                    checked_df[["Row", "Change", "Category", "Material", "Item_ID", "Quantity", "Current", "Location"]],
+                    use_container_width=True, hide_index=True
+                )
+
+                valid_count = len(checked_df) - len(errors_df)
+                if st.button(f"🛒 Add {valid_count} Valid Row(s) to Cart", disabled=valid_count == 0, use_container_width=True):
+                    if not current_po.strip():
+                        st.error("⚠️ Please enter a Purchase Order Number first!")
+                    else:
+                        new_lines = packing_list_to_cart(checked_df, SERIALIZED_CATEGORIES)
+                        st.session_state.receiving_cart.extend(new_lines)
+                        st.success(f"✅ Added {len(new_lines)} cart line(s) from {packing_file.name}")
+                        st.rerun()
+            except Exception as e:
+                st.error(f"❌ Could not read packing list: {e}")
+
+    # ── Display Receiving Cart ──────────────────────────────────────────────────
+    if st.session_state.receiving_cart:
+        st.markdown("---")
+        st.markdown("### 🛒 Current Receiving Batch")
+        st.info(f"📋 **PO:** {st.session_state.current_po} | 👤 **Operator:** {st.session_state.receiving_operator}")
+        
+        for idx, item in enumerate(st.session_state.receiving_cart):
+            col_item, col_remove = st.columns([5, 1])
+            
+            with col_item:
+                if item['is_serialized']:
+                    st.write(f"**{idx+1}.** {item['item_count']} × {item['material']} = **{item['total_added']:.1f} ft** → 📍 {item['location']}")
+                    if item['id_list']:
+                        st.caption(f"🏷️ IDs: {', '.join(item['id_list'][:3])}{'...' if len(item['id_list']) > 3 else ''}")
+                    else:
+                        st.caption(f"🏷️ IDs from {item['id_preview']} (reserved when received)")
+                else:
+                    st.write(f"**{idx+1}.** {item['total_added']:.0f} {item['unit_label'].lower()} of {item['material']} → 📍 {item['location']}")
+            
+            with col_remove:
+                if st.button("🗑️", key=f"remove_receiving_{idx}"):
+                    st.session_state.receiving_cart.pop(idx)
+                    st.rerun()
+        
+        st.markdown("---")
+        
+        col_process, col_clear = st.columns(2)
+
+        with col_process:
+            if st.button("✅ Process All Items to Inventory", type="primary", use_container_width=True):
+                if not st.session_state.current_po.strip() or not st.session_state.receiving_operator.strip():
+                    st.error("⚠️ PO Number and Operator are required!")
+                else:
+                    has_clashes = False
+
+                    # Draft PO lines get their Item IDs now that the stock is actually arriving
+                    try:
+                        reserve_pending_ids(st.session_state.receiving_cart)
+                    except Exception as e:
+                        st.error(f"❌ Could not reserve Item IDs: {e}")
+                        has_clashes = True
+
+                    # Final validation for SERIALIZED items ONLY
+                    all_new_ids = []
+                    for item in st.session_state.receiving_cart:
+                        if item['is_serialized']:  # Only check serialized items
+                            all_new_ids.extend(item['id_list'])
+                    
+                    if all_new_ids:  # Only check if there are serialized items
+                        try:
+                            response = supabase.table("inventory").select("Item_ID").in_("Item_ID", all_new_ids).execute()
+                            if response.data:
+                                existing_clashes = [row['Item_ID'] for row in response.data]
+                                st.error(f"❌ **These IDs already exist:**")
+                                for clash in existing_clashes[:5]:
+                                    st.write(f"- `{clash}`")
+                                has_clashes = True
+                        except:
+                            pass
+                    
+                    if not has_clashes:
+                        with st.spinner("☁️ Processing to Cloud Database..."):
+                            try:
+                                items_added = commit_receiving_cart(
+                                    st.session_state.receiving_cart,
+                                    st.session_state.current_po,
+                                    st.session_state.receiving_operator
+                                )
+                                
+                                st.cache_data.clear()
+                                st.session_state.force_refresh = True
+                                
+                                st.success(f"✅ Successfully processed {items_added} item(s) for PO: {st.session_state.current_po}!")
+                                st.balloons()
+                                
+                                st.session_state.receiving_cart = []
+                                time.sleep(1)
+                                st.rerun()
+                            
+                            except Exception as e:
+                                st.error(f"❌ Failed to process: {e}")
+                                import traceback
+                                st.code(traceback.format_exc())
+        with col_clear:
+            if st.button("🗑️ Clear Cart", use_container_width=True):
+                st.session_state.receiving_cart = []
+                st.rerun()
+    
+    elif not st.session_state.receiving_cart:
+        st.info("👆 Add items to start building your receiving batch")
+    
+    # ══════════════════════════════════════════════════════════════════════════════
+    # REVERSE RECEIVED ORDER SECTION
+    # ══════════════════════════════════════════════════════════════════════════════
+    st.markdown("---")
+    st.markdown("""
+        <div style="text-align: center; padding: 20px 0;">
+            <h2 style="color: #dc2626; margin: 0;">🔄 Reverse Received Order</h2>
+            <p style="color: #64748b; margin-top: 8px;">Undo items received under a specific Purchase Order</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    with st.expander("🔄 Reverse a Received PO", expanded=False):
+        st.warning("⚠️ **Use with caution!** This will remove items from inventory.")
+        
+        # Input PO number to reverse
+        reverse_po = st.text_input(
+            "📄 Enter PO Number to Reverse",
+            placeholder="e.g. PO-2026-001",
+            key="reverse_po_input"
+        )
+        
+        if reverse_po.strip():
+            # Fetch items with this PO
+            try:
+                response = supabase.table("inventory").select("*").eq("Purchase_Order_Num", reverse_po.strip()).execute()
+                
+                if not response.data:
+                    st.info(f"📭 No items found for PO: {reverse_po}")
+                else:
+                    po_items = response.data
+                    po_df = pd.DataFrame(po_items)
+                    
+                    st.markdown(f"### 📋 Items under PO: {reverse_po}")
+                    st.info(f"Found **{len(po_items)}** item(s)")
+                    
+                    # Summary by category
+                    summary = po_df.groupby('Category').agg({
+                        'Footage': 'sum',
+                        'Item_ID': 'count'
+                    }).reset_index()
+                    summary.columns = ['Category', 'Total Footage/Qty', 'Item Count']
+                    
+                    st.dataframe(summary, use_container_width=True, hide_index=True)
+                    
+                    # Show details
+                    with st.expander("📋 View All Items"):
+                        st.dataframe(
+                            po_df[['Item_ID', 'Category', 'Material', 'Footage', 'Location']],
+                            use_container_width=True,
+                            hide_index=True
+                        )
+                    
+                    st.markdown("---")
+                    
+                    # Reversal options
+                    reversal_type = st.radio(
+                        "What do you want to reverse?",
+                        ["All items under this PO", "Select specific items"],
+                        key="reversal_type"
+                    )
+                    
+                    items_to_remove = []
+                    
+                    if reversal_type == "All items under this PO":
+                        items_to_remove = [item['Item_ID'] for item in po_items]
+                        st.warning(f"⚠️ This will remove **{len(items_to_remove)}** item(s) from inventory")
+                    
+                    else:
+                        # Multi-select specific items
+                        item_options = [f"{item['Item_ID']} - {item['Material'][:30]}... ({item['Footage']})" for item in po_items]
+                        selected_items = st.multiselect(
+                            "Select items to remove",
+                            item_options,
+                            key="select_items_to_remove"
+                        )
+                        
+                        items_to_remove = [opt.split(" - ")[0] for opt in selected_items]
+                        
+                        if items_to_remove:
+                            st.warning(f"⚠️ This will remove **{len(items_to_remove)}** item(s)")
+                    
+                    if items_to_remove:
+                        reversal_reason = st.text_input(
+                            "Reason for Reversal *",
+                            placeholder="e.g. Wrong PO, duplicate entry, returned to supplier",
+                            key="reversal_reason_input"
+                        )
+                        
+                        confirm_reversal = st.checkbox(
+                            f"I confirm I want to remove {len(items_to_remove)} item(s) from inventory",
+                            key="confirm_po_reversal"
+                        )
+                        
+                        if st.button("🗑️ Reverse Selected Items", type="primary", use_container_width=True):
+                            if not reversal_reason.strip():
+                                st.error("⚠️ Please provide a reason for the reversal")
+                            elif not confirm_reversal:
+                                st.error("⚠️ Please confirm the reversal")
+                            else:
+                                with st.spinner("Reversing..."):
+                                    try:
+                                        removed_count = 0
+                                        
+                                        for item_id in items_to_remove:
+                                            # Get item details for logging
+                                            item_data = next((item for item in po_items if item['Item_ID'] == item_id), None)
+                                            
+                                            if item_data:
+                                                # Delete from inventory
+                                                supabase.table("inventory").delete().eq("Item_ID", item_id).execute()
+                                                removed_count += 1
+                                                
+                                                # Log the reversal
+                                                log_entry = {
+                                                    "Item_ID": item_id,
+                                                    "Action": "Receiving Reversed",
+                                                    "User": st.session_state.get('username', 'Admin'),
+                                                    "Details": f"Reversed PO: {reverse_po} | {item_data['Material'][:30]} | {item_data['Footage']} | Reason: {reversal_reason}"
+                                                }
+                                                audit_writer.log(log_entry)
+                                        
+                                        # Log overall reversal
+                                        summary_log = {
+                                            "Item_ID": reverse_po,
+                                            "Action": "PO Reversal",
+                                            "User": st.session_state.get('username', 'Admin'),
+                                            "Details": f"Reversed {removed_count} items from PO {reverse_po}. Reason: {reversal_reason}"
+                                        }
+                                        audit_writer.log(summary_log)
+                                        
+                                        st.success(f"✅ Reversed {removed_count} item(s) from PO: {reverse_po}")
+                                        st.balloons()
+                                        
+                                        st.cache_data.clear()
+                                        st.session_state.force_refresh = True
+                                        time.sleep(1)
+                                        st.rerun()
+                                        
+                                    except Exception as e:
+                                        st.error(f"❌ Error: {e}")
+            
+            except Exception as e:
+                st.error(f"Error fetching PO items: {e}")
+    
+    # ══════════════════════════════════════════════════════════════════════════════
+    # RECEIPT REPORT SECTION
+    # ══════════════════════════════════════════════════════════════════════════════
+    st.markdown("---")
+    st.markdown("""
+        <div style="text-align: center; padding: 20px 0;">
+            <h2 style="color: #1e40af; margin: 0;">📄 Receipt Report Generator</h2>
+            <p style="color: #64748b; margin-top: 8px;">Generate PDF reports for items received under specific Purchase Orders</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    with st.container():
+        st.markdown("""
+            <div style="background: linear-gradient(135deg, #fff7ed 0%, #ffedd5 100%); 
+                        padding: 24px; border-radius: 12px; border: 2px solid #fb923c;">
+        """, unsafe_allow_html=True)
+        
+        with st.form("export_report_form"):
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                report_po_num = st.text_input(
+                    "📄 Purchase Order Number",
+                    placeholder="e.g. PO-2026-001",
+                    key="report_po"
+                )
+            
+            with col2:
+                export_mode = st.radio(
+                    "📤 Action",
+                    ["Download Only", "Download & Email"],
+                    help="Choose whether to download or also email to admin"
+                )
+            
+            submitted_report = st.form_submit_button(
+                "🚀 Generate PDF Report", 
+                use_container_width=True, 
+                type="primary"
+            )
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    if submitted_report and report_po_num.strip():
+        with st.spinner(f"🔍 Fetching items for PO: {report_po_num}..."):
+            try:
+                response = supabase.table("inventory").select("*").eq("Purchase_Order_Num", report_po_num.strip()).execute()
+                
+                if not response.data:
+                    st.warning(f"⚠️ No items found for PO: {report_po_num}")
+                else:
+                    report_df = pd.DataFrame(response.data)
+                    operator = st.session_state.get('username', 'Operator')
+                    
+                    # Same PO contents and operator -> the PDF built last time
+                    pdf_bytes = get_artifact_cache().get_or_build(
+                        "receipt_pdf",
+                        {"po": report_po_num.strip(), "operator": operator},
+                        lambda: generate_receipt_pdf(po_num=report_po_num, df=report_df, operator=operator),
+                        data_version=compute_data_version(report_df, None),
+                    )
+                    pdf_buffer = BytesIO(pdf_bytes)
+                    
+                    file_name = f"Receipt_{report_po_num.replace(' ', '_')}.pdf"
+                    
+                    st.download_button(
+                        label="📥 Download PDF Report",
+                        data=pdf_bytes,
+                        file_name=file_name,
+                        mime="application/pdf",
+                        key=f"dl_{report_po_num}",
+                        type="secondary"
+                    )
+                    
+                    if export_mode == "Download & Email":
+                        with st.spinner("📧 Queueing email..."):
+                            pdf_buffer.seek(0)
+                            
+                            email_success = send_receipt_email(
+                                admin_email="tmilazi@gmail.com",
+                                po_num=report_po_num,
+                                pdf_buffer=pdf_buffer,
+                                operator=st.session_state.get('username', 'Operator')
+                            )
+                            
+                            if email_success:
+                                st.success(f"✅ PDF queued for email to admin!")
+                            else:
+                                st.warning("⚠️ PDF generated but email could not be queued.")
+                    else:
+                        st.success("✅ PDF generated!")
+                        
+            except Exception as e:
+                st.error(f"❌ Error: {e}")
@@ -0,0 +1,86 @@
+"""Admin-only sidebar panel with timings, Supabase call metrics and cache hit rates."""
+
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse import metrics
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def render_panel(last_rerun):
+    with st.expander("⏱️ Performance", expanded=False):
+        if last_rerun:
+            c1, c2, c3 = st.columns(3)
+            c1.metric("Rerun", f"{last_rerun['seconds'] * 1000:.0f} ms")
+            c2.metric("DB calls", last_rerun['supabase_calls'])
+            c3.metric("Cache hits", f"{last_rerun['cache_hits']}/{last_rerun['cache_hits'] + last_rerun['cache_misses']}")
+            if last_rerun['sections']:
+                st.caption("This rerun")
+                st.dataframe(
+                    pd.DataFrame(
+                        [{"Section": name, "ms": _ms(s)} for name, s in
+                         sorted(last_rerun['sections'].items(), key=lambda kv: -kv[1])]
+                    ),
+                    hide_index=True, use_container_width=True
+                )
+            if last_rerun['supabase_by_call']:
+                st.caption(f"Supabase this rerun ({last_rerun['supabase_seconds'] * 1000:.0f} ms)")
+                st.dataframe(
+                    pd.DataFrame([{"Call": call, "Count": n} for call, n in last_rerun['supabase_by_call'].items()]),
+                    hide_index=True, use_container_width=True
+                )
+
+        sections = metrics.section_stats()
+        if sections:
+            st.caption("Sections since start")
+            st.dataframe(
+                pd.DataFrame([
+                    {"Section": name, "Count": s['count'], "Mean ms": _ms(s['sum'] / s['count']),
+                     "p50 ms": _ms(s['p50']), "p95 ms": _ms(s['p95']), "Max ms": _ms(s['max'])}
+                    for name, s in sections.items()
+                ]),
+                hide_index=True, use_container_width=True
+            )
+
+        calls = metrics.supabase_stats()
+        if calls:
+            st.caption("Supabase since start")
+            st.dataframe(
+                pd.DataFrame([
+                    {"Table": c['table'], "Op": c['operation'], "Count": c['count'], "Errors": c['errors'],
+                     "Mean ms": _ms(c['sum'] / c['count']), "p50 ms": _ms(c['p50']), "p95 ms": _ms(c['p95'])}
+                    for c in calls
+                ]),
+                hide_index=True, use_container_width=True
+            )
+
+        caches = metrics.cache_stats()
+        if caches:
+            st.caption("Cache hit rates")
+            st.dataframe(
+                pd.DataFrame([
+                    {"Cache": name, "Hits": c['hits'], "Misses": c['misses'],
+                     "Hit %": None if c['hit_rate'] is None else round(c['hit_rate'] * 100, 1)}
+                    for name, c in caches.items()
+                ]),
+                hide_index=True, use_container_width=True
+            )
+
+        components = metrics.component_stats()
+        if components:
+            st.caption("Background components")
+            for name, stats in components.items():
+                st.markdown(f"**{name}**: " + ", ".join(f"{k}={v}" for k, v in stats.items()))
+
+        d1, d2 = st.columns(2)
+        d1.download_button(
+            "JSON", metrics.export_json(last_rerun), file_name="warehouse_pulse_metrics.json",
+            mime="application/json", use_container_width=True, key="perf_export_json"
+        )
+        d2.download_button(
+            "Prometheus", metrics.export_prometheus(), file_name="warehouse_pulse_metrics.prom",
+            mime="text/plain", use_container_width=True, key="perf_export_prom"
+        )
@@ -0,0 +1,1103 @@
+"""Production Log tab."""
+
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse.catalog import SIZE_DISPLAY
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.client import supabase
+from warehouse_pulse.domain.production import calculate_pool_capacity, clean_pool, get_pool_details, process_pool_deduction
+from warehouse_pulse.mail import send_production_pdf
+from warehouse_pulse.reporting.pdf import generate_production_pdf
+
+
+# ── TAB 2: Production Log ────────────────────────────────────────────────────────
+def render(df, df_audit):
+    st.subheader("📋 Production Log - Multi-Size Orders with Coil Pooling")
+
+    # ══════════════════════════════════════════════════════════════════════════════
+    # MST DISPLAY HELPER (audit rows are stamped in UTC by audit_writer)
+    # ══════════════════════════════════════════════════════════════════════════════
+    def get_mst_display():
+        """Get formatted display timestamp in MST"""
+        from datetime import timezone, timedelta
+        utc_now = datetime.now(timezone.utc)
+        mst_offset = timedelta(hours=-7)
+        mst_now = utc_now + mst_offset
+        return mst_now.strftime('%B %d, %Y at %I:%M %p MST')
+
+    # Guard rails
+    if df.empty:
+        st.warning("⚠️ No inventory data found. Please add items first.")
+
+    # Safe column name handling
+    category_col = next((c for c in df.columns if c.lower() == 'category'), None)
+    if not category_col:
+        st.error("Column 'Category' not found in inventory data.")
+
+    # Initialize session state
+    if "coil_lines" not in st.session_state:
+        st.session_state.coil_lines = [{
+            "display_size": "#2", 
+            "pieces": 0, 
+            "waste": 0.0, 
+            "pool": [], 
+            "use_custom": False, 
+            "custom_inches": 12.0,
+            "custom_feet": 1.0,
+            "custom_unit": "inches"
+        }]
+    if "roll_lines" not in st.session_state:
+        st.session_state.roll_lines = [{
+            "display_size": "#2", 
+            "pieces": 0, 
+            "waste": 0.0, 
+            "pool": [], 
+            "use_custom": False, 
+            "custom_inches": 12.0
+        }]
+
+    # Material type toggle
+    st.markdown("### 🔧 Material Type Filter")
+    material_type = st.radio(
+        "Select texture for sources (applies to both Coils & Rolls)",
+        options=["Smooth", "Stucco"],
+        horizontal=True,
+        key="material_texture_toggle"
+    )
+
+    def filter_materials(df_subset):
+        if df_subset.empty:
+            return df_subset
+        if material_type == "Smooth":
+            return df_subset[df_subset['Material'].str.contains("Smooth", case=False, na=False) & ~df_subset['Material'].str.contains("Stucco", case=False, na=False)]
+        elif material_type == "Stucco":
+            return df_subset[df_subset['Material'].str.contains("Stucco", case=False, na=False)]
+        return df_subset
+
+    # Get available coils and rolls - ONLY ITEMS WITH FOOTAGE > 0
+    if category_col and not df.empty:
+        available_coils = filter_materials(df[(df[category_col] == "Coils") & (df['Footage'] > 0)])
+        available_rolls = filter_materials(df[(df[category_col] == "Rolls") & (df['Footage'] > 0)])
+    else:
+        available_coils = pd.DataFrame()
+        available_rolls = pd.DataFrame()
+
+    if available_coils.empty and available_rolls.empty:
+        st.info("No available stock matching the selected texture.")
+
+    # Create option lists
+    coil_options = [f"{r['Item_ID']} | {r['Material'][:30]}... | {r['Footage']:.1f} ft" for _, r in available_coils.iterrows()] if not available_coils.empty else []
+    roll_options = [f"{r['Item_ID']} | {r['Material'][:30]}... | {r['Footage']:.1f} ft" for _, r in available_rolls.iterrows()] if not available_rolls.empty else []
+
+    # ══════════════════════════════════════════════════════════════════════════════
+    # COILS SECTION WITH POOL
+    # ══════════════════════════════════════════════════════════════════════════════
+    st.markdown("### 🌀 Coils Production")
+    
+    coil_extra = st.number_input(
+        "Extra Inch Allowance per piece (Coils)",
+        min_value=0.0, 
+        value=0.0,
+        step=0.1,
+        key="coil_extra_allowance",
+        help="Additional inches added to each piece for trim/overlap"
+    )
+
+    COIL_SIZE_OPTIONS = list(SIZE_DISPLAY.keys()) + ["Custom (Inches)", "Custom (Feet)"]
+
+    for i in range(len(st.session_state.coil_lines)):
+        line = st.session_state.coil_lines[i]
+        
+        # Ensure pool exists and clean it of depleted items
+        if "pool" not in line:
+            line["pool"] = []
+        else:
+            # Auto-clean depleted items from pool
+            cleaned_pool = clean_pool(line["pool"], available_coils)
+            if len(cleaned_pool) != len(line["pool"]):
+                st.session_state.coil_lines[i]["pool"] = cleaned_pool
+                line["pool"] = cleaned_pool
+        
+        with st.container(border=True):
+            st.markdown(f"**📦 Coil Production Line {i + 1}**")
+            
+            col1, col2, col3, col4, col5 = st.columns([2, 1.5, 1, 1, 0.4])
+            
+            with col1:
+                current_size = line.get("display_size", "#2")
+                if current_size in COIL_SIZE_OPTIONS:
+                    default_index = COIL_SIZE_OPTIONS.index(current_size)
+                else:
+                    default_index = 0
+                
+                size_selection = st.selectbox(
+                    "📐 Size",
+                    COIL_SIZE_OPTIONS,
+                    index=default_index,
+                    key=f"c_size_{i}"
+                )
+                st.session_state.coil_lines[i]["display_size"] = size_selection
+            
+            with col2:
+                if size_selection == "Custom (Inches)":
+                    custom_val = st.number_input(
+                        "📏 Inches per piece",
+                        min_value=0.1,
+                        value=float(line.get("custom_inches", 12.0)),
+                        step=0.25,
+                        key=f"c_custom_in_{i}"
+                    )
+                    st.session_state.coil_lines[i]["custom_inches"] = custom_val
+                    st.session_state.coil_lines[i]["use_custom"] = True
+                    st.session_state.coil_lines[i]["custom_unit"] = "inches"
+                    
+                elif size_selection == "Custom (Feet)":
+                    custom_val = st.number_input(
+                        "📏 Feet per piece",
+                        min_value=0.1,
+                        value=float(line.get("custom_feet", 1.0)),
+                        step=0.5,
+                        key=f"c_custom_ft_{i}"
+                    )
+                    st.session_state.coil_lines[i]["custom_feet"] = custom_val
+                    st.session_state.coil_lines[i]["custom_inches"] = custom_val * 12
+                    st.session_state.coil_lines[i]["use_custom"] = True
+                    st.session_state.coil_lines[i]["custom_unit"] = "feet"
+                else:
+                    st.session_state.coil_lines[i]["use_custom"] = False
+                    st.session_state.coil_lines[i]["custom_inches"] = SIZE_DISPLAY.get(size_selection, 12.0)
+            
+            with col3:
+                pieces_val = st.number_input(
+                    "🔢 Pieces",
+                    min_value=0,
+                    value=int(line.get("pieces", 0)),
+                    step=1,
+                    key=f"c_pcs_{i}"
+                )
+                st.session_state.coil_lines[i]["pieces"] = pieces_val
+            
+            with col4:
+                waste_val = st.number_input(
+                    "🗑️ Waste (ft)",
+                    min_value=0.0,
+                    value=float(line.get("waste", 0.0)),
+                    step=0.5,
+                    key=f"c_waste_{i}"
+                )
+                st.session_state.coil_lines[i]["waste"] = waste_val
+            
+            with col5:
+                if len(st.session_state.coil_lines) > 1:
+                    if st.button("🗑", key=f"del_coil_{i}", help="Remove line"):
+                        st.session_state.coil_lines.pop(i)
+                        st.rerun()
+            
+            # Calculate required footage
+            if pieces_val > 0:
+                if size_selection in ["Custom (Inches)", "Custom (Feet)"]:
+                    calc_inches = (st.session_state.coil_lines[i].get("custom_inches", 12.0) + coil_extra) * pieces_val
+                else:
+                    std_inches = SIZE_DISPLAY.get(size_selection, 12.0)
+                    calc_inches = (std_inches + coil_extra) * pieces_val
+                
+                production_footage = calc_inches / 12.0
+                total_footage_needed = production_footage + waste_val
+                
+                st.caption(f"📊 **Production:** {production_footage:.2f} ft + **Waste:** {waste_val:.1f} ft = **Total:** {total_footage_needed:.2f} ft")
+            else:
+                production_footage = 0
+                total_footage_needed = 0
+            
+            # ── COIL POOL SELECTOR ──────────────────────────────────────────────
+            st.markdown("---")
+            st.markdown("**🏊 Coil Pool** - Select source coils in order of deduction")
+            
+            current_pool = st.session_state.coil_lines[i].get("pool", [])
+            
+            # Pool management
+            pool_col1, pool_col2 = st.columns([3, 2])
+            
+            with pool_col1:
+                available_for_pool = [opt for opt in coil_options if opt.split(" | ")[0] not in current_pool]
+                
+                if available_for_pool:
+                    add_to_pool = st.selectbox(
+                        "➕ Add coil to pool",
+                        ["-- Select to add --"] + available_for_pool,
+                        key=f"add_pool_coil_{i}"
+                    )
+                    
+                    if add_to_pool != "-- Select to add --":
+                        if st.button("➕ Add to Pool", key=f"btn_add_pool_{i}", type="secondary"):
+                            coil_id = add_to_pool.split(" | ")[0]
+                            if "pool" not in st.session_state.coil_lines[i]:
+                                st.session_state.coil_lines[i]["pool"] = []
+                            st.session_state.coil_lines[i]["pool"].append(coil_id)
+                            st.rerun()
+                else:
+                    st.info("All available coils are in the pool")
+            
+            with pool_col2:
+                pool_capacity = calculate_pool_capacity(current_pool, available_coils)
+                
+                if total_footage_needed > 0:
+                    if pool_capacity >= total_footage_needed:
+                        st.success(f"✅ Pool: {pool_capacity:,.1f} ft")
+                        st.caption(f"Need: {total_footage_needed:,.1f} ft")
+                    else:
+                        shortage = total_footage_needed - pool_capacity
+                        st.error(f"❌ Pool: {pool_capacity:,.1f} ft")
+                        st.caption(f"Short: {shortage:,.1f} ft")
+                else:
+                    st.info(f"🏊 Pool: {pool_capacity:,.1f} ft")
+            
+            # Display current pool
+            if current_pool:
+                pool_details = get_pool_details(current_pool, available_coils)
+                
+                if pool_details:
+                    st.markdown("**📋 Current Pool (deduction order):**")
+                    
+                    for idx, item in enumerate(pool_details):
+                        pcol1, pcol2, pcol3, pcol4 = st.columns([0.3, 2.5, 1, 0.5])
+                        
+                        with pcol1:
+                            st.markdown(f"**{idx + 1}.**")
+                        
+                        with pcol2:
+                            st.markdown(f"`{item['id']}` - **{item['footage']:,.1f} ft**")
+                            st.caption(f"{item['material'][:40]}...")
+                        
+                        with pcol3:
+                            btn_col1, btn_col2 = st.columns(2)
+                            with btn_col1:
+                                if idx > 0:
+                                    if st.button("⬆️", key=f"up_{i}_{idx}", help="Move up"):
+                                        pool = st.session_state.coil_lines[i]["pool"]
+                                        pool[idx], pool[idx-1] = pool[idx-1], pool[idx]
+                                        st.rerun()
+                            with btn_col2:
+                                if idx < len(pool_details) - 1:
+                                    if st.button("⬇️", key=f"down_{i}_{idx}", help="Move down"):
+                                        pool = st.session_state.coil_lines[i]["pool"]
+                                        pool[idx], pool[idx+1] = pool[idx+1], pool[idx]
+                                        st.rerun()
+                        
+                        with pcol4:
+                            if st.button("❌", key=f"remove_pool_{i}_{idx}", help="Remove"):
+                                st.session_state.coil_lines[i]["pool"].pop(idx)
+                                st.rerun()
+                    
+                    # Pool quick actions
+                    pool_action_col1, pool_action_col2 = st.columns(2)
+                    with pool_action_col1:
+                        if st.button("🗑️ Clear Pool", key=f"clear_pool_coil_{i}"):
+                            st.session_state.coil_lines[i]["pool"] = []
+                            st.rerun()
+                    with pool_action_col2:
+                        if len(st.session_state.coil_lines) > 1:
+                            if st.button("📋 Copy to All Lines", key=f"copy_pool_coil_{i}"):
+                                for j in range(len(st.session_state.coil_lines)):
+                                    if j != i:
+                                        st.session_state.coil_lines[j]["pool"] = current_pool.copy()
+                                st.success(f"✅ Copied to {len(st.session_state.coil_lines) - 1} line(s)")
+                                st.rerun()
+                    
+                    # Deduction preview
+                    if total_footage_needed > 0 and pool_capacity >= total_footage_needed:
+                        with st.expander("👁️ Preview Deduction Sequence"):
+                            remaining = total_footage_needed
+                            st.markdown("**How footage will be deducted:**")
+                            
+                            for item in pool_details:
+                                if remaining <= 0:
+                                    st.markdown(f"- `{item['id']}`: ✅ No deduction (stays at {item['footage']:,.1f} ft)")
+                                    continue
+                                
+                                deduct = min(item['footage'], remaining)
+                                new_footage = item['footage'] - deduct
+                                status = "🔴 **DEPLETED**" if new_footage <= 0 else f"🟢 {new_footage:,.1f} ft remaining"
+                                
+                                st.markdown(f"- `{item['id']}`: **-{deduct:,.1f} ft** → {status}")
+                                remaining -= deduct
+                else:
+                    st.info("👆 Add coils to the pool above (depleted items were auto-removed)")
+            else:
+                st.info("👆 Add coils to the pool above")
+
+    # Add new coil line button
+    add_coil_col1, add_coil_col2 = st.columns([3, 1])
+    
+    with add_coil_col1:
+        if st.button("➕ Add another coil size", use_container_width=True, key="add_coil_line"):
+            last_pool = []
+            if st.session_state.coil_lines:
+                last_pool = clean_pool(st.session_state.coil_lines[-1].get("pool", []).copy(), available_coils)
+            
+            st.session_state.coil_lines.append({
+                "display_size": "#2", 
+                "pieces": 0, 
+                "waste": 0.0,
+                "pool": last_pool,
+                "use_custom": False, 
+                "custom_inches": 12.0, 
+                "custom_feet": 1.0,
+                "custom_unit": "inches"
+            })
+            st.rerun()
+    
+    with add_coil_col2:
+        if len(st.session_state.coil_lines) > 1:
+            if st.button("🔄 Sync Pools", key="sync_coil_pools", help="Copy Line 1 pool to all"):
+                first_pool = clean_pool(st.session_state.coil_lines[0].get("pool", []).copy(), available_coils)
+                for line in st.session_state.coil_lines[1:]:
+                    line["pool"] = first_pool.copy()
+                st.success("✅ All coil lines synced")
+                st.rerun()
+
+    st.divider()
+
+    # ══════════════════════════════════════════════════════════════════════════════
+    # ROLLS SECTION WITH POOL
+    # ══════════════════════════════════════════════════════════════════════════════
+    st.markdown("### 🗞️ Rolls Production")
+    
+    roll_extra = st.number_input(
+        "Extra Inch Allowance per piece (Rolls)",
+        min_value=0.0, 
+        value=0.0,
+        step=0.1,
+        key="roll_extra_allowance",
+        help="Additional inches added to each piece for trim/overlap"
+    )
+
+    for i in range(len(st.session_state.roll_lines)):
+        line = st.session_state.roll_lines[i]
+        
+        # Ensure pool exists and clean it of depleted items
+        if "pool" not in line:
+            line["pool"] = []
+        else:
+            cleaned_pool = clean_pool(line["pool"], available_rolls)
+            if len(cleaned_pool) != len(line["pool"]):
+                st.session_state.roll_lines[i]["pool"] = cleaned_pool
+                line["pool"] = cleaned_pool
+        
+        with st.container(border=True):
+            st.markdown(f"**📦 Roll Production Line {i + 1}**")
+            
+            r1, r2, r3, r4 = st.columns([3, 1.2, 1.2, 0.4])
+            
+            with r1:
+                current_roll_size = line.get("display_size", "#2")
+                roll_size_list = list(SIZE_DISPLAY.keys())
+                if current_roll_size in roll_size_list:
+                    roll_default_idx = roll_size_list.index(current_roll_size)
+                else:
+                    roll_default_idx = 0
+                
+                selected_roll_size = st.selectbox(
+                    "Size", 
+                    roll_size_list,
+                    index=roll_default_idx,
+                    key=f"r_size_{i}"
+                )
+                st.session_state.roll_lines[i]["display_size"] = selected_roll_size
+            
+            with r2:
+                roll_pieces = st.number_input(
+                    "Pieces", 
+                    min_value=0, 
+                    step=1,
+                    value=int(line.get("pieces", 0)),
+                    key=f"r_pcs_{i}"
+                )
+                st.session_state.roll_lines[i]["pieces"] = roll_pieces
+            
+            with r3:
+                roll_waste = st.number_input(
+                    "Waste (ft)", 
+                    min_value=0.0, 
+                    step=0.5,
+                    value=float(line.get("waste", 0.0)),
+                    key=f"r_waste_{i}"
+                )
+                st.session_state.roll_lines[i]["waste"] = roll_waste
+            
+            with r4:
+                if len(st.session_state.roll_lines) > 1:
+                    if st.button("🗑", key=f"del_roll_{i}", help="Remove line"):
+                        st.session_state.roll_lines.pop(i)
+                        st.rerun()
+
+            use_custom_roll = st.checkbox(
+                "Use custom inches instead of standard size",
+                value=line.get("use_custom", False),
+                key=f"r_custom_chk_{i}"
+            )
+            st.session_state.roll_lines[i]["use_custom"] = use_custom_roll
+
+            if use_custom_roll:
+                custom_roll_inches = st.number_input(
+                    "Custom length per piece (inches)",
+                    min_value=0.1,
+                    value=float(line.get("custom_inches", 12.0)) if line.get("custom_inches") else 12.0,
+                    step=0.25,
+                    key=f"r_custom_in_{i}"
+                )
+                st.session_state.roll_lines[i]["custom_inches"] = custom_roll_inches
+            else:
+                st.session_state.roll_lines[i]["custom_inches"] = 0.0
+            
+            # Calculate required footage
+            if roll_pieces > 0:
+                if use_custom_roll and st.session_state.roll_lines[i].get("custom_inches", 0) > 0:
+                    calc_inches = (st.session_state.roll_lines[i]["custom_inches"] + roll_extra) * roll_pieces
+                else:
+                    std_inches = SIZE_DISPLAY.get(selected_roll_size, 12.0)
+                    calc_inches = (std_inches + roll_extra) * roll_pieces
+                
+                roll_production_footage = calc_inches / 12.0
+                roll_total_needed = roll_production_footage + roll_waste
+                
+                st.caption(f"📊 **Production:** {roll_production_footage:.2f} ft + **Waste:** {roll_waste:.1f} ft = **Total:** {roll_total_needed:.2f} ft")
+            else:
+                roll_production_footage = 0
+                roll_total_needed = 0
+
+            # ── ROLL POOL SELECTOR ──────────────────────────────────────────────
+            st.markdown("---")
+            st.markdown("**🏊 Roll Pool** - Select source rolls in order of deduction")
+            
+            current_roll_pool = st.session_state.roll_lines[i].get("pool", [])
+            
+            rpool_col1, rpool_col2 = st.columns([3, 2])
+            
+            with rpool_col1:
+                available_for_roll_pool = [opt for opt in roll_options if opt.split(" | ")[0] not in current_roll_pool]
+                
+                if available_for_roll_pool:
+                    add_to_roll_pool = st.selectbox(
+                        "➕ Add roll to pool",
+                        ["-- Select to add --"] + available_for_roll_pool,
+                        key=f"add_pool_roll_{i}"
+                    )
+                    
+                    if add_to_roll_pool != "-- Select to add --":
+                        if st.button("➕ Add to Pool", key=f"btn_add_roll_pool_{i}", type="secondary"):
+                            roll_id = add_to_roll_pool.split(" | ")[0]
+                            if "pool" not in st.session_state.roll_lines[i]:
+                                st.session_state.roll_lines[i]["pool"] = []
+                            st.session_state.roll_lines[i]["pool"].append(roll_id)
+                            st.rerun()
+                else:
+                    st.info("All available rolls are in the pool")
+            
+            with rpool_col2:
+                roll_pool_capacity = calculate_pool_capacity(current_roll_pool, available_rolls)
+                
+                if roll_total_needed > 0:
+                    if roll_pool_capacity >= roll_total_needed:
+                        st.success(f"✅ Pool: {roll_pool_capacity:,.1f} ft")
+                        st.caption(f"Need: {roll_total_needed:,.1f} ft")
+                    else:
+                        shortage = roll_total_needed - roll_pool_capacity
+                        st.error(f"❌ Pool: {roll_pool_capacity:,.1f} ft")
+                        st.caption(f"Short: {shortage:,.1f} ft")
+                else:
+                    st.info(f"🏊 Pool: {roll_pool_capacity:,.1f} ft")
+            
+            # Display current roll pool
+            if current_roll_pool:
+                roll_pool_details = get_pool_details(current_roll_pool, available_rolls)
+                
+                if roll_pool_details:
+                    st.markdown("**📋 Current Pool (deduction order):**")
+                    
+                    for idx, item in enumerate(roll_pool_details):
+                        rpcol1, rpcol2, rpcol3, rpcol4 = st.columns([0.3, 2.5, 1, 0.5])
+                        
+                        with rpcol1:
+                            st.markdown(f"**{idx + 1}.**")
+                        
+                        with rpcol2:
+                            st.markdown(f"`{item['id']}` - **{item['footage']:,.1f} ft**")
+                            st.caption(f"{item['material'][:40]}...")
+                        
+                        with rpcol3:
+                            btn_c1, btn_c2 = st.columns(2)
+                            with btn_c1:
+                                if idx > 0:
+                                    if st.button("⬆️", key=f"rup_{i}_{idx}", help="Move up"):
+                                        pool = st.session_state.roll_lines[i]["pool"]
+                                        pool[idx], pool[idx-1] = pool[idx-1], pool[idx]
+                                        st.rerun()
+                            with btn_c2:
+                                if idx < len(roll_pool_details) - 1:
+                                    if st.button("⬇️", key=f"rdown_{i}_{idx}", help="Move down"):
+                                        pool = st.session_state.roll_lines[i]["pool"]
+                                        pool[idx], pool[idx+1] = pool[idx+1], pool[idx]
+                                        st.rerun()
+                        
+                        with rpcol4:
+                            if st.button("❌", key=f"rrem_{i}_{idx}", help="Remove"):
+                                st.session_state.roll_lines[i]["pool"].pop(idx)
+                                st.rerun()
+                    
+                    # Pool quick actions
+                    rpool_action_col1, rpool_action_col2 = st.columns(2)
+                    with rpool_action_col1:
+                        if st.button("🗑️ Clear Pool", key=f"clear_pool_roll_{i}"):
+                            st.session_state.roll_lines[i]["pool"] = []
+                            st.rerun()
+                    with rpool_action_col2:
+                        if len(st.session_state.roll_lines) > 1:
+                            if st.button("📋 Copy to All Lines", key=f"copy_pool_roll_{i}"):
+                                for j in range(len(st.session_state.roll_lines)):
+                                    if j != i:
+                                        st.session_state.roll_lines[j]["pool"] = current_roll_pool.copy()
+                                st.success(f"✅ Copied to {len(st.session_state.roll_lines) - 1} line(s)")
+                                st.rerun()
+                    
+                    # Preview
+                    if roll_total_needed > 0 and roll_pool_capacity >= roll_total_needed:
+                        with st.expander("👁️ Preview Deduction Sequence"):
+                            remaining = roll_total_needed
+                            for item in roll_pool_details:
+                                if remaining <= 0:
+                                    st.markdown(f"- `{item['id']}`: ✅ No deduction (stays at {item['footage']:,.1f} ft)")
+                                    continue
+                                deduct = min(item['footage'], remaining)
+                                new_footage = item['footage'] - deduct
+                                status = "🔴 **DEPLETED**" if new_footage <= 0 else f"🟢 {new_footage:,.1f} ft remaining"
+                                st.markdown(f"- `{item['id']}`: **-{deduct:,.1f} ft** → {status}")
+                                remaining -= deduct
+                else:
+                    st.info("👆 Add rolls to the pool above (depleted items were auto-removed)")
+            else:
+                st.info("👆 Add rolls to the pool above")
+
+    # Add new roll line button
+    add_roll_col1, add_roll_col2 = st.columns([3, 1])
+    
+    with add_roll_col1:
+        if st.button("➕ Add another roll size", use_container_width=True, key="add_roll_line"):
+            last_pool = []
+            if st.session_state.roll_lines:
+                last_pool = clean_pool(st.session_state.roll_lines[-1].get("pool", []).copy(), available_rolls)
+            
+            st.session_state.roll_lines.append({
+                "display_size": "#2", 
+                "pieces": 0, 
+                "waste": 0.0,
+                "pool": last_pool,
+                "use_custom": False, 
+                "custom_inches": 12.0
+            })
+            st.rerun()
+    
+    with add_roll_col2:
+        if len(st.session_state.roll_lines) > 1:
+            if st.button("🔄 Sync Pools", key="sync_roll_pools", help="Copy Line 1 pool to all"):
+                first_pool = clean_pool(st.session_state.roll_lines[0].get("pool", []).copy(), available_rolls)
+                for line in st.session_state.roll_lines[1:]:
+                    line["pool"] = first_pool.copy()
+                st.success("✅ All roll lines synced")
+                st.rerun()
+
+    st.divider()
+
+    # ══════════════════════════════════════════════════════════════════════════════
+    # SUBMISSION FORM
+    # ══════════════════════════════════════════════════════════════════════════════
+    with st.form("production_order_form", clear_on_submit=True):
+        st.markdown("#### 📑 Order Information")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            client_name = st.text_input("Client Name", key="prod_client")
+        with col2:
+            order_number = st.text_input("Internal Order #", key="prod_order")
+        with col3:
+            operator_name = st.text_input(
+                "Operator Name",
+                value=st.session_state.get('username', ''),
+                key="prod_operator"
+            )
+
+        st.markdown("#### 📦 Box Usage")
+        box_types = [
+            "Small Metal Box", "Big Metal Box",
+            "Small Elbow Box", "Medium Elbow Box", "Large Elbow Box"
+        ]
+        box_usage = {box: st.number_input(box, min_value=0, step=1, key=f"box_{box.replace(' ','_')}") 
+                     for box in box_types}
+
+        submitted = st.form_submit_button("🚀 Complete Order & Deduct Stock", use_container_width=True, type="primary")
+
+    if submitted:
+        if not all([client_name.strip(), order_number.strip(), operator_name.strip()]):
+            st.error("Client Name, Order Number, and Operator Name are required.")
+        else:
+            # ══════════════════════════════════════════════════════════════════════
+            # VALIDATION
+            # ══════════════════════════════════════════════════════════════════════
+            validation_errors = []
+            has_production_lines = False
+            
+            # Check coil lines
+            for i, line in enumerate(st.session_state.coil_lines):
+                if line.get("pieces", 0) <= 0:
+                    continue
+                
+                has_production_lines = True
+                
+                # Clean pool before validation
+                cleaned_pool = clean_pool(line.get("pool", []), available_coils)
+                st.session_state.coil_lines[i]["pool"] = cleaned_pool
+                
+                if not cleaned_pool:
+                    validation_errors.append(f"Coil Line {i+1}: No coils with footage > 0 in pool")
+                    continue
+                
+                if line.get("use_custom") or line.get("display_size") in ["Custom (Inches)", "Custom (Feet)"]:
+                    calc_inches = (line.get("custom_inches", 12.0) + coil_extra) * line["pieces"]
+                else:
+                    std_inches = SIZE_DISPLAY.get(line.get("display_size", "#2"), 12.0)
+                    calc_inches = (std_inches + coil_extra) * line["pieces"]
+                
+                production_footage = calc_inches / 12.0
+                total_needed = production_footage + line.get("waste", 0)
+                
+                pool_capacity = calculate_pool_capacity(cleaned_pool, available_coils)
+                
+                if pool_capacity < total_needed:
+                    validation_errors.append(f"Coil Line {i+1}: Pool has {pool_capacity:.1f} ft, needs {total_needed:.1f} ft")
+            
+            # Check roll lines
+            for i, line in enumerate(st.session_state.roll_lines):
+                if line.get("pieces", 0) <= 0:
+                    continue
+                
+                has_production_lines = True
+                
+                # Clean pool before validation
+                cleaned_pool = clean_pool(line.get("pool", []), available_rolls)
+                st.session_state.roll_lines[i]["pool"] = cleaned_pool
+                
+                if not cleaned_pool:
+                    validation_errors.append(f"Roll Line {i+1}: No rolls with footage > 0 in pool")
+                    continue
+                
+                if line.get("use_custom") and line.get("custom_inches", 0) > 0:
+                    calc_inches = (line["custom_inches"] + roll_extra) * line["pieces"]
+                else:
+                    std_inches = SIZE_DISPLAY.get(line.get("display_size", "#2"), 12.0)
+                    calc_inches = (std_inches + roll_extra) * line["pieces"]
+                
+                production_footage = calc_inches / 12.0
+                total_needed = production_footage + line.get("waste", 0)
+                
+                pool_capacity = calculate_pool_capacity(cleaned_pool, available_rolls)
+                
+                if pool_capacity < total_needed:
+                    validation_errors.append(f"Roll Line {i+1}: Pool has {pool_capacity:.1f} ft, needs {total_needed:.1f} ft")
+            
+            if not has_production_lines:
+                st.error("❌ No production lines with pieces > 0")
+            elif validation_errors:
+                st.error("❌ **Validation Errors:**")
+                for err in validation_errors:
+                    st.error(f"• {err}")
+            else:
+                # ══════════════════════════════════════════════════════════════════
+                # PROCESS ALL LINES
+                # ══════════════════════════════════════════════════════════════════
+                with st.spinner("Processing production order..."):
+                    all_deductions = []
+                    pool_mapping = {}
+                    success = True
+                    feedback = []
+                    
+                    # Process Coil Lines
+                    for i, line in enumerate(st.session_state.coil_lines):
+                        if line.get("pieces", 0) <= 0:
+                            continue
+                        
+                        size_label = line.get("display_size", "#2")
+                        if line.get("use_custom") or size_label in ["Custom (Inches)", "Custom (Feet)"]:
+                            if line.get("custom_unit") == "feet":
+                                size_label = f"Custom {line.get('custom_feet', 1.0)} ft"
+                            else:
+                                size_label = f"Custom {line.get('custom_inches', 12.0)} in"
+                        
+                        if line.get("use_custom") or line.get("display_size") in ["Custom (Inches)", "Custom (Feet)"]:
+                            calc_inches = (line.get("custom_inches", 12.0) + coil_extra) * line["pieces"]
+                        else:
+                            std_inches = SIZE_DISPLAY.get(line.get("display_size", "#2"), 12.0)
+                            calc_inches = (std_inches + coil_extra) * line["pieces"]
+                        
+                        production_footage = calc_inches / 12.0
+                        waste_footage = line.get("waste", 0)
+                        total_needed = production_footage + waste_footage
+                        
+                        line_desc = f"Coil Production: {line['pieces']} pcs of {size_label}"
+                        
+                        ok, deduction_log, error = process_pool_deduction(
+                            pool_ids=line["pool"],
+                            total_needed=total_needed,
+                            production_footage=production_footage,
+                            waste_footage=waste_footage,
+                            available_df=available_coils,
+                            supabase_client=supabase,
+                            operator=operator_name,
+                            order_number=order_number,
+                            client_name=client_name,
+                            line_description=line_desc,
+                            size_label=size_label,
+                            pieces=line["pieces"]
+                        )
+                        
+                        if not ok:
+                            st.error(f"❌ Coil Line {i+1}: {error}")
+                            success = False
+                            break
+                        
+                        for ded in deduction_log:
+                            ded['material_type'] = 'Coil'
+                            all_deductions.append(ded)
+                        
+                        pool_mapping[f"coil_line_{i+1}"] = {
+                            'size': size_label,
+                            'pieces': line['pieces'],
+                            'total_footage': total_needed,
+                            'production_footage': production_footage,
+                            'waste': waste_footage,
+                            'sources': deduction_log
+                        }
+                        
+                        source_breakdown = " | ".join([f"{d['footage_used']:.1f}ft from {d['source_id']}" for d in deduction_log])
+                        feedback.append(f"✓ Coil {size_label}: {line['pieces']} pcs ({total_needed:.2f} ft) ← {source_breakdown}")
+                    
+                    # Process Roll Lines
+                    if success:
+                        for i, line in enumerate(st.session_state.roll_lines):
+                            if line.get("pieces", 0) <= 0:
+                                continue
+                            
+                            size_label = line.get("display_size", "#2")
+                            if line.get("use_custom") and line.get("custom_inches", 0) > 0:
+                                size_label = f"Custom {line.get('custom_inches', 12.0)} in"
+                            
+                            if line.get("use_custom") and line.get("custom_inches", 0) > 0:
+                                calc_inches = (line["custom_inches"] + roll_extra) * line["pieces"]
+                            else:
+                                std_inches = SIZE_DISPLAY.get(line.get("display_size", "#2"), 12.0)
+                                calc_inches = (std_inches + roll_extra) * line["pieces"]
+                            
+                            production_footage = calc_inches / 12.0
+                            waste_footage = line.get("waste", 0)
+                            total_needed = production_footage + waste_footage
+                            
+                            line_desc = f"Roll Production: {line['pieces']} pcs of {size_label}"
+                            
+                            ok, deduction_log, error = process_pool_deduction(
+                                pool_ids=line["pool"],
+                                total_needed=total_needed,
+                                production_footage=production_footage,
+                                waste_footage=waste_footage,
+                                available_df=available_rolls,
+                                supabase_client=supabase,
+                                operator=operator_name,
+                                order_number=order_number,
+                                client_name=client_name,
+                                line_description=line_desc,
+                                size_label=size_label,
+                                pieces=line["pieces"]
+                            )
+                            
+                            if not ok:
+                                st.error(f"❌ Roll Line {i+1}: {error}")
+                                success = False
+                                break
+                            
+                            for ded in deduction_log:
+                                ded['material_type'] = 'Roll'
+                                all_deductions.append(ded)
+                            
+                            pool_mapping[f"roll_line_{i+1}"] = {
+                                'size': size_label,
+                                'pieces': line['pieces'],
+                                'total_footage': total_needed,
+                                'production_footage': production_footage,
+                                'waste': waste_footage,
+                                'sources': deduction_log
+                            }
+                            
+                            source_breakdown = " | ".join([f"{d['footage_used']:.1f}ft from {d['source_id']}" for d in deduction_log])
+                            feedback.append(f"✓ Roll {size_label}: {line['pieces']} pcs ({total_needed:.2f} ft) ← {source_breakdown}")
+                    
+                    if success and all_deductions:
+                        st.success(f"Order **{order_number}** completed successfully! 🎉")
+                        
+                        for msg in feedback:
+                            st.info(msg)
+                        
+                        # Show pool deduction summary
+                        st.markdown("### 📊 Pool Deduction Summary")
+                        
+                        for line_key, line_data in pool_mapping.items():
+                            with st.expander(f"📦 {line_key.replace('_', ' ').title()}: {line_data['size']} ({line_data['pieces']} pcs)"):
+                                st.markdown(f"**Total:** {line_data['total_footage']:.2f} ft (Production: {line_data['production_footage']:.2f} + Waste: {line_data['waste']:.2f})")
+                                st.markdown("**Source Breakdown:**")
+                                for src in line_data['sources']:
+                                    status_icon = "🔴" if src['status'] == 'Depleted' else "🟢"
+                                    st.markdown(f"- `{src['source_id']}`: **{src['footage_used']:.2f} ft** | {src['previous_footage']:.1f} → {src['remaining_footage']:.1f} ft {status_icon}")
+                        
+                        # Generate PDF
+                        pdf_buffer = generate_production_pdf(
+                            order_number=order_number,
+                            client_name=client_name,
+                            operator_name=operator_name,
+                            deduction_details=all_deductions,
+                            box_usage=box_usage,
+                            coil_extra=coil_extra,
+                            roll_extra=roll_extra
+                        )
+
+                        # Send email
+                        if send_production_pdf(pdf_buffer, order_number, client_name):
+                            st.balloons()
+                            st.success("PDF generated and queued for email to admin!")
+                        else:
+                            st.warning("PDF generated, but email could not be queued.")
+
+                        # Clear lines
+                        st.session_state.coil_lines = [{
+                            "display_size": "#2", 
+                            "pieces": 0, 
+                            "waste": 0.0, 
+                            "pool": [], 
+                            "use_custom": False, 
+                            "custom_inches": 12.0,
+                            "custom_feet": 1.0,
+                            "custom_unit": "inches"
+                        }]
+                        st.session_state.roll_lines = [{
+                            "display_size": "#2", 
+                            "pieces": 0, 
+                            "waste": 0.0, 
+                            "pool": [], 
+                            "use_custom": False, 
+                            "custom_inches": 12.0
+                        }]
+
+                        # Force refresh
+                        st.cache_data.clear()
+                        if 'df' in st.session_state:
+                            del st.session_state['df']
+                        if 'df_audit' in st.session_state:
+                            del st.session_state['df_audit']
+                        st.session_state.force_refresh = True
+                        
+                        time.sleep(1)
+                        st.rerun()
+                    elif success and not all_deductions:
+                        st.warning("No deductions were made. Check your production lines.")
+
+    # ══════════════════════════════════════════════════════════════════════════════
+    # PRODUCTION ORDER REVERSAL SECTION
+    # ══════════════════════════════════════════════════════════════════════════════
+    st.markdown("---")
+    st.markdown("""
+        <div style="text-align: center; padding: 20px 0;">
+            <h2 style="color: #dc2626; margin: 0;">🔄 Reverse Production Order</h2>
+            <p style="color: #64748b; margin-top: 8px;">Undo a production order and restore deducted footage</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    with st.expander("🔄 Reverse a Production Order", expanded=False):
+        st.warning("⚠️ **Use with caution!** This will restore footage to the source materials.")
+        
+        try:
+            response = supabase.table("audit_log").select("*").ilike("Action", "%Production%").order("Timestamp", desc=True).limit(100).execute()
+            
+            if not response.data:
+                st.info("📭 No recent production orders found")
+            else:
+                import re
+                from collections import defaultdict
+                
+                orders = defaultdict(list)
+                
+                for log in response.data:
+                    details = log.get('Details', '')
+                    order_match = re.search(r'\(Order:\s*([^)]+)\)', details)
+                    if order_match:
+                        order_num = order_match.group(1).strip()
+                        orders[order_num].append(log)
+                
+                if not orders:
+                    st.info("📭 No production orders with order numbers found")
+                else:
+                    order_options = []
+                    for order_num, logs in orders.items():
+                        latest_log = max(logs, key=lambda x: x.get('Timestamp', ''))
+                        details = latest_log.get('Details', '')
+                        
+                        client_match = re.search(r'for\s+([^(]+)\s*\(Order:', details)
+                        client_name_extracted = client_match.group(1).strip() if client_match else "Unknown"
+                        
+                        timestamp = latest_log.get('Timestamp', '')[:16]
+                        
+                        order_options.append({
+                            'display': f"{order_num} - {client_name_extracted} ({timestamp})",
+                            'order_num': order_num,
+                            'logs': logs,
+                            'client': client_name_extracted,
+                            'timestamp': timestamp
+                        })
+                    
+                    order_options.sort(key=lambda x: x['timestamp'], reverse=True)
+                    
+                    selected_order = st.selectbox(
+                        "Select Production Order to Reverse",
+                        options=["-- Select an order --"] + [o['display'] for o in order_options],
+                        key="reverse_order_select"
+                    )
+                    
+                    if selected_order != "-- Select an order --":
+                        selected = next((o for o in order_options if o['display'] == selected_order), None)
+                        
+                        if selected:
+                            st.markdown("---")
+                            st.markdown(f"### 📋 Order Details: {selected['order_num']}")
+                            st.write(f"**Client:** {selected['client']}")
+                            st.write(f"**Date:** {selected['timestamp']}")
+                            
+                            st.markdown("**Items to Restore:**")
+                            
+                            items_to_restore = []
+                            
+                            for log in selected['logs']:
+                                details = log.get('Details', '')
+                                item_id_raw = log.get('Item_ID', '')
+                                
+                                # Extract the actual source ID from the new format
+                                source_match = re.search(r'Source:\s*([^\s|]+)', details)
+                                if source_match:
+                                    actual_item_id = source_match.group(1).strip()
+                                else:
+                                    # Fallback - remove UUID suffix if present
+                                    actual_item_id = item_id_raw.rsplit('-', 1)[0] if '-' in item_id_raw and len(item_id_raw.split('-')[-1]) == 8 else item_id_raw
+                                
+                                # Handle both formats
+                                total_match = re.search(r'=\s*(\d+\.?\d*)\s*ft\s*used', details)
+                                footage_match = re.search(r'(\d+\.?\d*)\s*ft\s*(?:used|production)', details)
+                                pieces_match = re.search(r'Production:\s*(\d+)\s*pcs\s*of\s*([^(]+)', details)
+                                
+                                if total_match:
+                                    footage_used = float(total_match.group(1))
+                                elif footage_match:
+                                    footage_used = float(footage_match.group(1))
+                                else:
+                                    continue
+                                
+                                pieces = int(pieces_match.group(1)) if pieces_match else 0
+                                size = pieces_match.group(2).strip() if pieces_match else "Unknown"
+                                
+                                items_to_restore.append({
+                                    'item_id': actual_item_id,
+                                    'footage_to_restore': footage_used,
+                                    'pieces': pieces,
+                                    'size': size,
+                                    'original_log': log
+                                })
+                                
+                                st.write(f"• **{actual_item_id}**: +{footage_used:.2f} ft ({pieces} pcs of {size})")
+                            
+                            if items_to_restore:
+                                total_to_restore = sum(item['footage_to_restore'] for item in items_to_restore)
+                                st.markdown(f"**Total Footage to Restore:** {total_to_restore:.2f} ft")
+                                
+                                st.markdown("---")
+                                
+                                reversal_reason = st.text_input(
+                                    "Reason for Reversal *",
+                                    placeholder="e.g. Wrong material used, customer cancelled, data entry error",
+                                    key="reversal_reason"
+                                )
+                                
+                                confirm_reversal = st.checkbox(
+                                    f"I confirm I want to reverse order {selected['order_num']} and restore {total_to_restore:.2f} ft",
+                                    key="confirm_reversal"
+                                )
+                                
+                                if st.button("🔄 Reverse This Order", type="primary", use_container_width=True):
+                                    if not reversal_reason.strip():
+                                        st.error("⚠️ Please provide a reason for the reversal")
+                                    elif not confirm_reversal:
+                                        st.error("⚠️ Please confirm the reversal")
+                                    else:
+                                        with st.spinner("Reversing production order..."):
+                                            try:
+                                                import uuid
+                                                success_count = 0
+                                                
+                                                for item in items_to_restore:
+                                                    inv_response = supabase.table("inventory").select("Footage, Status").eq("Item_ID", item['item_id']).execute()
+                                                    
+                                                    if inv_response.data:
+                                                        current_footage = float(inv_response.data[0]['Footage'])
+                                                        new_footage = current_footage + item['footage_to_restore']
+                                                        
+                                                        update_data = {"Footage": new_footage}
+                                                        if inv_response.data[0].get('Status') == 'Depleted':
+                                                            update_data["Status"] = "Active"
+                                                        
+                                                        supabase.table("inventory").update(update_data).eq("Item_ID", item['item_id']).execute()
+                                                        
+                                                        # Use unique ID for reversal log too
+                                                        unique_log_id = f"{item['item_id']}-REV-{uuid.uuid4().hex[:6]}"
+                                                        
+                                                        log_entry = {
+                                                            "Item_ID": unique_log_id,
+                                                            "Action": "Production Reversal",
+                                                            "User": st.session_state.get('username', 'Admin'),
+                                                            "Details": f"Source: {item['item_id']} | Reversed order {selected['order_num']}: Restored {item['footage_to_restore']:.2f} ft ({item['pieces']} pcs of {item['size']}). Reason: {reversal_reason}. Previous: {current_footage:.2f} ft → New: {new_footage:.2f} ft"
+                                                        }
+                                                        audit_writer.log(log_entry)
+                                                        
+                                                        success_count += 1
+                                                    else:
+                                                        st.warning(f"⚠️ Item {item['item_id']} not found - skipped")
+                                                
+                                                # Summary log with unique ID
+                                                summary_log = {
+                                                    "Item_ID": f"{selected['order_num']}-REV-{uuid.uuid4().hex[:6]}",
+                                                    "Action": "Order Reversed",
+                                                    "User": st.session_state.get('username', 'Admin'),
+                                                    "Details": f"Reversed production order {selected['order_num']} for {selected['client']}. Restored {total_to_restore:.2f} ft across {success_count} items. Reason: {reversal_reason}"
+                                                }
+                                                audit_writer.log(summary_log)
+                                                
+                                                st.success(f"✅ Successfully reversed order {selected['order_num']}!")
+                                                st.success(f"📦 Restored {total_to_restore:.2f} ft to {success_count} item(s)")
+                                                st.balloons()
+                                                
+                                                st.cache_data.clear()
+                                                st.session_state.force_refresh = True
+                                                time.sleep(1)
+                                                st.rerun()
+                                                
+                                            except Exception as e:
+                                                st.error(f"❌ Error reversing order: {e}")
+                            else:
+                                st.warning("⚠️ Could not parse deduction details from this order")
+        
+        except Exception as e:
+            st.error(f"Error loading production orders: {e}")
@@ -0,0 +1,266 @@
+"""Reports tab."""
+
+from datetime import datetime
+
+import streamlit as st
+
+from warehouse_pulse.reporting.cache import get_artifact_cache
+from warehouse_pulse.reporting.inventory_report import build_inventory_report, render_inventory_report_pdf, write_report_excel
+
+def render(df, df_audit):
+    st.markdown("""
+        <div style="text-align: center; padding: 20px 0;">
+            <h1 style="color: #0ea5e9; margin: 0;">📊 Inventory Reports</h1>
+            <p style="color: #64748b; margin-top: 8px;">Generate detailed inventory reports by category</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    if df is None or df.empty:
+        st.info("📦 No inventory data available. Add items first.")
+    else:
+        # Report Options
+        st.markdown("### 📋 Report Settings")
+        
+        col_cat, col_format = st.columns(2)
+        
+        with col_cat:
+            report_categories = ["All Categories"] + sorted(df['Category'].unique().tolist())
+            selected_report_cat = st.selectbox(
+                "Select Category",
+                report_categories,
+                key="report_category_select"
+            )
+        
+        with col_format:
+            report_format = st.radio(
+                "Report Format",
+                ["View on Screen", "Download PDF", "Download Excel"],
+                horizontal=True,
+                key="report_format"
+            )
+        
+        # Date for report
+        report_date = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+        
+        st.markdown("---")
+        
+        # Generate Report Button
+        if st.button("📊 Generate Report", type="primary", use_container_width=True):
+            
+            # Filter data
+            if selected_report_cat == "All Categories":
+                report_df = df
+            else:
+                report_df = df[df['Category'] == selected_report_cat]
+            
+            if report_df.empty:
+                st.warning("No data found for selected category.")
+            else:
+                # ══════════════════════════════════════════════════════════════
+                # BUILD REPORT DATA (one groupby, cached per data version)
+                # ══════════════════════════════════════════════════════════════
+                
+                report = build_inventory_report(
+                    st.session_state.get('data_version', ''), df,
+                    None if selected_report_cat == "All Categories" else selected_report_cat
+                )
+                report_summary_df = report['materials']
+                report_totals = report['totals']
+                categories_to_process = report['categories']['Category'].tolist()
+                category_totals = report['categories'].set_index('Category')
+                materials_by_category = dict(tuple(report_summary_df.groupby('Category', sort=False)))
+                
+                # ══════════════════════════════════════════════════════════════
+                # DISPLAY ON SCREEN
+                # ══════════════════════════════════════════════════════════════
+                
+                if report_format == "View on Screen":
+                    st.markdown(f"""
+                        <div style="background: linear-gradient(135deg, #0ea5e9 0%, #0284c7 100%); 
+                                    padding: 20px; border-radius: 12px; color: white; margin-bottom: 20px;">
+                            <h2 style="margin: 0;">📊 Inventory Report</h2>
+                            <p style="margin: 5px 0 0 0; opacity: 0.9;">
+                                Category: <strong>{selected_report_cat}</strong> | Generated: {report_date}
+                            </p>
+                        </div>
+                    """, unsafe_allow_html=True)
+                    
+                    # Overall Summary
+                    st.markdown("### 📈 Overall Summary")
+                    
+                    sum1, sum2, sum3, sum4 = st.columns(4)
+                    sum1.metric("Total Footage", f"{report_totals['footage']:,.1f} ft")
+                    sum2.metric("Total Items", report_totals['items'])
+                    sum3.metric("Material Types", report_totals['material_types'])
+                    sum4.metric("Locations", report_totals['locations'])
+                    
+                    st.markdown("---")
+                    
+                    # Detailed breakdown by category
+                    items_by_category = dict(tuple(report_df.groupby('Category', sort=False)))
+                    for category in categories_to_process:
+                        cat_data = materials_by_category[category]
+                        cat_df_raw = items_by_category[category]
+                        
+                        st.markdown(f"""
+                            <div style="background: #f8fafc; padding: 15px; border-radius: 8px; 
+                                        border-left: 4px solid #0ea5e9; margin: 20px 0 10px 0;">
+                                <h3 style="margin: 0; color: #0ea5e9;">{category}</h3>
+                                <p style="margin: 5px 0 0 0; color: #64748b;">
+                                    {category_totals.at[category, 'Items']} items | {category_totals.at[category, 'Footage']:,.1f} ft total
+                                </p>
+                            </div>
+                        """, unsafe_allow_html=True)
+                        
+                        # Material breakdown
+                        for mat_row in cat_data.itertuples(index=False):
+                            material = mat_row.Material
+                            total_ft = mat_row.Total_Footage
+                            count = int(mat_row.Item_Count)
+                            avg_ft = mat_row.Avg_Footage
+                            locations = mat_row.Locations
+                            
+                            # Build description based on category
+                            if category == "Coils":
+                                desc = f"{count} Coil{'s' if count != 1 else ''} @ ~{avg_ft:,.0f} ft each"
+                            elif category == "Rolls":
+                                desc = f"{count} Roll{'s' if count != 1 else ''} @ ~{avg_ft:,.0f} ft each"
+                            elif category in ["Elbows", "Fab Straps", "Wing Seals"]:
+                                desc = f"{count} item{'s' if count != 1 else ''}"
+                            else:
+                                desc = f"{count} item{'s' if count != 1 else ''} @ ~{avg_ft:,.0f} units each"
+                            
+                            st.markdown(f"""
+                                <div style="background: white; padding: 15px; border-radius: 8px; 
+                                            margin: 8px 0; border: 1px solid #e2e8f0;">
+                                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                                        <div>
+                                            <strong style="color: #1e293b; font-size: 15px;">{material}</strong><br>
+                                            <span style="color: #64748b; font-size: 13px;">{desc}</span><br>
+                                            <span style="color: #94a3b8; font-size: 11px;">📍 {locations}</span>
+                                        </div>
+                                        <div style="text-align: right;">
+                                            <span style="color: #0ea5e9; font-size: 24px; font-weight: bold;">{total_ft:,.1f}</span><br>
+                                            <span style="color: #64748b; font-size: 12px;">feet total</span>
+                                        </div>
+                                    </div>
+                                </div>
+                            """, unsafe_allow_html=True)
+                        
+                        # Show individual items in expander
+                        with st.expander(f"📋 View all {category} items"):
+                            st.dataframe(
+                                cat_df_raw[['Item_ID', 'Material', 'Footage', 'Location']].sort_values(['Material', 'Item_ID']),
+                                use_container_width=True,
+                                hide_index=True
+                            )
+                
+                # ══════════════════════════════════════════════════════════════
+                # DOWNLOAD PDF
+                # ══════════════════════════════════════════════════════════════
+                
+                elif report_format == "Download PDF":
+                    with st.spinner("Generating PDF report..."):
+                        try:
+                            pdf_bytes = get_artifact_cache().get_or_build(
+                                "inventory_report_pdf",
+                                {"category": selected_report_cat},
+                                lambda: render_inventory_report_pdf(report, selected_report_cat, report_date),
+                                data_version=st.session_state.get('data_version', ''),
+                            )
+                            
+                            # Download button
+                            file_name = f"Inventory_Report_{selected_report_cat.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+                            
+                            st.download_button(
+                                label="📥 Download PDF Report",
+                                data=pdf_bytes,
+                                file_name=file_name,
+                                mime="application/pdf",
+                                type="primary",
+                                use_container_width=True
+                            )
+                            
+                            st.success("✅ PDF report generated successfully!")
+                            
+                        except Exception as e:
+                            st.error(f"❌ Error generating PDF: {e}")
+                
+                # ══════════════════════════════════════════════════════════════
+                # DOWNLOAD EXCEL
+                # ══════════════════════════════════════════════════════════════
+                
+                elif report_format == "Download Excel":
+                    with st.spinner("Generating Excel report..."):
+                        try:
+                            excel_bytes = get_artifact_cache().get_or_build(
+                                "inventory_report_xlsx",
+                                {"category": selected_report_cat},
+                                lambda: write_report_excel(report, report_df, selected_report_cat, report_date),
+                                data_version=st.session_state.get('data_version', ''),
+                            )
+                            
+                            file_name = f"Inventory_Report_{selected_report_cat.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+                            
+                            st.download_button(
+                                label="📥 Download Excel Report",
+                                data=excel_bytes,
+                                file_name=file_name,
+                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                                type="primary",
+                                use_container_width=True
+                            )
+                            
+                            st.success("✅ Excel report generated successfully!")
+                            
+                        except Exception as e:
+                            st.error(f"❌ Error generating Excel: {e}")
+        
+        st.markdown("---")
+        
+        # ══════════════════════════════════════════════════════════════════════
+        # QUICK CATEGORY REPORTS
+        # ══════════════════════════════════════════════════════════════════════
+        
+        st.markdown("### 🚀 Quick Reports")
+        st.caption("Click to view instant summaries")
+        
+        # Get categories that have data
+        quick_report = build_inventory_report(st.session_state.get('data_version', ''), df)
+        quick_totals = quick_report['categories'].set_index('Category')
+        quick_materials = dict(tuple(quick_report['materials'].groupby('Category', sort=False)))
+        categories_with_data = quick_report['categories']['Category'].tolist()
+        
+        # Create columns for quick report buttons
+        num_cols = min(4, len(categories_with_data))
+        if num_cols > 0:
+            cols = st.columns(num_cols)
+            
+            for idx, category in enumerate(categories_with_data[:8]):  # Max 8 categories
+                with cols[idx % num_cols]:
+                    total_ft = quick_totals.at[category, 'Footage']
+                    item_count = int(quick_totals.at[category, 'Items'])
+                    
+                    # Category icon
+                    cat_icons = {
+                        "Coils": "🔄", "Rolls": "📜", "Elbows": "↩️",
+                        "Fab Straps": "🔗", "Mineral Wool": "🧶",
+                        "Fiberglass Insulation": "🏠", "Wing Seals": "🔒",
+                        "Wire": "➰", "Banding": "📏"
+                    }
+                    icon = cat_icons.get(category, "📦")
+                    
+                    with st.expander(f"{icon} {category}"):
+                        st.metric("Total Footage", f"{total_ft:,.1f} ft")
+                        st.metric("Items", item_count)
+                        
+                        # Quick material breakdown
+                        mat_summary = quick_materials[category].nlargest(5, 'Total_Footage')
+                        
+                        st.markdown("**Top Materials:**")
+                        for row in mat_summary.itertuples(index=False):
+                            if category in ["Coils", "Rolls"]:
+                                st.write(f"• {row.Material[:30]}...")
+                                st.write(f"  {row.Total_Footage:,.1f} ft ({int(row.Item_Count)} items)")
+                            else:
+                                st.write(f"• {row.Material[:30]}: {int(row.Total_Footage)} pcs")
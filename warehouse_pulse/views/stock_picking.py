@@ -0,0 +1,1035 @@
+"""Stock Picking tab."""
+
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from warehouse_pulse.data.audit_writer import audit_writer
+from warehouse_pulse.data.back_orders import bulk_set_back_order_status, delete_back_orders_by_status, load_back_orders
+from warehouse_pulse.data.client import supabase
+
+
+def render(df, df_audit):
+    st.subheader("🛒 Stock Picking & Sales")
+    st.caption("Perform instant stock removals. Updates sync across all devices in real-time.")
+
+    # ── Safety check for empty database ─────────────────────────────────────────
+    if df is None or df.empty:
+        st.info("📦 No inventory available for picking. Please add items in the 'Manage' tab first.")
+        st.markdown("---")
+        st.markdown("### Getting Started")
+        st.markdown("""
+        1. Go to the **Manage** tab
+        2. Receive your first inventory items
+        3. Return here to start picking orders
+        """)
+    else:
+        # ── Local helper function ───────────────────────────────────────────────────
+        def normalize_pick_category(cat):
+            if pd.isna(cat) or not isinstance(cat, str):
+                return "Unknown"
+            
+            cat_lower = str(cat).strip().lower()
+            
+            mapping = {
+                'fab strap':     'Fab Straps',
+                'fabstraps':     'Fab Straps',
+                'fab straps':    'Fab Straps',
+                'strap':         'Fab Straps',
+                'straps':        'Fab Straps',
+                'coil':          'Coils',
+                'coils':         'Coils',
+                'roll':          'Rolls',
+                'rolls':         'Rolls',
+                'elbow':         'Elbows',
+                'elbows':        'Elbows',
+                'mineral wool':  'Mineral Wool',
+                'mineralwools':  'Mineral Wool',
+                'mineral wools': 'Mineral Wool',
+            }
+            
+            for key, value in mapping.items():
+                if key in cat_lower:
+                    return value
+            
+            return cat.strip().title() + 's' if not cat.strip().endswith(('s', 'wool')) else cat.strip().title()
+
+        # ── Work on a local copy ────────────────────────────────────────────────────
+        pick_df = df.copy()
+        if 'Category' in pick_df.columns and not pick_df.empty:
+            pick_df['Category'] = pick_df['Category'].apply(normalize_pick_category)
+        
+        # Add Roll Type for RPR detection
+        def get_roll_type(row):
+            if row.get('Category') != 'Rolls':
+                return None
+            if 'RPR' in str(row.get('Item_ID', '')).upper() or 'RPR' in str(row.get('Material', '')).upper():
+                return 'RPR'
+            return 'Regular'
+        
+        pick_df['Roll_Type'] = pick_df.apply(get_roll_type, axis=1)
+
+        category_options = ["Coils", "Rolls", "Fab Straps", "Elbows", "Mineral Wool"]
+        
+        # Filter to only show categories that exist in inventory
+        available_categories = [cat for cat in category_options if cat in pick_df['Category'].unique()]
+        if not available_categories:
+            available_categories = category_options  # Fallback
+        
+        # ── Initialize Session State for Cart ───────────────────────────────────────
+        if 'pick_cart' not in st.session_state:
+            st.session_state.pick_cart = []
+        
+        if 'show_back_order' not in st.session_state:
+            st.session_state.show_back_order = False
+            st.session_state.back_order_items = []
+            st.session_state.last_customer = ""
+            st.session_state.last_sales_order = ""
+
+        # ── Order Information (Outside form so it persists) ─────────────────────────
+        st.markdown("#### 📋 Order & Customer Information")
+        
+        col_cust, col_order = st.columns(2, gap="medium")
+        
+        with col_cust:
+            st.markdown("""
+                <div style="background-color: #f0f7ff; padding: 20px; border-radius: 12px; 
+                            border: 1px solid #d1e3ff; box-shadow: 0 2px 8px rgba(0,0,0,0.05);">
+                    <p style="font-weight: bold; margin: 0 0 12px 0; color: #1e40af;">Customer / Job</p>
+            """, unsafe_allow_html=True)
+            
+            customer = st.text_input(
+                "Customer / Job Name",
+                placeholder="e.g. John Doe / Site A",
+                key="pick_customer_persist",
+                label_visibility="collapsed"
+            )
+            
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        with col_order:
+            st.markdown("""
+                <div style="background-color: #fff7e6; padding: 20px; border-radius: 12px; 
+                            border: 1px solid #ffe8c2; box-shadow: 0 2px 8px rgba(0,0,0,0.05);">
+                    <p style="font-weight: bold; margin: 0 0 12px 0; color: #92400e;">Sales Order</p>
+            """, unsafe_allow_html=True)
+            
+            sales_order = st.text_input(
+                "Sales Order Number",
+                placeholder="e.g. SO-2026-0456",
+                key="pick_sales_order_persist",
+                label_visibility="collapsed"
+            )
+            
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        st.divider()
+
+        # ── Add Items to Cart ───────────────────────────────────────────────────────
+        st.markdown("#### ➕ Add Items to Order")
+        
+        # Category selection
+        pick_cat = st.selectbox(
+            "📦 Category",
+            available_categories,
+            key="pick_cat_add"
+        )
+        
+        # Filter by category
+        filtered_df = pick_df[pick_df['Category'] == pick_cat].copy() if not pick_df.empty else pd.DataFrame()
+        filtered_df = filtered_df[filtered_df['Footage'] > 0]  # Only show items with stock
+        
+        # ════════════════════════════════════════════════════════════════════════════
+        # COILS PICKING
+        # ════════════════════════════════════════════════════════════════════════════
+        if pick_cat == "Coils":
+            if filtered_df.empty:
+                st.warning("⚠️ No coils in stock")
+            else:
+                # Extract coil properties for filtering
+                import re
+                
+                def extract_coil_props(row):
+                    mat = str(row['Material']).lower()
+                    
+                    # Gauge
+                    gauge_match = re.search(r'\.(\d{3})', str(row['Material']))
+                    gauge = f".{gauge_match.group(1)}" if gauge_match else "Unknown"
+                    
+                    # Texture
+                    texture = "Smooth" if "smooth" in mat else ("Stucco" if "stucco" in mat else "Other")
+                    
+                    # Metal
+                    metal = "Aluminum" if "aluminum" in mat else ("Stainless Steel" if "stainless" in mat else "Other")
+                    
+                    return pd.Series({'Gauge': gauge, 'Texture': texture, 'Metal': metal})
+                
+                filtered_df[['Gauge', 'Texture', 'Metal']] = filtered_df.apply(extract_coil_props, axis=1)
+                
+                # Filters
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    texture_opts = ["All"] + sorted(filtered_df['Texture'].unique().tolist())
+                    sel_texture = st.selectbox("🎨 Texture", texture_opts, key="coil_texture_filter")
+                
+                with col2:
+                    metal_opts = ["All"] + sorted(filtered_df['Metal'].unique().tolist())
+                    sel_metal = st.selectbox("🔩 Metal", metal_opts, key="coil_metal_filter")
+                
+                with col3:
+                    gauge_opts = ["All"] + sorted(filtered_df['Gauge'].unique().tolist())
+                    sel_gauge = st.selectbox("📏 Gauge", gauge_opts, key="coil_gauge_filter")
+                
+                # Apply filters
+                display_df = filtered_df.copy()
+                if sel_texture != "All":
+                    display_df = display_df[display_df['Texture'] == sel_texture]
+                if sel_metal != "All":
+                    display_df = display_df[display_df['Metal'] == sel_metal]
+                if sel_gauge != "All":
+                    display_df = display_df[display_df['Gauge'] == sel_gauge]
+                
+                if display_df.empty:
+                    st.warning("No coils match the selected filters")
+                else:
+                    # Show available coils
+                    st.markdown(f"**{len(display_df)} coil(s) available:**")
+                    st.dataframe(
+                        display_df[['Item_ID', 'Material', 'Footage', 'Location']].sort_values('Footage', ascending=False),
+                        use_container_width=True,
+                        hide_index=True,
+                        height=200
+                    )
+                    
+                    st.markdown("---")
+                    
+                    # Pick form
+                    with st.form("pick_coil_form", clear_on_submit=True):
+                        # Select specific coil
+                        coil_options = [f"{row['Item_ID']} | {row['Material'][:35]}... | {row['Footage']:.0f} ft" 
+                                       for _, row in display_df.iterrows()]
+                        
+                        selected_coil = st.selectbox("🎯 Select Coil", coil_options, key="coil_select")
+                        
+                        if selected_coil:
+                            coil_id = selected_coil.split(" | ")[0]
+                            coil_data = display_df[display_df['Item_ID'] == coil_id].iloc[0]
+                            current_footage = float(coil_data['Footage'])
+                            
+                            col1, col2 = st.columns(2)
+                            
+                            with col1:
+                                pick_footage = st.number_input(
+                                    "📏 Footage to Pick",
+                                    min_value=1.0,
+                                    max_value=current_footage,
+                                    value=min(100.0, current_footage),
+                                    step=10.0,
+                                    key="coil_pick_footage"
+                                )
+                            
+                            with col2:
+                                remaining = current_footage - pick_footage
+                                st.metric("Remaining After Pick", f"{remaining:,.0f} ft")
+                                if remaining < 100:
+                                    st.caption("⚠️ Low stock warning")
+                        
+                        add_coil = st.form_submit_button("🛒 Add Coil to Cart", use_container_width=True)
+                    
+                    if add_coil and selected_coil:
+                        coil_id = selected_coil.split(" | ")[0]
+                        coil_data = display_df[display_df['Item_ID'] == coil_id].iloc[0]
+                        
+                        st.session_state.pick_cart.append({
+                            'category': 'Coils',
+                            'material': coil_data['Material'],
+                            'item_id': coil_id,
+                            'quantity': pick_footage,
+                            'unit': 'ft',
+                            'available': coil_data['Footage'],
+                            'shortfall': 0,
+                            'pick_type': 'partial'  # Indicates we're picking footage, not whole coil
+                        })
+                        st.success(f"✅ Added {pick_footage:.0f} ft from Coil {coil_id}")
+                        st.rerun()
+        
+        # ════════════════════════════════════════════════════════════════════════════
+        # ROLLS PICKING
+        # ════════════════════════════════════════════════════════════════════════════
+        elif pick_cat == "Rolls":
+            if filtered_df.empty:
+                st.warning("⚠️ No rolls in stock")
+            else:
+                # Extract roll properties
+                import re
+                
+                def extract_roll_props(row):
+                    mat = str(row['Material']).lower()
+                    
+                    gauge_match = re.search(r'\.(\d{3})', str(row['Material']))
+                    gauge = f".{gauge_match.group(1)}" if gauge_match else "Unknown"
+                    
+                    texture = "Smooth" if "smooth" in mat else ("Stucco" if "stucco" in mat else "Other")
+                    metal = "Aluminum" if "aluminum" in mat else ("Stainless Steel" if "stainless" in mat else "Other")
+                    
+                    # RPR detection
+                    roll_type = "RPR" if ("rpr" in mat or "rpr" in str(row['Item_ID']).lower()) else "Regular"
+                    
+                    return pd.Series({'Gauge': gauge, 'Texture': texture, 'Metal': metal, 'Roll_Type': roll_type})
+                
+                filtered_df[['Gauge', 'Texture', 'Metal', 'Roll_Type']] = filtered_df.apply(extract_roll_props, axis=1)
+                
+                # Filters
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    roll_type_opts = ["All"] + sorted(filtered_df['Roll_Type'].unique().tolist())
+                    sel_roll_type = st.selectbox("🗞️ Type", roll_type_opts, key="roll_type_filter")
+                
+                with col2:
+                    texture_opts = ["All"] + sorted(filtered_df['Texture'].unique().tolist())
+                    sel_texture = st.selectbox("🎨 Texture", texture_opts, key="roll_texture_filter")
+                
+                with col3:
+                    metal_opts = ["All"] + sorted(filtered_df['Metal'].unique().tolist())
+                    sel_metal = st.selectbox("🔩 Metal", metal_opts, key="roll_metal_filter")
+                
+                with col4:
+                    gauge_opts = ["All"] + sorted(filtered_df['Gauge'].unique().tolist())
+                    sel_gauge = st.selectbox("📏 Gauge", gauge_opts, key="roll_gauge_filter")
+                
+                # Apply filters
+                display_df = filtered_df.copy()
+                if sel_roll_type != "All":
+                    display_df = display_df[display_df['Roll_Type'] == sel_roll_type]
+                if sel_texture != "All":
+                    display_df = display_df[display_df['Texture'] == sel_texture]
+                if sel_metal != "All":
+                    display_df = display_df[display_df['Metal'] == sel_metal]
+                if sel_gauge != "All":
+                    display_df = display_df[display_df['Gauge'] == sel_gauge]
+                
+                if display_df.empty:
+                    st.warning("No rolls match the selected filters")
+                else:
+                    st.markdown(f"**{len(display_df)} roll(s) available:**")
+                    st.dataframe(
+                        display_df[['Item_ID', 'Roll_Type', 'Material', 'Footage', 'Location']].sort_values(['Roll_Type', 'Material']),
+                        use_container_width=True,
+                        hide_index=True,
+                        height=200
+                    )
+                    
+                    st.markdown("---")
+                    
+                    # Pick mode selection
+                    pick_mode = st.radio(
+                        "Pick Mode",
+                        ["Pick entire roll(s)", "Pick partial footage"],
+                        horizontal=True,
+                        key="roll_pick_mode"
+                    )
+                    
+                    if pick_mode == "Pick entire roll(s)":
+                        # Multi-select for whole rolls
+                        roll_options = [f"{row['Item_ID']} | {row['Roll_Type']} | {row['Footage']:.0f} ft" 
+                                       for _, row in display_df.iterrows()]
+                        
+                        selected_rolls = st.multiselect(
+                            "🎯 Select Roll(s) to Pick",
+                            roll_options,
+                            key="roll_multi_select"
+                        )
+                        
+                        if selected_rolls:
+                            total_footage = 0
+                            for roll_str in selected_rolls:
+                                roll_id = roll_str.split(" | ")[0]
+                                roll_footage = display_df[display_df['Item_ID'] == roll_id]['Footage'].values[0]
+                                total_footage += roll_footage
+                            
+                            st.info(f"📦 Selected: {len(selected_rolls)} roll(s) = **{total_footage:,.0f} ft** total")
+                            
+                            if st.button("🛒 Add Selected Rolls to Cart", type="primary", use_container_width=True):
+                                for roll_str in selected_rolls:
+                                    roll_id = roll_str.split(" | ")[0]
+                                    roll_data = display_df[display_df['Item_ID'] == roll_id].iloc[0]
+                                    
+                                    st.session_state.pick_cart.append({
+                                        'category': 'Rolls',
+                                        'material': roll_data['Material'],
+                                        'item_id': roll_id,
+                                        'quantity': roll_data['Footage'],
+                                        'unit': 'ft (whole roll)',
+                                        'available': roll_data['Footage'],
+                                        'shortfall': 0,
+                                        'pick_type': 'whole',
+                                        'roll_type': roll_data['Roll_Type']
+                                    })
+                                
+                                st.success(f"✅ Added {len(selected_rolls)} roll(s) to cart")
+                                st.rerun()
+                    
+                    else:  # Partial footage
+                        with st.form("pick_roll_partial_form", clear_on_submit=True):
+                            roll_options = [f"{row['Item_ID']} | {row['Roll_Type']} | {row['Material'][:30]}... | {row['Footage']:.0f} ft" 
+                                           for _, row in display_df.iterrows()]
+                            
+                            selected_roll = st.selectbox("🎯 Select Roll", roll_options, key="roll_single_select")
+                            
+                            if selected_roll:
+                                roll_id = selected_roll.split(" | ")[0]
+                                roll_data = display_df[display_df['Item_ID'] == roll_id].iloc[0]
+                                current_footage = float(roll_data['Footage'])
+                                
+                                col1, col2 = st.columns(2)
+                                
+                                with col1:
+                                    pick_footage = st.number_input(
+                                        "📏 Footage to Pick",
+                                        min_value=1.0,
+                                        max_value=current_footage,
+                                        value=min(50.0, current_footage),
+                                        step=5.0,
+                                        key="roll_pick_footage"
+                                    )
+                                
+                                with col2:
+                                    remaining = current_footage - pick_footage
+                                    st.metric("Remaining", f"{remaining:,.0f} ft")
+                            
+                            add_roll = st.form_submit_button("🛒 Add to Cart", use_container_width=True)
+                        
+                        if add_roll and selected_roll:
+                            roll_id = selected_roll.split(" | ")[0]
+                            roll_data = display_df[display_df['Item_ID'] == roll_id].iloc[0]
+                            
+                            st.session_state.pick_cart.append({
+                                'category': 'Rolls',
+                                'material': roll_data['Material'],
+                                'item_id': roll_id,
+                                'quantity': pick_footage,
+                                'unit': 'ft',
+                                'available': roll_data['Footage'],
+                                'shortfall': 0,
+                                'pick_type': 'partial',
+                                'roll_type': roll_data.get('Roll_Type', 'Regular')
+                            })
+                            st.success(f"✅ Added {pick_footage:.0f} ft from Roll {roll_id}")
+                            st.rerun()
+        
+        # ════════════════════════════════════════════════════════════════════════════
+        # OTHER CATEGORIES (Fab Straps, Elbows, Mineral Wool, etc.)
+        # ════════════════════════════════════════════════════════════════════════════
+        else:
+            if filtered_df.empty:
+                st.warning(f"⚠️ No {pick_cat.lower()} in stock")
+            else:
+                st.markdown(f"**{len(filtered_df)} item(s) available:**")
+                st.dataframe(
+                    filtered_df[['Item_ID', 'Material', 'Footage', 'Location']].sort_values('Material'),
+                    use_container_width=True,
+                    hide_index=True,
+                    height=200
+                )
+                
+                st.markdown("---")
+                
+                with st.form("pick_other_form", clear_on_submit=True):
+                    # Material selection
+                    mat_options = sorted(filtered_df['Material'].unique().tolist())
+                    selected_mat = st.selectbox("📦 Select Material", mat_options, key="other_mat_select")
+                    
+                    if selected_mat:
+                        mat_data = filtered_df[filtered_df['Material'] == selected_mat].iloc[0]
+                        current_qty = int(mat_data['Footage'])
+                        
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            pick_qty = st.number_input(
+                                "🔢 Quantity to Pick",
+                                min_value=1,
+                                max_value=current_qty,
+                                value=1,
+                                step=1,
+                                key="other_pick_qty"
+                            )
+                        
+                        with col2:
+                            remaining = current_qty - pick_qty
+                            st.metric("Remaining", f"{remaining} pcs")
+                            if remaining < 5:
+                                st.caption("⚠️ Low stock warning")
+                    
+                    add_other = st.form_submit_button("🛒 Add to Cart", use_container_width=True)
+                
+                if add_other and selected_mat:
+                    mat_data = filtered_df[filtered_df['Material'] == selected_mat].iloc[0]
+                    current_qty = int(mat_data['Footage'])
+                    
+                    available = min(current_qty, pick_qty)
+                    shortfall = max(0, pick_qty - current_qty)
+                    
+                    st.session_state.pick_cart.append({
+                        'category': pick_cat,
+                        'material': selected_mat,
+                        'item_id': mat_data['Item_ID'],
+                        'quantity': pick_qty,
+                        'unit': 'pcs',
+                        'available': available,
+                        'shortfall': shortfall,
+                        'pick_type': 'quantity'
+                    })
+                    
+                    if shortfall > 0:
+                        st.warning(f"⚠️ Added: {available} available, {shortfall} back ordered")
+                    else:
+                        st.success(f"✅ Added {pick_qty} × {selected_mat}")
+                    st.rerun()
+
+        # ════════════════════════════════════════════════════════════════════════════
+        # DISPLAY CART
+        # ════════════════════════════════════════════════════════════════════════════
+        if st.session_state.pick_cart:
+            st.markdown("---")
+            st.markdown("#### 🛒 Current Order")
+            
+            total_coil_footage = 0
+            total_roll_footage = 0
+            total_other_items = 0
+            
+            for idx, item in enumerate(st.session_state.pick_cart):
+                col_item, col_remove = st.columns([5, 1])
+                
+                with col_item:
+                    status = ""
+                    if item.get('shortfall', 0) > 0:
+                        status = f" ⚠️ ({item['available']} avail, {item['shortfall']} backorder)"
+                    
+                    if item['category'] == 'Coils':
+                        st.markdown(f"**🔄 Coil** - {item['material'][:40]}...")
+                        st.caption(f"ID: {item['item_id']} | Pick: **{item['quantity']:.0f} ft**{status}")
+                        total_coil_footage += item['quantity']
+                    
+                    elif item['category'] == 'Rolls':
+                        roll_type_icon = "🔷" if item.get('roll_type') == 'RPR' else "📜"
+                        pick_label = "Whole Roll" if item.get('pick_type') == 'whole' else f"{item['quantity']:.0f} ft"
+                        st.markdown(f"**{roll_type_icon} {item.get('roll_type', 'Regular')} Roll** - {item['material'][:35]}...")
+                        st.caption(f"ID: {item['item_id']} | Pick: **{pick_label}**{status}")
+                        total_roll_footage += item['quantity']
+                    
+                    else:
+                        st.markdown(f"**📦 {item['category']}** - {item['material'][:40]}...")
+                        st.caption(f"Qty: **{item['quantity']} {item.get('unit', 'pcs')}**{status}")
+                        total_other_items += item['quantity']
+                
+                with col_remove:
+                    if st.button("🗑️", key=f"remove_{idx}", help="Remove from cart"):
+                        st.session_state.pick_cart.pop(idx)
+                        st.rerun()
+            
+            # Cart summary
+            st.markdown("---")
+            sum_col1, sum_col2, sum_col3 = st.columns(3)
+            if total_coil_footage > 0:
+                sum_col1.metric("Coil Footage", f"{total_coil_footage:,.0f} ft")
+            if total_roll_footage > 0:
+                sum_col2.metric("Roll Footage", f"{total_roll_footage:,.0f} ft")
+            if total_other_items > 0:
+                sum_col3.metric("Other Items", f"{total_other_items:,}")
+            
+            st.divider()
+            
+            # Authorized By
+            picker_name = st.text_input(
+                "👤 Authorized By",
+                value=st.session_state.get("username", "Admin"),
+                key="pick_authorized"
+            )
+            
+            col_process, col_clear = st.columns(2)
+            
+            with col_process:
+                if st.button("📤 Process Order", type="primary", use_container_width=True):
+                    if not customer.strip():
+                        st.error("⚠️ Please enter Customer / Job Name.")
+                    elif not sales_order.strip():
+                        st.error("⚠️ Please enter Sales Order Number.")
+                    elif not picker_name.strip():
+                        st.error("⚠️ Please enter Authorized By name.")
+                    else:
+                        st.session_state.last_customer = customer.strip()
+                        st.session_state.last_sales_order = sales_order.strip()
+                        st.session_state.back_order_items = []
+                        
+                        all_success = True
+                        
+                        with st.spinner("Processing order..."):
+                            for item in st.session_state.pick_cart:
+                                try:
+                                    # Get current stock from database
+                                    response = supabase.table("inventory").select("Footage").eq("Item_ID", item['item_id']).execute()
+                                    
+                                    if response.data:
+                                        current_stock = float(response.data[0]['Footage'])
+                                        
+                                        if item['pick_type'] == 'whole':
+                                            # Remove entire roll/coil (set to 0 or delete)
+                                            new_footage = 0
+                                            action_desc = f"Picked whole {item['category'][:-1]} ({item['quantity']:.0f} ft)"
+                                        else:
+                                            # Partial pick
+                                            new_footage = current_stock - item['quantity']
+                                            if new_footage < 0:
+                                                new_footage = 0
+                                            action_desc = f"Picked {item['quantity']:.0f} {item.get('unit', 'units')} from {item['category']}"
+                                        
+                                        # Update database
+                                        supabase.table("inventory").update({
+                                            "Footage": new_footage
+                                        }).eq("Item_ID", item['item_id']).execute()
+                                        
+                                        # Log the pick
+                                        log_entry = {
+                                            "Item_ID": item['item_id'],
+                                            "Action": f"Stock Pick - {item['category']}",
+                                            "User": picker_name,
+                                            "Details": f"{action_desc} for {customer} (SO: {sales_order}). Material: {item['material'][:40]}. Remaining: {new_footage:.0f}"
+                                        }
+                                        audit_writer.log(log_entry)
+                                        
+                                        # Track back orders
+                                        if item.get('shortfall', 0) > 0:
+                                            st.session_state.back_order_items.append(item)
+                                    else:
+                                        st.warning(f"Item {item['item_id']} not found")
+                                        all_success = False
+                                        
+                                except Exception as e:
+                                    st.error(f"Error processing {item['item_id']}: {e}")
+                                    all_success = False
+                        
+                        if all_success:
+                            st.success(f"✅ Order processed for {customer} ({sales_order})!")
+                            
+                            if st.session_state.back_order_items:
+                                st.session_state.show_back_order = True
+                            else:
+                                st.balloons()
+                                st.toast("Order complete! 🎉", icon="🎉")
+                                st.session_state.pick_cart = []
+                                st.cache_data.clear()
+                                st.session_state.force_refresh = True
+                                time.sleep(1)
+                                st.rerun()
+                        else:
+                            st.error("Some items failed. Check above for details.")
+            
+            with col_clear:
+                if st.button("🗑️ Clear Cart", use_container_width=True):
+                    st.session_state.pick_cart = []
+                    st.rerun()
+
+        # ════════════════════════════════════════════════════════════════════════════
+        # BACK ORDER MANAGEMENT
+        # ════════════════════════════════════════════════════════════════════════════
+        if not st.session_state.pick_cart and not st.session_state.show_back_order:
+            st.markdown("---")
+            st.markdown("#### 📦 Back Order Management")
+            
+            try:
+                # Fetch all back orders (not just open)
+                all_back_orders = load_back_orders()
+                
+                # Separate by status
+                open_orders = [bo for bo in all_back_orders if bo.get('status') == 'Open']
+                fulfilled_orders = [bo for bo in all_back_orders if bo.get('status') == 'Fulfilled']
+                cancelled_orders = [bo for bo in all_back_orders if bo.get('status') == 'Cancelled']
+                
+                # Summary metrics
+                metric_col1, metric_col2, metric_col3 = st.columns(3)
+                metric_col1.metric("🔴 Open", len(open_orders))
+                metric_col2.metric("✅ Fulfilled", len(fulfilled_orders))
+                metric_col3.metric("❌ Cancelled", len(cancelled_orders))
+                
+                # Tabs for different views
+                bo_tab1, bo_tab2, bo_tab3 = st.tabs(["🔴 Open Orders", "✅ Fulfilled", "📊 All Orders"])
+                
+                # ── OPEN ORDERS TAB ─────────────────────────────────────────────────
+                with bo_tab1:
+                    if not open_orders:
+                        st.success("✅ No open back orders!")
+                    else:
+                        st.warning(f"📋 **{len(open_orders)}** order(s) pending fulfillment")
+                        
+                        for bo in open_orders:
+                            bo_id = bo.get('id')
+                            
+                            with st.expander(f"📦 {bo.get('material', 'Unknown')[:40]}... - {bo.get('shortfall_quantity')} units | {bo.get('client_name')}"):
+                                col1, col2 = st.columns(2)
+                                
+                                with col1:
+                                    st.markdown(f"""
+                                        **Material:** {bo.get('material', 'N/A')}  
+                                        **Quantity Needed:** {bo.get('shortfall_quantity', 0)}  
+                                        **Customer:** {bo.get('client_name', 'N/A')}  
+                                        **Sales Order:** {bo.get('order_number', 'N/A')}
+                                    """)
+                                    
+                                    if bo.get('note'):
+                                        st.info(f"📝 Note: {bo.get('note')}")
+                                
+                                with col2:
+                                    st.markdown("**Actions:**")
+                                    
+                                    # Fulfill button
+                                    if st.button("✅ Mark as Fulfilled", key=f"fulfill_{bo_id}", type="primary", use_container_width=True):
+                                        try:
+                                            supabase.table("back_orders").update({
+                                                "status": "Fulfilled",
+                                                "fulfilled_date": datetime.now().isoformat(),
+                                                "fulfilled_by": st.session_state.get('username', 'Admin')
+                                            }).eq("id", bo_id).execute()
+                                            
+                                            # Log it
+                                            log_entry = {
+                                                "Item_ID": f"BO-{bo_id}",
+                                                "Action": "Back Order Fulfilled",
+                                                "User": st.session_state.get('username', 'Admin'),
+                                                "Details": f"Fulfilled back order for {bo.get('shortfall_quantity')} × {bo.get('material', 'N/A')[:30]} for {bo.get('client_name')} (SO: {bo.get('order_number')})"
+                                            }
+                                            audit_writer.log(log_entry)
+                                            
+                                            st.success("✅ Marked as fulfilled!")
+                                            load_back_orders.clear()
+                                            st.rerun()
+                                        except Exception as e:
+                                            st.error(f"Failed: {e}")
+                                    
+                                    # Partial fulfill
+                                    with st.form(f"partial_fulfill_{bo_id}"):
+                                        st.markdown("**Partial Fulfillment:**")
+                                        partial_qty = st.number_input(
+                                            "Quantity fulfilled",
+                                            min_value=1,
+                                            max_value=int(bo.get('shortfall_quantity', 1)),
+                                            value=1,
+                                            key=f"partial_qty_{bo_id}"
+                                        )
+                                        
+                                        if st.form_submit_button("📦 Partial Fulfill", use_container_width=True):
+                                            try:
+                                                remaining = int(bo.get('shortfall_quantity', 0)) - partial_qty
+                                                
+                                                if remaining <= 0:
+                                                    # Fully fulfilled
+                                                    supabase.table("back_orders").update({
+                                                        "status": "Fulfilled",
+                                                        "shortfall_quantity": 0,
+                                                        "fulfilled_date": datetime.now().isoformat(),
+                                                        "fulfilled_by": st.session_state.get('username', 'Admin')
+                                                    }).eq("id", bo_id).execute()
+                                                    st.success("✅ Fully fulfilled!")
+                                                else:
+                                                    # Partial - update remaining quantity
+                                                    supabase.table("back_orders").update({
+                                                        "shortfall_quantity": remaining
+                                                    }).eq("id", bo_id).execute()
+                                                    st.success(f"✅ Fulfilled {partial_qty}. Remaining: {remaining}")
+                                                
+                                                # Log it
+                                                log_entry = {
+                                                    "Item_ID": f"BO-{bo_id}",
+                                                    "Action": "Back Order Partial Fulfill",
+                                                    "User": st.session_state.get('username', 'Admin'),
+                                                    "Details": f"Fulfilled {partial_qty} of {bo.get('shortfall_quantity')} × {bo.get('material', 'N/A')[:30]}. Remaining: {remaining}"
+                                                }
+                                                audit_writer.log(log_entry)
+                                                
+                                                load_back_orders.clear()
+                                                st.rerun()
+                                            except Exception as e:
+                                                st.error(f"Failed: {e}")
+                                    
+                                    # Cancel button
+                                    if st.button("❌ Cancel Order", key=f"cancel_{bo_id}", use_container_width=True):
+                                        try:
+                                            supabase.table("back_orders").update({
+                                                "status": "Cancelled",
+                                                "cancelled_date": datetime.now().isoformat(),
+                                                "cancelled_by": st.session_state.get('username', 'Admin')
+                                            }).eq("id", bo_id).execute()
+                                            
+                                            # Log it
+                                            log_entry = {
+                                                "Item_ID": f"BO-{bo_id}",
+                                                "Action": "Back Order Cancelled",
+                                                "User": st.session_state.get('username', 'Admin'),
+                                                "Details": f"Cancelled back order for {bo.get('shortfall_quantity')} × {bo.get('material', 'N/A')[:30]} for {bo.get('client_name')}"
+                                            }
+                                            audit_writer.log(log_entry)
+                                            
+                                            st.success("❌ Order cancelled")
+                                            load_back_orders.clear()
+                                            st.rerun()
+                                        except Exception as e:
+                                            st.error(f"Failed: {e}")
+                        
+                        # Bulk actions
+                        st.markdown("---")
+                        st.markdown("**Bulk Actions:**")
+                        
+                        col_bulk1, col_bulk2 = st.columns(2)
+                        
+                        with col_bulk1:
+                            if st.button("✅ Fulfill ALL Open Orders", use_container_width=True):
+                                try:
+                                    fulfilled_count = bulk_set_back_order_status(
+                                        [bo.get('id') for bo in open_orders],
+                                        "Fulfilled",
+                                        st.session_state.get('username', 'Admin')
+                                    )
+                                    
+                                    skipped = len(open_orders) - fulfilled_count
+                                    st.success(f"✅ Fulfilled {fulfilled_count} orders!" + (f" ({skipped} were already closed)" if skipped else ""))
+                                    st.balloons()
+                                    st.rerun()
+                                except Exception as e:
+                                    st.error(f"Failed: {e}")
+                        
+                        with col_bulk2:
+                            confirm = st.checkbox("I confirm I want to cancel all open orders", key="confirm_cancel_all")
+                            if st.button("❌ Cancel ALL Open Orders", use_container_width=True, disabled=not confirm):
+                                try:
+                                    cancelled_count = bulk_set_back_order_status(
+                                        [bo.get('id') for bo in open_orders],
+                                        "Cancelled",
+                                        st.session_state.get('username', 'Admin')
+                                    )
+                                    
+                                    skipped = len(open_orders) - cancelled_count
+                                    st.success(f"❌ Cancelled {cancelled_count} orders" + (f" ({skipped} were already closed)" if skipped else ""))
+                                    st.rerun()
+                                except Exception as e:
+                                    st.error(f"Failed: {e}")
+                
+                # ── FULFILLED ORDERS TAB ────────────────────────────────────────────
+                with bo_tab2:
+                    if not fulfilled_orders:
+                        st.info("📭 No fulfilled orders yet")
+                    else:
+                        st.success(f"✅ **{len(fulfilled_orders)}** order(s) fulfilled")
+                        
+                        # Create dataframe for display
+                        fulfilled_df = pd.DataFrame(fulfilled_orders)
+                        
+                        # Select columns to display
+                        display_cols = ['material', 'shortfall_quantity', 'client_name', 'order_number', 'fulfilled_date', 'fulfilled_by']
+                        available_cols = [col for col in display_cols if col in fulfilled_df.columns]
+                        
+                        if available_cols:
+                            st.dataframe(
+                                fulfilled_df[available_cols].rename(columns={
+                                    'material': 'Material',
+                                    'shortfall_quantity': 'Qty',
+                                    'client_name': 'Customer',
+                                    'order_number': 'SO #',
+                                    'fulfilled_date': 'Fulfilled Date',
+                                    'fulfilled_by': 'Fulfilled By'
+                                }),
+                                use_container_width=True,
+                                hide_index=True
+                            )
+                        
+                        # Option to reopen
+                        st.markdown("---")
+                        st.markdown("**Reopen a fulfilled order:**")
+                        
+                        reopen_options = [f"{bo.get('id')} - {bo.get('material', 'N/A')[:30]} ({bo.get('client_name')})" for bo in fulfilled_orders]
+                        selected_reopen = st.selectbox("Select order to reopen", ["-- Select --"] + reopen_options, key="reopen_select")
+                        
+                        if selected_reopen != "-- Select --":
+                            reopen_id = int(selected_reopen.split(" - ")[0])
+                            
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                reopen_qty = st.number_input("Quantity to reopen", min_value=1, value=1, key="reopen_qty")
+                            
+                            with col2:
+                                if st.button("🔄 Reopen Order", type="primary", use_container_width=True):
+                                    try:
+                                        supabase.table("back_orders").update({
+                                            "status": "Open",
+                                            "shortfall_quantity": reopen_qty,
+                                            "fulfilled_date": None,
+                                            "fulfilled_by": None
+                                        }).eq("id", reopen_id).execute()
+                                        
+                                        st.success("🔄 Order reopened!")
+                                        load_back_orders.clear()
+                                        st.rerun()
+                                    except Exception as e:
+                                        st.error(f"Failed: {e}")
+                
+                # ── ALL ORDERS TAB ──────────────────────────────────────────────────
+                with bo_tab3:
+                    if not all_back_orders:
+                        st.info("📭 No back orders in system")
+                    else:
+                        st.markdown(f"**Total:** {len(all_back_orders)} back order(s) in history")
+                        
+                        # Filter by status
+                        status_filter = st.multiselect(
+                            "Filter by Status",
+                            ["Open", "Fulfilled", "Cancelled"],
+                            default=["Open", "Fulfilled", "Cancelled"],
+                            key="bo_status_filter"
+                        )
+                        
+                        filtered_bo = [bo for bo in all_back_orders if bo.get('status') in status_filter]
+                        
+                        if filtered_bo:
+                            bo_df = pd.DataFrame(filtered_bo)
+                            
+                            display_cols = ['id', 'status', 'material', 'shortfall_quantity', 'client_name', 'order_number', 'note']
+                            available_cols = [col for col in display_cols if col in bo_df.columns]
+                            
+                            st.dataframe(
+                                bo_df[available_cols].rename(columns={
+                                    'id': 'ID',
+                                    'status': 'Status',
+                                    'material': 'Material',
+                                    'shortfall_quantity': 'Qty',
+                                    'client_name': 'Customer',
+                                    'order_number': 'SO #',
+                                    'note': 'Notes'
+                                }),
+                                use_container_width=True,
+                                hide_index=True
+                            )
+                        
+                        # Delete old records
+                        st.markdown("---")
+                        st.markdown("**🗑️ Cleanup:**")
+                        
+                        with st.expander("Delete old fulfilled/cancelled orders"):
+                            st.warning("⚠️ This will permanently delete records from the database")
+                            
+                            delete_status = st.multiselect(
+                                "Delete orders with status:",
+                                ["Fulfilled", "Cancelled"],
+                                key="delete_status"
+                            )
+                            
+                            if delete_status:
+                                to_delete = [bo for bo in all_back_orders if bo.get('status') in delete_status]
+                                st.write(f"This will delete **{len(to_delete)}** record(s)")
+                                
+                                confirm_delete = st.checkbox(f"I confirm I want to delete {len(to_delete)} records", key="confirm_delete_bo")
+                                
+                                if confirm_delete:
+                                    if st.button("🗑️ Delete Records", type="primary"):
+                                        try:
+                                            deleted_count = delete_back_orders_by_status(
+                                                delete_status,
+                                                st.session_state.get('username', 'Admin')
+                                            )
+                                            
+                                            st.success(f"🗑️ Deleted {deleted_count} records")
+                                            st.rerun()
+                                        except Exception as e:
+                                            st.error(f"Failed: {e}")
+                
+                # ── GENERATE REPORT ─────────────────────────────────────────────────
+                st.markdown("---")
+                if open_orders and st.button("📥 Generate PDF Report", type="secondary"):
+                    current_time = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+                    
+                    html_content = f"""
+                    <!DOCTYPE html>
+                    <html>
+                    <head>
+                        <meta charset="UTF-8">
+                        <title>Back Order Report</title>
+                        <style>
+                            @page {{ size: A4; margin: 2cm; }}
+                            body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 40px; background: white; color: #333; }}
+                            .header {{ text-align: center; border-bottom: 4px solid #2563eb; padding-bottom: 20px; margin-bottom: 30px; }}
+                            .header h1 {{ margin: 0; color: #1e40af; font-size: 32px; font-weight: 700; }}
+                            .header .subtitle {{ color: #64748b; font-size: 14px; margin-top: 8px; }}
+                            .meta-info {{ background: #f1f5f9; padding: 15px 20px; border-radius: 8px; margin-bottom: 30px; display: flex; justify-content: space-between; }}
+                            .order-card {{ border: 2px solid #e2e8f0; border-radius: 10px; padding: 20px; margin-bottom: 20px; background: #ffffff; page-break-inside: avoid; }}
+                            .order-header {{ background: linear-gradient(135deg, #dc2626 0%, #b91c1c 100%); color: white; padding: 12px 16px; border-radius: 6px; margin: -20px -20px 15px -20px; }}
+                            .detail-row {{ padding: 8px 0; border-bottom: 1px solid #f1f5f9; }}
+                            .detail-label {{ color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; }}
+                            .detail-value {{ color: #1e293b; font-size: 15px; font-weight: 500; margin-top: 4px; }}
+                            .quantity {{ background: #fef3c7; color: #92400e; padding: 4px 12px; border-radius: 20px; font-weight: 700; }}
+                            .footer {{ margin-top: 40px; text-align: center; color: #94a3b8; font-size: 12px; border-top: 2px solid #e2e8f0; padding-top: 20px; }}
+                        </style>
+                    </head>
+                    <body>
+                        <div class="header">
+                            <h1>📦 OPEN BACK ORDERS</h1>
+                            <div class="subtitle">Pending Fulfillment Report</div>
+                        </div>
+                        <div class="meta-info">
+                            <div><strong>Generated:</strong> {current_time}</div>
+                            <div><strong>Open Orders:</strong> {len(open_orders)}</div>
+                        </div>
+                    """
+                    
+                    for idx, bo in enumerate(open_orders, 1):
+                        html_content += f"""
+                        <div class="order-card">
+                            <div class="order-header">Back Order #{idx}</div>
+                            <div class="detail-row">
+                                <div class="detail-label">Material</div>
+                                <div class="detail-value">{bo.get('material', 'N/A')}</div>
+                            </div>
+                            <div class="detail-row">
+                                <div class="detail-label">Quantity</div>
+                                <div class="detail-value"><span class="quantity">{bo.get('shortfall_quantity', 0)} units</span></div>
+                            </div>
+                            <div class="detail-row">
+                                <div class="detail-label">Customer</div>
+                                <div class="detail-value">{bo.get('client_name', 'N/A')}</div>
+                            </div>
+                            <div class="detail-row">
+                                <div class="detail-label">Sales Order</div>
+                                <div class="detail-value">{bo.get('order_number', 'N/A')}</div>
+                            </div>
+                        """
+                        if bo.get('note'):
+                            html_content += f"""
+                            <div class="detail-row">
+                                <div class="detail-label">Notes</div>
+                                <div class="detail-value">{bo.get('note')}</div>
+                            </div>
+                            """
+                        html_content += "</div>"
+                    
+                    html_content += """
+                        <div class="footer">
+                            <p>Generated by MJP Pulse Inventory System</p>
+                        </div>
+                    </body>
+                    </html>
+                    """
+                    
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    st.download_button(
+                        label="📄 Download Report",
+                        data=html_content,
+                        file_name=f"back_orders_{timestamp}.html",
+                        mime="text/html"
+                    )
+                    st.info("💡 Open in browser → Print → Save as PDF")
+            
+            except Exception as e:
+                st.error(f"Error loading back orders: {e}")
+            
+            st.info("👆 Select a category above to start building your order")